@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Prueba de carga de ventas concurrentes en TiendaMuebles.
+
+Varios vendedores (hilos) intentan vender todas las unidades del inventario en
+orden aleatorio mientras un lector consulta sin parar. Verifica que no haya
+ventas dobles y mide ventas por segundo según la cantidad de hilos, con y sin
+diario de ventas (el fsync del diario libera el GIL, por eso es el caso en el
+que más hilos ayudan).
+
+Uso:
+    python benchmarks/concurrencia_ventas.py [--cantidad N] [--hilos 1 2 4 8]
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from models.concretos.silla import Silla  # noqa: E402
+from services.tienda import TiendaMuebles  # noqa: E402
+
+
+def medir(cantidad: int, hilos: int, con_diario: bool) -> dict:
+    """Vende todo el inventario con la cantidad de hilos dada."""
+    tienda = TiendaMuebles(concurrente=True)
+    directorio = tempfile.TemporaryDirectory()
+    if con_diario:
+        tienda.abrir_diario(Path(directorio.name) / "ventas.jsonl")
+    muebles = [Silla(f"Silla {i}", "Madera", "Café", 100.0 + i) for i in range(cantidad)]
+    tienda.agregar_muebles(muebles)
+    vendidas = [0] * hilos
+    lecturas = [0]
+    terminado = threading.Event()
+
+    def vendedor(numero: int) -> None:
+        orden = muebles[:]
+        random.Random(numero).shuffle(orden)
+        for mueble in orden:
+            if "error" not in tienda.realizar_venta(mueble, f"Vendedor {numero}"):
+                vendidas[numero] += 1
+
+    def lector() -> None:
+        while not terminado.is_set():
+            tienda.filtrar_por_precio(100, 200)
+            lecturas[0] += 1
+
+    hilo_lector = threading.Thread(target=lector)
+    vendedores = [threading.Thread(target=vendedor, args=(n,)) for n in range(hilos)]
+    hilo_lector.start()
+    inicio = time.perf_counter()
+    for hilo in vendedores:
+        hilo.start()
+    for hilo in vendedores:
+        hilo.join()
+    duracion = time.perf_counter() - inicio
+    terminado.set()
+    hilo_lector.join()
+    tienda.cerrar_diario()
+    directorio.cleanup()
+
+    total = sum(vendidas)
+    if total != cantidad or tienda.obtener_estadisticas()["ventas_realizadas"] != cantidad:
+        raise AssertionError(f"Ventas dobles o perdidas: {total} de {cantidad}")
+    return {"ventas_s": total / duracion, "lecturas": lecturas[0]}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=5000)
+    parser.add_argument("--hilos", type=int, nargs="+", default=[1, 2, 4, 8])
+    argumentos = parser.parse_args()
+
+    print(f"{'hilos':>5} {'diario':>7} {'ventas/s':>10} {'lecturas':>9}")
+    for con_diario in (False, True):
+        for hilos in argumentos.hilos:
+            resultado = medir(argumentos.cantidad, hilos, con_diario)
+            print(
+                f"{hilos:>5} {'sí' if con_diario else 'no':>7} "
+                f"{resultado['ventas_s']:>10.0f} {resultado['lecturas']:>9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Benchmark del costo de construcción de los muebles concretos.
+
+Mide los nanosegundos por instancia que cuesta construir cada clase con el
+código actual y con src/models tal como estaba en una revisión de git de
+referencia (por defecto HEAD), para comparar cambios en los constructores o
+en la invalidación del precio cacheado.
+
+Uso:
+    python benchmarks/construccion_muebles.py [--cantidad N] [--referencia REV]
+"""
+
+import argparse
+import io
+import json
+import subprocess
+import sys
+import tarfile
+import tempfile
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parent.parent
+
+# Se ejecuta en un subproceso con PYTHONPATH apuntando al árbol a medir
+_MEDICION = """
+import json, sys, timeit
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+from models.concretos.cama import Cama
+from models.concretos.escritorio import Escritorio
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+
+fabricas = {
+    "Silla": lambda: Silla("Silla", "Madera", "Café", 100.0, True, "tela"),
+    "Mesa": lambda: Mesa("Mesa", "Madera", "Natural", 200.0),
+    "Sofa": lambda: Sofa("Sofá", "Tela", "Gris", 500.0),
+    "Cama": lambda: Cama("Cama", "Madera", "Blanco", 300.0, "queen", True, True),
+    "SofaCama": lambda: SofaCama("SofaCama", "Metal", "Azul", 600.0),
+    "Armario": lambda: Armario("Armario", "Madera", "Blanco", 500, 3, 2, True),
+    "Cajonera": lambda: Cajonera("Cajonera", "Madera", "Blanco", 200),
+    "Escritorio": lambda: Escritorio("Escritorio", "Metal", "Negro", 400),
+    "Sillon": lambda: Sillon("Sillón", "Cuero", "Marrón", 800, material_tapizado="cuero"),
+}
+cantidad = int(sys.argv[1])
+resultados = {}
+for nombre, fabrica in fabricas.items():
+    mejor = min(timeit.repeat(fabrica, number=cantidad, repeat=5))
+    resultados[nombre] = mejor / cantidad * 1e9
+print(json.dumps(resultados))
+"""
+
+
+def extraer_modelos(revision: str, destino: Path) -> None:
+    """Extrae src/models de la revisión de git indicada dentro de destino."""
+    archivo = subprocess.run(
+        ["git", "archive", revision, "src/models"],
+        cwd=RAIZ,
+        capture_output=True,
+        check=True,
+    ).stdout
+    with tarfile.open(fileobj=io.BytesIO(archivo)) as tar:
+        tar.extractall(destino)
+
+
+def medir(ruta_src: Path, cantidad: int) -> dict:
+    """Mide los nanosegundos por construcción del árbol de fuentes indicado."""
+    salida = subprocess.run(
+        [sys.executable, "-c", _MEDICION, str(cantidad)],
+        env={"PYTHONPATH": str(ruta_src), "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(salida.stdout)
+
+
+def main() -> None:
+    """Ejecuta ambas mediciones e imprime la comparación."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=20000, help="instancias por repetición")
+    parser.add_argument("--referencia", default="HEAD", help="revisión de git a comparar")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporal:
+        extraer_modelos(args.referencia, Path(temporal))
+        antes = medir(Path(temporal) / "src", args.cantidad)
+    despues = medir(RAIZ / "src", args.cantidad)
+
+    print(f"{'Clase':<12}{args.referencia:>12}{'actual':>12}{'cambio':>10}")
+    for clase, ns_antes in antes.items():
+        ns_despues = despues[clase]
+        cambio = 100 * (ns_despues / ns_antes - 1)
+        print(f"{clase:<12}{ns_antes:>10.0f}ns{ns_despues:>10.0f}ns{cambio:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Benchmark de memoria por instancia de los muebles concretos.
+
+Mide los bytes por instancia del código actual (con __slots__) y de una copia
+temporal de src/models a la que se le quitan todas las declaraciones __slots__,
+que equivale al layout anterior basado en __dict__.
+
+Uso:
+    python benchmarks/memoria_muebles.py [--cantidad N]
+"""
+
+import argparse
+import ast
+import json
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+RAIZ_SRC = Path(__file__).resolve().parent.parent / "src"
+
+# Se ejecuta en un subproceso con PYTHONPATH apuntando al árbol a medir
+_MEDICION = """
+import json, sys, tracemalloc
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+from models.concretos.cama import Cama
+from models.concretos.escritorio import Escritorio
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+
+fabricas = {
+    "Silla": lambda: Silla("Silla", "Madera", "Café", 100.0, True, "tela"),
+    "Mesa": lambda: Mesa("Mesa", "Madera", "Natural", 200.0),
+    "Sofa": lambda: Sofa("Sofá", "Tela", "Gris", 500.0),
+    "Cama": lambda: Cama("Cama", "Madera", "Blanco", 300.0, "queen", True, True),
+    "SofaCama": lambda: SofaCama("SofaCama", "Metal", "Azul", 600.0),
+    "Armario": lambda: Armario("Armario", "Madera", "Blanco", 500, 3, 2, True),
+    "Cajonera": lambda: Cajonera("Cajonera", "Madera", "Blanco", 200),
+    "Escritorio": lambda: Escritorio("Escritorio", "Metal", "Negro", 400),
+    "Sillon": lambda: Sillon("Sillón", "Cuero", "Marrón", 800, material_tapizado="cuero"),
+}
+cantidad = int(sys.argv[1])
+resultados = {}
+for nombre, fabrica in fabricas.items():
+    fabrica().calcular_precio()
+    instancias = [None] * cantidad
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+    for i in range(cantidad):
+        mueble = fabrica()
+        mueble.calcular_precio()
+        instancias[i] = mueble
+    resultados[nombre] = (tracemalloc.get_traced_memory()[0] - inicio) / cantidad
+    tracemalloc.stop()
+    del instancias
+print(json.dumps(resultados))
+"""
+
+
+def quitar_slots(directorio: Path) -> None:
+    """Elimina las asignaciones a __slots__ de todos los módulos del directorio."""
+    for archivo in directorio.rglob("*.py"):
+        fuente = archivo.read_text(encoding="utf-8")
+        lineas = fuente.splitlines(keepends=True)
+        rangos = [
+            (nodo.lineno, nodo.end_lineno)
+            for nodo in ast.walk(ast.parse(fuente))
+            if isinstance(nodo, ast.Assign)
+            and any(getattr(t, "id", None) == "__slots__" for t in nodo.targets)
+        ]
+        for inicio, fin in sorted(rangos, reverse=True):
+            del lineas[inicio - 1 : fin]
+        archivo.write_text("".join(lineas), encoding="utf-8")
+
+
+def medir(ruta_src: Path, cantidad: int) -> dict:
+    """Mide los bytes por instancia del árbol de fuentes indicado."""
+    salida = subprocess.run(
+        [sys.executable, "-c", _MEDICION, str(cantidad)],
+        env={"PYTHONPATH": str(ruta_src), "PYTHONDONTWRITEBYTECODE": "1"},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(salida.stdout)
+
+
+def main() -> None:
+    """Ejecuta ambas mediciones e imprime la comparación."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--cantidad", type=int, default=20000, help="instancias por clase")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as temporal:
+        copia = Path(temporal) / "src"
+        shutil.copytree(RAIZ_SRC / "models", copia / "models")
+        quitar_slots(copia / "models")
+        antes = medir(copia, args.cantidad)
+    despues = medir(RAIZ_SRC, args.cantidad)
+
+    print(f"{'Clase':<12}{'sin slots':>12}{'con slots':>12}{'ahorro':>10}")
+    for clase, bytes_antes in antes.items():
+        bytes_despues = despues[clase]
+        ahorro = 100 * (1 - bytes_despues / bytes_antes)
+        print(f"{clase:<12}{bytes_antes:>12.0f}{bytes_despues:>12.0f}{ahorro:>9.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,21 +1,31 @@
 #!/usr/bin/env python3
 """
 Punto de entrada principal para la aplicación Tienda de Muebles.
-Este archivo inicializa la aplicación y proporciona datos de ejemplo.
+Sin argumentos inicializa la aplicación con datos de ejemplo y abre el menú
+interactivo. Con un subcomando (load, search, filter, sell, stats, report)
+trabaja sin interacción sobre una base SQLite, para scripts, cron y tuberías.
+
+Los modelos, los servicios y la interfaz Rich se importan dentro de las
+funciones que los usan: cada subcomando carga solo lo que necesita.
 """
 
-from models.composicion.comedor import Comedor
-from models.concretos.armario import Armario
-from models.concretos.cajonera import Cajonera
-from models.concretos.cama import Cama
-from models.concretos.escritorio import Escritorio
-from models.concretos.mesa import Mesa
-from models.concretos.silla import Silla
-from models.concretos.sillon import Sillon
-from models.concretos.sofa import Sofa
-from models.concretos.sofacama import SofaCama
-from services.tienda import TiendaMuebles
-from ui.menu import MenuTienda
+import argparse
+import os
+import sys
+from typing import TYPE_CHECKING, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from models.mueble import Mueble
+    from services.tienda import TiendaMuebles
+    from services.tienda_sqlite import TiendaSQLite
+
+# Diario de ventas que se reproduce al iniciar
+RUTA_DIARIO_VENTAS = os.environ.get("TIENDA_DIARIO_VENTAS", "ventas.jsonl")
+
+# Base SQLite sobre la que trabajan los subcomandos
+RUTA_BASE = os.environ.get("TIENDA_BASE", "tienda.db")
+
+NOMBRE_TIENDA = "Mueblería Moderna OOP"
 
 
 def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
@@ -26,6 +36,16 @@ def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
     Args:
         tienda: Instancia de TiendaMuebles donde agregar los muebles
     """
+    from models.concretos.armario import Armario
+    from models.concretos.cajonera import Cajonera
+    from models.concretos.cama import Cama
+    from models.concretos.escritorio import Escritorio
+    from models.concretos.mesa import Mesa
+    from models.concretos.silla import Silla
+    from models.concretos.sillon import Sillon
+    from models.concretos.sofa import Sofa
+    from models.concretos.sofacama import SofaCama
+
     print("🔨 Creando catálogo inicial de muebles...")
 
     sillas = [
@@ -201,9 +221,10 @@ def crear_catalogo_inicial(tienda: "TiendaMuebles") -> None:
         sillas + mesas + asientos_grandes + almacenamiento + dormitorio_oficina + [sofacama]
     )
 
-    for mueble in todos_los_muebles:
-        resultado = tienda.agregar_mueble(mueble)
-        print(f"  ✓ {resultado}")
+    resumen = tienda.agregar_muebles(todos_los_muebles)
+    print(f"  ✓ {resumen['aceptados']} muebles agregados al inventario")
+    for posicion, error in resumen["errores"]:
+        print(f"  ✗ {todos_los_muebles[posicion].nombre}: {error}")
 
     print(f" Catálogo inicial creado con éxito!")
 
@@ -215,6 +236,10 @@ def crear_comedores_ejemplo(tienda: "TiendaMuebles") -> None:
     Args:
         tienda: Instancia de TiendaMuebles donde agregar los comedores
     """
+    from models.composicion.comedor import Comedor
+    from models.concretos.mesa import Mesa
+    from models.concretos.silla import Silla
+
     print("\n🍽️ Creando comedores de ejemplo...")
 
     mesa_familiar = Mesa(
@@ -319,9 +344,9 @@ def mostrar_estadisticas_iniciales(tienda: "TiendaMuebles") -> None:
         print(f"    • {tipo}: {cantidad} unidades")
 
 
-def main():
+def ejecutar_menu() -> None:
     """
-    Función principal que inicializa y ejecuta la aplicación.
+    Inicializa la tienda de ejemplo y ejecuta el menú interactivo.
 
     Esta función demuestra todos los conceptos de OOP implementados:
     - Creación de objetos de diferentes clases
@@ -330,11 +355,15 @@ def main():
     - Herencia múltiple con el sofá-cama
     - Encapsulación y abstracción en toda la jerarquía
     """
+    tienda = None
     try:
+        from services.tienda import TiendaMuebles
+        from ui.menu import MenuTienda
+
         print("🏠 Bienvenido a la Tienda de Muebles - Taller OOP 🏠")
         print("=" * 50)
 
-        tienda = TiendaMuebles("Mueblería Moderna OOP")
+        tienda = TiendaMuebles(NOMBRE_TIENDA)
         print(f"🏪 Inicializando {tienda.nombre}...")
 
         crear_catalogo_inicial(tienda)
@@ -343,6 +372,10 @@ def main():
 
         aplicar_descuentos_ejemplo(tienda)
 
+        recuperadas = tienda.abrir_diario(RUTA_DIARIO_VENTAS)
+        if recuperadas:
+            print(f"↻ {recuperadas} ventas recuperadas del diario {RUTA_DIARIO_VENTAS}")
+
         mostrar_estadisticas_iniciales(tienda)
 
         print("\n Iniciando interfaz de usuario...")
@@ -360,10 +393,337 @@ def main():
 
         traceback.print_exc()
     finally:
+        if tienda is not None:
+            tienda.cerrar_diario()
         print("\n" + "=" * 50)
         print(" Programa finalizado. ¡Gracias por usar la Tienda de Muebles! ")
 
 
+def _abrir_tienda(args: argparse.Namespace) -> "TiendaSQLite":
+    """
+    Abre la base de los subcomandos con una sola conexión.
+
+    Raises:
+        ValueError: Si el archivo no es una base SQLite válida
+    """
+    import sqlite3
+
+    from services.tienda_sqlite import TiendaSQLite
+
+    try:
+        return TiendaSQLite(args.base, NOMBRE_TIENDA, tamaño_pool=1)
+    except sqlite3.DatabaseError as e:
+        raise ValueError(f"No se pudo abrir la base {args.base}: {e}") from e
+
+
+def _escribir_muebles(tienda: "TiendaSQLite", muebles: Iterable["Mueble"], formato: str) -> int:
+    """
+    Escribe muebles en la salida estándar, uno por línea, a medida que se leen.
+
+    En formato texto cada línea lleva id, tipo, nombre, material, color y
+    precio separados por tabuladores; el id (primera columna) es el que
+    acepta sell. En formato jsonl cada línea es el registro del mueble con
+    su id y su precio.
+
+    Args:
+        tienda: Tienda de la que vienen los muebles
+        muebles: Muebles a escribir (puede ser un generador)
+        formato: "texto" o "jsonl"
+
+    Returns:
+        int: Cantidad de muebles escritos
+    """
+    escribir = sys.stdout.write
+    if formato == "jsonl":
+        import json
+
+        from services.catalogo import registro_de
+    cantidad = 0
+    for mueble in muebles:
+        precio = tienda.precio(mueble)
+        fila = tienda.fila_de(mueble)
+        if formato == "jsonl":
+            registro = {"id": fila, **registro_de(mueble), "precio": precio}
+            escribir(json.dumps(registro, ensure_ascii=False) + "\n")
+        else:
+            escribir(
+                f"{fila}\t{type(mueble).__name__}\t{mueble.nombre}\t{mueble.material}\t"
+                f"{mueble.color}\t{precio:.2f}\n"
+            )
+        cantidad += 1
+    return cantidad
+
+
+def _resolver_tipo(nombre: str) -> type:
+    """
+    Clase de mueble o categoría escrita por el usuario ("sillas", "Asiento").
+
+    Raises:
+        ValueError: Si el tipo no existe
+    """
+    from services.catalogo import TIPOS_MUEBLE
+    from services.descuentos import CATEGORIAS_DESCUENTO, resolver_categoria
+
+    clases = {clase.__name__: clase for clase in (*TIPOS_MUEBLE.values(), *CATEGORIAS_DESCUENTO)}
+    clase = clases.get(resolver_categoria(nombre))
+    if clase is None:
+        raise ValueError(f"Tipo de mueble desconocido '{nombre}'")
+    return clase
+
+
+def comando_load(args: argparse.Namespace) -> int:
+    """Carga un catálogo CSV o JSON Lines en la base."""
+    from services.catalogo import cargar_catalogo
+
+    tienda = _abrir_tienda(args)
+    try:
+        resumen = cargar_catalogo(tienda, args.archivo, args.formato, args.lote)
+    finally:
+        tienda.cerrar()
+    for linea, mensaje in resumen["errores"]:
+        print(f"línea {linea}: {mensaje}", file=sys.stderr)
+    print(f"{resumen['aceptados']} muebles cargados, {resumen['rechazados']} rechazados")
+    return 1 if resumen["rechazados"] else 0
+
+
+def comando_search(args: argparse.Namespace) -> int:
+    """Busca muebles por nombre (coincidencia parcial)."""
+    tienda = _abrir_tienda(args)
+    try:
+        _escribir_muebles(tienda, tienda.iter_buscar_muebles_por_nombre(args.texto), args.formato)
+    finally:
+        tienda.cerrar()
+    return 0
+
+
+def comando_filter(args: argparse.Namespace) -> int:
+    """Filtra por tipo, material, color y rango de precio (ordena por precio si hay rango)."""
+    tipo = _resolver_tipo(args.tipo) if args.tipo else None
+    por_precio = args.precio_min is not None or args.precio_max is not None
+    tienda = _abrir_tienda(args)
+    try:
+        muebles = tienda.iter_consultar(
+            por_precio=por_precio,
+            tipo=tipo,
+            material=args.material,
+            color=args.color,
+            precio_min=args.precio_min,
+            precio_max=args.precio_max,
+        )
+        _escribir_muebles(tienda, muebles, args.formato)
+    finally:
+        tienda.cerrar()
+    return 0
+
+
+def _leer_ids(valores: List[str]) -> List[int]:
+    """
+    Ids de los muebles a vender. Sin valores (o con "-") se leen de la
+    entrada estándar: la primera columna de cada línea, como la imprime search.
+
+    Raises:
+        ValueError: Si algún id no es un número entero
+    """
+    if not valores or valores == ["-"]:
+        valores = [linea.split(None, 1)[0] for linea in sys.stdin if linea.strip()]
+    try:
+        return [int(valor) for valor in valores]
+    except ValueError as e:
+        raise ValueError(f"Id de mueble inválido: {e}") from e
+
+
+def comando_sell(args: argparse.Namespace) -> int:
+    """Vende muebles por id en una sola transacción e imprime cada venta en JSON."""
+    import json
+
+    filas = _leer_ids(args.ids)
+    errores = 0
+    tienda = _abrir_tienda(args)
+    try:
+        encontrados = []
+        for fila in filas:
+            mueble = tienda.obtener_por_fila(fila)
+            if mueble is None:
+                print(f"Error: No hay ningún mueble con id {fila}", file=sys.stderr)
+                errores += 1
+            else:
+                encontrados.append((fila, mueble))
+        resultados = (
+            tienda.realizar_ventas([mueble for _, mueble in encontrados], args.cliente)
+            if encontrados
+            else []
+        )
+    finally:
+        tienda.cerrar()
+    for (fila, _), resultado in zip(encontrados, resultados):
+        if "error" in resultado:
+            print(f"Error: id {fila}: {resultado['error']}", file=sys.stderr)
+            errores += 1
+        else:
+            print(json.dumps({"id": fila, **resultado}, ensure_ascii=False))
+    return 1 if errores else 0
+
+
+def comando_stats(args: argparse.Namespace) -> int:
+    """Imprime las estadísticas de la tienda en JSON."""
+    import json
+
+    tienda = _abrir_tienda(args)
+    try:
+        estadisticas = tienda.obtener_estadisticas()
+    finally:
+        tienda.cerrar()
+    print(json.dumps(estadisticas, ensure_ascii=False, indent=2))
+    return 0
+
+
+def comando_report(args: argparse.Namespace) -> int:
+    """
+    Escribe el reporte de inventario. Sin --salida se escribe un único
+    formato en la salida estándar; con --salida, un archivo por formato
+    (BASE.txt, BASE.csv, BASE.jsonl) en un solo recorrido.
+    """
+    from contextlib import ExitStack
+
+    from services.reportes import FORMATOS_REPORTE
+
+    formatos = list(dict.fromkeys(args.formato or ["texto"]))
+    if args.salida is None and len(formatos) > 1:
+        raise ValueError("Para escribir varios formatos indica un nombre base con --salida")
+    tienda = _abrir_tienda(args)
+    try:
+        with ExitStack() as pila:
+            if args.salida is None:
+                destinos = {formatos[0]: sys.stdout}
+            else:
+                destinos = {
+                    formato: pila.enter_context(
+                        open(
+                            args.salida + FORMATOS_REPORTE[formato].extension,
+                            "w",
+                            encoding="utf-8",
+                            newline="",
+                        )
+                    )
+                    for formato in formatos
+                }
+            cantidad = tienda.escribir_reporte(destinos)
+    finally:
+        tienda.cerrar()
+    if args.salida is not None:
+        archivos = ", ".join(archivo.name for archivo in destinos.values())
+        print(f"{cantidad} muebles escritos en {archivos}")
+    return 0
+
+
+def crear_parser() -> argparse.ArgumentParser:
+    """
+    Parser de la línea de comandos. Cada subcomando acepta también su
+    alias en español (cargar, buscar, filtrar, vender, estadisticas, reporte).
+
+    Returns:
+        argparse.ArgumentParser: Parser con los subcomandos
+    """
+    parser = argparse.ArgumentParser(
+        description="Tienda de Muebles. Sin subcomando abre el menú interactivo."
+    )
+    comun = argparse.ArgumentParser(add_help=False)
+    comun.add_argument(
+        "--base",
+        default=RUTA_BASE,
+        help="Base SQLite de la tienda (por defecto $TIENDA_BASE o tienda.db)",
+    )
+    # --formato siempre es el formato de los datos y --salida, un archivo de destino
+    listado = argparse.ArgumentParser(add_help=False)
+    listado.add_argument(
+        "--formato",
+        choices=("texto", "jsonl"),
+        default="texto",
+        help="texto: columnas separadas por tabuladores; jsonl: un objeto JSON por línea",
+    )
+    subcomandos = parser.add_subparsers(dest="comando", metavar="COMANDO")
+
+    load = subcomandos.add_parser(
+        "load", aliases=["cargar"], parents=[comun], help="Cargar un catálogo CSV o JSON Lines"
+    )
+    load.add_argument("archivo", help="Archivo del catálogo")
+    load.add_argument("--formato", choices=("csv", "jsonl"), help="Formato del archivo")
+    load.add_argument("--lote", type=int, default=10000, help="Muebles por transacción")
+    load.set_defaults(funcion=comando_load)
+
+    search = subcomandos.add_parser(
+        "search", aliases=["buscar"], parents=[comun, listado], help="Buscar muebles por nombre"
+    )
+    search.add_argument("texto", help="Parte del nombre")
+    search.set_defaults(funcion=comando_search)
+
+    filtro = subcomandos.add_parser(
+        "filter", aliases=["filtrar"], parents=[comun, listado], help="Filtrar el inventario"
+    )
+    filtro.add_argument("--tipo", help="Tipo o categoría (silla, asientos, ...)")
+    filtro.add_argument("--material")
+    filtro.add_argument("--color")
+    filtro.add_argument("--precio-min", type=float)
+    filtro.add_argument("--precio-max", type=float)
+    filtro.set_defaults(funcion=comando_filter)
+
+    sell = subcomandos.add_parser(
+        "sell", aliases=["vender"], parents=[comun], help="Vender muebles por id"
+    )
+    sell.add_argument(
+        "ids",
+        nargs="*",
+        help="Ids de los muebles (sin ids o '-': entrada estándar)",
+    )
+    sell.add_argument("--cliente", default="Cliente Anónimo")
+    sell.set_defaults(funcion=comando_sell)
+
+    stats = subcomandos.add_parser(
+        "stats", aliases=["estadisticas"], parents=[comun], help="Estadísticas en JSON"
+    )
+    stats.set_defaults(funcion=comando_stats)
+
+    report = subcomandos.add_parser(
+        "report", aliases=["reporte"], parents=[comun], help="Reporte de inventario"
+    )
+    report.add_argument(
+        "--formato",
+        action="append",
+        choices=("texto", "csv", "jsonl"),
+        help="Formato del reporte (se puede repetir)",
+    )
+    report.add_argument(
+        "--salida", metavar="BASE", help="Nombre base de los archivos (sin extensión)"
+    )
+    report.set_defaults(funcion=comando_report)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ejecuta un subcomando o, sin argumentos, el menú interactivo.
+
+    Args:
+        argv: Argumentos de la línea de comandos (por defecto sys.argv)
+
+    Returns:
+        int: Código de salida (0 si todo salió bien, 1 si hubo errores)
+    """
+    args = crear_parser().parse_args(argv)
+    if args.comando is None:
+        ejecutar_menu()
+        return 0
+    try:
+        return args.funcion(args)
+    except (OSError, ValueError) as e:
+        if isinstance(e, BrokenPipeError):
+            # El lector de la tubería terminó antes (ej: | head): no es un error
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            return 0
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+
 if __name__ == "__main__":
     # Punto de entrada de la aplicación
-    main()
+    sys.exit(main())
@@ -17,6 +17,8 @@ class Almacenamiento(Mueble, ABC):
     - Abstracción: Define características comunes de almacenamiento
     """
 
+    __slots__ = ("_num_compartimentos", "_capacidad_litros")
+
     def __init__(
         self,
         nombre: str,
@@ -48,6 +50,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("El número de compartimentos debe ser mayor a 0")
         self._num_compartimentos = value
+        self._modificado()
 
     @property
     def capacidad_litros(self) -> float:
@@ -60,6 +63,7 @@ class Almacenamiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_litros = value
+        self._modificado()
 
     def calcular_factor_almacenamiento(self) -> float:
         """
@@ -21,6 +21,8 @@ class Asiento(Mueble, ABC):
     - Polimorfismo: Permite diferentes implementaciones del cálculo de comodidad
     """
 
+    __slots__ = ("_capacidad_personas", "_tiene_respaldo", "_material_tapizado")
+
     def __init__(
         self,
         nombre: str,
@@ -57,6 +59,7 @@ class Asiento(Mueble, ABC):
         if value <= 0:
             raise ValueError("La capacidad debe ser mayor a 0")
         self._capacidad_personas = value
+        self._modificado()
 
     @property
     def tiene_respaldo(self) -> bool:
@@ -67,6 +70,7 @@ class Asiento(Mueble, ABC):
     def tiene_respaldo(self, value: bool) -> None:
         """Setter para respaldo."""
         self._tiene_respaldo = value
+        self._modificado()
 
     @property
     def material_tapizado(self) -> str:
@@ -77,6 +81,7 @@ class Asiento(Mueble, ABC):
     def material_tapizado(self, value: str) -> None:
         """Setter para material de tapizado."""
         self._material_tapizado = value
+        self._modificado()
 
     def calcular_factor_comodidad(self) -> float:
         """
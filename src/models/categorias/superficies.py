@@ -17,6 +17,8 @@ class Superficie(Mueble, ABC):
     - Abstracción: Define características comunes de superficies
     """
 
+    __slots__ = ("_largo", "_ancho", "_altura")
+
     def __init__(
         self,
         nombre: str,
@@ -51,6 +53,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("El largo debe ser mayor a 0")
         self._largo = value
+        self._modificado()
 
     @property
     def ancho(self) -> float:
@@ -63,6 +66,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("El ancho debe ser mayor a 0")
         self._ancho = value
+        self._modificado()
 
     @property
     def altura(self) -> float:
@@ -75,6 +79,7 @@ class Superficie(Mueble, ABC):
         if value <= 0:
             raise ValueError("La altura debe ser mayor a 0")
         self._altura = value
+        self._modificado()
 
     def calcular_area(self) -> float:
         """
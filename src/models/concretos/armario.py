@@ -3,14 +3,36 @@ Clase concreta Armario.
 Representa un armario genérico.
 """
 
+from ..precio_cache import AtributoPrecio, PrecioCacheable, precio_memoizado
+
 # from ..mueble import Mueble
 
 
-class Armario:
+class Armario(PrecioCacheable):
     """
     Clase concreta que representa un armario.
     """
 
+    __slots__ = (
+        "_nombre",
+        "_material",
+        "_color",
+        "_precio_base",
+        "_num_puertas",
+        "_num_cajones",
+        "_tiene_espejos",
+        "_precio_cache",
+    )
+
+    # Asignarlos después del constructor invalida el precio cacheado
+    nombre = AtributoPrecio()
+    material = AtributoPrecio()
+    color = AtributoPrecio()
+    precio_base = AtributoPrecio()
+    num_puertas = AtributoPrecio()
+    num_cajones = AtributoPrecio()
+    tiene_espejos = AtributoPrecio()
+
     def __init__(
         self,
         nombre: str,
@@ -21,14 +43,15 @@ class Armario:
         num_cajones: int = 0,
         tiene_espejos: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.num_puertas = num_puertas
-        self.num_cajones = num_cajones
-        self.tiene_espejos = tiene_espejos
+        self._nombre = nombre
+        self._material = material
+        self._color = color
+        self._precio_base = int(precio_base) if precio_base is not None else 0
+        self._num_puertas = num_puertas
+        self._num_cajones = num_cajones
+        self._tiene_espejos = tiene_espejos
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final del armario."""
         precio = self.precio_base
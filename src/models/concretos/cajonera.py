@@ -3,14 +3,34 @@ Clase concreta Cajonera.
 Representa una cajonera genérica.
 """
 
+from ..precio_cache import AtributoPrecio, PrecioCacheable, precio_memoizado
+
 # from ..mueble import Mueble
 
 
-class Cajonera:
+class Cajonera(PrecioCacheable):
     """
     Clase concreta que representa una cajonera.
     """
 
+    __slots__ = (
+        "_nombre",
+        "_material",
+        "_color",
+        "_precio_base",
+        "_num_cajones",
+        "_tiene_ruedas",
+        "_precio_cache",
+    )
+
+    # Asignarlos después del constructor invalida el precio cacheado
+    nombre = AtributoPrecio()
+    material = AtributoPrecio()
+    color = AtributoPrecio()
+    precio_base = AtributoPrecio()
+    num_cajones = AtributoPrecio()
+    tiene_ruedas = AtributoPrecio()
+
     def __init__(
         self,
         nombre: str,
@@ -20,13 +40,14 @@ class Cajonera:
         num_cajones: int = 3,
         tiene_ruedas: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.num_cajones = num_cajones
-        self.tiene_ruedas = tiene_ruedas
+        self._nombre = nombre
+        self._material = material
+        self._color = color
+        self._precio_base = int(precio_base) if precio_base is not None else 0
+        self._num_cajones = num_cajones
+        self._tiene_ruedas = tiene_ruedas
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final de la cajonera."""
         precio = self.precio_base
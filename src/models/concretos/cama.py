@@ -4,6 +4,7 @@ Representa una cama genérica.
 """
 
 from ..mueble import Mueble
+from ..precio_cache import precio_memoizado
 
 
 class Cama(Mueble):
@@ -11,6 +12,12 @@ class Cama(Mueble):
     Clase concreta que representa una cama.
     """
 
+    # CPython rechaza una clase con dos bases que agregan slots, así que Cama no
+    # puede declarar los suyos sin romper SofaCama(Sofa, Cama) ("multiple bases
+    # have instance lay-out conflict"). Las camas guardan sus atributos en
+    # __dict__; SofaCama los redeclara como slots y su __dict__ queda vacío.
+    __slots__ = ("__dict__",)
+
     def __init__(
         self,
         nombre: str,
@@ -38,6 +45,7 @@ class Cama(Mueble):
         if value not in tamaños_validos:
             raise ValueError(f"Tamaño debe ser uno de: {tamaños_validos}")
         self._tamaño = value
+        self._modificado()
 
     @property
     def incluye_colchon(self) -> bool:
@@ -49,6 +57,7 @@ class Cama(Mueble):
         """Getter para cabecera."""
         return self._tiene_cabecera
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final de la cama."""
         precio = self.precio_base
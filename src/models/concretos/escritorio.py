@@ -3,14 +3,40 @@ Clase concreta Escritorio.
 Representa un escritorio genérico.
 """
 
+from ..precio_cache import AtributoPrecio, PrecioCacheable, precio_memoizado
+
 # from ..mueble import Mueble
 
 
-class Escritorio:
+class Escritorio(PrecioCacheable):
     """
     Clase concreta que representa un escritorio.
     """
 
+    __slots__ = (
+        "_nombre",
+        "_material",
+        "_color",
+        "_precio_base",
+        "_forma",
+        "_tiene_cajones",
+        "_num_cajones",
+        "_largo",
+        "_tiene_iluminacion",
+        "_precio_cache",
+    )
+
+    # Asignarlos después del constructor invalida el precio cacheado
+    nombre = AtributoPrecio()
+    material = AtributoPrecio()
+    color = AtributoPrecio()
+    precio_base = AtributoPrecio()
+    forma = AtributoPrecio()
+    tiene_cajones = AtributoPrecio()
+    num_cajones = AtributoPrecio()
+    largo = AtributoPrecio()
+    tiene_iluminacion = AtributoPrecio()
+
     def __init__(
         self,
         nombre: str,
@@ -23,16 +49,17 @@ class Escritorio:
         largo: float = 1.2,
         tiene_iluminacion: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.forma = forma
-        self.tiene_cajones = tiene_cajones
-        self.num_cajones = num_cajones
-        self.largo = largo
-        self.tiene_iluminacion = tiene_iluminacion
+        self._nombre = nombre
+        self._material = material
+        self._color = color
+        self._precio_base = int(precio_base) if precio_base is not None else 0
+        self._forma = forma
+        self._tiene_cajones = tiene_cajones
+        self._num_cajones = num_cajones
+        self._largo = largo
+        self._tiene_iluminacion = tiene_iluminacion
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final del escritorio."""
         precio = self.precio_base
@@ -3,15 +3,43 @@ Clase concreta Sillón.
 Implementa un mueble de asiento para más de una persona, con brazos y respaldo.
 """
 
+from ..precio_cache import AtributoPrecio, PrecioCacheable, precio_memoizado
+
 # from ..categorias.asientos import Asiento
 
 
-class Sillon:
+class Sillon(PrecioCacheable):
     """
     Clase concreta que representa un sillón.
     Hereda de Asiento y añade características específicas.
     """
 
+    __slots__ = (
+        "_nombre",
+        "_material",
+        "_color",
+        "_precio_base",
+        "_capacidad_personas",
+        "_tiene_respaldo",
+        "_material_tapizado",
+        "_tiene_brazos",
+        "_es_reclinable",
+        "_tiene_reposapiés",
+        "_precio_cache",
+    )
+
+    # Asignarlos después del constructor invalida el precio cacheado
+    nombre = AtributoPrecio()
+    material = AtributoPrecio()
+    color = AtributoPrecio()
+    precio_base = AtributoPrecio()
+    capacidad_personas = AtributoPrecio()
+    tiene_respaldo = AtributoPrecio()
+    material_tapizado = AtributoPrecio()
+    tiene_brazos = AtributoPrecio()
+    es_reclinable = AtributoPrecio()
+    tiene_reposapiés = AtributoPrecio()
+
     def __init__(
         self,
         nombre: str,
@@ -25,17 +53,18 @@ class Sillon:
         es_reclinable: bool = False,
         tiene_reposapiés: bool = False,
     ):
-        self.nombre = nombre
-        self.material = material
-        self.color = color
-        self.precio_base = int(precio_base) if precio_base is not None else 0
-        self.capacidad_personas = capacidad_personas
-        self.tiene_respaldo = tiene_respaldo
-        self.material_tapizado = material_tapizado
-        self.tiene_brazos = tiene_brazos
-        self.es_reclinable = es_reclinable
-        self.tiene_reposapiés = tiene_reposapiés
+        self._nombre = nombre
+        self._material = material
+        self._color = color
+        self._precio_base = int(precio_base) if precio_base is not None else 0
+        self._capacidad_personas = capacidad_personas
+        self._tiene_respaldo = tiene_respaldo
+        self._material_tapizado = material_tapizado
+        self._tiene_brazos = tiene_brazos
+        self._es_reclinable = es_reclinable
+        self._tiene_reposapiés = tiene_reposapiés
 
+    @precio_memoizado
     def calcular_precio(self) -> int:
         """Calcula el precio final del sillón."""
         precio = self.precio_base
@@ -4,6 +4,7 @@ Implementa un mueble de asiento para varias personas, sin brazos reclinables.
 """
 
 from ..categorias.asientos import Asiento
+from ..precio_cache import precio_memoizado
 
 
 class Sofa(Asiento):
@@ -12,6 +13,8 @@ class Sofa(Asiento):
     Hereda de Asiento y añade características específicas.
     """
 
+    __slots__ = ("_tiene_brazos", "_es_modular", "_incluye_cojines")
+
     def __init__(
         self,
         nombre: str,
@@ -53,6 +56,7 @@ class Sofa(Asiento):
         """Getter para cojines."""
         return self._incluye_cojines
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """Calcula el precio final del sofá."""
         precio = self.precio_base
@@ -3,6 +3,7 @@ Clase SofaCama que implementa herencia múltiple.
 Esta clase hereda tanto de Sofa como de Cama.
 """
 
+from ..precio_cache import precio_memoizado
 from .cama import Cama
 from .sofa import Sofa
 
@@ -21,6 +22,17 @@ class SofaCama(Sofa, Cama):
     - Super(): Usa super() para resolver conflictos de herencia
     """
 
+    # Cama no puede tener slots propios (ver cama.py), así que los atributos de
+    # cama se declaran aquí: los slots de la subclase tienen prioridad y el
+    # __dict__ heredado de Cama nunca llega a crearse.
+    __slots__ = (
+        "_tamaño",
+        "_incluye_colchon",
+        "_tiene_cabecera",
+        "_mecanismo_conversion",
+        "_modo_actual",
+    )
+
     def __init__(
         self,
         nombre: str,
@@ -58,6 +70,7 @@ class SofaCama(Sofa, Cama):
         self._mecanismo_conversion = mecanismo_conversion
         self._modo_actual = "sofa"
 
+    @precio_memoizado
     def calcular_precio(self) -> float:
         """
         Calcula el precio final del sofá cama.
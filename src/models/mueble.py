@@ -5,8 +5,10 @@ Este es el punto de partida de nuestra jerarquía de clases.
 
 from abc import ABC, abstractmethod
 
+from .precio_cache import PrecioCacheable
 
-class Mueble(ABC):
+
+class Mueble(PrecioCacheable, ABC):
     """
     Clase abstracta base para todos los muebles.
 
@@ -16,8 +18,11 @@ class Mueble(ABC):
     Conceptos OOP aplicados:
     - Abstracción: Define una interfaz común sin implementación específica
     - Encapsulación: Usa atributos privados con getters/setters
+    - Memoización: El precio calculado se cachea y los setters lo invalidan
     """
 
+    __slots__ = ("_nombre", "_material", "_color", "_precio_base", "_precio_cache")
+
     def __init__(self, nombre: str, material: str, color: str, precio_base: float):
         """
         Constructor de la clase Mueble.
@@ -45,6 +50,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El nombre no puede estar vacío")
         self._nombre = value.strip()
+        self._modificado()
 
     @property
     def material(self) -> str:
@@ -57,6 +63,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El material no puede estar vacío")
         self._material = value.strip()
+        self._modificado()
 
     @property
     def color(self) -> str:
@@ -69,6 +76,7 @@ class Mueble(ABC):
         if not value or not value.strip():
             raise ValueError("El color no puede estar vacío")
         self._color = value.strip()
+        self._modificado()
 
     @property
     def precio_base(self) -> float:
@@ -81,6 +89,7 @@ class Mueble(ABC):
         if value < 0:
             raise ValueError("El precio base no puede ser negativo")
         self._precio_base = value
+        self._modificado()
 
     @abstractmethod
     def calcular_precio(self) -> float:
@@ -0,0 +1,176 @@
+"""
+Memoización del precio de los muebles.
+Provee un mixin y un decorador para cachear calcular_precio por instancia.
+"""
+
+import weakref
+from functools import wraps
+from typing import Callable, Dict, Iterator, List
+
+# Observadores de cambios por id de instancia (ver agregar_observador); vive
+# fuera de las instancias para no agregar un slot a cada mueble
+_observadores: Dict[int, List[Callable[[object], None]]] = {}
+# Referencia débil a cada instancia con observadores, para limpiar su entrada
+# cuando se libera y que otra instancia con el mismo id() no la herede
+_referencias: Dict[int, weakref.KeyedRef] = {}
+
+
+def _olvidar(referencia: weakref.KeyedRef) -> None:
+    """Descarta los observadores de una instancia que se liberó."""
+    _observadores.pop(referencia.key, None)
+    _referencias.pop(referencia.key, None)
+
+
+class PrecioCacheable:
+    """
+    Mixin que guarda el último precio calculado de cada instancia.
+
+    Los setters de los atributos (precio_base, material_tapizado, largo,
+    capacidad_personas, etc.) llaman a _modificado, que invalida el precio
+    cacheado y avisa a los observadores suscritos; las asignaciones del constructor
+    van directo a los slots y no pasan por aquí.
+
+    Los contadores de aciertos y fallos se llevan por clase concreta; consultarlos
+    desde una clase suma los de todas sus subclases.
+
+    Las instancias admiten referencias débiles (slot __weakref__), así las
+    tiendas pueden indexarlas sin mantenerlas vivas.
+    """
+
+    __slots__ = ("__weakref__",)
+
+    _aciertos_cache: int = 0
+    _fallos_cache: int = 0
+
+    def _modificado(self) -> None:
+        """Invalida el precio cacheado y notifica a los observadores del mueble."""
+        self._precio_cache = None
+        if _observadores:
+            for observador in tuple(_observadores.get(id(self), ())):
+                observador(self)
+
+    def agregar_observador(self, observador: Callable[[object], None]) -> None:
+        """
+        Registra una función que se llama cada vez que un setter modifica el mueble.
+
+        El registro se indexa por id() pero no mantiene viva la instancia: sus
+        observadores se descartan cuando se libera.
+
+        Args:
+            observador: Función que recibe el mueble modificado
+        """
+        clave = id(self)
+        observadores = _observadores.get(clave)
+        if observadores is None:
+            observadores = _observadores[clave] = []
+            _referencias[clave] = weakref.KeyedRef(self, _olvidar, clave)
+        observadores.append(observador)
+
+    def quitar_observador(self, observador: Callable[[object], None]) -> None:
+        """Quita un observador del mueble, si lo tenía."""
+        observadores = _observadores.get(id(self))
+        if observadores is None or observador not in observadores:
+            return
+        observadores.remove(observador)
+        if not observadores:
+            del _observadores[id(self)]
+            del _referencias[id(self)]
+
+    def invalidar_precio(self) -> None:
+        """Descarta el precio cacheado de esta instancia."""
+        self._precio_cache = None
+
+    @classmethod
+    def _jerarquia(cls) -> Iterator[type]:
+        """Recorre la clase y todas sus subclases."""
+        pendientes = [cls]
+        vistas = set()
+        while pendientes:
+            clase = pendientes.pop()
+            if clase in vistas:
+                continue
+            vistas.add(clase)
+            yield clase
+            pendientes.extend(clase.__subclasses__())
+
+    @classmethod
+    def obtener_estadisticas_cache(cls) -> Dict[str, int]:
+        """
+        Retorna los contadores de la caché de precios de la clase y sus subclases.
+
+        Returns:
+            Dict[str, int]: Aciertos y fallos acumulados
+        """
+        aciertos = fallos = 0
+        for clase in cls._jerarquia():
+            aciertos += clase.__dict__.get("_aciertos_cache", 0)
+            fallos += clase.__dict__.get("_fallos_cache", 0)
+        return {"aciertos": aciertos, "fallos": fallos}
+
+    @classmethod
+    def reiniciar_estadisticas_cache(cls) -> None:
+        """Pone en cero los contadores de la clase y sus subclases."""
+        for clase in cls._jerarquia():
+            if "_aciertos_cache" in clase.__dict__:
+                clase._aciertos_cache = 0
+            if "_fallos_cache" in clase.__dict__:
+                clase._fallos_cache = 0
+
+
+class AtributoPrecio:
+    """
+    Atributo público respaldado por un slot privado ("_" + nombre).
+
+    Lo usan las clases planas que no tienen propiedades propias: leer cuesta
+    lo mismo que un getattr del slot y asignar invalida el precio como lo hacen
+    los setters de Mueble.
+    """
+
+    __slots__ = ("_privado",)
+
+    def __set_name__(self, clase: type, nombre: str) -> None:
+        """Toma el nombre del slot a partir del nombre del atributo."""
+        self._privado = "_" + nombre
+
+    def __get__(self, instancia, clase=None):
+        """Retorna el valor del slot (o el descriptor si se lee desde la clase)."""
+        if instancia is None:
+            return self
+        return getattr(instancia, self._privado)
+
+    def __set__(self, instancia, valor) -> None:
+        """Asigna el slot e invalida el precio."""
+        setattr(instancia, self._privado, valor)
+        instancia._modificado()
+
+
+def precio_memoizado(metodo: Callable) -> Callable:
+    """
+    Decorador para calcular_precio que usa el precio cacheado de la instancia.
+
+    Solo cachea cuando el método decorado es el calcular_precio efectivo de la
+    clase de la instancia; las llamadas a través de super() (por ejemplo, desde
+    SofaCama hacia Sofa) se calculan siempre para no devolver el precio del hijo.
+
+    Args:
+        metodo: Implementación original de calcular_precio
+
+    Returns:
+        Callable: Método envuelto con memoización
+    """
+
+    @wraps(metodo)
+    def envoltura(self):
+        clase = type(self)
+        if clase.calcular_precio is not envoltura:
+            return metodo(self)
+        precio = getattr(self, "_precio_cache", None)
+        if precio is not None:
+            clase._aciertos_cache += 1
+            return precio
+        clase._fallos_cache += 1
+        precio = metodo(self)
+        self._precio_cache = precio
+        return precio
+
+    return envoltura
@@ -1,2 +1,302 @@
-# Catalogo
+"""
+Carga del catálogo desde archivos.
+Lee CSV y JSON Lines de forma perezosa con generadores y alimenta la tienda por lotes,
+de modo que la memoria usada no depende del tamaño del archivo.
+"""
 
+import csv
+import inspect
+import json
+import unicodedata
+from functools import lru_cache
+from itertools import islice
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from models.concretos.armario import Armario
+from models.concretos.cajonera import Cajonera
+from models.concretos.cama import Cama
+from models.concretos.escritorio import Escritorio
+from models.concretos.mesa import Mesa
+from models.concretos.silla import Silla
+from models.concretos.sillon import Sillon
+from models.concretos.sofa import Sofa
+from models.concretos.sofacama import SofaCama
+
+# Clases por valor normalizado de la columna "tipo"
+TIPOS_MUEBLE: Dict[str, type] = {
+    "silla": Silla,
+    "mesa": Mesa,
+    "sofa": Sofa,
+    "sofacama": SofaCama,
+    "armario": Armario,
+    "cajonera": Cajonera,
+    "cama": Cama,
+    "escritorio": Escritorio,
+    "sillon": Sillon,
+}
+
+_VERDADEROS = {"1", "true", "verdadero", "si", "sí", "s", "yes", "y"}
+_FALSOS = {"0", "false", "falso", "no", "n"}
+
+Fila = Tuple[int, Dict[str, object]]
+
+
+class ErrorCatalogo(ValueError):
+    """Error al interpretar una fila del catálogo."""
+
+
+@lru_cache(maxsize=256)
+def normalizar_tipo(tipo: str) -> str:
+    """
+    Normaliza el nombre de un tipo: minúsculas, sin tildes ni separadores.
+
+    Args:
+        tipo: Valor de la columna tipo (ej: "Sofá-Cama", "sillón")
+
+    Returns:
+        str: Clave normalizada (ej: "sofacama", "sillon")
+    """
+    sin_tildes = unicodedata.normalize("NFKD", tipo.strip().lower())
+    sin_tildes = "".join(c for c in sin_tildes if not unicodedata.combining(c))
+    return "".join(c for c in sin_tildes if c.isalnum())
+
+
+def _parametros(clase: type) -> Dict[str, inspect.Parameter]:
+    """Parámetros del constructor de la clase, sin self."""
+    parametros = dict(inspect.signature(clase.__init__).parameters)
+    parametros.pop("self", None)
+    return parametros
+
+
+# Se calcula una sola vez por clase
+_PARAMETROS = {clase: _parametros(clase) for clase in TIPOS_MUEBLE.values()}
+
+
+def _convertir(valor: object, anotacion: object, nombre: str) -> object:
+    """Convierte un valor textual al tipo anotado en el constructor."""
+    if not isinstance(valor, str):
+        return valor
+    texto = valor.strip()
+    if anotacion is bool:
+        if texto.lower() in _VERDADEROS:
+            return True
+        if texto.lower() in _FALSOS:
+            return False
+        raise ErrorCatalogo(f"Valor booleano inválido para '{nombre}': {valor!r}")
+    try:
+        if anotacion is int:
+            numero = float(texto)
+            if not numero.is_integer():
+                raise ValueError
+            return int(numero)
+        if anotacion is float:
+            return float(texto)
+    except ValueError:
+        raise ErrorCatalogo(f"Valor numérico inválido para '{nombre}': {valor!r}") from None
+    return texto
+
+
+def crear_mueble(registro: Dict[str, object]) -> object:
+    """
+    Construye el mueble concreto que describe un registro.
+
+    Las columnas vacías se omiten para usar el valor por defecto del constructor
+    y las columnas que no corresponden a la clase se ignoran.
+
+    Args:
+        registro: Diccionario con la columna "tipo" y los argumentos del constructor
+
+    Returns:
+        Mueble: Instancia de la clase indicada por "tipo"
+
+    Raises:
+        ErrorCatalogo: Si el tipo es desconocido o algún valor no es válido
+    """
+    tipo = registro.get("tipo")
+    if not isinstance(tipo, str) or not tipo.strip():
+        raise ErrorCatalogo("Falta la columna 'tipo'")
+    clase = TIPOS_MUEBLE.get(normalizar_tipo(tipo))
+    if clase is None:
+        raise ErrorCatalogo(f"Tipo de mueble desconocido: {tipo!r}")
+
+    argumentos = {}
+    for nombre, parametro in _PARAMETROS[clase].items():
+        valor = registro.get(nombre)
+        if valor is None or (isinstance(valor, str) and not valor.strip()):
+            if parametro.default is inspect.Parameter.empty:
+                raise ErrorCatalogo(f"Falta el valor obligatorio '{nombre}'")
+            continue
+        argumentos[nombre] = _convertir(valor, parametro.annotation, nombre)
+    try:
+        return clase(**argumentos)
+    except (TypeError, ValueError) as e:
+        raise ErrorCatalogo(str(e)) from e
+
+
+def registro_de(mueble: object) -> Dict[str, object]:
+    """
+    Operación inversa de crear_mueble: describe un mueble como registro.
+
+    Args:
+        mueble: Instancia de una de las clases de TIPOS_MUEBLE
+
+    Returns:
+        Dict: Columna "tipo" con el nombre de la clase y los argumentos del constructor
+
+    Raises:
+        ErrorCatalogo: Si la clase del mueble no está en TIPOS_MUEBLE
+    """
+    nombre_clase = type(mueble).__name__
+    clase = TIPOS_MUEBLE.get(normalizar_tipo(nombre_clase))
+    if clase is None:
+        raise ErrorCatalogo(f"Tipo de mueble desconocido: {nombre_clase!r}")
+    registro: Dict[str, object] = {"tipo": nombre_clase}
+    for nombre in _PARAMETROS[clase]:
+        registro[nombre] = getattr(mueble, nombre)
+    return registro
+
+
+def mueble_desde_registro(registro: Dict[str, object]) -> object:
+    """
+    Reconstruye un mueble a partir de un registro producido por registro_de.
+
+    A diferencia de crear_mueble, los valores se pasan tal cual (ya tienen su
+    tipo), de modo que los vacíos y None se conservan como se guardaron.
+
+    Args:
+        registro: Diccionario con "tipo" y los argumentos del constructor
+
+    Returns:
+        Mueble: Instancia equivalente a la original
+    """
+    argumentos = dict(registro)
+    clase = TIPOS_MUEBLE[normalizar_tipo(argumentos.pop("tipo"))]
+    return clase(**argumentos)
+
+
+def leer_csv(ruta: Union[str, Path]) -> Iterator[Fila]:
+    """
+    Lee un CSV fila por fila.
+
+    Args:
+        ruta: Ruta del archivo con encabezado
+
+    Yields:
+        Tuple: (número de línea, diccionario de la fila)
+    """
+    with open(ruta, newline="", encoding="utf-8") as archivo:
+        lector = csv.DictReader(archivo)
+        for fila in lector:
+            yield lector.line_num, fila
+
+
+def leer_jsonl(ruta: Union[str, Path]) -> Iterator[Fila]:
+    """
+    Lee un archivo JSON Lines objeto por objeto.
+    Las líneas vacías se saltan; las inválidas producen un registro vacío
+    para que se reporten como error en su línea.
+
+    Args:
+        ruta: Ruta del archivo
+
+    Yields:
+        Tuple: (número de línea, diccionario del objeto)
+    """
+    with open(ruta, encoding="utf-8") as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            if not linea.strip():
+                continue
+            try:
+                registro = json.loads(linea)
+            except json.JSONDecodeError:
+                registro = {"_error": "JSON inválido"}
+            if not isinstance(registro, dict):
+                registro = {"_error": "Se esperaba un objeto JSON"}
+            yield numero, registro
+
+
+def leer_catalogo(ruta: Union[str, Path], formato: Optional[str] = None) -> Iterator[Fila]:
+    """
+    Elige el lector según el formato o la extensión del archivo.
+
+    Args:
+        ruta: Ruta del archivo
+        formato: "csv" o "jsonl" (por defecto se deduce de la extensión)
+    """
+    formato = (formato or Path(ruta).suffix.lstrip(".")).lower()
+    if formato == "csv":
+        return leer_csv(ruta)
+    if formato in ("jsonl", "ndjson"):
+        return leer_jsonl(ruta)
+    raise ValueError(f"Formato de catálogo no soportado: {formato!r}")
+
+
+def muebles_desde_filas(
+    filas: Iterable[Fila], errores: List[Tuple[int, str]]
+) -> Iterator[Tuple[int, object]]:
+    """
+    Convierte filas en muebles de forma perezosa.
+
+    Args:
+        filas: Pares (línea, registro)
+        errores: Lista donde se agregan (línea, mensaje) de las filas inválidas
+
+    Yields:
+        Tuple: (línea, mueble)
+    """
+    for linea, registro in filas:
+        if "_error" in registro:
+            errores.append((linea, str(registro["_error"])))
+            continue
+        try:
+            yield linea, crear_mueble(registro)
+        except ErrorCatalogo as e:
+            errores.append((linea, str(e)))
+
+
+def cargar_catalogo(
+    tienda,
+    ruta: Union[str, Path],
+    formato: Optional[str] = None,
+    tamaño_lote: int = 10000,
+    max_errores: int = 100,
+) -> Dict:
+    """
+    Carga un archivo de catálogo en la tienda por lotes.
+
+    Solo se mantiene en memoria un lote a la vez; de los errores se guardan
+    como máximo max_errores (el total se cuenta siempre).
+
+    Args:
+        tienda: Instancia de TiendaMuebles
+        ruta: Ruta del archivo CSV o JSON Lines
+        formato: "csv" o "jsonl" (opcional)
+        tamaño_lote: Cantidad de muebles por llamada a agregar_muebles
+        max_errores: Máximo de errores detallados en el resumen
+
+    Returns:
+        Dict: Resumen con aceptados, rechazados y errores (línea, mensaje)
+    """
+    if tamaño_lote <= 0:
+        raise ValueError("El tamaño de lote debe ser mayor a 0")
+    resumen = {"aceptados": 0, "rechazados": 0, "errores": []}
+
+    def registrar(errores: Iterable[Tuple[int, str]]) -> None:
+        for error in errores:
+            resumen["rechazados"] += 1
+            if len(resumen["errores"]) < max_errores:
+                resumen["errores"].append(error)
+
+    errores_lectura: List[Tuple[int, str]] = []
+    muebles = muebles_desde_filas(leer_catalogo(ruta, formato), errores_lectura)
+    while True:
+        lote = list(islice(muebles, tamaño_lote))
+        registrar(errores_lectura)
+        errores_lectura.clear()
+        if not lote:
+            break
+        resultado = tienda.agregar_muebles(mueble for _, mueble in lote)
+        resumen["aceptados"] += resultado["aceptados"]
+        registrar((lote[posicion][0], mensaje) for posicion, mensaje in resultado["errores"])
+    return resumen
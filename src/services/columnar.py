@@ -0,0 +1,455 @@
+"""
+Motor columnar del inventario.
+Agrupa las filas por clase y guarda cada atributo que leen las reglas de precio
+(precio_base, capacidad_personas, tiene_respaldo, material_tapizado, largo...)
+en una columna tipada: arrays de enteros, reales o booleanos, y los textos
+codificados como índices a sus valores distintos. Los precios, los filtros y
+los agregados se calculan recorriendo esas columnas.
+"""
+
+from array import array
+from heapq import merge
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from services.indices import normalizar_texto
+from services.reglas_precio import MotorPrecios
+
+# Atributos que se guardan aunque las reglas no los lean (los usan los filtros)
+_ATRIBUTOS_FILTRO = ("material", "color")
+
+
+class ColumnaCodificada:
+    """
+    Columna de valores repetidos (textos, None) guardada como códigos enteros.
+
+    Cada valor distinto se guarda una vez; las funciones y los filtros se
+    evalúan una vez por valor distinto y se expanden con los códigos.
+    """
+
+    __slots__ = ("codigos", "valores", "_codigo_por_valor")
+
+    def __init__(self, valores: Iterable[object] = ()):
+        self.codigos = array("l")
+        self.valores: List[object] = []
+        # El tipo forma parte de la clave para no confundir True con 1
+        self._codigo_por_valor: Dict[Tuple[type, object], int] = {}
+        self.extend(valores)
+
+    def _codigo(self, valor: object) -> int:
+        clave = (type(valor), valor)
+        codigo = self._codigo_por_valor.get(clave)
+        if codigo is None:
+            codigo = self._codigo_por_valor[clave] = len(self.valores)
+            self.valores.append(valor)
+        return codigo
+
+    def __len__(self) -> int:
+        return len(self.codigos)
+
+    def __getitem__(self, fila: int) -> object:
+        return self.valores[self.codigos[fila]]
+
+    def __setitem__(self, fila: int, valor: object) -> None:
+        self.codigos[fila] = self._codigo(valor)
+
+    def __iter__(self):
+        valores = self.valores
+        return (valores[codigo] for codigo in self.codigos)
+
+    def append(self, valor: object) -> None:
+        self.codigos.append(self._codigo(valor))
+
+    def extend(self, valores: Iterable[object]) -> None:
+        self.codigos.extend(self._codigo(valor) for valor in valores)
+
+    def pop(self) -> object:
+        return self.valores[self.codigos.pop()]
+
+    def mapear(self, funcion: Callable[[object], object]) -> List[object]:
+        """Aplica la función una vez por valor distinto y la expande a cada fila."""
+        por_codigo = [funcion(valor) for valor in self.valores]
+        return [por_codigo[codigo] for codigo in self.codigos]
+
+    def filas_donde(self, condicion: Callable[[object], bool]) -> List[int]:
+        """Filas cuyo valor cumple la condición."""
+        elegidos = {codigo for codigo, valor in enumerate(self.valores) if condicion(valor)}
+        if not elegidos:
+            return []
+        if len(elegidos) == 1:
+            (unico,) = elegidos
+            return [fila for fila, codigo in enumerate(self.codigos) if codigo == unico]
+        return [fila for fila, codigo in enumerate(self.codigos) if codigo in elegidos]
+
+
+def crear_columna(valores: List[object]) -> Sequence:
+    """
+    Elige la representación de una columna según los tipos de sus valores.
+
+    Args:
+        valores: Valores de la columna, uno por fila
+
+    Returns:
+        Sequence: array("b") si son booleanos, array("q") si son enteros,
+            array("d") si son números, o ColumnaCodificada en otro caso
+    """
+    tipos = set(map(type, valores))
+    try:
+        if tipos <= {bool}:
+            return array("b", valores)
+        if tipos <= {int}:
+            return array("q", valores)
+        if tipos <= {int, float}:
+            return array("d", valores)
+    except OverflowError:
+        pass
+    return ColumnaCodificada(valores)
+
+
+def _filas_donde(columna: Sequence, condicion: Callable[[object], bool]) -> List[int]:
+    """Filas de una columna cuyo valor cumple la condición."""
+    if isinstance(columna, ColumnaCodificada):
+        return columna.filas_donde(condicion)
+    return [fila for fila, valor in enumerate(columna) if condicion(valor)]
+
+
+class _BloqueColumnar:
+    """
+    Filas de una sola clase de mueble, con una columna por atributo.
+    Las bajas intercambian la fila con la última para costar O(1).
+
+    El precio de cada fila se calcula al escribirla (alta, cambio del mueble
+    o cambio de reglas), siempre bajo el candado de escritura de la tienda,
+    así que las lecturas nunca modifican el bloque.
+    """
+
+    def __init__(self, clase: type, motor: MotorPrecios):
+        self.clase = clase
+        # Orden de alta de cada fila en todo el inventario
+        self.secuencias = array("q")
+        self.muebles: List[object] = []
+        self.precios = array("d")
+        self.columnas: Dict[str, Sequence] = {}
+        self._fila_por_id: Dict[int, int] = {}
+        self._programa = motor.programa(clase)
+
+    def __len__(self) -> int:
+        return len(self.muebles)
+
+    def _atributos(self) -> Tuple[str, ...]:
+        """Atributos guardados en columnas: los de los filtros y los de las reglas."""
+        leidos = self._programa.atributos if self._programa is not None else ()
+        return tuple(dict.fromkeys(_ATRIBUTOS_FILTRO + leidos))
+
+    def _valuar(self, columnas: Dict[str, Sequence], muebles: List[object]) -> List[float]:
+        """Precios de las filas dadas por sus columnas (o con calcular_precio sin reglas)."""
+        if self._programa is None:
+            return [mueble.calcular_precio() for mueble in muebles]
+        return self._programa.evaluar_columnas(columnas, len(muebles))
+
+    def _extender(self, atributo: str, valores: List[object]) -> None:
+        """Agrega valores al final de una columna, cambiando su tipo si no caben."""
+        columna = self.columnas.get(atributo)
+        if columna is None:
+            self.columnas[atributo] = crear_columna(valores)
+            return
+        filas = len(columna)
+        try:
+            columna.extend(valores)
+        except (TypeError, OverflowError):
+            self.columnas[atributo] = crear_columna(list(columna)[:filas] + valores)
+
+    def _escribir(self, atributo: str, fila: int, valor: object) -> None:
+        """Reemplaza un valor de una columna, cambiando su tipo si no cabe."""
+        columna = self.columnas[atributo]
+        try:
+            columna[fila] = valor
+        except (TypeError, OverflowError):
+            valores = list(columna)
+            valores[fila] = valor
+            self.columnas[atributo] = crear_columna(valores)
+
+    def agregar(self, muebles: List[object], secuencias: List[int]) -> None:
+        """Agrega filas al final del bloque valuándolas en un solo lote."""
+        nuevas = {
+            atributo: list(map(attrgetter(atributo), muebles)) for atributo in self._atributos()
+        }
+        for mueble in muebles:
+            self._fila_por_id[id(mueble)] = len(self.muebles)
+            self.muebles.append(mueble)
+        self.secuencias.extend(secuencias)
+        for atributo, valores in nuevas.items():
+            self._extender(atributo, valores)
+        self.precios.extend(self._valuar(nuevas, muebles))
+
+    def quitar(self, mueble: object) -> bool:
+        """Quita la fila del mueble moviendo la última a su lugar."""
+        fila = self._fila_por_id.pop(id(mueble), None)
+        if fila is None:
+            return False
+        ultima = len(self.muebles) - 1
+        columnas = (self.secuencias, self.precios, *self.columnas.values())
+        if fila != ultima:
+            movido = self.muebles[ultima]
+            self.muebles[fila] = movido
+            self._fila_por_id[id(movido)] = fila
+            for columna in columnas:
+                columna[fila] = columna[ultima]
+        self.muebles.pop()
+        for columna in columnas:
+            columna.pop()
+        return True
+
+    def actualizar(self, mueble: object) -> None:
+        """Vuelve a leer los atributos de un mueble modificado y su precio."""
+        fila = self._fila_por_id.get(id(mueble))
+        if fila is None:
+            return
+        fila_nueva = {}
+        for atributo in self._atributos():
+            valor = getattr(mueble, atributo)
+            self._escribir(atributo, fila, valor)
+            fila_nueva[atributo] = [valor]
+        self.precios[fila] = self._valuar(fila_nueva, [mueble])[0]
+
+    def revaluar(self, motor: MotorPrecios) -> None:
+        """Vuelve a valuar el bloque con las reglas vigentes, desde sus columnas."""
+        programa = motor.programa(self.clase)
+        if programa is not self._programa:
+            # Las reglas nuevas pueden leer otros atributos
+            anteriores = self.columnas
+            self._programa = programa
+            self.columnas = {}
+            for atributo in self._atributos():
+                if atributo in anteriores:
+                    self.columnas[atributo] = anteriores[atributo]
+                else:
+                    self._extender(atributo, list(map(attrgetter(atributo), self.muebles)))
+        self.precios = array("d", self._valuar(self.columnas, self.muebles))
+
+    def filas(
+        self,
+        material: Optional[str],
+        color: Optional[str],
+        precio_min: Optional[float],
+        precio_max: Optional[float],
+    ) -> Iterable[int]:
+        """Filas que cumplen los filtros, en orden de fila."""
+        filas: Optional[List[int]] = None
+        for atributo, valor in (("material", material), ("color", color)):
+            if valor is None:
+                continue
+            clave = normalizar_texto(valor)
+            if filas is None:
+                filas = _filas_donde(
+                    self.columnas[atributo], lambda v, clave=clave: normalizar_texto(v) == clave
+                )
+            else:
+                columna = self.columnas[atributo]
+                filas = [f for f in filas if normalizar_texto(columna[f]) == clave]
+        if precio_min is not None or precio_max is not None:
+            minimo = float("-inf") if precio_min is None else precio_min
+            maximo = float("inf") if precio_max is None else precio_max
+            precios = self.precios
+            if filas is None:
+                filas = [f for f, precio in enumerate(precios) if minimo <= precio <= maximo]
+            else:
+                filas = [f for f in filas if minimo <= precios[f] <= maximo]
+        return range(len(self.muebles)) if filas is None else filas
+
+
+class InventarioColumnar:
+    """
+    Motor de almacenamiento columnar para el inventario.
+
+    Cada clase concreta tiene su bloque de filas, con una columna tipada por
+    cada atributo que leen sus reglas de precio más material y color. Los
+    precios de un bloque se calculan con el motor de reglas sobre esas
+    columnas: cada término recorre su columna una vez (las columnas de texto,
+    una vez por valor distinto). Las clases sin reglas, o que redefinen
+    calcular_precio, se valúan con su calcular_precio.
+
+    Los precios se calculan al escribir: en cada alta, cuando la tienda avisa
+    que un mueble cambió (actualizar) o cambió las reglas (revaluar). Así las
+    consultas (filtrar, valor_total, conteo_por_tipo) solo leen columnas y
+    pueden correr sin candados.
+
+    Conceptos aplicados:
+    - Encapsulación: La tienda no conoce la representación de las columnas
+    - Polimorfismo: Cada bloque usa el programa de reglas de su clase
+    """
+
+    def __init__(self, motor_precios: Optional[MotorPrecios] = None):
+        """
+        Constructor del motor vacío.
+
+        Args:
+            motor_precios: Reglas con las que se valúan las filas (por defecto
+                las predeterminadas, que reproducen calcular_precio)
+        """
+        self._motor = motor_precios if motor_precios is not None else MotorPrecios()
+        self._bloques: Dict[type, _BloqueColumnar] = {}
+        self._bloque_por_id: Dict[int, type] = {}
+        self._secuencia = 0
+
+    def __len__(self) -> int:
+        """Cantidad total de filas."""
+        return len(self._bloque_por_id)
+
+    def __contains__(self, mueble: object) -> bool:
+        """Pertenencia por identidad."""
+        return id(mueble) in self._bloque_por_id
+
+    def agregar(self, mueble: object) -> bool:
+        """
+        Agrega un mueble al motor y calcula su precio.
+
+        Args:
+            mueble: Mueble a agregar
+
+        Returns:
+            bool: False si ya estaba
+        """
+        return self.agregar_lote([mueble]) == 1
+
+    def agregar_lote(self, muebles: Iterable[object]) -> int:
+        """
+        Agrega varios muebles valuando cada clase del lote en una sola pasada.
+
+        Args:
+            muebles: Muebles a agregar (los que ya estaban se ignoran)
+
+        Returns:
+            int: Cantidad de muebles agregados
+        """
+        por_clase: Dict[type, Tuple[List[object], List[int]]] = {}
+        agregados = 0
+        for mueble in muebles:
+            if id(mueble) in self._bloque_por_id:
+                continue
+            self._bloque_por_id[id(mueble)] = type(mueble)
+            nuevos, secuencias = por_clase.setdefault(type(mueble), ([], []))
+            nuevos.append(mueble)
+            secuencias.append(self._secuencia)
+            self._secuencia += 1
+            agregados += 1
+        for clase, (nuevos, secuencias) in por_clase.items():
+            bloque = self._bloques.get(clase)
+            if bloque is None:
+                bloque = self._bloques[clase] = _BloqueColumnar(clase, self._motor)
+            bloque.agregar(nuevos, secuencias)
+        return agregados
+
+    def quitar(self, mueble: object) -> bool:
+        """
+        Quita un mueble del motor.
+
+        Returns:
+            bool: False si no estaba
+        """
+        clase = self._bloque_por_id.pop(id(mueble), None)
+        if clase is None:
+            return False
+        return self._bloques[clase].quitar(mueble)
+
+    def actualizar(self, mueble: object) -> None:
+        """
+        Reescribe la fila de un mueble cuyos atributos cambiaron y su precio.
+
+        Args:
+            mueble: Mueble ya agregado
+        """
+        clase = self._bloque_por_id.get(id(mueble))
+        if clase is not None:
+            self._bloques[clase].actualizar(mueble)
+
+    def revaluar(self) -> None:
+        """Vuelve a valuar todas las filas, por ejemplo después de cambiar las reglas."""
+        for bloque in self._bloques.values():
+            bloque.revaluar(self._motor)
+
+    def columna(self, clase: type, atributo: str) -> List[object]:
+        """
+        Valores de un atributo para todas las filas de una clase.
+
+        Args:
+            clase: Clase concreta
+            atributo: Atributo guardado en columna (material, color o uno de sus reglas)
+
+        Returns:
+            List[object]: Valores en orden de fila (vacía si la clase no tiene filas)
+        """
+        bloque = self._bloques.get(clase)
+        if bloque is None or atributo not in bloque.columnas:
+            return []
+        return list(bloque.columnas[atributo])
+
+    def calcular_precios(self) -> Tuple[List[object], List[float]]:
+        """
+        Retorna los precios de todo el inventario, un bloque por clase.
+
+        Returns:
+            Tuple: Lista de muebles y lista paralela de precios
+        """
+        muebles: List[object] = []
+        precios: List[float] = []
+        for bloque in self._bloques.values():
+            muebles.extend(bloque.muebles)
+            precios.extend(bloque.precios)
+        return muebles, precios
+
+    def valor_total(self) -> float:
+        """Suma de las columnas de precios; no modifica el motor."""
+        return sum(sum(bloque.precios) for bloque in self._bloques.values())
+
+    def conteo_por_tipo(self) -> Dict[str, int]:
+        """
+        Cantidad de filas por nombre de clase (el largo de cada bloque).
+
+        Returns:
+            Dict[str, int]: Conteo de las clases con filas
+        """
+        conteo: Dict[str, int] = {}
+        for clase, bloque in self._bloques.items():
+            if bloque.muebles:
+                conteo[clase.__name__] = conteo.get(clase.__name__, 0) + len(bloque)
+        return conteo
+
+    def filtrar(
+        self,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+        por_precio: bool = False,
+    ) -> List[object]:
+        """
+        Muebles que cumplen todos los filtros dados.
+
+        Cada bloque se incluye o descarta completo según su clase; dentro de
+        él, material y color se comparan una vez por valor distinto de su
+        columna y el rango de precios se aplica sobre la columna de precios.
+
+        Args:
+            tipo: Clase (concreta o de categoría) de los muebles
+            material: Material (sin distinguir mayúsculas ni espacios extremos)
+            color: Color (ídem)
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            por_precio: Ordenar de menor a mayor precio en lugar de por orden de alta
+
+        Returns:
+            List[object]: Muebles en orden de alta (o de precio)
+        """
+        clave = itemgetter(0, 1) if por_precio else itemgetter(1)
+        porciones = []
+        for clase, bloque in self._bloques.items():
+            if not bloque.muebles or (tipo is not None and not issubclass(clase, tipo)):
+                continue
+            filas = bloque.filas(material, color, precio_min, precio_max)
+            precios, secuencias, muebles = bloque.precios, bloque.secuencias, bloque.muebles
+            porcion = [(precios[f], secuencias[f], muebles[f]) for f in filas]
+            porcion.sort(key=clave)
+            porciones.append(porcion)
+        return [mueble for _, _, mueble in merge(*porciones, key=clave)]
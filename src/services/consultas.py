@@ -0,0 +1,205 @@
+"""
+Planificador de consultas compuestas.
+Elige el índice más selectivo para obtener los candidatos y evalúa el resto
+de las condiciones solo sobre ellos.
+"""
+
+from bisect import bisect_right
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class Predicado:
+    """
+    Condición de una consulta junto con las formas de resolverla.
+
+    Cada predicado sabe estimar cuántos muebles devolvería su índice, obtener
+    esos muebles (acceso) y comprobar la condición sobre un mueble suelto
+    (filtro residual).
+    """
+
+    __slots__ = ("campo", "descripcion", "estimacion", "_obtener", "_cumple", "ordenado")
+
+    def __init__(
+        self,
+        campo: str,
+        descripcion: str,
+        estimacion: int,
+        obtener: Callable[[], List[object]],
+        cumple: Callable[[object], bool],
+        ordenado: bool = True,
+    ):
+        """
+        Constructor del predicado.
+
+        Args:
+            campo: Atributo consultado (nombre, tipo, material, color, precio)
+            descripcion: Texto de la condición para la explicación del plan
+            estimacion: Muebles que devolvería el acceso por índice
+            obtener: Función que devuelve los candidatos usando el índice
+            cumple: Función que comprueba la condición sobre un mueble
+            ordenado: Si el acceso devuelve los muebles en orden de inserción
+        """
+        self.campo = campo
+        self.descripcion = descripcion
+        self.estimacion = estimacion
+        self._obtener = obtener
+        self._cumple = cumple
+        self.ordenado = ordenado
+
+    def obtener(self) -> List[object]:
+        """Candidatos que cumplen el predicado, leídos del índice."""
+        return self._obtener()
+
+    def cumple(self, mueble: object) -> bool:
+        """Comprueba el predicado sobre un mueble."""
+        return self._cumple(mueble)
+
+
+class PlanConsulta:
+    """
+    Plan elegido para una consulta: un acceso y los filtros residuales.
+
+    Sin predicados el acceso es el recorrido completo del inventario. Los
+    filtros se aplican del más al menos selectivo, para descartar antes.
+    """
+
+    def __init__(self, acceso: Optional[Predicado], filtros: List[Predicado], total: int):
+        """
+        Constructor del plan.
+
+        Args:
+            acceso: Predicado cuyo índice da los candidatos (None: recorrido completo)
+            filtros: Predicados a evaluar sobre los candidatos, en orden
+            total: Muebles en el inventario al planificar
+        """
+        self.acceso = acceso
+        self.filtros = filtros
+        self.total = total
+
+    @property
+    def costo(self) -> int:
+        """Costo estimado: candidatos por comprobaciones a hacer sobre cada uno."""
+        candidatos = self.total if self.acceso is None else self.acceso.estimacion
+        return candidatos * (1 + len(self.filtros))
+
+    def ejecutar(
+        self, listar: Callable[[], List[object]], orden: Callable[[object], int]
+    ) -> List[object]:
+        """
+        Ejecuta el plan.
+
+        Args:
+            listar: Función que devuelve todo el inventario (recorrido completo)
+            orden: Clave de orden de inserción, para accesos que devuelven otro orden
+
+        Returns:
+            List: Muebles que cumplen todos los predicados, en orden de inserción
+        """
+        if self.acceso is None:
+            return listar()
+        candidatos = self.acceso.obtener()
+        for predicado in self.filtros:
+            if not candidatos:
+                break
+            candidatos = [mueble for mueble in candidatos if predicado.cumple(mueble)]
+        if not self.acceso.ordenado:
+            candidatos.sort(key=orden)
+        return candidatos
+
+    def pagina(
+        self,
+        desde: Callable[[int], Iterator[Tuple[int, object]]],
+        orden: Callable[[object], int],
+        despues_de: int,
+        limite: int,
+    ) -> List[object]:
+        """
+        Ejecuta el plan solo hasta completar una página.
+
+        Los candidatos se retoman después de la secuencia del cursor (búsqueda
+        binaria sobre la lista del índice, o Inventario.desde en el recorrido
+        completo) y los filtros se evalúan hasta reunir limite muebles.
+
+        Args:
+            desde: Recorrido del inventario a partir de una secuencia
+            orden: Secuencia de inserción de un mueble
+            despues_de: Secuencia del último mueble de la página anterior (-1 al inicio)
+            limite: Tamaño máximo de la página
+
+        Returns:
+            List: Hasta limite muebles, en orden de inserción
+        """
+        if self.acceso is None:
+            fuente: Iterable[object] = (mueble for _, mueble in desde(despues_de))
+        else:
+            candidatos = self.acceso.obtener()
+            if not self.acceso.ordenado:
+                candidatos.sort(key=orden)
+            fuente = islice(candidatos, bisect_right(candidatos, despues_de, key=orden), None)
+        filtros = [predicado.cumple for predicado in self.filtros]
+        resultados: List[object] = []
+        for mueble in fuente:
+            if all(cumple(mueble) for cumple in filtros):
+                resultados.append(mueble)
+                if len(resultados) >= limite:
+                    break
+        return resultados
+
+    def como_dict(self) -> Dict:
+        """Representación del plan como diccionario (útil para la UI o JSON)."""
+        return {
+            "acceso": (
+                "recorrido completo"
+                if self.acceso is None
+                else f"índice {self.acceso.campo}: {self.acceso.descripcion}"
+            ),
+            "estimacion": self.total if self.acceso is None else self.acceso.estimacion,
+            "filtros": [
+                {"campo": p.campo, "condicion": p.descripcion, "estimacion": p.estimacion}
+                for p in self.filtros
+            ],
+            "costo": self.costo,
+        }
+
+    def __str__(self) -> str:
+        """Explicación legible del plan, una línea por paso."""
+        if self.acceso is None:
+            lineas = [f"RECORRIDO COMPLETO ({self.total} muebles)"]
+        else:
+            lineas = [
+                f"ACCESO índice {self.acceso.campo} [{self.acceso.descripcion}] "
+                f"~{self.acceso.estimacion} de {self.total} muebles"
+            ]
+        for predicado in self.filtros:
+            lineas.append(
+                f"  FILTRO {predicado.campo} [{predicado.descripcion}] "
+                f"(el índice daría ~{predicado.estimacion})"
+            )
+        if self.acceso is not None and not self.acceso.ordenado:
+            lineas.append("  ORDENAR por inserción")
+        lineas.append(f"Costo estimado: {self.costo}")
+        return "\n".join(lineas)
+
+
+def planificar(predicados: List[Predicado], total: int) -> PlanConsulta:
+    """
+    Elige el plan de menor costo para una conjunción de predicados.
+
+    El acceso es el predicado con menos candidatos estimados; los demás pasan
+    a ser filtros ordenados por selectividad. Como los índices de material,
+    color, precio y tipo dan conteos exactos, la estimación solo es una cota
+    para el nombre (lista de trigramas más corta).
+
+    Args:
+        predicados: Condiciones de la consulta (todas deben cumplirse)
+        total: Cantidad de muebles en el inventario
+
+    Returns:
+        PlanConsulta: Plan a ejecutar o explicar
+    """
+    if not predicados:
+        return PlanConsulta(None, [], total)
+    # sorted es estable: ante estimaciones iguales se respeta el orden recibido
+    ordenados = sorted(predicados, key=lambda predicado: predicado.estimacion)
+    return PlanConsulta(ordenados[0], ordenados[1:], total)
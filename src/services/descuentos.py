@@ -0,0 +1,216 @@
+"""
+Descuentos por categoría con herencia.
+Un descuento puede apuntar a una clase concreta (Sofa) o a una categoría
+(Asiento, Superficie, Almacenamiento, Mueble) y lo heredan todas sus
+subclases siguiendo el MRO.
+"""
+
+from functools import lru_cache
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from models.categorias.almacenamiento import Almacenamiento
+from models.categorias.asientos import Asiento
+from models.categorias.superficies import Superficie
+from models.mueble import Mueble
+
+# Categorías a las que se puede aplicar un descuento, además de los tipos concretos
+CATEGORIAS_DESCUENTO: Tuple[type, ...] = (Asiento, Superficie, Almacenamiento, Mueble)
+
+# Clases que no heredan de su categoría (se implementan con __slots__ sobre
+# PrecioCacheable) pero cuyos descuentos deben seguirla
+CATEGORIAS_DECLARADAS: Dict[str, type] = {
+    "Sillon": Asiento,
+    "Escritorio": Superficie,
+    "Armario": Almacenamiento,
+    "Cajonera": Almacenamiento,
+}
+
+
+@lru_cache(maxsize=None)
+def _clases() -> Dict[str, type]:
+    """
+    Clase por nombre normalizado ("sofacama" -> SofaCama, "asiento" -> Asiento).
+    El catálogo se importa recién aquí: abrir una tienda no carga las clases concretas.
+    """
+    from services.catalogo import TIPOS_MUEBLE, normalizar_tipo
+
+    return {
+        normalizar_tipo(clase.__name__): clase
+        for clase in (*TIPOS_MUEBLE.values(), *CATEGORIAS_DESCUENTO)
+    }
+
+
+def resolver_categoria(categoria: str) -> Optional[str]:
+    """
+    Nombre de clase al que apunta una categoría escrita por el usuario.
+
+    Acepta mayúsculas, tildes, separadores y plurales en español
+    ("Sofás", "escritorios", "sillones", "sofá-camas", "asientos").
+
+    Args:
+        categoria: Categoría tal como la escribió el usuario
+
+    Returns:
+        Optional[str]: Nombre de la clase (ej: "Sofa", "Asiento") o None si no existe
+    """
+    from services.catalogo import normalizar_tipo
+
+    clave = normalizar_tipo(categoria)
+    candidatas = [clave]
+    if clave.endswith("s"):
+        candidatas.append(clave[:-1])
+    if clave.endswith("es"):
+        candidatas.append(clave[:-2])
+    for candidata in candidatas:
+        clase = _clases().get(candidata)
+        if clase is not None:
+            return clase.__name__
+    return None
+
+
+def linaje(clase: type) -> List[str]:
+    """
+    Nombres de las clases de las que una clase hereda descuentos, de la más
+    a la menos específica.
+
+    Es el MRO de la clase seguido del MRO de las categorías declaradas en
+    CATEGORIAS_DECLARADAS para ella o sus bases.
+
+    Args:
+        clase: Clase concreta del mueble
+
+    Returns:
+        List[str]: Nombres sin repetir (ej: SofaCama, Sofa, Asiento, Cama, Mueble, ...)
+    """
+    nombres = [base.__name__ for base in clase.__mro__]
+    for nombre in list(nombres):
+        categoria = CATEGORIAS_DECLARADAS.get(nombre)
+        if categoria is not None:
+            nombres.extend(base.__name__ for base in categoria.__mro__)
+    return list(dict.fromkeys(nombres))
+
+
+class TablaDescuentos:
+    """
+    Descuentos activos y tasa efectiva precalculada por clase concreta.
+
+    La tasa de una clase es la del descuento más cercano en su linaje: uno
+    aplicado a la propia clase gana sobre el de su categoría, y en herencia
+    múltiple manda el orden del MRO (SofaCama toma el de Sofa y, si Sofa y
+    Asiento no tienen, el de Cama). Cada cambio recompila la tabla completa,
+    de modo que una venta solo hace una búsqueda en un diccionario.
+
+    La tabla se indexa por nombre de clase, que es también lo que guarda la
+    base SQLite en la columna tipo.
+
+    Conceptos aplicados:
+    - Herencia: Los descuentos siguen la jerarquía de clases de los muebles
+    - Encapsulación: La resolución de nombres y la tabla compilada quedan ocultas
+    """
+
+    def __init__(self, descuentos: Optional[Mapping[str, float]] = None):
+        """
+        Constructor de la tabla.
+
+        Args:
+            descuentos: Tasas iniciales por categoría (ej: {"Silla": 0.1})
+        """
+        self._activos: Dict[str, float] = {}
+        self._linajes: Dict[str, List[str]] = {}
+        self._tasas: Dict[str, float] = {}
+        self.cargar(descuentos or {})
+
+    @property
+    def activos(self) -> Dict[str, float]:
+        """Tasas aplicadas por categoría (nombres de clase, sin heredar)."""
+        return self._activos
+
+    def aplicar(self, categoria: str, tasa: float) -> Optional[str]:
+        """
+        Activa (o reemplaza) el descuento de una categoría.
+
+        Args:
+            categoria: Categoría escrita por el usuario ("sofás", "Asiento")
+            tasa: Fracción a descontar (0.1 = 10%)
+
+        Returns:
+            Optional[str]: Nombre de la clase afectada o None si la categoría no existe
+        """
+        nombre = resolver_categoria(categoria)
+        if nombre is not None:
+            self._activos[nombre] = tasa
+            self._compilar()
+        return nombre
+
+    def cargar(self, descuentos: Mapping[str, float]) -> None:
+        """
+        Activa varios descuentos guardados (snapshot o base de datos).
+        Las categorías que ya no existen se ignoran.
+
+        Args:
+            descuentos: Tasas por categoría
+        """
+        for categoria, tasa in descuentos.items():
+            nombre = resolver_categoria(categoria)
+            if nombre is not None:
+                self._activos[nombre] = float(tasa)
+        self._compilar()
+
+    def _compilar(self) -> None:
+        """
+        Recalcula la tasa efectiva de cada clase conocida.
+        Sin descuentos activos la tabla queda vacía (todas las tasas son 0) y
+        no hace falta cargar el catálogo.
+        """
+        if not self._activos:
+            self._tasas = {}
+            return
+        from services.catalogo import TIPOS_MUEBLE
+
+        for clase in TIPOS_MUEBLE.values():
+            if clase.__name__ not in self._linajes:
+                self._linajes[clase.__name__] = linaje(clase)
+        self._tasas = {
+            nombre: self._resolver(nombres) for nombre, nombres in list(self._linajes.items())
+        }
+
+    def _resolver(self, nombres: Iterable[str]) -> float:
+        """Tasa del descuento más cercano en el linaje (0 si no hay)."""
+        for nombre in nombres:
+            tasa = self._activos.get(nombre)
+            if tasa is not None:
+                return tasa
+        return 0.0
+
+    def tasa(self, clase: type) -> float:
+        """
+        Tasa efectiva para una clase de mueble.
+
+        Args:
+            clase: Clase concreta del mueble
+
+        Returns:
+            float: Fracción a descontar
+        """
+        tasa = self._tasas.get(clase.__name__)
+        if tasa is None:
+            # Clase no registrada en el catálogo: se resuelve y se agrega a la tabla
+            self._linajes[clase.__name__] = linaje(clase)
+            tasa = self._tasas[clase.__name__] = self._resolver(self._linajes[clase.__name__])
+        return tasa
+
+    def tasa_por_nombre(self, nombre: str) -> float:
+        """
+        Tasa efectiva para un nombre de clase (columna tipo de la base).
+
+        Args:
+            nombre: Nombre de la clase concreta
+
+        Returns:
+            float: Fracción a descontar (0 si la clase no se conoce)
+        """
+        return self._tasas.get(nombre, 0.0)
+
+    def tabla(self) -> Dict[str, float]:
+        """Copia de la tabla compilada: tasa efectiva por clase concreta (vacía sin descuentos)."""
+        return dict(self._tasas)
@@ -0,0 +1,198 @@
+"""
+Diario de ventas en disco.
+Registra cada venta en un archivo de solo anexado (JSON Lines) para poder
+reconstruir el estado de la tienda después de una caída.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Union
+
+
+class DiarioVentas:
+    """
+    Archivo de solo anexado con una venta por línea.
+
+    Cada registro se escribe y se vacía al sistema operativo de inmediato, de
+    modo que una caída del proceso no pierde ventas. El fsync, que es la parte
+    costosa, se agrupa (group commit): se hace cuando se acumulan tamaño_grupo
+    registros o, a más tardar, intervalo_fsync segundos después del último; un
+    hilo sincronizador se encarga del fsync de la cola de una ráfaga aunque no
+    llegue ninguna escritura más.
+
+    La durabilidad ante una caída del sistema operativo o un corte de energía
+    es diferida: registrar() vuelve antes del fsync, así que se pueden perder
+    las ventas de los últimos intervalo_fsync segundos. Quien necesite esperar
+    a que un registro sea durable puede llamar a sincronizar().
+
+    Una línea final incompleta (escritura interrumpida) se descarta al abrir.
+
+    Conceptos aplicados:
+    - Encapsulación: El formato y la política de sincronización quedan ocultos
+    - Responsabilidad única: La tienda delega aquí la persistencia de ventas
+    """
+
+    def __init__(
+        self,
+        ruta: Union[str, Path],
+        tamaño_grupo: int = 32,
+        intervalo_fsync: float = 0.05,
+    ):
+        """
+        Abre (o crea) el diario para anexar.
+
+        Args:
+            ruta: Archivo del diario
+            tamaño_grupo: Registros pendientes que fuerzan un fsync
+            intervalo_fsync: Segundos máximos entre fsync con registros pendientes
+        """
+        if tamaño_grupo <= 0:
+            raise ValueError("El tamaño de grupo debe ser mayor a 0")
+        self._ruta = Path(ruta)
+        self._tamaño_grupo = tamaño_grupo
+        self._intervalo_fsync = intervalo_fsync
+        self._candado = threading.Lock()
+        self._hay_pendientes = threading.Condition(self._candado)
+        self._pendientes = 0
+        self._ultimo_fsync = time.monotonic()
+        self._descartar_cola_incompleta()
+        self._archivo = open(self._ruta, "a", encoding="utf-8")
+        self._sincronizador = threading.Thread(
+            target=self._sincronizar_periodicamente, name="diario-fsync", daemon=True
+        )
+        self._sincronizador.start()
+
+    @property
+    def ruta(self) -> Path:
+        """Ruta del archivo del diario."""
+        return self._ruta
+
+    @property
+    def pendientes(self) -> int:
+        """Registros escritos que aún no pasaron por fsync."""
+        return self._pendientes
+
+    def _descartar_cola_incompleta(self) -> None:
+        """Trunca la última línea si quedó sin terminar por una caída."""
+        if not self._ruta.exists():
+            return
+        with open(self._ruta, "rb+") as archivo:
+            tamaño = archivo.seek(0, os.SEEK_END)
+            if tamaño == 0:
+                return
+            archivo.seek(-1, os.SEEK_END)
+            if archivo.read(1) == b"\n":
+                return
+            # Retroceder por bloques hasta el último salto de línea
+            posicion = tamaño
+            while posicion > 0:
+                inicio = max(0, posicion - 4096)
+                archivo.seek(inicio)
+                bloque = archivo.read(posicion - inicio)
+                salto = bloque.rfind(b"\n")
+                if salto >= 0:
+                    archivo.truncate(inicio + salto + 1)
+                    return
+                posicion = inicio
+            archivo.truncate(0)
+
+    def registrar(self, evento: Dict) -> None:
+        """
+        Anexa un evento al diario.
+
+        Args:
+            evento: Diccionario serializable a JSON
+        """
+        self._anexar(json.dumps(evento, ensure_ascii=False) + "\n", 1)
+
+    def registrar_lote(self, eventos: Iterable[Dict]) -> None:
+        """
+        Anexa varios eventos con una sola escritura.
+
+        Args:
+            eventos: Diccionarios serializables a JSON
+        """
+        lineas = [json.dumps(evento, ensure_ascii=False) + "\n" for evento in eventos]
+        if lineas:
+            self._anexar("".join(lineas), len(lineas))
+
+    def _anexar(self, texto: str, cantidad: int) -> None:
+        """Escribe registros ya serializados y aplica la política de fsync."""
+        with self._candado:
+            self._archivo.write(texto)
+            self._archivo.flush()
+            self._pendientes += cantidad
+            if (
+                self._pendientes >= self._tamaño_grupo
+                or time.monotonic() - self._ultimo_fsync >= self._intervalo_fsync
+            ):
+                self._sincronizar()
+            else:
+                self._hay_pendientes.notify()
+
+    def _sincronizar_periodicamente(self) -> None:
+        """Hilo sincronizador: fsync de los pendientes al vencer intervalo_fsync."""
+        with self._candado:
+            while not self._archivo.closed:
+                if not self._pendientes:
+                    self._hay_pendientes.wait()
+                    continue
+                restante = self._ultimo_fsync + self._intervalo_fsync - time.monotonic()
+                if restante > 0:
+                    self._hay_pendientes.wait(restante)
+                    continue
+                self._sincronizar()
+
+    def _sincronizar(self) -> None:
+        """fsync de los registros pendientes (requiere el candado)."""
+        if self._pendientes:
+            os.fsync(self._archivo.fileno())
+            self._pendientes = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def sincronizar(self) -> None:
+        """Fuerza el fsync de los registros pendientes."""
+        with self._candado:
+            self._sincronizar()
+
+    def cerrar(self) -> None:
+        """Sincroniza, cierra el archivo y detiene el hilo sincronizador."""
+        with self._candado:
+            if self._archivo.closed:
+                return
+            self._sincronizar()
+            self._archivo.close()
+            self._hay_pendientes.notify()
+        self._sincronizador.join()
+
+    def __enter__(self) -> "DiarioVentas":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    @staticmethod
+    def leer(ruta: Union[str, Path]) -> Iterator[Dict]:
+        """
+        Recorre los eventos del diario en orden.
+        Las líneas inválidas (por ejemplo, una cola incompleta) se saltan.
+
+        Args:
+            ruta: Archivo del diario
+
+        Yields:
+            Dict: Cada evento registrado
+        """
+        if not Path(ruta).exists():
+            return
+        with open(ruta, encoding="utf-8") as archivo:
+            for linea in archivo:
+                try:
+                    evento = json.loads(linea)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(evento, dict):
+                    yield evento
@@ -0,0 +1,186 @@
+"""
+Estadísticas acumuladas de la tienda.
+Se actualizan en cada alta, venta y cambio de precio o de descuentos, así consultarlas cuesta O(1).
+"""
+
+from collections import Counter
+from typing import Dict, Iterable, Tuple
+
+
+class EstadisticasInventario:
+    """
+    Agregado que lleva las estadísticas de la tienda al día de forma incremental.
+
+    El valor del inventario se acumula en centavos enteros para que las altas
+    y bajas sucesivas no acumulen error de redondeo de punto flotante.
+
+    Conceptos aplicados:
+    - Encapsulación: Los contadores solo cambian a través de los métodos registrar_*
+    - Responsabilidad única: La tienda delega aquí el cálculo de estadísticas
+    """
+
+    def __init__(self):
+        """Constructor con todos los contadores en cero."""
+        self._total_muebles = 0
+        self._valor_centavos = 0
+        self._tipos_muebles: Dict[str, int] = {}
+        self._descuentos_activos: Dict[str, float] = {}
+        self._ventas_realizadas = 0
+        self._total_muebles_vendidos = 0
+        self._valor_total_ventas = 0.0
+
+    @staticmethod
+    def _a_centavos(precio: float) -> int:
+        """Convierte un precio a centavos enteros."""
+        return int(round(precio * 100))
+
+    def registrar_alta(self, mueble: object, precio: float) -> None:
+        """
+        Registra un mueble que entra al inventario.
+
+        Args:
+            mueble: Mueble agregado
+            precio: Precio con el que se agregó
+        """
+        tipo = type(mueble).__name__
+        self._total_muebles += 1
+        self._valor_centavos += self._a_centavos(precio)
+        self._tipos_muebles[tipo] = self._tipos_muebles.get(tipo, 0) + 1
+
+    def registrar_altas(self, muebles_precios: Iterable[Tuple[object, float]]) -> None:
+        """
+        Registra un lote de altas actualizando los contadores una sola vez.
+
+        Args:
+            muebles_precios: Pares (mueble, precio)
+        """
+        cantidad = 0
+        centavos = 0
+        tipos: Counter = Counter()
+        for mueble, precio in muebles_precios:
+            cantidad += 1
+            centavos += self._a_centavos(precio)
+            tipos[type(mueble).__name__] += 1
+        self._total_muebles += cantidad
+        self._valor_centavos += centavos
+        for tipo, conteo in tipos.items():
+            self._tipos_muebles[tipo] = self._tipos_muebles.get(tipo, 0) + conteo
+
+    def registrar_baja(self, mueble: object, precio: float) -> None:
+        """
+        Registra un mueble que sale del inventario.
+
+        Args:
+            mueble: Mueble retirado
+            precio: Precio con el que se había agregado
+        """
+        tipo = type(mueble).__name__
+        self._total_muebles -= 1
+        self._valor_centavos -= self._a_centavos(precio)
+        restantes = self._tipos_muebles.get(tipo, 0) - 1
+        if restantes > 0:
+            self._tipos_muebles[tipo] = restantes
+        else:
+            self._tipos_muebles.pop(tipo, None)
+
+    def registrar_bajas(self, muebles_precios: Iterable[Tuple[object, float]]) -> None:
+        """
+        Registra un lote de bajas actualizando los contadores una sola vez.
+
+        Args:
+            muebles_precios: Pares (mueble, precio con el que se había agregado)
+        """
+        cantidad = 0
+        centavos = 0
+        tipos: Counter = Counter()
+        for mueble, precio in muebles_precios:
+            cantidad += 1
+            centavos += self._a_centavos(precio)
+            tipos[type(mueble).__name__] += 1
+        self._total_muebles -= cantidad
+        self._valor_centavos -= centavos
+        for tipo, conteo in tipos.items():
+            restantes = self._tipos_muebles.get(tipo, 0) - conteo
+            if restantes > 0:
+                self._tipos_muebles[tipo] = restantes
+            else:
+                self._tipos_muebles.pop(tipo, None)
+
+    def registrar_cambio_precio(self, anterior: float, nuevo: float) -> None:
+        """
+        Aplica al valor del inventario el cambio de precio de un mueble que sigue en él.
+
+        Args:
+            anterior: Precio con el que estaba registrado
+            nuevo: Precio actual
+        """
+        self._valor_centavos += self._a_centavos(nuevo) - self._a_centavos(anterior)
+
+    def registrar_venta(self, precio_final: float) -> None:
+        """
+        Registra una venta en los contadores acumulativos.
+
+        Args:
+            precio_final: Precio cobrado al cliente
+        """
+        self._ventas_realizadas += 1
+        self._total_muebles_vendidos += 1
+        self._valor_total_ventas += precio_final
+
+    def registrar_ventas(self, precios_finales: Iterable[float]) -> None:
+        """
+        Registra un lote de ventas en los contadores acumulativos.
+
+        Args:
+            precios_finales: Precio cobrado por cada mueble del lote
+        """
+        precios = list(precios_finales)
+        self._ventas_realizadas += len(precios)
+        self._total_muebles_vendidos += len(precios)
+        self._valor_total_ventas += sum(precios)
+
+    def registrar_descuentos(self, descuentos: Dict[str, float]) -> None:
+        """
+        Actualiza la copia de los descuentos activos.
+
+        Args:
+            descuentos: Descuentos vigentes por categoría (fracción 0-1)
+        """
+        self._descuentos_activos = dict(descuentos)
+
+    @property
+    def total_muebles(self) -> int:
+        """Cantidad de muebles en inventario."""
+        return self._total_muebles
+
+    @property
+    def valor_inventario(self) -> float:
+        """Suma de los precios de los muebles en inventario."""
+        return self._valor_centavos / 100
+
+    @property
+    def total_muebles_vendidos(self) -> int:
+        """Cantidad acumulada de muebles vendidos."""
+        return self._total_muebles_vendidos
+
+    @property
+    def valor_total_ventas(self) -> float:
+        """Valor acumulado de las ventas."""
+        return self._valor_total_ventas
+
+    def como_dict(self) -> dict:
+        """
+        Retorna las estadísticas con el formato que usa la UI.
+
+        Returns:
+            dict: Copia de las estadísticas actuales
+        """
+        return {
+            "total_muebles": self._total_muebles,
+            "valor_inventario": self.valor_inventario,
+            "tipos_muebles": self._tipos_muebles.copy(),
+            "descuentos_activos": self._descuentos_activos.copy(),
+            "ventas_realizadas": self._ventas_realizadas,
+            "total_muebles_vendidos": self._total_muebles_vendidos,
+            "valor_total_ventas": self._valor_total_ventas,
+        }
@@ -0,0 +1,599 @@
+"""
+Índices secundarios del inventario de la tienda.
+Permiten responder búsquedas y filtros sin recorrer todo el inventario.
+"""
+
+from bisect import bisect_left, bisect_right
+from heapq import merge
+from itertools import count
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+
+def normalizar_texto(valor: Optional[str]) -> str:
+    """
+    Normaliza un texto para usarlo como clave de índice.
+
+    Args:
+        valor: Texto a normalizar (puede ser None)
+
+    Returns:
+        str: Texto en minúsculas y sin espacios en los extremos
+    """
+    if not valor or not isinstance(valor, str):
+        return ""
+    return valor.lower().strip()
+
+
+class IndiceHash:
+    """
+    Índice hash que agrupa muebles por un atributo normalizado.
+
+    Cada clave apunta a un diccionario ordenado por inserción (id -> mueble),
+    de modo que agregar y quitar cuestan O(1) y las consultas devuelven los
+    muebles en el mismo orden en que entraron al inventario.
+
+    Conceptos aplicados:
+    - Encapsulación: Oculta la estructura interna del índice
+    - Abstracción: La tienda solo conoce agregar, quitar y buscar
+    """
+
+    def __init__(
+        self,
+        extraer_clave: Callable[[object], Optional[str]],
+        orden: Optional[Callable[[object], int]] = None,
+    ):
+        """
+        Constructor del índice.
+
+        Args:
+            extraer_clave: Función que obtiene el valor a indexar de un mueble
+            orden: Secuencia de inserción de un mueble (ver Inventario.orden);
+                permite que actualizar conserve el orden de los grupos
+        """
+        self._extraer_clave = extraer_clave
+        self._orden = orden
+        self._grupos: Dict[str, Dict[int, object]] = {}
+        # Clave usada al indexar cada mueble, para poder quitarlo aunque cambie
+        self._clave_por_id: Dict[int, str] = {}
+
+    def agregar(self, mueble: object) -> None:
+        """Registra un mueble bajo su clave normalizada."""
+        clave = normalizar_texto(self._extraer_clave(mueble))
+        if not clave:
+            return
+        self._grupos.setdefault(clave, {})[id(mueble)] = mueble
+        self._clave_por_id[id(mueble)] = clave
+
+    def agregar_lote(self, muebles: Iterable[object]) -> None:
+        """Registra varios muebles reutilizando las referencias locales del índice."""
+        extraer, grupos, claves = self._extraer_clave, self._grupos, self._clave_por_id
+        # Los valores se repiten mucho (pocos materiales/colores): normalizar una vez cada uno
+        normalizados: Dict[object, str] = {}
+        for mueble in muebles:
+            valor = extraer(mueble)
+            clave = normalizados.get(valor)
+            if clave is None:
+                clave = normalizados[valor] = normalizar_texto(valor)
+            if not clave:
+                continue
+            grupo = grupos.get(clave)
+            if grupo is None:
+                grupo = grupos[clave] = {}
+            grupo[id(mueble)] = mueble
+            claves[id(mueble)] = clave
+
+    def quitar(self, mueble: object) -> None:
+        """Elimina un mueble del índice si estaba registrado."""
+        clave = self._clave_por_id.pop(id(mueble), None)
+        if clave is None:
+            return
+        grupo = self._grupos[clave]
+        del grupo[id(mueble)]
+        if not grupo:
+            del self._grupos[clave]
+
+    def actualizar(self, mueble: object) -> None:
+        """
+        Vuelve a indexar un mueble cuyo atributo pudo haber cambiado.
+
+        Si la clave no cambió no hace nada. Si cambió, el mueble pasa al grupo
+        nuevo en la posición que le corresponde por orden de inserción.
+
+        Args:
+            mueble: Mueble ya registrado (o que ahora tiene una clave)
+        """
+        clave = normalizar_texto(self._extraer_clave(mueble))
+        if self._clave_por_id.get(id(mueble)) == clave:
+            return
+        self.quitar(mueble)
+        if not clave:
+            return
+        grupo = self._grupos.setdefault(clave, {})
+        grupo[id(mueble)] = mueble
+        self._clave_por_id[id(mueble)] = clave
+        if self._orden is not None and len(grupo) > 1:
+            orden = self._orden
+            previos = reversed(grupo.values())
+            next(previos)  # el propio mueble, recién agregado al final
+            if orden(next(previos)) > orden(mueble):
+                self._grupos[clave] = dict(sorted(grupo.items(), key=lambda par: orden(par[1])))
+
+    def buscar(self, valor: str) -> List[object]:
+        """
+        Retorna los muebles cuya clave coincide con el valor dado.
+
+        Args:
+            valor: Valor a buscar (se normaliza igual que las claves)
+
+        Returns:
+            List: Muebles coincidentes en orden de inserción
+        """
+        grupo = self._grupos.get(normalizar_texto(valor))
+        return list(grupo.values()) if grupo else []
+
+    def contar(self, valor: str) -> int:
+        """Cantidad de muebles bajo la clave del valor, en O(1)."""
+        return len(self._grupos.get(normalizar_texto(valor), ()))
+
+    def coincide(self, mueble: object, valor: str) -> bool:
+        """Indica si el mueble está indexado bajo la clave del valor."""
+        return self._clave_por_id.get(id(mueble)) == normalizar_texto(valor)
+
+    def claves(self) -> List[str]:
+        """Retorna las claves normalizadas presentes en el índice."""
+        return list(self._grupos)
+
+
+# Bajas a partir de las cuales IndicePrecios reconstruye sus listas
+UMBRAL_RECONSTRUCCION = 64
+
+
+class IndicePrecios:
+    """
+    Índice ordenado por precio para consultas por rango.
+
+    Mantiene una lista de claves (precio, secuencia) ordenada y una lista
+    paralela de muebles. Las consultas usan búsqueda binaria y cuestan
+    O(log n + k); la secuencia de inserción desempata precios iguales.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._claves: List[Tuple[float, int]] = []
+        self._muebles: List[object] = []
+        self._clave_por_id: Dict[int, Tuple[float, int]] = {}
+        self._secuencia = count()
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de muebles indexados."""
+        return len(self._claves)
+
+    def agregar(self, mueble: object, precio: float) -> None:
+        """
+        Registra un mueble con su precio ya calculado.
+
+        Args:
+            mueble: Mueble a indexar
+            precio: Precio final del mueble
+        """
+        clave = (precio, next(self._secuencia))
+        posicion = bisect_right(self._claves, clave)
+        self._claves.insert(posicion, clave)
+        self._muebles.insert(posicion, mueble)
+        self._clave_por_id[id(mueble)] = clave
+
+    def agregar_lote(self, muebles_precios: Iterable[Tuple[object, float]]) -> None:
+        """
+        Registra varios muebles con sus precios en una sola mezcla ordenada.
+
+        Solo se ordena el lote nuevo; luego se ubica cada clave nueva con
+        búsqueda binaria (a partir de la anterior) y se copian los tramos de
+        la lista existente que quedan entre ellas. Cuesta O(k log k + n) en
+        lugar de reordenar todo o desplazar la lista por cada mueble.
+
+        Args:
+            muebles_precios: Pares (mueble, precio)
+        """
+        nuevos = []
+        for mueble, precio in muebles_precios:
+            clave = (precio, next(self._secuencia))
+            self._clave_por_id[id(mueble)] = clave
+            nuevos.append((clave, mueble))
+        if not nuevos:
+            return
+        nuevos.sort(key=itemgetter(0))
+        claves_previas, muebles_previos = self._claves, self._muebles
+        claves: List[Tuple[float, int]] = []
+        muebles: List[object] = []
+        anterior = 0
+        for clave, mueble in nuevos:
+            posicion = bisect_right(claves_previas, clave, anterior)
+            if posicion > anterior:
+                claves += claves_previas[anterior:posicion]
+                muebles += muebles_previos[anterior:posicion]
+                anterior = posicion
+            claves.append(clave)
+            muebles.append(mueble)
+        claves += claves_previas[anterior:]
+        muebles += muebles_previos[anterior:]
+        self._claves = claves
+        self._muebles = muebles
+
+    def quitar(self, mueble: object) -> None:
+        """Elimina un mueble del índice si estaba registrado."""
+        clave = self._clave_por_id.pop(id(mueble), None)
+        if clave is None:
+            return
+        posicion = bisect_left(self._claves, clave)
+        del self._claves[posicion]
+        del self._muebles[posicion]
+
+    def quitar_lote(self, muebles: Iterable[object]) -> None:
+        """
+        Elimina varios muebles del índice.
+
+        Con pocos muebles se borra cada posición (de atrás hacia adelante);
+        con muchos se ubican las posiciones con búsqueda binaria y se copian
+        los tramos que quedan entre ellas, lo que cuesta una copia O(n) en
+        total en lugar de un desplazamiento O(n) por mueble.
+
+        Args:
+            muebles: Muebles a eliminar
+        """
+        posiciones = []
+        for mueble in muebles:
+            clave = self._clave_por_id.pop(id(mueble), None)
+            if clave is not None:
+                posiciones.append(bisect_left(self._claves, clave))
+        posiciones.sort()
+        if len(posiciones) < UMBRAL_RECONSTRUCCION:
+            for posicion in reversed(posiciones):
+                del self._claves[posicion]
+                del self._muebles[posicion]
+            return
+        claves: List[Tuple[float, int]] = []
+        muebles_restantes: List[object] = []
+        anterior = 0
+        for posicion in posiciones:
+            claves += self._claves[anterior:posicion]
+            muebles_restantes += self._muebles[anterior:posicion]
+            anterior = posicion + 1
+        claves += self._claves[anterior:]
+        muebles_restantes += self._muebles[anterior:]
+        self._claves = claves
+        self._muebles = muebles_restantes
+
+    def actualizar(self, mueble: object, precio: float) -> None:
+        """
+        Cambia el precio de un mueble ya indexado.
+
+        Conserva su secuencia, así que entre precios iguales mantiene el lugar
+        que tenía por orden de alta.
+
+        Args:
+            mueble: Mueble registrado
+            precio: Precio nuevo
+        """
+        anterior = self._clave_por_id.get(id(mueble))
+        if anterior is None or anterior[0] == precio:
+            return
+        posicion = bisect_left(self._claves, anterior)
+        del self._claves[posicion]
+        del self._muebles[posicion]
+        clave = (precio, anterior[1])
+        posicion = bisect_right(self._claves, clave)
+        self._claves.insert(posicion, clave)
+        self._muebles.insert(posicion, mueble)
+        self._clave_por_id[id(mueble)] = clave
+
+    def precio_de(self, mueble: object) -> Optional[float]:
+        """Retorna el precio con el que se indexó un mueble, o None."""
+        clave = self._clave_por_id.get(id(mueble))
+        return clave[0] if clave is not None else None
+
+    def rango(self, precio_min: float, precio_max: float) -> List[object]:
+        """
+        Retorna los muebles con precio dentro del rango, ordenados por precio.
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+
+        Returns:
+            List: Muebles en el rango de menor a mayor precio
+        """
+        if precio_min > precio_max:
+            return []
+        inicio, fin = self._limites(precio_min, precio_max)
+        return self._muebles[inicio:fin]
+
+    def recorrer(self, descendente: bool = False) -> Iterator[object]:
+        """
+        Recorre todos los muebles por precio desde un extremo.
+
+        Args:
+            descendente: Empezar por el más caro
+
+        Yields:
+            Muebles de menor a mayor precio (o al revés)
+        """
+        return reversed(self._muebles) if descendente else iter(self._muebles)
+
+    def clave_de(self, mueble: object) -> Optional[Tuple[float, int]]:
+        """Clave (precio, secuencia) de un mueble; sirve de cursor en desde()."""
+        return self._clave_por_id.get(id(mueble))
+
+    def desde(
+        self,
+        precio_min: float,
+        precio_max: float,
+        despues_de: Optional[Tuple[float, int]] = None,
+    ) -> Iterator[object]:
+        """
+        Recorre el rango por precio retomando después de una clave dada.
+        Ubicar el punto de partida cuesta O(log n).
+
+        Args:
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+            despues_de: Clave del último mueble ya visto (None desde el inicio)
+
+        Yields:
+            Muebles del rango de menor a mayor precio
+        """
+        if precio_min > precio_max:
+            return
+        inicio, fin = self._limites(precio_min, precio_max)
+        claves, muebles = self._claves, self._muebles
+        if despues_de is not None:
+            inicio = max(inicio, bisect_right(claves, despues_de))
+        for posicion in range(inicio, fin):
+            yield muebles[posicion]
+
+    def contar(self, precio_min: float, precio_max: float) -> int:
+        """Cantidad de muebles en el rango, en O(log n) y sin copiar la lista."""
+        if precio_min > precio_max:
+            return 0
+        inicio, fin = self._limites(precio_min, precio_max)
+        return fin - inicio
+
+    def _limites(self, precio_min: float, precio_max: float) -> Tuple[int, int]:
+        """Posiciones [inicio, fin) del rango en las listas ordenadas."""
+        inicio = bisect_left(self._claves, (precio_min,))
+        fin = bisect_right(self._claves, (precio_max, float("inf")))
+        return inicio, fin
+
+
+class IndiceTipos:
+    """
+    Índice de muebles por clase concreta.
+
+    Las consultas por una clase (concreta o de categoría) reúnen los grupos
+    de todas las subclases presentes, que son pocas, en lugar de recorrer el
+    inventario con isinstance. Los grupos se mezclan según la secuencia de
+    inserción que asigna el inventario.
+    """
+
+    def __init__(self, orden: Callable[[object], int]):
+        """
+        Constructor del índice vacío.
+
+        Args:
+            orden: Secuencia de inserción de un mueble (ver Inventario.orden)
+        """
+        self._orden = orden
+        self._grupos: Dict[type, Dict[int, object]] = {}
+
+    def agregar(self, mueble: object) -> None:
+        """Registra un mueble bajo su clase."""
+        self._grupos.setdefault(type(mueble), {})[id(mueble)] = mueble
+
+    def agregar_lote(self, muebles: Iterable[object]) -> None:
+        """Registra varios muebles."""
+        grupos = self._grupos
+        for mueble in muebles:
+            grupo = grupos.get(type(mueble))
+            if grupo is None:
+                grupo = grupos[type(mueble)] = {}
+            grupo[id(mueble)] = mueble
+
+    def quitar(self, mueble: object) -> None:
+        """Elimina un mueble del índice si estaba registrado."""
+        grupo = self._grupos.get(type(mueble))
+        if grupo is None or grupo.pop(id(mueble), None) is None:
+            return
+        if not grupo:
+            del self._grupos[type(mueble)]
+
+    def _grupos_de(self, tipo_clase: type) -> List[Dict[int, object]]:
+        """Grupos de las clases presentes que son subclase de tipo_clase."""
+        return [grupo for clase, grupo in self._grupos.items() if issubclass(clase, tipo_clase)]
+
+    def buscar(self, tipo_clase: type) -> List[object]:
+        """
+        Retorna los muebles que son instancia de la clase dada.
+
+        Args:
+            tipo_clase: Clase concreta o de categoría
+
+        Returns:
+            List: Muebles coincidentes en orden de inserción
+        """
+        grupos = self._grupos_de(tipo_clase)
+        if len(grupos) == 1:
+            return list(grupos[0].values())
+        return list(merge(*(grupo.values() for grupo in grupos), key=self._orden))
+
+    def contar(self, tipo_clase: type) -> int:
+        """Cantidad de instancias de la clase, en O(clases presentes)."""
+        return sum(len(grupo) for grupo in self._grupos_de(tipo_clase))
+
+    def por_clase(self) -> Iterator[Tuple[type, Iterable[object]]]:
+        """Recorre los grupos como pares (clase concreta, muebles de esa clase)."""
+        for clase, grupo in self._grupos.items():
+            yield clase, grupo.values()
+
+
+def trigramas(texto: str) -> Set[str]:
+    """
+    Descompone un texto en sus trigramas (subcadenas de 3 caracteres).
+
+    Args:
+        texto: Texto ya normalizado
+
+    Returns:
+        Set[str]: Conjunto de trigramas del texto
+    """
+    return {texto[i : i + 3] for i in range(len(texto) - 2)}
+
+
+class IndiceTrigramas:
+    """
+    Índice invertido de trigramas para búsquedas parciales por nombre.
+
+    Cada trigrama del nombre en minúsculas apunta al conjunto de ids de los
+    muebles que lo contienen. Una búsqueda intersecta las listas de los
+    trigramas del término (empezando por la más corta) y confirma la
+    coincidencia de subcadena solo sobre esos candidatos. Los términos de
+    menos de 3 caracteres se resuelven recorriendo los nombres ya normalizados.
+    """
+
+    def __init__(self):
+        """Constructor del índice vacío."""
+        self._postings: Dict[str, Set[int]] = {}
+        self._nombres: Dict[int, str] = {}
+        self._muebles: Dict[int, object] = {}
+        self._orden: Dict[int, int] = {}
+        self._secuencia = count()
+
+    def agregar(self, mueble: object, nombre: str) -> None:
+        """
+        Registra un mueble bajo los trigramas de su nombre.
+
+        Args:
+            mueble: Mueble a indexar
+            nombre: Nombre del mueble
+        """
+        clave = id(mueble)
+        nombre_lower = nombre.lower()
+        self._nombres[clave] = nombre_lower
+        self._muebles[clave] = mueble
+        self._orden[clave] = next(self._secuencia)
+        for trigrama in trigramas(nombre_lower):
+            self._postings.setdefault(trigrama, set()).add(clave)
+
+    def agregar_lote(self, muebles_nombres: Iterable[Tuple[object, str]]) -> None:
+        """
+        Registra varios muebles con sus nombres.
+
+        Args:
+            muebles_nombres: Pares (mueble, nombre)
+        """
+        postings, nombres, muebles, orden = (
+            self._postings,
+            self._nombres,
+            self._muebles,
+            self._orden,
+        )
+        for mueble, nombre in muebles_nombres:
+            clave = id(mueble)
+            nombre_lower = nombre.lower()
+            nombres[clave] = nombre_lower
+            muebles[clave] = mueble
+            orden[clave] = next(self._secuencia)
+            for trigrama in trigramas(nombre_lower):
+                ids = postings.get(trigrama)
+                if ids is None:
+                    ids = postings[trigrama] = set()
+                ids.add(clave)
+
+    def quitar(self, mueble: object) -> None:
+        """Elimina un mueble del índice y poda los trigramas que quedan vacíos."""
+        clave = id(mueble)
+        nombre_lower = self._nombres.pop(clave, None)
+        if nombre_lower is None:
+            return
+        del self._muebles[clave]
+        del self._orden[clave]
+        for trigrama in trigramas(nombre_lower):
+            ids = self._postings[trigrama]
+            ids.discard(clave)
+            if not ids:
+                del self._postings[trigrama]
+
+    def actualizar(self, mueble: object, nombre: str) -> None:
+        """
+        Vuelve a indexar un mueble cuyo nombre pudo haber cambiado.
+        Conserva su lugar en el orden de inserción.
+
+        Args:
+            mueble: Mueble registrado
+            nombre: Nombre actual del mueble
+        """
+        clave = id(mueble)
+        anterior = self._nombres.get(clave)
+        nombre_lower = nombre.lower()
+        if anterior is None or anterior == nombre_lower:
+            return
+        self._nombres[clave] = nombre_lower
+        viejos, nuevos = trigramas(anterior), trigramas(nombre_lower)
+        for trigrama in viejos - nuevos:
+            ids = self._postings[trigrama]
+            ids.discard(clave)
+            if not ids:
+                del self._postings[trigrama]
+        for trigrama in nuevos - viejos:
+            self._postings.setdefault(trigrama, set()).add(clave)
+
+    def estimar(self, termino: str) -> int:
+        """
+        Cota superior de los muebles que devolvería buscar(termino).
+
+        Es el tamaño de la lista de trigramas más corta del término (0 si falta
+        alguno); con menos de 3 caracteres la búsqueda recorre todos los nombres.
+
+        Args:
+            termino: Texto a buscar, ya sin espacios en los extremos
+        """
+        termino_lower = termino.lower()
+        if len(termino_lower) < 3:
+            return len(self._nombres)
+        return min(len(self._postings.get(trigrama, ())) for trigrama in trigramas(termino_lower))
+
+    def coincide(self, mueble: object, termino: str) -> bool:
+        """Indica si el nombre indexado del mueble contiene el término."""
+        return termino.lower() in self._nombres.get(id(mueble), "")
+
+    def buscar(self, termino: str) -> List[object]:
+        """
+        Busca muebles cuyo nombre contiene el término (sin distinguir mayúsculas).
+
+        Args:
+            termino: Texto a buscar, ya sin espacios en los extremos
+
+        Returns:
+            List: Muebles coincidentes en orden de inserción
+        """
+        termino_lower = termino.lower()
+        if len(termino_lower) < 3:
+            return [
+                self._muebles[clave]
+                for clave, nombre in self._nombres.items()
+                if termino_lower in nombre
+            ]
+        listas = []
+        for trigrama in trigramas(termino_lower):
+            ids = self._postings.get(trigrama)
+            if not ids:
+                return []
+            listas.append(ids)
+        listas.sort(key=len)
+        candidatos = set(listas[0])
+        for ids in listas[1:]:
+            candidatos &= ids
+            if not candidatos:
+                return []
+        coincidencias = [c for c in candidatos if termino_lower in self._nombres[c]]
+        coincidencias.sort(key=self._orden.__getitem__)
+        return [self._muebles[clave] for clave in coincidencias]
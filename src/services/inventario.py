@@ -0,0 +1,177 @@
+"""
+Almacén del inventario de la tienda.
+Guarda los muebles por identidad conservando el orden de inserción.
+"""
+
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import count, islice
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Huecos a partir de los cuales el registro ordenado se compacta
+MIN_HUECOS_COMPACTAR = 1024
+
+
+class Inventario:
+    """
+    Colección de muebles indexada por identidad (id del objeto).
+
+    Se apoya en un diccionario, que en Python conserva el orden de inserción,
+    por lo que pertenencia, alta y baja cuestan O(1) y el recorrido mantiene
+    el orden en que se agregaron los muebles.
+
+    Cada mueble recibe además un número de secuencia creciente, que no se
+    reutiliza. Un registro paralelo (secuencias y muebles, con huecos para
+    las bajas) permite retomar un recorrido después de una secuencia dada en
+    O(log n); es la base de la paginación por cursor, que no se desplaza
+    cuando entran o salen muebles.
+
+    Conceptos aplicados:
+    - Encapsulación: Oculta el diccionario interno
+    - Polimorfismo: Se comporta como una secuencia (len, in, iteración, índice)
+    """
+
+    def __init__(self):
+        """Constructor del inventario vacío."""
+        self._muebles: Dict[int, object] = {}
+        self._orden: Dict[int, int] = {}
+        self._secuencias = array("q")
+        self._registro: List[Optional[object]] = []
+        self._huecos = 0
+        self._contador = count()
+
+    def agregar(self, mueble: object) -> bool:
+        """
+        Agrega un mueble al final del inventario.
+
+        Args:
+            mueble: Mueble a agregar
+
+        Returns:
+            bool: False si el mueble ya estaba en el inventario
+        """
+        clave = id(mueble)
+        if clave in self._muebles:
+            return False
+        secuencia = next(self._contador)
+        self._muebles[clave] = mueble
+        self._orden[clave] = secuencia
+        self._secuencias.append(secuencia)
+        self._registro.append(mueble)
+        return True
+
+    def quitar(self, mueble: object) -> bool:
+        """
+        Quita un mueble del inventario.
+
+        Args:
+            mueble: Mueble a quitar
+
+        Returns:
+            bool: False si el mueble no estaba en el inventario
+        """
+        if self._muebles.pop(id(mueble), None) is None:
+            return False
+        posicion = bisect_right(self._secuencias, self._orden.pop(id(mueble))) - 1
+        self._registro[posicion] = None
+        self._huecos += 1
+        if self._huecos >= MIN_HUECOS_COMPACTAR and self._huecos * 2 > len(self._registro):
+            self._compactar()
+        return True
+
+    def _compactar(self) -> None:
+        """Reconstruye el registro ordenado sin los huecos de las bajas."""
+        vivos = [
+            (secuencia, mueble)
+            for secuencia, mueble in zip(self._secuencias, self._registro)
+            if mueble is not None
+        ]
+        self._secuencias = array("q", (secuencia for secuencia, _ in vivos))
+        self._registro = [mueble for _, mueble in vivos]
+        self._huecos = 0
+
+    def orden(self, mueble: object) -> int:
+        """
+        Número de secuencia del mueble (crece con cada alta).
+
+        Args:
+            mueble: Mueble del inventario
+
+        Returns:
+            int: Secuencia, que sirve de cursor y de clave de orden de inserción
+        """
+        return self._orden[id(mueble)]
+
+    def desde(self, secuencia: int = -1) -> Iterator[Tuple[int, object]]:
+        """
+        Recorre los muebles con secuencia mayor a la dada, en orden de inserción.
+        Ubicar el punto de partida cuesta O(log n).
+
+        Args:
+            secuencia: Secuencia del último mueble ya visto (-1 desde el inicio)
+
+        Yields:
+            Tuple: (secuencia, mueble)
+        """
+        secuencias, registro = self._secuencias, self._registro
+        for posicion in range(bisect_right(secuencias, secuencia), len(registro)):
+            mueble = registro[posicion]
+            if mueble is not None:
+                yield secuencias[posicion], mueble
+
+    def obtener(self, clave: int) -> Optional[object]:
+        """
+        Retorna el mueble con el identificador dado en O(1).
+
+        Args:
+            clave: Identificador del mueble (id del objeto)
+
+        Returns:
+            El mueble, o None si no está en el inventario
+        """
+        return self._muebles.get(clave)
+
+    def obtener_por_orden(self, secuencia: int) -> Optional[object]:
+        """
+        Retorna el mueble con el número de secuencia dado en O(log n).
+
+        Args:
+            secuencia: Valor de orden(mueble)
+
+        Returns:
+            El mueble, o None si ya no está en el inventario
+        """
+        secuencias = self._secuencias
+        posicion = bisect_left(secuencias, secuencia)
+        if posicion < len(secuencias) and secuencias[posicion] == secuencia:
+            return self._registro[posicion]
+        return None
+
+    def listar(self) -> List[object]:
+        """Retorna una copia de los muebles en orden de inserción."""
+        return list(self._muebles.values())
+
+    def __contains__(self, mueble: object) -> bool:
+        """Pertenencia por identidad en O(1)."""
+        return id(mueble) in self._muebles
+
+    def __len__(self) -> int:
+        """Retorna la cantidad de muebles."""
+        return len(self._muebles)
+
+    def __iter__(self) -> Iterator[object]:
+        """Recorre los muebles en orden de inserción."""
+        return iter(self._muebles.values())
+
+    def __getitem__(self, indice: int) -> object:
+        """
+        Acceso por posición (O(n)); para recorridos numerados usar listar().
+
+        Args:
+            indice: Posición del mueble (admite índices negativos)
+        """
+        if indice < 0:
+            indice += len(self._muebles)
+        if not 0 <= indice < len(self._muebles):
+            raise IndexError("Índice fuera del inventario")
+        return next(islice(self._muebles.values(), indice, None))
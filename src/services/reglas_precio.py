@@ -0,0 +1,540 @@
+"""
+Motor de reglas de precio.
+Los recargos y factores de cada clase de mueble se describen como datos
+(diccionarios serializables a JSON), se compilan una vez a funciones por
+columna con tablas de búsqueda y se evalúan sobre lotes de muebles.
+"""
+
+import copy
+import json
+import os
+from operator import attrgetter
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+# Las reglas predeterminadas reproducen calcular_precio de cada clase concreta,
+# con las mismas operaciones y en el mismo orden (el resultado es idéntico).
+#
+# Cada clase tiene:
+#   hereda:    clase cuyo precio final (ya redondeado) es la base, en lugar de precio_base
+#   factor:    términos que se suman a 1.0; el precio base se multiplica por el total
+#   recargos:  términos que se suman al precio, en orden
+#   redondeo:  decimales del resultado, o "entero" para int(round(precio))
+#
+# Cada término es uno de:
+#   {"si": atributo, "monto": m}                          m si el atributo es verdadero
+#   {"segun": atributo, "valores": {...}, "otro": m}      tabla por valor del atributo
+#   {"por_unidad": atributo, "monto": m[, "si": cond]}    atributo * m (si cond)
+#   {"mayor_que": atributo, "tramos": [[limite, m], ...]} m del primer tramo superado
+#   {"lineal": atributo, "desde": d, "tasa": t}           (atributo - d) * t
+#   {"producto": [atributos], "divisor": d, "tasa": t}    (producto / d) * t
+_COMODIDAD = [
+    {"si": "tiene_respaldo", "monto": 0.1},
+    {
+        "segun": "material_tapizado",
+        "minusculas": True,
+        "valores": {"cuero": 0.2, "tela": 0.1},
+        "otro": 0,
+    },
+    {"lineal": "capacidad_personas", "desde": 1, "tasa": 0.05},
+]
+
+REGLAS_PREDETERMINADAS: Dict[str, Dict] = {
+    "Silla": {
+        "factor": _COMODIDAD,
+        "recargos": [
+            {"si": "altura_regulable", "monto": 30},
+            {"si": "tiene_ruedas", "monto": 20},
+        ],
+        "redondeo": 2,
+    },
+    "Sofa": {
+        "factor": _COMODIDAD,
+        "recargos": [
+            {"si": "tiene_brazos", "monto": 150},
+            {"si": "es_modular", "monto": 200},
+            {"si": "incluye_cojines", "monto": 50},
+        ],
+        "redondeo": 2,
+    },
+    "SofaCama": {
+        "hereda": "Sofa",
+        "recargos": [
+            {"segun": "tamaño", "valores": {"matrimonial": 300, "queen": 500, "king": 700}},
+            {"si": "incluye_colchon", "monto": 250},
+            {"segun": "mecanismo_conversion", "valores": {"hidraulico": 150, "electrico": 300}},
+        ],
+        "redondeo": 2,
+    },
+    "Mesa": {
+        "factor": [{"producto": ["largo", "ancho"], "divisor": 10000, "tasa": 0.05}],
+        "recargos": [
+            {"segun": "forma", "valores": {"rectangular": 0}, "otro": 50},
+            {"mayor_que": "capacidad_personas", "tramos": [[6, 100], [4, 50]]},
+        ],
+        "redondeo": 2,
+    },
+    "Cama": {
+        "recargos": [
+            {"segun": "tamaño", "valores": {"matrimonial": 200, "queen": 400, "king": 600}},
+            {"si": "incluye_colchon", "monto": 300},
+            {"si": "tiene_cabecera", "monto": 100},
+        ],
+        "redondeo": 2,
+    },
+    "Armario": {
+        "recargos": [
+            {"por_unidad": "num_puertas", "monto": 50},
+            {"por_unidad": "num_cajones", "monto": 30},
+            {"si": "tiene_espejos", "monto": 100},
+        ],
+        "redondeo": "entero",
+    },
+    "Cajonera": {
+        "recargos": [
+            {"por_unidad": "num_cajones", "monto": 20},
+            {"si": "tiene_ruedas", "monto": 30},
+        ],
+        "redondeo": "entero",
+    },
+    "Escritorio": {
+        "recargos": [
+            {"por_unidad": "num_cajones", "monto": 25, "si": "tiene_cajones"},
+            {"mayor_que": "largo", "tramos": [[1.5, 50]]},
+            {"si": "tiene_iluminacion", "monto": 40},
+            {"segun": "forma", "valores": {"rectangular": 0}, "otro": 30},
+        ],
+        "redondeo": "entero",
+    },
+    "Sillon": {
+        "recargos": [
+            {"si": "material_tapizado", "monto": 200},
+            {"si": "tiene_brazos", "monto": 100},
+            {"si": "es_reclinable", "monto": 250},
+            {"si": "tiene_reposapiés", "monto": 80},
+        ],
+        "redondeo": "entero",
+    },
+}
+
+_CLAVES_CLASE = {"hereda", "factor", "recargos", "redondeo"}
+
+# Término compilado: recibe las columnas del lote (atributo -> valores) y
+# devuelve el aporte de cada fila
+Columnas = Mapping[str, Sequence]
+Termino = Callable[[Columnas], List[float]]
+
+
+class ErrorReglas(ValueError):
+    """Reglas de precio mal formadas."""
+
+
+def _por_valor(columna: Sequence, funcion: Callable[[object], float]) -> List[float]:
+    """
+    Aplica la función a cada valor de una columna.
+    Las columnas codificadas (ver columnar) la evalúan una vez por valor distinto.
+    """
+    mapear = getattr(columna, "mapear", None)
+    if mapear is not None:
+        return mapear(funcion)
+    return [funcion(valor) for valor in columna]
+
+
+def _termino_si(regla: Mapping) -> Termino:
+    """Monto fijo si el atributo es verdadero."""
+    atributo, monto = regla["si"], regla["monto"]
+    return lambda columnas: _por_valor(columnas[atributo], lambda valor: monto if valor else 0)
+
+
+def _termino_segun(regla: Mapping) -> Termino:
+    """Monto según el valor del atributo, leído de una tabla."""
+    atributo = regla["segun"]
+    tabla = dict(regla["valores"])
+    otro = regla.get("otro", 0)
+    if regla.get("minusculas"):
+
+        def monto_de(valor) -> float:
+            # Los valores vacíos o None no se pasan a minúsculas y caen en "otro"
+            return tabla.get(valor.lower(), otro) if valor else otro
+
+    else:
+
+        def monto_de(valor) -> float:
+            return tabla.get(valor, otro)
+
+    return lambda columnas: _por_valor(columnas[atributo], monto_de)
+
+
+def _termino_por_unidad(regla: Mapping) -> Termino:
+    """Monto por unidad del atributo, opcionalmente condicionado."""
+    atributo, monto = regla["por_unidad"], regla["monto"]
+    if "si" in regla:
+        condicion = regla["si"]
+        return lambda columnas: [
+            valor * monto if cumple else 0
+            for valor, cumple in zip(columnas[atributo], columnas[condicion])
+        ]
+    return lambda columnas: [valor * monto for valor in columnas[atributo]]
+
+
+def _termino_mayor_que(regla: Mapping) -> Termino:
+    """Monto del primer tramo cuyo límite supera el atributo."""
+    atributo = regla["mayor_que"]
+    tramos = [(limite, monto) for limite, monto in regla["tramos"]]
+
+    def monto_de(valor) -> float:
+        for limite, monto in tramos:
+            if valor > limite:
+                return monto
+        return 0
+
+    return lambda columnas: _por_valor(columnas[atributo], monto_de)
+
+
+def _termino_lineal(regla: Mapping) -> Termino:
+    """Aporte proporcional al atributo a partir de un valor."""
+    atributo = regla["lineal"]
+    desde, tasa = regla.get("desde", 0), regla["tasa"]
+    return lambda columnas: [(valor - desde) * tasa for valor in columnas[atributo]]
+
+
+def _termino_producto(regla: Mapping) -> Termino:
+    """Aporte proporcional al producto de varios atributos."""
+    atributos = list(regla["producto"])
+    if not atributos:
+        raise ErrorReglas("'producto' necesita al menos un atributo")
+    divisor, tasa = regla.get("divisor", 1), regla["tasa"]
+
+    def termino(columnas: Columnas) -> List[float]:
+        productos = list(columnas[atributos[0]])
+        for atributo in atributos[1:]:
+            productos = [p * valor for p, valor in zip(productos, columnas[atributo])]
+        return [(p / divisor) * tasa for p in productos]
+
+    return termino
+
+
+# Tipo de término por la clave que lo identifica
+_TERMINOS: Dict[str, Callable[[Mapping], Termino]] = {
+    "segun": _termino_segun,
+    "por_unidad": _termino_por_unidad,
+    "mayor_que": _termino_mayor_que,
+    "lineal": _termino_lineal,
+    "producto": _termino_producto,
+    # "si" va al final: por_unidad también puede llevar una condición "si"
+    "si": _termino_si,
+}
+
+
+def _atributos_termino(regla: Mapping) -> List[str]:
+    """Atributos del mueble que lee un término."""
+    atributos = [regla[clave] for clave in _TERMINOS if clave in regla and clave != "producto"]
+    atributos.extend(regla.get("producto", ()))
+    return atributos
+
+
+def _compilar_termino(regla: Mapping, clase: str) -> Tuple[Termino, List[str]]:
+    """Convierte la descripción de un término en su función por columnas y sus atributos."""
+    if not isinstance(regla, Mapping):
+        raise ErrorReglas(f"{clase}: cada término debe ser un objeto")
+    for clave, compilar in _TERMINOS.items():
+        if clave in regla:
+            try:
+                termino = compilar(regla)
+                atributos = _atributos_termino(regla)
+            except (KeyError, TypeError, ValueError) as e:
+                raise ErrorReglas(f"{clase}: término inválido {regla!r} ({e})") from None
+            if not all(isinstance(atributo, str) for atributo in atributos):
+                raise ErrorReglas(f"{clase}: término inválido {regla!r} (atributo no textual)")
+            return termino, atributos
+    raise ErrorReglas(f"{clase}: término sin tipo conocido {regla!r}")
+
+
+class _Programa:
+    """
+    Reglas compiladas de una clase: evalúa el precio de un lote homogéneo.
+    Trabaja sobre columnas (un valor por fila para cada atributo de atributos).
+    """
+
+    __slots__ = ("base", "factor", "recargos", "entero", "decimales", "atributos")
+
+    def __init__(
+        self,
+        base: Optional["_Programa"],
+        factor: List[Tuple[Termino, List[str]]],
+        recargos: List[Tuple[Termino, List[str]]],
+        redondeo: Union[int, str],
+    ):
+        self.base = base
+        self.factor = [termino for termino, _ in factor]
+        self.recargos = [termino for termino, _ in recargos]
+        self.entero = redondeo == "entero"
+        self.decimales = 0 if self.entero else redondeo
+        leidos = list(base.atributos) if base is not None else ["precio_base"]
+        for _, atributos in factor + recargos:
+            leidos.extend(atributos)
+        # Sin repetidos, en el orden en que aparecen
+        self.atributos: Tuple[str, ...] = tuple(dict.fromkeys(leidos))
+
+    def evaluar(self, muebles: List[object]) -> List[float]:
+        """Precios del lote, en el mismo orden."""
+        columnas = {
+            atributo: list(map(attrgetter(atributo), muebles)) for atributo in self.atributos
+        }
+        return self.evaluar_columnas(columnas, len(muebles))
+
+    def evaluar_columnas(self, columnas: Columnas, filas: int) -> List[float]:
+        """
+        Precios de un lote dado por columnas.
+
+        Args:
+            columnas: Valores de cada atributo de self.atributos, uno por fila
+            filas: Cantidad de filas del lote
+
+        Returns:
+            List[float]: Precio de cada fila
+        """
+        if self.base is not None:
+            precios = self.base.evaluar_columnas(columnas, filas)
+        else:
+            precios = list(columnas["precio_base"])
+        if self.factor:
+            factores = [1.0] * filas
+            for termino in self.factor:
+                factores = [f + v for f, v in zip(factores, termino(columnas))]
+            precios = [p * f for p, f in zip(precios, factores)]
+        for termino in self.recargos:
+            precios = [p + v for p, v in zip(precios, termino(columnas))]
+        if self.entero:
+            return [int(round(p)) for p in precios]
+        decimales = self.decimales
+        return [round(p, decimales) for p in precios]
+
+
+def compilar_reglas(reglas: Mapping[str, Mapping]) -> Dict[str, _Programa]:
+    """
+    Valida y compila un juego de reglas.
+
+    Args:
+        reglas: Reglas por nombre de clase (formato de REGLAS_PREDETERMINADAS)
+
+    Returns:
+        Dict[str, _Programa]: Programa compilado por nombre de clase
+
+    Raises:
+        ErrorReglas: Si las reglas están mal formadas o la herencia es circular
+    """
+    programas: Dict[str, _Programa] = {}
+    en_curso = set()
+
+    def compilar(clase: str) -> _Programa:
+        if clase in programas:
+            return programas[clase]
+        if clase in en_curso:
+            raise ErrorReglas(f"{clase}: herencia circular")
+        definicion = reglas.get(clase)
+        if not isinstance(definicion, Mapping):
+            raise ErrorReglas(f"{clase}: no hay reglas para la clase")
+        desconocidas = set(definicion) - _CLAVES_CLASE
+        if desconocidas:
+            raise ErrorReglas(f"{clase}: claves desconocidas {sorted(desconocidas)}")
+        redondeo = definicion.get("redondeo", 2)
+        if redondeo != "entero" and (isinstance(redondeo, bool) or not isinstance(redondeo, int)):
+            raise ErrorReglas(f"{clase}: 'redondeo' debe ser un entero o \"entero\"")
+        en_curso.add(clase)
+        base = compilar(definicion["hereda"]) if "hereda" in definicion else None
+        en_curso.discard(clase)
+        programa = _Programa(
+            base,
+            [_compilar_termino(t, clase) for t in definicion.get("factor", [])],
+            [_compilar_termino(t, clase) for t in definicion.get("recargos", [])],
+            redondeo,
+        )
+        programas[clase] = programa
+        return programa
+
+    for clase in reglas:
+        compilar(clase)
+    return programas
+
+
+class MotorPrecios:
+    """
+    Evalúa precios de muebles a partir de reglas declarativas.
+
+    Las reglas se compilan al cargarlas: cada término queda como una función
+    que recorre la columna de un atributo del lote y resuelve su aporte con
+    una tabla de búsqueda. evaluar agrupa los muebles por clase y aplica cada
+    término una vez por grupo, en lugar de una cadena de if/elif por mueble.
+
+    Las reglas se pueden reemplazar en caliente (cargar o recargar desde el
+    archivo): se compilan aparte y se publican con una sola asignación, así
+    que una evaluación en curso usa el juego anterior completo. Si las nuevas
+    reglas son inválidas se conservan las vigentes.
+
+    Los muebles de clases sin reglas, o cuya clase sobrescribe el
+    calcular_precio que las reglas describen, se valúan con calcular_precio.
+
+    Conceptos aplicados:
+    - Abstracción: Los recargos son datos y no código en cada clase
+    - Encapsulación: La compilación y el reemplazo de reglas quedan ocultos
+    """
+
+    def __init__(self, reglas: Optional[Mapping[str, Mapping]] = None):
+        """
+        Constructor del motor.
+
+        Args:
+            reglas: Reglas por nombre de clase (por defecto REGLAS_PREDETERMINADAS)
+        """
+        self._ruta: Optional[Path] = None
+        self._marca_archivo: Optional[Tuple[int, int]] = None
+        self._version = 0
+        self.cargar(REGLAS_PREDETERMINADAS if reglas is None else reglas)
+
+    @classmethod
+    def desde_archivo(cls, ruta: Union[str, Path]) -> "MotorPrecios":
+        """
+        Crea un motor con las reglas de un archivo JSON, que luego puede recargarse.
+
+        Args:
+            ruta: Archivo JSON con un objeto de reglas por clase
+
+        Returns:
+            MotorPrecios: Motor asociado al archivo
+        """
+        motor = cls()
+        motor._ruta = Path(ruta)
+        if not motor.recargar():
+            raise ErrorReglas(f"No se pudieron leer las reglas de {ruta}")
+        return motor
+
+    @property
+    def version(self) -> int:
+        """Cantidad de juegos de reglas cargados (cambia en cada recarga)."""
+        return self._version
+
+    def reglas(self) -> Dict[str, Dict]:
+        """Copia de las reglas vigentes."""
+        return copy.deepcopy(self._compilado[0])
+
+    def cargar(self, reglas: Mapping[str, Mapping]) -> None:
+        """
+        Compila y publica un nuevo juego de reglas.
+
+        Args:
+            reglas: Reglas por nombre de clase
+
+        Raises:
+            ErrorReglas: Si las reglas son inválidas (las vigentes no cambian)
+        """
+        if not isinstance(reglas, Mapping):
+            raise ErrorReglas("Las reglas deben ser un objeto con una entrada por clase")
+        copia = copy.deepcopy(dict(reglas))
+        programas = compilar_reglas(copia)
+        # Una sola asignación: los lectores ven el juego anterior o el nuevo
+        self._compilado = (copia, programas, {})
+        self._version += 1
+
+    def recargar(self) -> bool:
+        """
+        Vuelve a leer el archivo de reglas si cambió desde la última carga.
+
+        Returns:
+            bool: True si se cargó un juego nuevo
+
+        Raises:
+            ErrorReglas: Si el archivo cambió y sus reglas son inválidas
+        """
+        if self._ruta is None:
+            return False
+        try:
+            estado = os.stat(self._ruta)
+        except OSError:
+            return False
+        marca = (estado.st_mtime_ns, estado.st_size)
+        if marca == self._marca_archivo:
+            return False
+        try:
+            with open(self._ruta, encoding="utf-8") as archivo:
+                reglas = json.load(archivo)
+        except json.JSONDecodeError as e:
+            raise ErrorReglas(f"JSON inválido en {self._ruta}: {e}") from None
+        self.cargar(reglas)
+        self._marca_archivo = marca
+        return True
+
+    def programa(self, clase: type) -> Optional[_Programa]:
+        """
+        Reglas compiladas aplicables a una clase.
+
+        Args:
+            clase: Clase concreta de mueble
+
+        Returns:
+            Optional[_Programa]: Programa de la clase, o None si se valúa con calcular_precio
+        """
+        _, programas, por_clase = self._compilado
+        if clase in por_clase:
+            return por_clase[clase]
+        nombre = clase.__name__
+        programa = programas.get(nombre)
+        # Igual que el motor columnar: una subclase que redefine calcular_precio
+        # no se describe con las reglas de su clase
+        metodo = getattr(clase, "calcular_precio", None)
+        if programa is not None and getattr(metodo, "__qualname__", "") != (
+            f"{nombre}.calcular_precio"
+        ):
+            programa = None
+        por_clase[clase] = programa
+        return programa
+
+    def evaluar(self, muebles: Iterable[object]) -> List[float]:
+        """
+        Precios de un lote de muebles.
+
+        Args:
+            muebles: Muebles a valuar (de cualquier clase, mezclados)
+
+        Returns:
+            List[float]: Precio de cada mueble, en el mismo orden
+        """
+        muebles = list(muebles)
+        grupos: Dict[type, List[int]] = {}
+        for posicion, mueble in enumerate(muebles):
+            grupos.setdefault(type(mueble), []).append(posicion)
+        precios: List[float] = [0.0] * len(muebles)
+        for clase, posiciones in grupos.items():
+            lote = [muebles[i] for i in posiciones]
+            programa = self.programa(clase)
+            if programa is None:
+                valores = [mueble.calcular_precio() for mueble in lote]
+            else:
+                valores = programa.evaluar(lote)
+            for posicion, precio in zip(posiciones, valores):
+                precios[posicion] = precio
+        return precios
+
+    def precio(self, mueble: object) -> float:
+        """
+        Precio de un solo mueble.
+
+        Args:
+            mueble: Mueble a valuar
+
+        Returns:
+            float: Precio según las reglas vigentes
+        """
+        return self.evaluar([mueble])[0]
+
+    def valor_total(self, muebles: Iterable[object]) -> float:
+        """
+        Suma de los precios de un lote, redondeada a centavos.
+
+        Args:
+            muebles: Muebles a valuar
+
+        Returns:
+            float: Valor total
+        """
+        return round(sum(self.evaluar(muebles)), 2)
@@ -0,0 +1,208 @@
+"""
+Reportes de inventario por flujo.
+Escribe el reporte directamente en archivos abiertos, en texto, CSV y JSON
+Lines, recorriendo el inventario una sola vez para todos los formatos.
+"""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Mapping, Optional, TextIO, Type
+
+from services.catalogo import ErrorCatalogo, registro_de
+
+# Columnas comunes a todas las clases, usadas por el CSV
+COLUMNAS_REPORTE = ("tipo", "nombre", "material", "color", "precio")
+
+
+class EscritorReporte(ABC):
+    """
+    Formato de salida de un reporte.
+
+    El recorrido llama a encabezado una vez, a mueble por cada mueble del
+    inventario y a cierre al final. Cada llamada escribe de inmediato en el
+    archivo, sin acumular el reporte en memoria.
+
+    Conceptos aplicados:
+    - Polimorfismo: Cada formato redefine cómo se escribe cada parte
+    - Abstracción: El recorrido no conoce los detalles de los formatos
+    """
+
+    extension = ".txt"
+
+    def __init__(self, archivo: TextIO):
+        """
+        Constructor del escritor.
+
+        Args:
+            archivo: Archivo de texto abierto para escribir
+        """
+        self._archivo = archivo
+
+    def encabezado(self, nombre_tienda: str, estadisticas: Dict) -> None:
+        """Escribe lo que va antes de los muebles (por defecto nada)."""
+
+    @abstractmethod
+    def mueble(self, mueble: object, precio: float) -> None:
+        """
+        Escribe un mueble del inventario.
+        Este método debe ser implementado por cada formato.
+        """
+
+    def cierre(self, cantidad: int) -> None:
+        """Escribe lo que va después de los muebles (por defecto nada)."""
+
+
+class ReporteTexto(EscritorReporte):
+    """Reporte legible: resumen de la tienda y, opcionalmente, un mueble por línea."""
+
+    extension = ".txt"
+
+    def __init__(self, archivo: TextIO, detalle: bool = True):
+        """
+        Constructor del escritor de texto.
+
+        Args:
+            archivo: Archivo de texto abierto para escribir
+            detalle: Si listar cada mueble después del resumen
+        """
+        super().__init__(archivo)
+        self._detalle = detalle
+
+    def encabezado(self, nombre_tienda: str, estadisticas: Dict) -> None:
+        """Escribe el resumen: totales, distribución por tipos y descuentos."""
+        escribir = self._archivo.write
+        escribir(f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n\n")
+        escribir(f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n")
+        escribir(f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n")
+        escribir(f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n\n")
+        escribir("DISTRIBUCIÓN POR TIPOS:\n")
+        for tipo, cantidad in (estadisticas.get("tipos_muebles") or {}).items():
+            escribir(f"- {tipo}: {cantidad} unidades\n")
+        descuentos = estadisticas.get("descuentos_activos") or {}
+        if descuentos:
+            escribir("\nDESCUENTOS ACTIVOS:\n")
+            for categoria, descuento in descuentos.items():
+                escribir(f"- {categoria}: {descuento * 100:.1f}%\n")
+        if self._detalle:
+            escribir("\nDETALLE DEL INVENTARIO:\n")
+
+    def mueble(self, mueble: object, precio: float) -> None:
+        """Escribe una línea con tipo, nombre, material, color y precio."""
+        if self._detalle:
+            self._archivo.write(
+                f"- {type(mueble).__name__}: {mueble.nombre} | {mueble.material} | "
+                f"{mueble.color} | ${precio:.2f}\n"
+            )
+
+    def cierre(self, cantidad: int) -> None:
+        """Escribe la cantidad de muebles listados."""
+        if self._detalle:
+            self._archivo.write(f"\nMuebles listados: {cantidad}\n")
+
+
+class ReporteCSV(EscritorReporte):
+    """Un mueble por fila con las columnas de COLUMNAS_REPORTE."""
+
+    extension = ".csv"
+
+    def __init__(self, archivo: TextIO):
+        """
+        Constructor del escritor CSV.
+
+        Args:
+            archivo: Archivo abierto con newline="" (como pide el módulo csv)
+        """
+        super().__init__(archivo)
+        self._escritor = csv.writer(archivo)
+
+    def encabezado(self, nombre_tienda: str, estadisticas: Dict) -> None:
+        """Escribe la fila de nombres de columna."""
+        self._escritor.writerow(COLUMNAS_REPORTE)
+
+    def mueble(self, mueble: object, precio: float) -> None:
+        """Escribe la fila del mueble."""
+        self._escritor.writerow(
+            (type(mueble).__name__, mueble.nombre, mueble.material, mueble.color, precio)
+        )
+
+
+class ReporteJSONL(EscritorReporte):
+    """
+    Un objeto JSON por línea con el registro del mueble y su precio.
+
+    Los registros llevan la columna tipo y los argumentos del constructor
+    (registro_de), así que el archivo se puede volver a cargar con
+    cargar_catalogo; la columna precio se ignora al cargar.
+    """
+
+    extension = ".jsonl"
+
+    def mueble(self, mueble: object, precio: float) -> None:
+        """Escribe la línea del mueble."""
+        try:
+            registro = registro_de(mueble)
+        except ErrorCatalogo:
+            # Clase fuera del catálogo: solo las columnas comunes
+            registro = {
+                "tipo": type(mueble).__name__,
+                "nombre": mueble.nombre,
+                "material": mueble.material,
+                "color": mueble.color,
+            }
+        registro["precio"] = precio
+        self._archivo.write(json.dumps(registro, ensure_ascii=False) + "\n")
+
+
+# Escritor por nombre de formato
+FORMATOS_REPORTE: Dict[str, Type[EscritorReporte]] = {
+    "texto": ReporteTexto,
+    "csv": ReporteCSV,
+    "jsonl": ReporteJSONL,
+}
+
+
+def escribir_reporte(
+    nombre_tienda: str,
+    estadisticas: Dict,
+    muebles: Iterable[object],
+    destinos: Mapping[str, TextIO],
+    precio_de: Optional[Callable[[object], float]] = None,
+) -> int:
+    """
+    Escribe el reporte en uno o más formatos con un solo recorrido.
+
+    Cada mueble se lee una vez y se pasa a todos los escritores, de modo que
+    la memoria usada no depende de la cantidad de muebles.
+
+    Args:
+        nombre_tienda: Nombre que encabeza el reporte
+        estadisticas: Estadísticas de la tienda (obtener_estadisticas)
+        muebles: Muebles a listar (puede ser un generador)
+        destinos: Archivo abierto por formato ("texto", "csv" o "jsonl")
+        precio_de: Precio de cada mueble (por defecto su calcular_precio)
+
+    Returns:
+        int: Cantidad de muebles escritos
+
+    Raises:
+        ValueError: Si algún formato no existe
+    """
+    desconocidos = set(destinos) - set(FORMATOS_REPORTE)
+    if desconocidos:
+        raise ValueError(
+            f"Formatos de reporte desconocidos: {sorted(desconocidos)} "
+            f"(disponibles: {', '.join(FORMATOS_REPORTE)})"
+        )
+    escritores = [FORMATOS_REPORTE[formato](archivo) for formato, archivo in destinos.items()]
+    for escritor in escritores:
+        escritor.encabezado(nombre_tienda, estadisticas)
+    cantidad = 0
+    for mueble in muebles:
+        precio = mueble.calcular_precio() if precio_de is None else precio_de(mueble)
+        for escritor in escritores:
+            escritor.mueble(mueble, precio)
+        cantidad += 1
+    for escritor in escritores:
+        escritor.cierre(cantidad)
+    return cantidad
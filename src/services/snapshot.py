@@ -0,0 +1,385 @@
+"""
+Snapshot binario del inventario.
+Guarda los muebles en registros de ancho fijo con una tabla de cadenas, en un
+formato versionado que se puede abrir con mmap sin reconstruir cada objeto.
+
+Formato (little-endian):
+
+    cabecera    magic, versión, tamaño de registro, cantidades y desplazamientos
+    cadenas     desplazamientos uint32 (n + 1) seguidos del texto UTF-8
+    registros   tipo, nombre, material, color (ids de cadena), precio_base,
+                precio (float64) y argumentos extra (id de cadena JSON)
+    precios     precios float64 ordenados seguidos de los índices uint32
+"""
+
+import json
+import mmap
+import struct
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from services.catalogo import ErrorCatalogo, mueble_desde_registro, registro_de
+from services.indices import normalizar_texto
+
+MAGIC = b"MUEBSNAP"
+VERSION = 1
+
+_CABECERA = struct.Struct("<8sHHIIIQQQ")
+_REGISTRO = struct.Struct("<IIIIddI")
+_FLOAT64 = struct.Struct("<d")
+
+# Campos del registro que no van en los argumentos extra
+_CAMPOS_FIJOS = ("nombre", "material", "color", "precio_base")
+
+
+class ErrorSnapshot(ValueError):
+    """El archivo no es un snapshot válido o su versión no está soportada."""
+
+
+class _TablaCadenas:
+    """Tabla de cadenas sin repetidos que asigna un id a cada texto."""
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._cadenas: List[str] = []
+
+    def id_de(self, texto: str) -> int:
+        """Retorna el id del texto, agregándolo si no existe."""
+        identificador = self._ids.get(texto)
+        if identificador is None:
+            identificador = self._ids[texto] = len(self._cadenas)
+            self._cadenas.append(texto)
+        return identificador
+
+    def serializar(self) -> bytes:
+        """Desplazamientos uint32 seguidos del texto UTF-8 concatenado."""
+        codificadas = [cadena.encode("utf-8") for cadena in self._cadenas]
+        desplazamientos = [0]
+        for cadena in codificadas:
+            desplazamientos.append(desplazamientos[-1] + len(cadena))
+        indice = struct.pack(f"<{len(desplazamientos)}I", *desplazamientos)
+        return indice + b"".join(codificadas)
+
+    def __len__(self) -> int:
+        return len(self._cadenas)
+
+
+def escribir_snapshot(
+    ruta: Union[str, Path],
+    muebles_precios: Iterable[Tuple[object, float]],
+    metadatos: Optional[Dict] = None,
+) -> int:
+    """
+    Escribe un snapshot con los muebles en el orden recibido.
+
+    Args:
+        ruta: Archivo de destino (se sobrescribe)
+        muebles_precios: Pares (mueble, precio calculado)
+        metadatos: Datos adicionales serializables a JSON (nombre, descuentos...)
+
+    Returns:
+        int: Cantidad de registros escritos
+
+    Raises:
+        ErrorSnapshot: Si algún mueble no es de un tipo conocido del catálogo
+    """
+    cadenas = _TablaCadenas()
+    registros = bytearray()
+    precios: List[Tuple[float, int]] = []
+    tipos: Counter = Counter()
+    centavos = 0
+    extras: Dict[tuple, int] = {}
+    for indice, (mueble, precio) in enumerate(muebles_precios):
+        try:
+            registro = registro_de(mueble)
+        except ErrorCatalogo as e:
+            raise ErrorSnapshot(f"Mueble no soportado en snapshot: {e}") from e
+        fijos = [registro.pop(campo) for campo in ("tipo",) + _CAMPOS_FIJOS]
+        # Muchos muebles comparten los mismos argumentos extra: se serializan una vez
+        clave_extra = (fijos[0],) + tuple(registro.values())
+        id_extra = extras.get(clave_extra)
+        if id_extra is None:
+            id_extra = extras[clave_extra] = cadenas.id_de(
+                json.dumps(registro, ensure_ascii=False, sort_keys=True)
+            )
+        registros += _REGISTRO.pack(
+            cadenas.id_de(fijos[0]),
+            cadenas.id_de(fijos[1]),
+            cadenas.id_de(fijos[2]),
+            cadenas.id_de(fijos[3]),
+            float(fijos[4]),
+            float(precio),
+            id_extra,
+        )
+        precios.append((float(precio), indice))
+        tipos[fijos[0]] += 1
+        centavos += int(round(precio * 100))
+
+    cantidad = len(precios)
+    metadatos = dict(metadatos or {})
+    metadatos["tipos_muebles"] = dict(tipos)
+    metadatos["valor_centavos"] = centavos
+    id_metadatos = cadenas.id_de(json.dumps(metadatos, ensure_ascii=False))
+
+    precios.sort()
+    seccion_precios = struct.pack(f"<{cantidad}d", *(p for p, _ in precios)) + struct.pack(
+        f"<{cantidad}I", *(i for _, i in precios)
+    )
+    seccion_cadenas = cadenas.serializar()
+    inicio_cadenas = _CABECERA.size
+    inicio_registros = inicio_cadenas + len(seccion_cadenas)
+    inicio_precios = inicio_registros + len(registros)
+    cabecera = _CABECERA.pack(
+        MAGIC,
+        VERSION,
+        _REGISTRO.size,
+        cantidad,
+        len(cadenas),
+        id_metadatos,
+        inicio_cadenas,
+        inicio_registros,
+        inicio_precios,
+    )
+
+    destino = Path(ruta)
+    temporal = destino.with_name(destino.name + ".tmp")
+    with open(temporal, "wb") as archivo:
+        archivo.write(cabecera)
+        archivo.write(seccion_cadenas)
+        archivo.write(registros)
+        archivo.write(seccion_precios)
+    temporal.replace(destino)
+    return cantidad
+
+
+class _ColumnaPrecios:
+    """Vista de los precios ordenados del archivo, apta para bisect."""
+
+    def __init__(self, datos, inicio: int, cantidad: int):
+        self._datos = datos
+        self._inicio = inicio
+        self._cantidad = cantidad
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __getitem__(self, posicion: int) -> float:
+        return _FLOAT64.unpack_from(self._datos, self._inicio + 8 * posicion)[0]
+
+
+class TiendaSnapshot:
+    """
+    Tienda de solo lectura respaldada por un snapshot abierto con mmap.
+
+    Abrir el archivo solo lee la cabecera, así que el arranque no depende de
+    la cantidad de muebles. Las búsquedas y filtros recorren los registros en
+    el archivo y solo construyen los muebles que forman parte del resultado;
+    cada mueble construido se conserva para que las consultas repetidas
+    retornen los mismos objetos.
+
+    Conceptos aplicados:
+    - Polimorfismo: Expone las mismas consultas que TiendaMuebles
+    - Encapsulación: El formato binario queda oculto detrás de los métodos
+    """
+
+    def __init__(self, ruta: Union[str, Path]):
+        """
+        Abre el snapshot.
+
+        Args:
+            ruta: Archivo escrito con escribir_snapshot
+
+        Raises:
+            ErrorSnapshot: Si el archivo no es un snapshot o su versión no está soportada
+        """
+        self._archivo = open(ruta, "rb")
+        try:
+            self._datos = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._archivo.close()
+            raise ErrorSnapshot("El archivo de snapshot está vacío") from None
+        if len(self._datos) < _CABECERA.size:
+            self.cerrar()
+            raise ErrorSnapshot("El archivo de snapshot está truncado")
+        (
+            magic,
+            version,
+            tamaño_registro,
+            self._cantidad,
+            self._num_cadenas,
+            id_metadatos,
+            self._inicio_cadenas,
+            self._inicio_registros,
+            self._inicio_precios,
+        ) = _CABECERA.unpack_from(self._datos, 0)
+        if magic != MAGIC:
+            self.cerrar()
+            raise ErrorSnapshot("El archivo no es un snapshot de inventario")
+        if version != VERSION or tamaño_registro != _REGISTRO.size:
+            self.cerrar()
+            raise ErrorSnapshot(f"Versión de snapshot no soportada: {version}")
+        self._inicio_texto = self._inicio_cadenas + 4 * (self._num_cadenas + 1)
+        self._cadenas: Dict[int, str] = {}
+        self._muebles: Dict[int, object] = {}
+        self._metadatos = json.loads(self._cadena(id_metadatos))
+
+    def cerrar(self) -> None:
+        """Libera el mapeo y el archivo."""
+        self._datos.close()
+        self._archivo.close()
+
+    def __enter__(self) -> "TiendaSnapshot":
+        return self
+
+    def __exit__(self, *excepcion) -> None:
+        self.cerrar()
+
+    def __len__(self) -> int:
+        """Cantidad de muebles del snapshot."""
+        return self._cantidad
+
+    @property
+    def nombre(self) -> str:
+        """Nombre de la tienda guardado en el snapshot."""
+        return self._metadatos.get("nombre", "")
+
+    @property
+    def metadatos(self) -> Dict:
+        """Copia de los metadatos guardados junto al inventario."""
+        return dict(self._metadatos)
+
+    def _cadena(self, identificador: int) -> str:
+        """Decodifica una cadena de la tabla (con caché)."""
+        texto = self._cadenas.get(identificador)
+        if texto is None:
+            posicion = self._inicio_cadenas + 4 * identificador
+            inicio, fin = struct.unpack_from("<II", self._datos, posicion)
+            texto = self._datos[self._inicio_texto + inicio : self._inicio_texto + fin].decode(
+                "utf-8"
+            )
+            self._cadenas[identificador] = texto
+        return texto
+
+    def _registros(self) -> Iterator[tuple]:
+        """Recorre los registros crudos en orden de inserción."""
+        fin = self._inicio_registros + self._cantidad * _REGISTRO.size
+        return _REGISTRO.iter_unpack(memoryview(self._datos)[self._inicio_registros : fin])
+
+    def _ids_que_cumplen(self, condicion) -> set:
+        """Ids de cadena cuyo texto cumple la condición."""
+        return {i for i in range(self._num_cadenas) if condicion(self._cadena(i))}
+
+    def obtener(self, indice: int) -> object:
+        """
+        Construye (o retorna el ya construido) mueble en la posición dada.
+
+        Args:
+            indice: Posición en orden de inserción
+        """
+        if indice < 0:
+            indice += self._cantidad
+        if not 0 <= indice < self._cantidad:
+            raise IndexError("Índice fuera del snapshot")
+        mueble = self._muebles.get(indice)
+        if mueble is None:
+            posicion = self._inicio_registros + indice * _REGISTRO.size
+            tipo, nombre, material, color, precio_base, _, extra = _REGISTRO.unpack_from(
+                self._datos, posicion
+            )
+            registro = json.loads(self._cadena(extra))
+            registro.update(
+                tipo=self._cadena(tipo),
+                nombre=self._cadena(nombre),
+                material=self._cadena(material),
+                color=self._cadena(color),
+                precio_base=precio_base,
+            )
+            mueble = mueble_desde_registro(registro)
+            self._muebles[indice] = mueble
+        return mueble
+
+    def precio(self, indice: int) -> float:
+        """Precio guardado del mueble en la posición dada, sin construirlo."""
+        return _REGISTRO.unpack_from(self._datos, self._inicio_registros + indice * _REGISTRO.size)[
+            5
+        ]
+
+    def iterar_muebles(self) -> Iterator[object]:
+        """Construye los muebles de forma perezosa en orden de inserción."""
+        return map(self.obtener, range(self._cantidad))
+
+    def listar_muebles(self) -> List[object]:
+        """Construye y retorna todos los muebles en orden de inserción."""
+        return list(self.iterar_muebles())
+
+    def _filtrar_columna(self, columna: int, ids: set) -> List[object]:
+        """Muebles cuyo id de cadena en la columna pertenece a ids."""
+        if not ids:
+            return []
+        return [
+            self.obtener(indice)
+            for indice, registro in enumerate(self._registros())
+            if registro[columna] in ids
+        ]
+
+    def buscar_muebles_por_nombre(self, nombre: str) -> List[object]:
+        """Búsqueda parcial por nombre, sin distinguir mayúsculas."""
+        if not nombre or not nombre.strip():
+            return []
+        termino = nombre.lower().strip()
+        return self._filtrar_columna(1, self._ids_que_cumplen(lambda t: termino in t.lower()))
+
+    def filtrar_por_material(self, material: str) -> List[object]:
+        """Muebles del material dado (normalizado)."""
+        if not material or not material.strip():
+            return []
+        clave = normalizar_texto(material)
+        return self._filtrar_columna(
+            2, self._ids_que_cumplen(lambda t: normalizar_texto(t) == clave)
+        )
+
+    def filtrar_por_color(self, color: str) -> List[object]:
+        """Muebles del color dado (normalizado)."""
+        if not color or not color.strip():
+            return []
+        clave = normalizar_texto(color)
+        return self._filtrar_columna(
+            3, self._ids_que_cumplen(lambda t: normalizar_texto(t) == clave)
+        )
+
+    def filtrar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List[object]:
+        """
+        Muebles con precio en el rango (inclusivo), ordenados por precio.
+        Usa búsqueda binaria sobre la sección de precios ordenados.
+        """
+        if precio_min < 0:
+            precio_min = 0
+        if precio_min > precio_max:
+            return []
+        precios = _ColumnaPrecios(self._datos, self._inicio_precios, self._cantidad)
+        desde = bisect_left(precios, precio_min)
+        hasta = bisect_right(precios, precio_max)
+        inicio_indices = self._inicio_precios + 8 * self._cantidad
+        indices = struct.unpack_from(f"<{hasta - desde}I", self._datos, inicio_indices + 4 * desde)
+        return list(map(self.obtener, indices))
+
+    def calcular_valor_inventario(self) -> float:
+        """Valor total guardado en el snapshot."""
+        return round(self._metadatos["valor_centavos"] / 100, 2)
+
+    def obtener_estadisticas(self) -> dict:
+        """Estadísticas con el mismo formato que TiendaMuebles, en O(1)."""
+        return {
+            "total_muebles": self._cantidad,
+            "valor_inventario": self._metadatos["valor_centavos"] / 100,
+            "tipos_muebles": dict(self._metadatos["tipos_muebles"]),
+            "descuentos_activos": dict(self._metadatos.get("descuentos_activos", {})),
+            "ventas_realizadas": 0,
+            "total_muebles_vendidos": 0,
+            "valor_total_ventas": 0.0,
+            "total_comedores": 0,
+        }
@@ -3,111 +3,129 @@ Servicio de la tienda que maneja la lógica de negocio.
 Esta clase implementa el patrón de servicio para separar la lógica de negocio de la UI.
 """
 
-from typing import List, Dict, Optional, Union
+import heapq
+import io
+import json
+import math
+import threading
+import time
+import weakref
+from contextlib import ExitStack, contextmanager, nullcontext
+from datetime import datetime
+from itertools import islice
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 # Corrección de imports para ejecución directa
-from models.mueble import Mueble
-from models.composicion.comedor import Comedor
-# TODO: Importar las clases necesarias
+from services.indices import IndiceHash, IndicePrecios, IndiceTipos, IndiceTrigramas
+from services.consultas import PlanConsulta, Predicado, planificar
+from services.descuentos import TablaDescuentos
+from services.estadisticas import EstadisticasInventario
+from services.inventario import Inventario
+
+if TYPE_CHECKING:
+    from models.composicion.comedor import Comedor
+    from models.mueble import Mueble
+    from services.columnar import InventarioColumnar
+    from services.diario import DiarioVentas
+    from services.reglas_precio import MotorPrecios
+
+# Cantidad de candados entre los que se reparten los muebles en modo concurrente
+FRANJAS_CANDADOS = 64
+
+# Páginas que piden los generadores iter_*: empiezan chicas y se duplican
+TAMAÑO_PAGINA_ITER = 256
+MAX_PAGINA_ITER = 65536
+
+
+def _observar(mueble: "Mueble", observador: Callable[["Mueble"], None]) -> None:
+    """Suscribe el observador si el mueble avisa sus cambios (ver PrecioCacheable)."""
+    agregar = getattr(mueble, "agregar_observador", None)
+    if agregar is not None:
+        agregar(observador)
+
+
+def _dejar_de_observar(mueble: "Mueble", observador: Callable[["Mueble"], None]) -> None:
+    """Quita el observador suscrito con _observar."""
+    quitar = getattr(mueble, "quitar_observador", None)
+    if quitar is not None:
+        quitar(observador)
+
+
+class _ObservadorTienda:
+    """
+    Observador de cambios de los muebles de una tienda (ver _observar).
+    Referencia a la tienda de forma débil para que el registro de observadores
+    no la mantenga viva.
+    """
+
+    __slots__ = ("_tienda",)
+
+    def __init__(self, tienda: "TiendaMuebles"):
+        """Constructor con una referencia débil a la tienda."""
+        self._tienda = weakref.ref(tienda)
+
+    def __call__(self, mueble: "Mueble") -> None:
+        """Avisa a la tienda, o se quita del mueble si la tienda ya no existe."""
+        tienda = self._tienda()
+        if tienda is None:
+            mueble.quitar_observador(self)
+        else:
+            tienda._al_modificar(mueble)
+
+
+def _desuscribir_muebles(muebles: Iterable["Mueble"], observador: _ObservadorTienda) -> None:
+    """Quita el observador de una tienda que se liberó de los muebles que le quedaban."""
+    for mueble in muebles:
+        _dejar_de_observar(mueble, observador)
 
 
 class TiendaMuebles:
     def obtener_estadisticas(self) -> dict:
         """
         Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Se leen del agregado incremental, por lo que cuesta O(1); con el motor
+        columnar los totales del inventario se calculan sobre sus columnas.
         Returns:
             dict: Diccionario con estadísticas
         """
-        try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
-            )
-            # Acumulativos
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
-            return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
-            }
-        except Exception:
-            return {
-                "total_muebles": 0,
-                "total_comedores": 0,
-                "valor_inventario": 0.0,
-                "tipos_muebles": {},
-                "descuentos_activos": {},
-                "ventas_realizadas": 0,
-                "total_muebles_vendidos": 0,
-                "valor_total_ventas": 0.0,
-            }
+        if self._columnar is not None:
+            estadisticas = self._leer(self._estadisticas_columnar)
+        else:
+            estadisticas = self._leer(self._estadisticas.como_dict)
+        estadisticas["total_comedores"] = len(self._comedores)
+        return estadisticas
+
+    def _estadisticas_columnar(self) -> dict:
+        """
+        Estadísticas con el total, el valor y los tipos del inventario leídos del motor columnar.
+        Método privado auxiliar de obtener_estadisticas.
+        """
+        estadisticas = self._estadisticas.como_dict()
+        estadisticas["total_muebles"] = len(self._columnar)
+        estadisticas["valor_inventario"] = round(self._columnar.valor_total(), 2)
+        estadisticas["tipos_muebles"] = self._columnar.conteo_por_tipo()
+        return estadisticas
 
     def estadisticas(self) -> dict:
         """
-        Retorna estadísticas básicas y acumulativas de la tienda para la UI.
+        Alias de obtener_estadisticas.
         Returns:
             dict: Diccionario con estadísticas
         """
-        try:
-            total_muebles = len(self._inventario)
-            total_comedores = len(self._comedores)
-            valor_inventario = 0
-            for mueble in self._inventario:
-                try:
-                    valor_inventario += mueble.calcular_precio()
-                except Exception:
-                    pass
-            tipos_muebles = {}
-            for mueble in self._inventario:
-                tipo = type(mueble).__name__
-                tipos_muebles[tipo] = tipos_muebles.get(tipo, 0) + 1
-            ventas_realizadas = (
-                len(self._ventas_realizadas)
-                if hasattr(self, "_ventas_realizadas")
-                else 0
-            )
-            total_muebles_vendidos = getattr(self, "_total_muebles_vendidos", 0)
-            valor_total_ventas = getattr(self, "_valor_total_ventas", 0.0)
-            return {
-                "total_muebles": total_muebles,
-                "total_comedores": total_comedores,
-                "valor_inventario": valor_inventario,
-                "tipos_muebles": tipos_muebles,
-                "descuentos_activos": self._descuentos_activos.copy(),
-                "ventas_realizadas": ventas_realizadas,
-                "total_muebles_vendidos": total_muebles_vendidos,
-                "valor_total_ventas": valor_total_ventas,
-            }
-        except Exception:
-            return {
-                "total_muebles": 0,
-                "total_comedores": 0,
-                "valor_inventario": 0.0,
-                "tipos_muebles": {},
-                "descuentos_activos": {},
-                "ventas_realizadas": 0,
-                "total_muebles_vendidos": 0,
-                "valor_total_ventas": 0.0,
-            }
+        return self.obtener_estadisticas()
 
     """
     Clase que maneja toda la lógica de negocio de la tienda de muebles.
@@ -124,52 +142,389 @@ class TiendaMuebles:
     - Composición: Contiene colecciones de muebles
     """
 
-    def __init__(self, nombre_tienda: str = "Mueblería OOP"):
+    def __init__(
+        self,
+        nombre_tienda: str = "Mueblería OOP",
+        motor_columnar: bool = False,
+        concurrente: bool = False,
+        motor_precios: Optional["MotorPrecios"] = None,
+    ):
         """
         Constructor de la tienda.
 
+        En modo concurrente cada mueble se vende bajo el candado de su franja
+        (un mismo mueble siempre cae en la misma), así que dos vendedores no
+        pueden vender la misma unidad; las modificaciones de los índices se
+        serializan con un candado de escritura corto. Las consultas no toman
+        candados: leen de forma optimista y se repiten si una escritura ocurrió
+        mientras leían (seqlock).
+
         Args:
             nombre_tienda: Nombre de la tienda
+            motor_columnar: Si mantener además el motor columnar para cálculos por lotes
+            concurrente: Si la tienda se usará desde varios hilos
+            motor_precios: Reglas de precio de la tienda; sin él cada mueble
+                se valúa con su propio calcular_precio
         """
         self._nombre = nombre_tienda
-        self._inventario: List[Mueble] = []
-        self._comedores: List[Comedor] = []
+        self._inventario = Inventario()
+        self._comedores: List["Comedor"] = []
         self._ventas_realizadas: List[Dict] = []
-        self._descuentos_activos: Dict[str, float] = {}
-        # Campos acumulativos
-        self._total_muebles_vendidos: int = 0
-        self._valor_total_ventas: float = 0.0
-        pass
+        self._descuentos = TablaDescuentos()
+        # Estadísticas y campos acumulativos
+        self._estadisticas = EstadisticasInventario()
+        # Índices secundarios (material y color normalizados)
+        self._indice_material = IndiceHash(
+            lambda m: getattr(m, "material", None), self._inventario.orden
+        )
+        self._indice_color = IndiceHash(lambda m: getattr(m, "color", None), self._inventario.orden)
+        self._indice_precios = IndicePrecios()
+        self._indice_nombres = IndiceTrigramas()
+        self._indice_tipos = IndiceTipos(self._inventario.orden)
+        self._motor_precios = motor_precios
+        self._columnar: Optional["InventarioColumnar"] = None
+        if motor_columnar:
+            from services import columnar
+
+            self._columnar = columnar.InventarioColumnar(motor_precios)
+        self._diario: Optional["DiarioVentas"] = None
+        # Sincronización (solo en modo concurrente)
+        self._concurrente = concurrente
+        self._version = 0
+        self._candado_escritura = threading.Lock() if concurrente else nullcontext()
+        self._candados_venta = (
+            [threading.Lock() for _ in range(FRANJAS_CANDADOS)] if concurrente else None
+        )
+        # Los setters de los muebles del inventario avisan para reindexarlos
+        self._observador = _ObservadorTienda(self)
+        weakref.finalize(self, _desuscribir_muebles, self._inventario, self._observador)
 
     @property
     def nombre(self) -> str:
         """Getter para el nombre de la tienda."""
         return self._nombre
 
+    @property
+    def concurrente(self) -> bool:
+        """Indica si la tienda está en modo concurrente."""
+        return self._concurrente
+
+    @property
+    def version(self) -> int:
+        """
+        Contador de modificaciones de la tienda.
+        Cambia con cada alta, venta, descuento o comedor; sirve para validar cachés.
+        """
+        return self._version
+
+    @contextmanager
+    def _escritura(self):
+        """
+        Bloque que modifica inventario, índices o estadísticas.
+        La versión queda impar mientras dura para que los lectores reintenten.
+        """
+        with self._candado_escritura:
+            self._version += 1
+            try:
+                yield
+            finally:
+                self._version += 1
+
+    def _leer(self, consulta: Callable, *argumentos):
+        """
+        Ejecuta una consulta sin bloquearse detrás de las escrituras.
+
+        En modo concurrente la consulta se repite si hubo una escritura
+        mientras se ejecutaba (o si la escritura la hizo fallar).
+        """
+        if not self._concurrente:
+            return consulta(*argumentos)
+        while True:
+            version = self._version
+            if version % 2 == 0:
+                try:
+                    resultado = consulta(*argumentos)
+                except (IndexError, KeyError, RuntimeError, TypeError, ValueError):
+                    if self._version == version:
+                        raise
+                else:
+                    if self._version == version:
+                        return resultado
+            time.sleep(0)
+
+    @staticmethod
+    def _franja(mueble: "Mueble") -> int:
+        """Franja de candado que le corresponde a un mueble."""
+        # Los id de CPython son múltiplos de 16: se descartan los bits bajos
+        return (id(mueble) >> 4) % FRANJAS_CANDADOS
+
+    def _candado_mueble(self, mueble: "Mueble"):
+        """Candado de la franja del mueble (o uno nulo fuera del modo concurrente)."""
+        if self._candados_venta is None:
+            return self._candado_escritura
+        return self._candados_venta[self._franja(mueble)]
+
+    @contextmanager
+    def _candados_lote(self, muebles: List["Mueble"]):
+        """
+        Toma los candados de las franjas de un lote de muebles.
+        Se toman en orden creciente para que dos lotes no se bloqueen mutuamente.
+        """
+        if self._candados_venta is None:
+            yield
+            return
+        with ExitStack() as pila:
+            for franja in sorted({self._franja(mueble) for mueble in muebles}):
+                pila.enter_context(self._candados_venta[franja])
+            yield
+
+    def listar_muebles(self) -> List["Mueble"]:
+        """
+        Retorna una copia del inventario en orden de inserción.
+        Útil para mostrar listas numeradas estables.
+
+        Returns:
+            List[Mueble]: Muebles disponibles
+        """
+        return self._leer(self._inventario.listar)
+
+    def guardar_snapshot(self, ruta: str) -> int:
+        """
+        Guarda el inventario en un snapshot binario (ver services.snapshot).
+        Los comedores y el historial de ventas no forman parte del snapshot.
+
+        Args:
+            ruta: Archivo de destino
+
+        Returns:
+            int: Cantidad de muebles guardados
+        """
+        from services.snapshot import escribir_snapshot
+
+        return escribir_snapshot(
+            ruta,
+            ((m, self._indice_precios.precio_de(m)) for m in self._inventario),
+            {"nombre": self._nombre, "descuentos_activos": self._descuentos.activos},
+        )
+
+    @classmethod
+    def desde_snapshot(
+        cls,
+        ruta: str,
+        motor_columnar: bool = False,
+        motor_precios: Optional["MotorPrecios"] = None,
+    ) -> "TiendaMuebles":
+        """
+        Crea una tienda modificable con el contenido de un snapshot.
+        Para consultas de solo lectura sin construir los muebles usar TiendaSnapshot.
+
+        Args:
+            ruta: Archivo escrito con guardar_snapshot
+            motor_columnar: Si mantener el motor columnar
+            motor_precios: Reglas de precio de la tienda (ver __init__)
+
+        Returns:
+            TiendaMuebles: Tienda con los muebles y descuentos guardados
+        """
+        from services.snapshot import TiendaSnapshot
+
+        with TiendaSnapshot(ruta) as snapshot:
+            tienda = cls(
+                snapshot.nombre or "Mueblería OOP",
+                motor_columnar=motor_columnar,
+                motor_precios=motor_precios,
+            )
+            tienda.agregar_muebles(snapshot.iterar_muebles())
+            tienda._descuentos.cargar(snapshot.metadatos.get("descuentos_activos", {}))
+        tienda._estadisticas.registrar_descuentos(tienda._descuentos.activos)
+        return tienda
+
+    def identificador(self, mueble: "Mueble") -> Optional[int]:
+        """
+        Identificador público y estable de un mueble del inventario: su número
+        de secuencia de alta, que no se reutiliza aunque el mueble se venda
+        (a diferencia de id(), que CPython puede reasignar a otro objeto).
+
+        Args:
+            mueble: Mueble del inventario
+
+        Returns:
+            int o None si el mueble no está disponible
+        """
+        try:
+            return self._inventario.orden(mueble)
+        except KeyError:
+            return None
+
+    def obtener_mueble(self, identificador: int) -> Optional["Mueble"]:
+        """
+        Busca un mueble del inventario por su identificador (ver identificador).
+        Lo usan las interfaces que no pueden pasar el objeto, como la API HTTP.
+
+        Args:
+            identificador: Valor de identificador(mueble)
+
+        Returns:
+            Mueble o None si no está disponible
+        """
+        return self._leer(self._inventario.obtener_por_orden, identificador)
+
     # @property
     # def total_muebles(self) -> int:
     #     """Retorna el total de muebles en inventario."""
     #     return len(self._inventario)
 
-    def agregar_mueble(self, mueble: "Mueble") -> str:
+    def precio(self, mueble: "Mueble") -> float:
         """
-        Agrega un mueble al inventario de la tienda.
+        Precio de un mueble para la tienda: el de las reglas del motor de
+        precios si la tienda tiene uno, o el de su calcular_precio.
+
         Args:
-            mueble: Objeto mueble a agregar
+            mueble: Mueble a valuar
+
         Returns:
-            str: Mensaje de confirmación
+            float: Precio antes de descuentos
+        """
+        if self._motor_precios is not None:
+            return self._motor_precios.precio(mueble)
+        return mueble.calcular_precio()
+
+    def cargar_reglas(self, reglas: Mapping[str, Mapping]) -> None:
+        """
+        Reemplaza las reglas de precio y revalúa el inventario.
+
+        Args:
+            reglas: Reglas por nombre de clase (formato de REGLAS_PREDETERMINADAS)
+
+        Raises:
+            ValueError: Si la tienda no tiene motor de precios
+            ErrorReglas: Si las reglas son inválidas (las vigentes no cambian)
+        """
+        if self._motor_precios is None:
+            raise ValueError("La tienda no tiene motor de precios")
+        self._motor_precios.cargar(reglas)
+        self._revaluar_inventario()
+
+    def recargar_reglas(self) -> bool:
+        """
+        Vuelve a leer el archivo de reglas del motor de precios y, si cambió,
+        revalúa el inventario. Permite cambiar precios sin reiniciar.
+
+        Returns:
+            bool: True si se cargaron reglas nuevas
+
+        Raises:
+            ErrorReglas: Si el archivo cambió y sus reglas son inválidas
+        """
+        if self._motor_precios is None or not self._motor_precios.recargar():
+            return False
+        self._revaluar_inventario()
+        return True
+
+    def _revaluar_inventario(self) -> None:
+        """
+        Valúa todo el inventario con las reglas vigentes, en un lote, y
+        actualiza el índice de precios, las estadísticas y el motor columnar.
+        Método privado auxiliar.
+        """
+        with self._escritura():
+            muebles = self._inventario.listar()
+            anteriores = [(m, self._indice_precios.precio_de(m)) for m in muebles]
+            nuevos = list(zip(muebles, self._motor_precios.evaluar(muebles)))
+            self._estadisticas.registrar_bajas(anteriores)
+            self._estadisticas.registrar_altas(nuevos)
+            self._indice_precios.quitar_lote(muebles)
+            self._indice_precios.agregar_lote(nuevos)
+            if self._columnar is not None:
+                self._columnar.revaluar()
+
+    def _validar_mueble(self, mueble: "Mueble") -> Tuple[Optional[float], Optional[str]]:
+        """
+        Valida un mueble y calcula su precio.
+        Método privado auxiliar compartido por las altas individuales y por lotes.
+
+        Returns:
+            Tuple: (precio, None) si es válido o (None, mensaje de error)
         """
         if mueble is None:
-            return "Error: El mueble no puede ser None"
+            return None, "Error: El mueble no puede ser None"
         try:
-            precio = mueble.calcular_precio()
+            precio = self.precio(mueble)
             if precio <= 0:
-                return "Error: El mueble debe tener un precio válido mayor a 0"
+                return None, "Error: El mueble debe tener un precio válido mayor a 0"
         except Exception as e:
-            return f"Error al calcular precio del mueble: {str(e)}"
-        self._inventario.append(mueble)
+            return None, f"Error al calcular precio del mueble: {str(e)}"
+        return precio, None
+
+    def agregar_mueble(self, mueble: "Mueble") -> str:
+        """
+        Agrega un mueble al inventario de la tienda.
+        Args:
+            mueble: Objeto mueble a agregar
+        Returns:
+            str: Mensaje de confirmación
+        """
+        precio, error = self._validar_mueble(mueble)
+        if error:
+            return error
+        with self._escritura():
+            if not self._inventario.agregar(mueble):
+                return "Error: El mueble ya está en el inventario"
+            self._indice_material.agregar(mueble)
+            self._indice_color.agregar(mueble)
+            self._indice_precios.agregar(mueble, precio)
+            self._indice_nombres.agregar(mueble, getattr(mueble, "nombre", "") or "")
+            self._indice_tipos.agregar(mueble)
+            self._estadisticas.registrar_alta(mueble, precio)
+            if self._columnar is not None:
+                self._columnar.agregar(mueble)
+            _observar(mueble, self._observador)
         return f"Mueble {getattr(mueble, 'nombre', str(mueble))} agregado exitosamente al inventario"
 
+    def agregar_muebles(self, muebles: Iterable["Mueble"]) -> Dict:
+        """
+        Agrega un lote de muebles al inventario.
+
+        Valida y calcula el precio de cada mueble en una sola pasada y luego
+        actualiza cada índice y las estadísticas una vez por lote.
+
+        Args:
+            muebles: Iterable de muebles a agregar
+        Returns:
+            Dict: Resumen con la cantidad de aceptados y rechazados, y los
+            errores como pares (posición en el lote, mensaje)
+        """
+        validados: List[Tuple[int, "Mueble", float]] = []
+        errores: List[Tuple[int, str]] = []
+        for posicion, mueble in enumerate(muebles):
+            precio, error = self._validar_mueble(mueble)
+            if error:
+                errores.append((posicion, error))
+            else:
+                validados.append((posicion, mueble, precio))
+
+        aceptados: List[Tuple["Mueble", float]] = []
+        with self._escritura():
+            for posicion, mueble, precio in validados:
+                if self._inventario.agregar(mueble):
+                    aceptados.append((mueble, precio))
+                else:
+                    errores.append((posicion, "Error: El mueble ya está en el inventario"))
+            self._indice_material.agregar_lote(m for m, _ in aceptados)
+            self._indice_color.agregar_lote(m for m, _ in aceptados)
+            self._indice_precios.agregar_lote(aceptados)
+            self._indice_nombres.agregar_lote(
+                (m, getattr(m, "nombre", "") or "") for m, _ in aceptados
+            )
+            self._indice_tipos.agregar_lote(m for m, _ in aceptados)
+            self._estadisticas.registrar_altas(aceptados)
+            if self._columnar is not None:
+                self._columnar.agregar_lote(m for m, _ in aceptados)
+            for mueble, _ in aceptados:
+                _observar(mueble, self._observador)
+        errores.sort()
+        return {"aceptados": len(aceptados), "rechazados": len(errores), "errores": errores}
+
     def agregar_comedor(self, comedor: "Comedor") -> str:
         """
         Agrega un comedor completo a la tienda.
@@ -180,7 +535,8 @@ class TiendaMuebles:
         """
         if comedor is None:
             return "Error: El comedor no puede ser None"
-        self._comedores.append(comedor)
+        with self._escritura():
+            self._comedores.append(comedor)
         return (
             f"Comedor {getattr(comedor, 'nombre', str(comedor))} agregado exitosamente"
         )
@@ -195,40 +551,35 @@ class TiendaMuebles:
         """
         if not nombre or not nombre.strip():
             return []
-        nombre_lower = nombre.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            if nombre_lower in mueble.nombre.lower():
-                resultados.append(mueble)
-        return resultados
+        return self._leer(self._indice_nombres.buscar, nombre.lower().strip())
 
     def filtrar_por_precio(
         self, precio_min: float = 0, precio_max: float = float("inf")
     ) -> List["Mueble"]:
         """
         Filtra muebles por rango de precios.
+        Con el motor columnar se recorre su columna de precios.
 
         Args:
             precio_min: Precio mínimo (inclusivo)
             precio_max: Precio máximo (inclusivo)
         Returns:
-            List[Mueble]: Lista de muebles en el rango de precios
+            List[Mueble]: Lista de muebles en el rango, ordenada por precio
         """
         if precio_min < 0:
             precio_min = 0
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                precio = mueble.calcular_precio()
-                if precio_min <= precio <= precio_max:
-                    resultados.append(mueble)
-            except Exception:
-                continue  # Saltar muebles con errores de precio
-        return resultados
+        if self._columnar is not None:
+            return self._leer(
+                lambda: self._columnar.filtrar(
+                    precio_min=precio_min, precio_max=precio_max, por_precio=True
+                )
+            )
+        return self._leer(self._indice_precios.rango, precio_min, precio_max)
 
     def filtrar_por_material(self, material: str) -> List["Mueble"]:
         """
         Filtra muebles por material.
+        Con el motor columnar se compara una vez cada valor distinto de su columna.
 
         Args:
             material: Material a buscar
@@ -237,19 +588,25 @@ class TiendaMuebles:
         """
         if not material or not material.strip():
             return []
-        material_lower = material.lower().strip()
-        resultados = []
-        for mueble in self._inventario:
-            try:
-                if (
-                    hasattr(mueble, "material")
-                    and mueble.material
-                    and mueble.material.lower().strip() == material_lower
-                ):
-                    resultados.append(mueble)
-            except Exception:
-                continue
-        return resultados
+        if self._columnar is not None:
+            return self._leer(lambda: self._columnar.filtrar(material=material))
+        return self._leer(self._indice_material.buscar, material)
+
+    def filtrar_por_color(self, color: str) -> List["Mueble"]:
+        """
+        Filtra muebles por color.
+        Con el motor columnar se compara una vez cada valor distinto de su columna.
+
+        Args:
+            color: Color a buscar
+        Returns:
+            List[Mueble]: Lista de muebles del color especificado
+        """
+        if not color or not color.strip():
+            return []
+        if self._columnar is not None:
+            return self._leer(lambda: self._columnar.filtrar(color=color))
+        return self._leer(self._indice_color.buscar, color)
 
     def obtener_muebles_por_tipo(self, tipo_clase: type) -> List["Mueble"]:
         """
@@ -261,59 +618,470 @@ class TiendaMuebles:
         Returns:
             List[Mueble]: Lista de muebles del tipo especificado
         """
-        # TODO: Implementar filtro por tipo
-        # resultados = []
-        # for mueble in self._inventario:
-        #     if isinstance(mueble, tipo_clase):
-        #         resultados.append(mueble)
-        # return resultados
-        pass
+        return self._leer(self._indice_tipos.buscar, tipo_clase)
+
+    def _predicados(
+        self,
+        nombre: Optional[str],
+        tipo: Optional[type],
+        material: Optional[str],
+        color: Optional[str],
+        precio_min: Optional[float],
+        precio_max: Optional[float],
+    ) -> List[Predicado]:
+        """
+        Arma los predicados de una consulta con sus estimaciones.
+        Método privado auxiliar de consultar y explicar_consulta.
+        """
+        predicados: List[Predicado] = []
+        if nombre and nombre.strip():
+            termino = nombre.lower().strip()
+            indice_nombres = self._indice_nombres
+            predicados.append(
+                Predicado(
+                    "nombre",
+                    f"contiene '{termino}'",
+                    indice_nombres.estimar(termino),
+                    lambda: indice_nombres.buscar(termino),
+                    lambda m: indice_nombres.coincide(m, termino),
+                )
+            )
+        if tipo is not None:
+            predicados.append(
+                Predicado(
+                    "tipo",
+                    f"es {tipo.__name__}",
+                    self._indice_tipos.contar(tipo),
+                    lambda: self._indice_tipos.buscar(tipo),
+                    lambda m: isinstance(m, tipo),
+                )
+            )
+        for campo, valor, indice in (
+            ("material", material, self._indice_material),
+            ("color", color, self._indice_color),
+        ):
+            if valor and valor.strip():
+                predicados.append(
+                    Predicado(
+                        campo,
+                        f"= '{valor.strip()}'",
+                        indice.contar(valor),
+                        lambda indice=indice, valor=valor: indice.buscar(valor),
+                        lambda m, indice=indice, valor=valor: indice.coincide(m, valor),
+                    )
+                )
+        if precio_min is not None or precio_max is not None:
+            minimo = max(precio_min or 0, 0)
+            maximo = float("inf") if precio_max is None else precio_max
+            precios = self._indice_precios
+
+            def en_rango(mueble: "Mueble") -> bool:
+                # Un mueble vendido mientras se lee ya no tiene precio indexado
+                precio = precios.precio_de(mueble)
+                return precio is not None and minimo <= precio <= maximo
+
+            predicados.append(
+                Predicado(
+                    "precio",
+                    f"entre {minimo} y {maximo}",
+                    precios.contar(minimo, maximo),
+                    lambda: precios.rango(minimo, maximo),
+                    en_rango,
+                    ordenado=False,
+                )
+            )
+        return predicados
+
+    def explicar_consulta(
+        self,
+        nombre: Optional[str] = None,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> PlanConsulta:
+        """
+        Plan que usaría consultar con los mismos criterios, sin ejecutarlo.
+        str(plan) muestra el índice elegido, los filtros y las estimaciones.
+
+        Returns:
+            PlanConsulta: Plan elegido
+        """
+        return self._leer(
+            lambda: planificar(
+                self._predicados(nombre, tipo, material, color, precio_min, precio_max),
+                len(self._inventario),
+            )
+        )
+
+    def consultar(
+        self,
+        nombre: Optional[str] = None,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> List["Mueble"]:
+        """
+        Busca muebles que cumplan todos los criterios indicados.
+
+        En lugar de resolver cada criterio por separado e intersectar, se
+        estima cuántos muebles devolvería cada índice, se obtienen los
+        candidatos del más selectivo y los demás criterios se comprueban solo
+        sobre ellos (ver explicar_consulta). Los criterios en None o vacíos
+        se ignoran; sin criterios se devuelve todo el inventario.
+
+        Args:
+            nombre: Parte del nombre (sin distinguir mayúsculas)
+            tipo: Clase concreta o de categoría
+            material: Material exacto (normalizado)
+            color: Color exacto (normalizado)
+            precio_min: Precio mínimo (inclusivo)
+            precio_max: Precio máximo (inclusivo)
+
+        Returns:
+            List[Mueble]: Muebles coincidentes en orden de inserción
+        """
+        return self._leer(
+            lambda: planificar(
+                self._predicados(nombre, tipo, material, color, precio_min, precio_max),
+                len(self._inventario),
+            ).ejecutar(self._inventario.listar, self._inventario.orden)
+        )
+
+    def paginar(
+        self,
+        cursor: Optional[Tuple] = None,
+        limite: int = 50,
+        nombre: Optional[str] = None,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+        por_precio: bool = False,
+    ) -> Tuple[List["Mueble"], Optional[Tuple]]:
+        """
+        Una página de consultar (o del rango de precios) a partir de un cursor.
+
+        El cursor es la clave del último mueble entregado (su secuencia de
+        inserción, o precio y secuencia si por_precio), no una posición: los
+        muebles agregados o vendidos entre páginas no hacen que se repitan ni
+        se salteen los demás. Los agregados después aparecen al final (o en su
+        lugar por precio) si todavía no se pasó por ahí.
+
+        Args:
+            cursor: Cursor devuelto por la página anterior (None para la primera)
+            limite: Tamaño máximo de la página
+            nombre, tipo, material, color, precio_min, precio_max: Como en consultar
+            por_precio: Ordenar de menor a mayor precio en lugar de por inserción
+
+        Returns:
+            Tuple: (muebles de la página, cursor de la siguiente o None si no hay más)
+        """
+        if limite <= 0:
+            raise ValueError("El límite de la página debe ser mayor a 0")
+        if cursor is not None and len(cursor) != (2 if por_precio else 1):
+            raise ValueError("El cursor no corresponde a este orden de paginación")
+        if por_precio:
+            return self._leer(
+                self._pagina_por_precio,
+                self._predicados(nombre, tipo, material, color, None, None),
+                max(precio_min or 0, 0),
+                float("inf") if precio_max is None else precio_max,
+                cursor,
+                limite,
+            )
+
+        def leer_pagina() -> Tuple[List["Mueble"], Optional[Tuple]]:
+            plan = planificar(
+                self._predicados(nombre, tipo, material, color, precio_min, precio_max),
+                len(self._inventario),
+            )
+            despues_de = -1 if cursor is None else cursor[0]
+            muebles = plan.pagina(
+                self._inventario.desde, self._inventario.orden, despues_de, limite
+            )
+            if len(muebles) < limite:
+                return muebles, None
+            return muebles, (self._inventario.orden(muebles[-1]),)
+
+        return self._leer(leer_pagina)
+
+    def _pagina_por_precio(
+        self,
+        predicados: List[Predicado],
+        precio_min: float,
+        precio_max: float,
+        cursor: Optional[Tuple[float, int]],
+        limite: int,
+    ) -> Tuple[List["Mueble"], Optional[Tuple]]:
+        """
+        Página ordenada por precio: recorre el índice de precios desde el
+        cursor y comprueba los demás predicados, del más selectivo al menos.
+        Método privado auxiliar de paginar.
+        """
+        filtros = [p.cumple for p in sorted(predicados, key=lambda p: p.estimacion)]
+        muebles: List["Mueble"] = []
+        for mueble in self._indice_precios.desde(precio_min, precio_max, cursor):
+            if all(cumple(mueble) for cumple in filtros):
+                muebles.append(mueble)
+                if len(muebles) >= limite:
+                    return muebles, self._indice_precios.clave_de(mueble)
+        return muebles, None
+
+    def mas_baratos(
+        self,
+        k: int,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+    ) -> List["Mueble"]:
+        """
+        Los k muebles más baratos, opcionalmente de un tipo, material o color.
+
+        Sin filtros basta con tomar el extremo del índice de precios (O(k)).
+        Con filtros se elige lo más barato entre recorrer ese índice hasta
+        reunir k coincidencias o seleccionar con un montículo entre los
+        candidatos del índice más selectivo (O(m log k)); ver _top_k.
+
+        Args:
+            k: Cantidad de muebles
+            tipo: Clase concreta o de categoría
+            material: Material (normalizado)
+            color: Color (normalizado)
+
+        Returns:
+            List[Mueble]: Hasta k muebles de menor a mayor precio
+        """
+        return self._leer(self._top_k, k, False, tipo, material, color)
+
+    def mas_caros(
+        self,
+        k: int,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+    ) -> List["Mueble"]:
+        """
+        Los k muebles más caros (ver mas_baratos).
+
+        Returns:
+            List[Mueble]: Hasta k muebles de mayor a menor precio
+        """
+        return self._leer(self._top_k, k, True, tipo, material, color)
+
+    def _top_k(
+        self,
+        k: int,
+        descendente: bool,
+        tipo: Optional[type],
+        material: Optional[str],
+        color: Optional[str],
+    ) -> List["Mueble"]:
+        """
+        Selección de los k extremos por precio.
+        Método privado auxiliar de mas_baratos y mas_caros.
+        """
+        if k <= 0:
+            return []
+        recorrido = self._indice_precios.recorrer(descendente)
+        predicados = self._predicados(None, tipo, material, color, None, None)
+        if not predicados:
+            return list(islice(recorrido, k))
+        total = len(self._indice_precios)
+        plan = planificar(predicados, total)
+        candidatos = plan.acceso.estimacion
+        if candidatos == 0:
+            return []
+        filtros = [predicado.cumple for predicado in predicados]
+        # Recorriendo por precio se esperan k * total / candidatos pasos hasta
+        # reunir k coincidencias; el montículo cuesta candidatos * log k
+        if k * total <= candidatos * candidatos * max(1.0, math.log2(k)):
+            coincidencias = (m for m in recorrido if all(cumple(m) for cumple in filtros))
+            return list(islice(coincidencias, k))
+        return self._seleccionar_por_precio(
+            k,
+            (m for m in plan.acceso.obtener() if all(p.cumple(m) for p in plan.filtros)),
+            descendente,
+        )
+
+    def _seleccionar_por_precio(
+        self, k: int, muebles: Iterable["Mueble"], descendente: bool
+    ) -> List["Mueble"]:
+        """
+        Los k extremos de un grupo por su clave (precio, secuencia) del índice.
+        Los muebles vendidos durante el recorrido ya no tienen clave y se
+        saltan (la lectura se repite de todos modos porque cambió la versión).
+        Método privado auxiliar.
+        """
+        clave_de = self._indice_precios.clave_de
+        con_clave = (
+            (clave, mueble)
+            for mueble in muebles
+            for clave in (clave_de(mueble),)
+            if clave is not None
+        )
+        seleccionar = heapq.nlargest if descendente else heapq.nsmallest
+        return [mueble for _, mueble in seleccionar(k, con_clave, key=itemgetter(0))]
+
+    def mas_baratos_por_tipo(self, k: int) -> Dict[str, List["Mueble"]]:
+        """
+        Los k muebles más baratos de cada clase concreta presente.
+        Un montículo por clase: O(n log k) en total.
+
+        Args:
+            k: Cantidad de muebles por clase
+
+        Returns:
+            Dict[str, List[Mueble]]: Nombre de la clase -> muebles de menor a mayor precio
+        """
+        return self._leer(self._top_k_por_tipo, k, False)
+
+    def mas_caros_por_tipo(self, k: int) -> Dict[str, List["Mueble"]]:
+        """
+        Los k muebles más caros de cada clase concreta presente.
+
+        Returns:
+            Dict[str, List[Mueble]]: Nombre de la clase -> muebles de mayor a menor precio
+        """
+        return self._leer(self._top_k_por_tipo, k, True)
+
+    def _top_k_por_tipo(self, k: int, descendente: bool) -> Dict[str, List["Mueble"]]:
+        """
+        Selección por clase. Las clases frecuentes se llenan en un solo
+        recorrido del índice de precios desde el extremo; las raras, para las
+        que ese recorrido sería largo, con un montículo sobre su grupo.
+        Método privado auxiliar.
+        """
+        if k <= 0:
+            return {}
+        total = len(self._indice_precios)
+        factor = max(1.0, math.log2(k))
+        resultado: Dict[type, List["Mueble"]] = {}
+        por_recorrido: Dict[type, List["Mueble"]] = {}
+        pendientes = 0
+        for clase, muebles in self._indice_tipos.por_clase():
+            # Llenar la clase recorriendo cuesta ~k * total / m pasos; el montículo, m * log k
+            if len(muebles) * len(muebles) * factor < k * total:
+                resultado[clase] = self._seleccionar_por_precio(k, muebles, descendente)
+            else:
+                resultado[clase] = por_recorrido[clase] = []
+                pendientes += min(k, len(muebles))
+        if pendientes:
+            for mueble in self._indice_precios.recorrer(descendente):
+                elegidos = por_recorrido.get(type(mueble))
+                if elegidos is not None and len(elegidos) < k:
+                    elegidos.append(mueble)
+                    pendientes -= 1
+                    if not pendientes:
+                        break
+        return {clase.__name__: muebles for clase, muebles in resultado.items()}
+
+    def iter_consultar(
+        self, por_precio: bool = False, tamaño_pagina: int = TAMAÑO_PAGINA_ITER, **criterios
+    ) -> Iterator["Mueble"]:
+        """
+        Versión perezosa de consultar: recorre los resultados página a página.
+
+        Cada página se lee completa y de forma consistente; entre página y
+        página la tienda puede cambiar (ver paginar). Las páginas se duplican
+        hasta MAX_PAGINA_ITER para que los recorridos largos pidan pocas.
+
+        Args:
+            por_precio: Recorrer de menor a mayor precio
+            tamaño_pagina: Tamaño de la primera página
+            **criterios: nombre, tipo, material, color, precio_min, precio_max
+
+        Yields:
+            Mueble: Cada mueble que cumple los criterios
+        """
+        cursor = None
+        while True:
+            muebles, cursor = self.paginar(
+                cursor, tamaño_pagina, por_precio=por_precio, **criterios
+            )
+            yield from muebles
+            if cursor is None:
+                return
+            tamaño_pagina = min(tamaño_pagina * 2, MAX_PAGINA_ITER)
+
+    def iter_muebles(self) -> Iterator["Mueble"]:
+        """Versión perezosa de listar_muebles."""
+        return self.iter_consultar()
+
+    def iter_buscar_muebles_por_nombre(self, nombre: str) -> Iterator["Mueble"]:
+        """Versión perezosa de buscar_muebles_por_nombre."""
+        if not nombre or not nombre.strip():
+            return iter(())
+        return self.iter_consultar(nombre=nombre)
+
+    def iter_filtrar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> Iterator["Mueble"]:
+        """Versión perezosa de filtrar_por_precio (de menor a mayor precio)."""
+        return self.iter_consultar(
+            por_precio=True, precio_min=max(precio_min, 0), precio_max=precio_max
+        )
+
+    def iter_filtrar_por_material(self, material: str) -> Iterator["Mueble"]:
+        """Versión perezosa de filtrar_por_material."""
+        if not material or not material.strip():
+            return iter(())
+        return self.iter_consultar(material=material)
+
+    def iter_filtrar_por_color(self, color: str) -> Iterator["Mueble"]:
+        """Versión perezosa de filtrar_por_color."""
+        if not color or not color.strip():
+            return iter(())
+        return self.iter_consultar(color=color)
+
+    def iter_muebles_por_tipo(self, tipo_clase: type) -> Iterator["Mueble"]:
+        """Versión perezosa de obtener_muebles_por_tipo (en orden de inserción)."""
+        return self.iter_consultar(tipo=tipo_clase)
 
     def calcular_valor_inventario(self) -> float:
         """
         Calcula el valor total del inventario.
+        Con el motor columnar se suman sus columnas de precios.
 
         Returns:
-            float: Valor total de todos los muebles en inventario
+            float: Valor total de todos los muebles en inventario y comedores
         """
-        # TODO: Implementar cálculo de valor total
-        # valor_total = 0
-        # for mueble in self._inventario:
-        #     try:
-        #         valor_total += mueble.calcular_precio()
-        #     except Exception:
-        #         continue  # Saltar muebles con errores
-
-        # for comedor in self._comedores:
-        #     try:
-        #         valor_total += comedor.calcular_precio_total()
-        #     except Exception:
-        #         continue
-
-        # return round(valor_total, 2)
-        pass
+        if self._columnar is not None:
+            valor_total = self._leer(self._columnar.valor_total)
+        else:
+            valor_total = self._estadisticas.valor_inventario
+
+        for comedor in self._comedores:
+            try:
+                valor_total += comedor.calcular_precio_total()
+            except Exception:
+                continue
+
+        return round(valor_total, 2)
 
     def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
         """
         Aplica un descuento a una categoría de muebles.
+        La categoría puede ser un tipo concreto o una categoría general
+        (asientos, superficies, almacenamiento, muebles); lo heredan sus subclases.
 
         Args:
-            categoria: Nombre de la categoría (ej: "sillas", "mesas")
+            categoria: Nombre de la categoría (ej: "sillas", "sofás", "asientos")
             porcentaje: Porcentaje de descuento (0-100)
         Returns:
             str: Mensaje de confirmación
         """
         if not 0 < porcentaje <= 100:
             return "Error: El porcentaje debe estar entre 1 y 100"
-        categoria_lower = categoria.lower().strip()
-        # Normalizar nombres de clase (Silla, Mesa, etc.)
-        # El sistema usa el nombre de la clase, por ejemplo 'Silla', 'Mesa', etc.
-        # Si el usuario ingresa 'sillas', 'mesas', etc., quitamos la 's' final si existe
-        if categoria_lower.endswith("s"):
-            categoria_lower = categoria_lower[:-1]
-        # Capitalizar para coincidir con el nombre de clase
-        categoria_clase = categoria_lower.capitalize()
-        self._descuentos_activos[categoria_clase] = porcentaje / 100
+        with self._escritura():
+            categoria_clase = self._descuentos.aplicar(categoria, porcentaje / 100)
+            if categoria_clase is None:
+                return f"Error: Categoría desconocida '{categoria}'"
+            self._estadisticas.registrar_descuentos(self._descuentos.activos)
         return (
             f"Descuento del {porcentaje}% aplicado a la categoría '{categoria_clase}'"
         )
@@ -329,38 +1097,213 @@ class TiendaMuebles:
         Returns:
             Dict: Información de la venta realizada o error
         """
-        if mueble not in self._inventario:
-            return {"error": "El mueble no está disponible en inventario"}
+        # Comprobar y retirar bajo el candado del mueble: una sola venta por unidad
+        with self._candado_mueble(mueble):
+            if mueble not in self._inventario:
+                return {"error": "El mueble no está disponible en inventario"}
+            try:
+                venta = self._crear_venta(
+                    mueble, cliente, datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                )
+                # Se escribe en el diario antes de modificar el estado
+                if self._diario is not None:
+                    self._diario.registrar(
+                        {"venta": venta, "mueble": self._registro_diario(mueble)}
+                    )
+                with self._escritura():
+                    self._ventas_realizadas.append(venta)
+                    self._estadisticas.registrar_venta(venta["precio_final"])
+                    self._retirar_mueble(mueble)
+                return venta
+            except Exception as e:
+                return {"error": f"Error al procesar la venta: {str(e)}"}
+
+    def _crear_venta(self, mueble: "Mueble", cliente: str, fecha: str) -> Dict:
+        """
+        Calcula precio y descuento de un mueble y arma el registro de venta.
+        Método privado auxiliar compartido por las ventas individuales y por lotes.
+        """
+        precio_original = self.precio(mueble)
+        # Tasa ya resuelta por la jerarquía de clases: una búsqueda en la tabla
+        descuento_aplicado = self._descuentos.tasa(type(mueble))
+        tipo_mueble = type(mueble).__name__
+        precio_final = precio_original * (1 - descuento_aplicado)
+        # Ensure mueble.nombre is always a string
+        nombre_mueble = getattr(mueble, "nombre", None)
+        if not nombre_mueble:
+            nombre_mueble = tipo_mueble
+        return {
+            "mueble": nombre_mueble,
+            "cliente": cliente,
+            "precio_original": precio_original,
+            "descuento": descuento_aplicado * 100,
+            "precio_final": round(precio_final, 2),
+            "fecha": fecha,
+        }
+
+    def realizar_ventas(
+        self, muebles: Iterable["Mueble"], cliente: str = "Cliente Anónimo"
+    ) -> List[Dict]:
+        """
+        Procesa la venta de un lote de muebles a un mismo cliente.
+
+        Todo el lote comparte una única lectura del reloj; los totales, el
+        diario y los índices se actualizan una sola vez para el lote.
+
+        Args:
+            muebles: Muebles a vender
+            cliente: Nombre del cliente
+        Returns:
+            List[Dict]: Resultado de cada mueble, en el mismo orden (venta o error)
+        """
+        muebles = list(muebles)
+        fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        resultados: List[Dict] = []
+        vendidos: List[Tuple["Mueble", Dict]] = []
+        with self._candados_lote(muebles):
+            incluidos = set()
+            for mueble in muebles:
+                if id(mueble) in incluidos or mueble not in self._inventario:
+                    resultados.append({"error": "El mueble no está disponible en inventario"})
+                    continue
+                try:
+                    venta = self._crear_venta(mueble, cliente, fecha)
+                except Exception as e:
+                    resultados.append({"error": f"Error al procesar la venta: {str(e)}"})
+                    continue
+                incluidos.add(id(mueble))
+                vendidos.append((mueble, venta))
+                resultados.append(venta)
+            if not vendidos:
+                return resultados
+            if self._diario is not None:
+                self._diario.registrar_lote(
+                    {"venta": venta, "mueble": self._registro_diario(mueble)}
+                    for mueble, venta in vendidos
+                )
+            with self._escritura():
+                self._ventas_realizadas.extend(venta for _, venta in vendidos)
+                self._estadisticas.registrar_ventas(venta["precio_final"] for _, venta in vendidos)
+                self._retirar_muebles([mueble for mueble, _ in vendidos])
+        return resultados
+
+    def _retirar_muebles(self, muebles: List["Mueble"]) -> None:
+        """
+        Versión por lotes de _retirar_mueble.
+        Método privado auxiliar.
+        """
+        self._estadisticas.registrar_bajas(
+            (mueble, self._indice_precios.precio_de(mueble)) for mueble in muebles
+        )
+        self._indice_precios.quitar_lote(muebles)
+        for mueble in muebles:
+            self._inventario.quitar(mueble)
+            self._indice_material.quitar(mueble)
+            self._indice_color.quitar(mueble)
+            self._indice_nombres.quitar(mueble)
+            self._indice_tipos.quitar(mueble)
+            if self._columnar is not None:
+                self._columnar.quitar(mueble)
+            _dejar_de_observar(mueble, self._observador)
+
+    def _retirar_mueble(self, mueble: "Mueble") -> None:
+        """
+        Quita un mueble del inventario, de los índices y de las estadísticas.
+        Método privado auxiliar.
+        """
+        self._estadisticas.registrar_baja(mueble, self._indice_precios.precio_de(mueble))
+        self._inventario.quitar(mueble)
+        self._indice_material.quitar(mueble)
+        self._indice_color.quitar(mueble)
+        self._indice_precios.quitar(mueble)
+        self._indice_nombres.quitar(mueble)
+        self._indice_tipos.quitar(mueble)
+        if self._columnar is not None:
+            self._columnar.quitar(mueble)
+        _dejar_de_observar(mueble, self._observador)
+
+    def _al_modificar(self, mueble: "Mueble") -> None:
+        """
+        Reindexa un mueble del inventario después de que uno de sus setters lo
+        modificó. La clase no cambia, así que el índice de tipos no se toca.
+        Método privado auxiliar.
+        """
+        precio = self.precio(mueble)
+        with self._escritura():
+            if mueble not in self._inventario:
+                return
+            self._indice_material.actualizar(mueble)
+            self._indice_color.actualizar(mueble)
+            self._indice_nombres.actualizar(mueble, getattr(mueble, "nombre", "") or "")
+            anterior = self._indice_precios.precio_de(mueble)
+            if anterior != precio:
+                self._indice_precios.actualizar(mueble, precio)
+                self._estadisticas.registrar_cambio_precio(anterior, precio)
+            if self._columnar is not None:
+                self._columnar.actualizar(mueble)
+
+    @staticmethod
+    def _registro_diario(mueble: "Mueble") -> Optional[Dict]:
+        """Descripción del mueble para el diario (None si no es de un tipo conocido)."""
+        from services.catalogo import ErrorCatalogo, registro_de
+
         try:
-            precio_original = mueble.calcular_precio()
-            descuento_aplicado = 0
-            # Use the class name as key, matching how discounts are registered
-            tipo_mueble = type(mueble).__name__
-            if self._descuentos_activos and tipo_mueble in self._descuentos_activos:
-                descuento_aplicado = self._descuentos_activos[tipo_mueble]
-            precio_final = precio_original * (1 - descuento_aplicado)
-            from datetime import datetime
-
-            # Ensure mueble.nombre is always a string
-            nombre_mueble = getattr(mueble, "nombre", None)
-            if not nombre_mueble:
-                nombre_mueble = tipo_mueble
-            venta = {
-                "mueble": nombre_mueble,
-                "cliente": cliente,
-                "precio_original": precio_original,
-                "descuento": descuento_aplicado * 100,
-                "precio_final": round(precio_final, 2),
-                "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            }
-            self._ventas_realizadas.append(venta)
-            self._inventario.remove(mueble)
-            # Acumulativos
-            self._total_muebles_vendidos += 1
-            self._valor_total_ventas += venta["precio_final"]
-            return venta
-        except Exception as e:
-            return {"error": f"Error al procesar la venta: {str(e)}"}
+            return registro_de(mueble)
+        except ErrorCatalogo:
+            return None
+
+    def abrir_diario(
+        self, ruta: str, tamaño_grupo: int = 32, intervalo_fsync: float = 0.05
+    ) -> int:
+        """
+        Reproduce las ventas de un diario y sigue registrando las nuevas en él.
+
+        Cada venta reproducida retira del inventario el primer mueble igual al
+        vendido (mismo tipo y atributos) y suma a los totales acumulados.
+        Las ventas nuevas sobreviven a una caída del proceso; ante una caída
+        del sistema su durabilidad es diferida hasta intervalo_fsync segundos
+        (ver DiarioVentas).
+
+        Args:
+            ruta: Archivo del diario (se crea si no existe)
+            tamaño_grupo: Ventas pendientes que fuerzan un fsync
+            intervalo_fsync: Segundos máximos entre fsync
+
+        Returns:
+            int: Cantidad de ventas reproducidas
+        """
+        from services.diario import DiarioVentas
+
+        self.cerrar_diario()
+        disponibles: Dict[str, List["Mueble"]] = {}
+        for mueble in self._inventario:
+            registro = self._registro_diario(mueble)
+            if registro is not None:
+                clave = json.dumps(registro, ensure_ascii=False, sort_keys=True)
+                disponibles.setdefault(clave, []).append(mueble)
+
+        reproducidas = 0
+        for evento in DiarioVentas.leer(ruta):
+            venta = evento.get("venta")
+            if not isinstance(venta, dict):
+                continue
+            clave = json.dumps(evento.get("mueble"), ensure_ascii=False, sort_keys=True)
+            iguales = disponibles.get(clave)
+            with self._escritura():
+                if iguales:
+                    self._retirar_mueble(iguales.pop(0))
+                self._ventas_realizadas.append(venta)
+                self._estadisticas.registrar_venta(venta.get("precio_final", 0))
+            reproducidas += 1
+
+        self._diario = DiarioVentas(ruta, tamaño_grupo, intervalo_fsync)
+        return reproducidas
+
+    def cerrar_diario(self) -> None:
+        """Sincroniza y cierra el diario de ventas, si hay uno abierto."""
+        if self._diario is not None:
+            self._diario.cerrar()
+            self._diario = None
 
     def _contar_tipos_muebles(self) -> Dict[str, int]:
         """
@@ -380,25 +1323,34 @@ class TiendaMuebles:
 
     def generar_reporte_inventario(self) -> str:
         """
-        Genera un reporte completo del inventario.
-        Returns:
-            str: Reporte detallado del inventario
-        """
-        estadisticas = self.obtener_estadisticas() or {}
-        nombre_tienda = getattr(self, "_nombre", "Tienda")
-        if not isinstance(estadisticas, dict):
-            estadisticas = {}
-        reporte = f"=== REPORTE DE INVENTARIO - {nombre_tienda} ===\n\n"
-        reporte += f"Total de muebles: {estadisticas.get('total_muebles', 0)}\n"
-        reporte += f"Total de comedores: {estadisticas.get('total_comedores', 0)}\n"
-        reporte += f"Valor total del inventario: ${estadisticas.get('valor_inventario', 0):.2f}\n\n"
-        reporte += "DISTRIBUCIÓN POR TIPOS:\n"
-        tipos = estadisticas.get("tipos_muebles", {}) or {}
-        for tipo, cantidad in tipos.items():
-            reporte += f"- {tipo}: {cantidad} unidades\n"
-        descuentos = estadisticas.get("descuentos_activos", {}) or {}
-        if descuentos:
-            reporte += "\nDESCUENTOS ACTIVOS:\n"
-            for categoria, descuento in descuentos.items():
-                reporte += f"- {categoria}: {descuento * 100:.1f}%\n"
-        return reporte
+        Genera el resumen del inventario (totales, tipos y descuentos).
+        Para el reporte completo en archivos usar escribir_reporte.
+        Returns:
+            str: Reporte del inventario
+        """
+        from services.reportes import ReporteTexto
+
+        salida = io.StringIO()
+        escritor = ReporteTexto(salida, detalle=False)
+        escritor.encabezado(self._nombre, self.obtener_estadisticas())
+        return salida.getvalue()
+
+    def escribir_reporte(self, destinos: Mapping[str, TextIO]) -> int:
+        """
+        Escribe el reporte completo en archivos abiertos, uno por formato.
+
+        Todos los formatos se llenan en un solo recorrido paginado del
+        inventario (iter_muebles), sin armar el reporte en memoria.
+
+        Args:
+            destinos: Archivo por formato: "texto", "csv" (abierto con
+                newline="") o "jsonl"
+
+        Returns:
+            int: Cantidad de muebles escritos
+        """
+        from services.reportes import escribir_reporte
+
+        return escribir_reporte(
+            self._nombre, self.obtener_estadisticas(), self.iter_muebles(), destinos, self.precio
+        )
@@ -0,0 +1,162 @@
+"""
+Fachada asyncio de la tienda.
+Permite usar TiendaMuebles desde un bucle de eventos sin bloquearlo.
+"""
+
+import asyncio
+from concurrent.futures import Executor, ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+from services.tienda import TiendaMuebles
+
+
+class AsyncTiendaMuebles:
+    """
+    Versión asíncrona de las operaciones de TiendaMuebles.
+
+    Las búsquedas, filtros, reportes, altas y ventas se ejecutan en un pool
+    de hilos para no bloquear el bucle de eventos; las estadísticas, que
+    cuestan O(1), se leen directamente. Las lecturas idénticas que llegan
+    mientras otra igual está en curso se agrupan: esperan el mismo resultado
+    en lugar de repetir el trabajo.
+
+    La tienda envuelta debe estar en modo concurrente, porque las llamadas
+    llegan desde varios hilos del pool.
+
+    Conceptos aplicados:
+    - Composición: Envuelve una TiendaMuebles en lugar de heredarla
+    - Encapsulación: El pool de hilos y la agrupación de lecturas quedan ocultos
+    """
+
+    def __init__(
+        self,
+        tienda: Optional[TiendaMuebles] = None,
+        ejecutor: Optional[Executor] = None,
+        max_hilos: int = 4,
+    ):
+        """
+        Constructor de la fachada.
+
+        Args:
+            tienda: Tienda a envolver (por defecto una nueva en modo concurrente)
+            ejecutor: Pool donde ejecutar las operaciones (por defecto uno propio)
+            max_hilos: Hilos del pool propio
+        """
+        if tienda is None:
+            tienda = TiendaMuebles(concurrente=True)
+        elif not tienda.concurrente:
+            raise ValueError("La tienda debe crearse con concurrente=True")
+        self._tienda = tienda
+        self._ejecutor_propio = ejecutor is None
+        self._ejecutor = ejecutor or ThreadPoolExecutor(
+            max_workers=max_hilos, thread_name_prefix="tienda"
+        )
+        self._en_curso: Dict[Hashable, asyncio.Future] = {}
+        self._lecturas_agrupadas = 0
+
+    @property
+    def tienda(self) -> TiendaMuebles:
+        """Tienda síncrona envuelta."""
+        return self._tienda
+
+    @property
+    def lecturas_agrupadas(self) -> int:
+        """Lecturas que se resolvieron esperando otra idéntica en curso."""
+        return self._lecturas_agrupadas
+
+    async def _ejecutar(self, funcion: Callable, *argumentos):
+        """Ejecuta una operación de la tienda en el pool de hilos."""
+        bucle = asyncio.get_running_loop()
+        return await bucle.run_in_executor(self._ejecutor, partial(funcion, *argumentos))
+
+    async def _leer(self, funcion: Callable, *argumentos) -> List:
+        """
+        Ejecuta una lectura agrupando las idénticas que estén en curso.
+        Cada llamador recibe su propia copia de la lista resultante.
+        """
+        clave = (funcion.__name__,) + argumentos
+        futuro = self._en_curso.get(clave)
+        if futuro is None:
+            futuro = asyncio.ensure_future(self._ejecutar(funcion, *argumentos))
+            self._en_curso[clave] = futuro
+            futuro.add_done_callback(lambda _: self._en_curso.pop(clave, None))
+        else:
+            self._lecturas_agrupadas += 1
+        # shield: cancelar a un llamador no cancela la lectura de los demás
+        return list(await asyncio.shield(futuro))
+
+    async def listar_muebles(self) -> List:
+        """Versión asíncrona de listar_muebles."""
+        return await self._leer(self._tienda.listar_muebles)
+
+    async def buscar_muebles_por_nombre(self, nombre: str) -> List:
+        """Versión asíncrona de buscar_muebles_por_nombre."""
+        return await self._leer(self._tienda.buscar_muebles_por_nombre, nombre)
+
+    async def filtrar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List:
+        """Versión asíncrona de filtrar_por_precio."""
+        return await self._leer(self._tienda.filtrar_por_precio, precio_min, precio_max)
+
+    async def filtrar_por_material(self, material: str) -> List:
+        """Versión asíncrona de filtrar_por_material."""
+        return await self._leer(self._tienda.filtrar_por_material, material)
+
+    async def filtrar_por_color(self, color: str) -> List:
+        """Versión asíncrona de filtrar_por_color."""
+        return await self._leer(self._tienda.filtrar_por_color, color)
+
+    async def obtener_muebles_por_tipo(self, tipo_clase: type) -> List:
+        """Versión asíncrona de obtener_muebles_por_tipo."""
+        return await self._leer(self._tienda.obtener_muebles_por_tipo, tipo_clase)
+
+    async def calcular_valor_inventario(self) -> float:
+        """Versión asíncrona de calcular_valor_inventario."""
+        return await self._ejecutar(self._tienda.calcular_valor_inventario)
+
+    async def obtener_estadisticas(self) -> dict:
+        """
+        Versión asíncrona de obtener_estadisticas. Va al pool de hilos porque
+        en algunos backends (TiendaSQLite, motor columnar) recorre datos.
+        """
+        return await self._ejecutar(self._tienda.obtener_estadisticas)
+
+    async def generar_reporte_inventario(self) -> str:
+        """Versión asíncrona de generar_reporte_inventario."""
+        return await self._ejecutar(self._tienda.generar_reporte_inventario)
+
+    async def agregar_mueble(self, mueble) -> str:
+        """Versión asíncrona de agregar_mueble."""
+        return await self._ejecutar(self._tienda.agregar_mueble, mueble)
+
+    async def agregar_muebles(self, muebles: Iterable) -> Dict:
+        """Versión asíncrona de agregar_muebles."""
+        return await self._ejecutar(self._tienda.agregar_muebles, muebles)
+
+    async def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
+        """Versión asíncrona de aplicar_descuento."""
+        return await self._ejecutar(self._tienda.aplicar_descuento, categoria, porcentaje)
+
+    async def realizar_venta(self, mueble, cliente: str = "Cliente Anónimo") -> Dict:
+        """Versión asíncrona de realizar_venta (la escritura del diario ocurre en el pool)."""
+        return await self._ejecutar(self._tienda.realizar_venta, mueble, cliente)
+
+    async def realizar_ventas(self, muebles: Iterable, cliente: str = "Cliente Anónimo") -> List:
+        """Versión asíncrona de realizar_ventas."""
+        return await self._ejecutar(self._tienda.realizar_ventas, list(muebles), cliente)
+
+    async def cerrar(self) -> None:
+        """Espera las operaciones pendientes y libera el pool propio."""
+        pendientes: Tuple[asyncio.Future, ...] = tuple(self._en_curso.values())
+        if pendientes:
+            await asyncio.gather(*pendientes, return_exceptions=True)
+        if self._ejecutor_propio:
+            await asyncio.get_running_loop().run_in_executor(None, self._ejecutor.shutdown)
+
+    async def __aenter__(self) -> "AsyncTiendaMuebles":
+        return self
+
+    async def __aexit__(self, *excepcion) -> None:
+        await self.cerrar()
@@ -0,0 +1,839 @@
+"""
+Backend persistente de la tienda sobre sqlite3.
+Guarda el inventario, las ventas y los descuentos en una base SQLite y
+resuelve búsquedas, filtros y ventas con consultas indexadas.
+"""
+
+import json
+import queue
+import sqlite3
+import threading
+import weakref
+from contextlib import contextmanager
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from models.mueble import Mueble
+from services.indices import normalizar_texto
+from services.tienda import (
+    TiendaMuebles,
+    _dejar_de_observar,
+    _desuscribir_muebles,
+    _observar,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from services.reglas_precio import MotorPrecios
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS muebles (
+    id INTEGER PRIMARY KEY,
+    tipo TEXT NOT NULL,
+    nombre TEXT NOT NULL,
+    nombre_busqueda TEXT NOT NULL,
+    material TEXT NOT NULL,
+    color TEXT NOT NULL,
+    precio REAL NOT NULL,
+    registro TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_muebles_tipo ON muebles (tipo);
+CREATE INDEX IF NOT EXISTS idx_muebles_material ON muebles (material);
+CREATE INDEX IF NOT EXISTS idx_muebles_color ON muebles (color);
+CREATE INDEX IF NOT EXISTS idx_muebles_precio ON muebles (precio, id);
+CREATE INDEX IF NOT EXISTS idx_muebles_nombre ON muebles (nombre_busqueda);
+CREATE TABLE IF NOT EXISTS ventas (
+    id INTEGER PRIMARY KEY,
+    mueble TEXT NOT NULL,
+    cliente TEXT NOT NULL,
+    precio_original REAL NOT NULL,
+    descuento REAL NOT NULL,
+    precio_final REAL NOT NULL,
+    fecha TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS descuentos (
+    categoria TEXT PRIMARY KEY,
+    tasa REAL NOT NULL
+);
+"""
+
+# Índice de texto por trigramas para las búsquedas parciales por nombre
+_ESQUEMA_NOMBRES = """
+CREATE VIRTUAL TABLE IF NOT EXISTS muebles_nombres USING fts5(
+    nombre_busqueda, content='muebles', content_rowid='id', tokenize='trigram'
+);
+CREATE TRIGGER IF NOT EXISTS muebles_nombres_alta AFTER INSERT ON muebles BEGIN
+    INSERT INTO muebles_nombres (rowid, nombre_busqueda)
+    VALUES (new.id, new.nombre_busqueda);
+END;
+CREATE TRIGGER IF NOT EXISTS muebles_nombres_baja AFTER DELETE ON muebles BEGIN
+    INSERT INTO muebles_nombres (muebles_nombres, rowid, nombre_busqueda)
+    VALUES ('delete', old.id, old.nombre_busqueda);
+END;
+CREATE TRIGGER IF NOT EXISTS muebles_nombres_cambio AFTER UPDATE OF nombre_busqueda ON muebles BEGIN
+    INSERT INTO muebles_nombres (muebles_nombres, rowid, nombre_busqueda)
+    VALUES ('delete', old.id, old.nombre_busqueda);
+    INSERT INTO muebles_nombres (rowid, nombre_busqueda) VALUES (new.id, new.nombre_busqueda);
+END;
+"""
+
+# Sentencias parametrizadas: sqlite3 las compila una vez por conexión
+_INSERTAR_MUEBLE = (
+    "INSERT INTO muebles (tipo, nombre, nombre_busqueda, material, color, precio, registro) "
+    "VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+_ACTUALIZAR_MUEBLE = (
+    "UPDATE muebles SET nombre = ?, nombre_busqueda = ?, material = ?, color = ?, precio = ?, "
+    "registro = ? WHERE id = ?"
+)
+_LISTAR = "SELECT id, registro FROM muebles ORDER BY id"
+_BUSCAR_NOMBRE_TRIGRAMAS = (
+    "SELECT id, registro FROM muebles WHERE id IN "
+    "(SELECT rowid FROM muebles_nombres WHERE muebles_nombres MATCH ?) "
+    "AND instr(nombre_busqueda, ?) > 0 ORDER BY id"
+)
+_BUSCAR_NOMBRE = "SELECT id, registro FROM muebles WHERE instr(nombre_busqueda, ?) > 0 ORDER BY id"
+_FILTRAR_PRECIO = (
+    "SELECT id, registro FROM muebles WHERE precio BETWEEN ? AND ? ORDER BY precio, id"
+)
+_FILTRAR_MATERIAL = "SELECT id, registro FROM muebles WHERE material = ? ORDER BY id"
+_FILTRAR_COLOR = "SELECT id, registro FROM muebles WHERE color = ? ORDER BY id"
+_MUEBLE_POR_FILA = "SELECT id, registro FROM muebles WHERE id = ?"
+_PRECIO_MUEBLE = "SELECT tipo, nombre, precio FROM muebles WHERE id = ?"
+_BORRAR_MUEBLE = "DELETE FROM muebles WHERE id = ?"
+_INSERTAR_VENTA = (
+    "INSERT INTO ventas (mueble, cliente, precio_original, descuento, precio_final, fecha) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+
+class PoolConexiones:
+    """
+    Conjunto pequeño de conexiones reutilizables a una misma base SQLite.
+
+    La base se abre en modo WAL, así que varios hilos pueden leer a la vez
+    mientras otro escribe; las escrituras se serializan con un candado.
+
+    Conceptos aplicados:
+    - Encapsulación: Los hilos piden y devuelven conexiones sin crearlas
+    """
+
+    def __init__(self, ruta: Union[str, "Path"], tamaño: int = 4):
+        """
+        Crea las conexiones del pool.
+
+        Args:
+            ruta: Archivo de la base de datos
+            tamaño: Cantidad de conexiones
+        """
+        if tamaño <= 0:
+            raise ValueError("El tamaño del pool debe ser mayor a 0")
+        self._ruta = str(ruta)
+        self._libres: "queue.Queue[sqlite3.Connection]" = queue.Queue()
+        self._todas: List[sqlite3.Connection] = []
+        self.candado_escritura = threading.Lock()
+        for _ in range(tamaño):
+            conexion = sqlite3.connect(self._ruta, check_same_thread=False, cached_statements=256)
+            conexion.execute("PRAGMA journal_mode=WAL")
+            conexion.execute("PRAGMA synchronous=NORMAL")
+            self._todas.append(conexion)
+            self._libres.put(conexion)
+
+    @contextmanager
+    def conexion(self) -> Iterator[sqlite3.Connection]:
+        """Presta una conexión mientras dure el bloque with."""
+        conexion = self._libres.get()
+        try:
+            yield conexion
+        finally:
+            self._libres.put(conexion)
+
+    @contextmanager
+    def transaccion(self) -> Iterator[sqlite3.Connection]:
+        """Presta una conexión dentro de una transacción de escritura."""
+        with self.candado_escritura, self.conexion() as conexion:
+            with conexion:
+                yield conexion
+
+    def cerrar(self) -> None:
+        """Cierra todas las conexiones."""
+        for conexion in self._todas:
+            conexion.close()
+        self._todas.clear()
+
+
+class TiendaSQLite(TiendaMuebles):
+    """
+    Tienda cuyo inventario, ventas y descuentos viven en una base SQLite.
+
+    Las búsquedas, filtros, el valor del inventario, las estadísticas y las
+    ventas se resuelven en SQL con índices sobre tipo, material, color,
+    precio y nombre (un índice de trigramas FTS5 para las búsquedas
+    parciales cuando la versión de SQLite lo permite).
+
+    Cada fila se convierte en un único objeto Mueble que se reutiliza en
+    las consultas siguientes mientras siga en uso. Los comedores se mantienen en memoria. Las
+    escrituras pasan por _escritura para que la versión de la tienda cambie.
+
+    Conceptos aplicados:
+    - Herencia: Reutiliza la validación, descuentos y reportes de TiendaMuebles
+    - Polimorfismo: Sobrescribe las consultas para delegarlas a la base
+    """
+
+    def __init__(
+        self,
+        ruta: Union[str, "Path"],
+        nombre_tienda: str = "Mueblería OOP",
+        tamaño_pool: int = 4,
+        motor_precios: Optional["MotorPrecios"] = None,
+    ):
+        """
+        Abre (o crea) la base de la tienda.
+
+        Args:
+            ruta: Archivo de la base de datos
+            nombre_tienda: Nombre de la tienda
+            tamaño_pool: Conexiones disponibles para lecturas concurrentes
+            motor_precios: Reglas de precio de la tienda (ver TiendaMuebles)
+        """
+        super().__init__(nombre_tienda, motor_precios=motor_precios)
+        self._pool = PoolConexiones(ruta, tamaño_pool)
+        # Mapa de identidad débil: un objeto vive mientras alguien lo use y al
+        # liberarse sale de ambos mapas (y del registro de observadores)
+        self._objetos: "weakref.WeakValueDictionary[int, Mueble]" = weakref.WeakValueDictionary()
+        self._filas: "weakref.WeakKeyDictionary[Mueble, int]" = weakref.WeakKeyDictionary()
+        self._candado_objetos = threading.Lock()
+        weakref.finalize(self, _desuscribir_muebles, self._filas, self._observador)
+        with self._pool.transaccion() as conexion:
+            conexion.executescript(_ESQUEMA)
+            try:
+                conexion.executescript(_ESQUEMA_NOMBRES)
+                self._indice_trigramas = True
+            except sqlite3.OperationalError:
+                # SQLite sin FTS5 o sin tokenizador trigram: se recorre la tabla
+                self._indice_trigramas = False
+            self._descuentos.cargar(
+                dict(conexion.execute("SELECT categoria, tasa FROM descuentos").fetchall())
+            )
+        self._estadisticas.registrar_descuentos(self._descuentos.activos)
+
+    def cerrar(self) -> None:
+        """Cierra el diario y las conexiones a la base."""
+        self.cerrar_diario()
+        self._pool.cerrar()
+
+    def _mueble(self, fila: int, registro: str) -> Mueble:
+        """Objeto único de una fila (se construye la primera vez)."""
+        mueble = self._objetos.get(fila)
+        if mueble is None:
+            with self._candado_objetos:
+                mueble = self._objetos.get(fila)
+                if mueble is None:
+                    from services.catalogo import mueble_desde_registro
+
+                    mueble = mueble_desde_registro(json.loads(registro))
+                    self._objetos[fila] = mueble
+                    self._filas[mueble] = fila
+                    _observar(mueble, self._observador)
+        return mueble
+
+    def _consultar(self, sentencia: str, parametros: Tuple = ()) -> List[Mueble]:
+        """Ejecuta una consulta de (id, registro) y retorna los muebles."""
+        with self._pool.conexion() as conexion:
+            filas = conexion.execute(sentencia, parametros).fetchall()
+        return [self._mueble(fila, registro) for fila, registro in filas]
+
+    def _preparar(self, mueble: Mueble) -> Tuple[Optional[tuple], Optional[str]]:
+        """Valida un mueble y arma los parámetros de su fila."""
+        from services.catalogo import ErrorCatalogo, registro_de
+
+        precio, error = self._validar_mueble(mueble)
+        if error:
+            return None, error
+        if mueble in self._filas:
+            return None, "Error: El mueble ya está en el inventario"
+        try:
+            registro = registro_de(mueble)
+        except ErrorCatalogo as e:
+            return None, f"Error: {e}"
+        nombre = mueble.nombre or ""
+        parametros = (
+            type(mueble).__name__,
+            nombre,
+            nombre.lower(),
+            normalizar_texto(mueble.material),
+            normalizar_texto(mueble.color),
+            precio,
+            json.dumps(registro, ensure_ascii=False),
+        )
+        return parametros, None
+
+    def _recordar(self, fila: int, mueble: Mueble) -> None:
+        """Asocia un mueble recién insertado con su fila."""
+        with self._candado_objetos:
+            self._objetos[fila] = mueble
+            self._filas[mueble] = fila
+        _observar(mueble, self._observador)
+
+    def agregar_mueble(self, mueble: Mueble) -> str:
+        """
+        Inserta un mueble en la base.
+
+        Args:
+            mueble: Objeto mueble a agregar
+        Returns:
+            str: Mensaje de confirmación o de error
+        """
+        parametros, error = self._preparar(mueble)
+        if error:
+            return error
+        with self._escritura(), self._pool.transaccion() as conexion:
+            fila = conexion.execute(_INSERTAR_MUEBLE, parametros).lastrowid
+        self._recordar(fila, mueble)
+        return f"Mueble {mueble.nombre} agregado exitosamente al inventario"
+
+    def agregar_muebles(self, muebles: Iterable[Mueble]) -> Dict:
+        """
+        Inserta un lote de muebles en una sola transacción.
+
+        Args:
+            muebles: Iterable de muebles a agregar
+        Returns:
+            Dict: Resumen con aceptados, rechazados y errores (posición, mensaje)
+        """
+        aceptados: List[Tuple[Mueble, tuple]] = []
+        errores: List[Tuple[int, str]] = []
+        vistos = set()
+        for posicion, mueble in enumerate(muebles):
+            parametros, error = self._preparar(mueble)
+            if error is None and id(mueble) in vistos:
+                error = "Error: El mueble ya está en el inventario"
+            if error:
+                errores.append((posicion, error))
+                continue
+            vistos.add(id(mueble))
+            aceptados.append((mueble, parametros))
+        with self._escritura(), self._pool.transaccion() as conexion:
+            for mueble, parametros in aceptados:
+                self._recordar(conexion.execute(_INSERTAR_MUEBLE, parametros).lastrowid, mueble)
+        return {"aceptados": len(aceptados), "rechazados": len(errores), "errores": errores}
+
+    def listar_muebles(self) -> List[Mueble]:
+        """Muebles en orden de inserción."""
+        return self._consultar(_LISTAR)
+
+    def identificador(self, mueble: Mueble) -> Optional[int]:
+        """Identificador público del mueble: su id de fila (ver fila_de)."""
+        return self.fila_de(mueble)
+
+    def obtener_mueble(self, identificador: int) -> Optional[Mueble]:
+        """Mueble con ese id de fila, si sigue en la base (ver obtener_por_fila)."""
+        return self.obtener_por_fila(identificador)
+
+    def _revaluar_inventario(self) -> None:
+        """Vuelve a valuar cada fila con las reglas vigentes y guarda el precio."""
+        with self._escritura(), self._pool.transaccion() as conexion:
+            filas = conexion.execute(_LISTAR).fetchall()
+            muebles = [self._mueble(fila, registro) for fila, registro in filas]
+            precios = self._motor_precios.evaluar(muebles)
+            conexion.executemany(
+                "UPDATE muebles SET precio = ? WHERE id = ?",
+                zip(precios, (fila for fila, _ in filas)),
+            )
+
+    def _al_modificar(self, mueble: Mueble) -> None:
+        """Guarda en su fila el mueble que uno de sus setters modificó."""
+        from services.catalogo import registro_de
+
+        fila = self._filas.get(mueble)
+        if fila is None:
+            return
+        nombre = mueble.nombre or ""
+        parametros = (
+            nombre,
+            nombre.lower(),
+            normalizar_texto(mueble.material),
+            normalizar_texto(mueble.color),
+            self.precio(mueble),
+            json.dumps(registro_de(mueble), ensure_ascii=False),
+            fila,
+        )
+        with self._escritura(), self._pool.transaccion() as conexion:
+            conexion.execute(_ACTUALIZAR_MUEBLE, parametros)
+
+    def fila_de(self, mueble: Mueble) -> Optional[int]:
+        """Id de fila de un mueble de la base (estable entre ejecuciones)."""
+        try:
+            return self._filas.get(mueble)
+        except TypeError:
+            # Sin referencias débiles no puede ser un objeto de la base
+            return None
+
+    def obtener_por_fila(self, fila: int) -> Optional[Mueble]:
+        """Mueble guardado en esa fila de la base, si sigue en inventario."""
+        muebles = self._consultar(_MUEBLE_POR_FILA, (fila,))
+        return muebles[0] if muebles else None
+
+    def buscar_muebles_por_nombre(self, nombre: str) -> List[Mueble]:
+        """Búsqueda parcial por nombre resuelta con el índice de trigramas."""
+        if not nombre or not nombre.strip():
+            return []
+        termino = nombre.lower().strip()
+        if self._indice_trigramas and len(termino) >= 3:
+            frase = '"' + termino.replace('"', '""') + '"'
+            return self._consultar(_BUSCAR_NOMBRE_TRIGRAMAS, (frase, termino))
+        return self._consultar(_BUSCAR_NOMBRE, (termino,))
+
+    def filtrar_por_precio(
+        self, precio_min: float = 0, precio_max: float = float("inf")
+    ) -> List[Mueble]:
+        """Rango de precios (inclusivo) sobre el índice de precio, ordenado por precio."""
+        if precio_min < 0:
+            precio_min = 0
+        return self._consultar(_FILTRAR_PRECIO, (precio_min, precio_max))
+
+    def filtrar_por_material(self, material: str) -> List[Mueble]:
+        """Muebles del material dado, sobre el índice de material."""
+        if not material or not material.strip():
+            return []
+        return self._consultar(_FILTRAR_MATERIAL, (normalizar_texto(material),))
+
+    def filtrar_por_color(self, color: str) -> List[Mueble]:
+        """Muebles del color dado, sobre el índice de color."""
+        if not color or not color.strip():
+            return []
+        return self._consultar(_FILTRAR_COLOR, (normalizar_texto(color),))
+
+    def obtener_muebles_por_tipo(self, tipo_clase: type) -> List[Mueble]:
+        """
+        Muebles del tipo dado o de sus subclases, sobre el índice de tipo.
+
+        Args:
+            tipo_clase: Clase del tipo de mueble (ej: Silla, Asiento)
+        """
+        tipos = self._tipos_de(tipo_clase)
+        if not tipos:
+            return []
+        marcas = ", ".join("?" * len(tipos))
+        return self._consultar(
+            f"SELECT id, registro FROM muebles WHERE tipo IN ({marcas}) ORDER BY id", tuple(tipos)
+        )
+
+    @staticmethod
+    def _tipos_de(tipo_clase: type) -> List[str]:
+        """Nombres de las clases concretas que son tipo_clase o heredan de ella."""
+        from services.catalogo import TIPOS_MUEBLE
+
+        return [
+            clase.__name__
+            for clase in TIPOS_MUEBLE.values()
+            if any(base.__name__ == tipo_clase.__name__ for base in clase.__mro__)
+        ]
+
+    def _condiciones_consulta(
+        self,
+        nombre: Optional[str],
+        tipo: Optional[type],
+        material: Optional[str],
+        color: Optional[str],
+        precio_min: Optional[float],
+        precio_max: Optional[float],
+    ) -> Tuple[List[str], List]:
+        """Condiciones SQL (y sus parámetros) de una consulta compuesta."""
+        condiciones: List[str] = []
+        parametros: List = []
+        if nombre and nombre.strip():
+            termino = nombre.lower().strip()
+            if self._indice_trigramas and len(termino) >= 3:
+                condiciones.append(
+                    "id IN (SELECT rowid FROM muebles_nombres WHERE muebles_nombres MATCH ?)"
+                )
+                parametros.append('"' + termino.replace('"', '""') + '"')
+            condiciones.append("instr(nombre_busqueda, ?) > 0")
+            parametros.append(termino)
+        if tipo is not None:
+            tipos = self._tipos_de(tipo)
+            condiciones.append(f"tipo IN ({', '.join('?' * len(tipos))})" if tipos else "0")
+            parametros.extend(tipos)
+        for columna, valor in (("material", material), ("color", color)):
+            if valor and valor.strip():
+                condiciones.append(f"{columna} = ?")
+                parametros.append(normalizar_texto(valor))
+        if precio_min is not None or precio_max is not None:
+            condiciones.append("precio BETWEEN ? AND ?")
+            parametros.extend(
+                (max(precio_min or 0, 0), float("inf") if precio_max is None else precio_max)
+            )
+        return condiciones, parametros
+
+    def _sentencia_consulta(self, *criterios) -> Tuple[str, Tuple]:
+        """Sentencia SQL (y sus parámetros) de una consulta compuesta."""
+        condiciones, parametros = self._condiciones_consulta(*criterios)
+        donde = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        return f"SELECT id, registro FROM muebles{donde} ORDER BY id", tuple(parametros)
+
+    def consultar(
+        self,
+        nombre: Optional[str] = None,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> List[Mueble]:
+        """
+        Consulta compuesta en una sola sentencia SQL.
+        El planificador de SQLite elige el índice; ver explicar_consulta.
+        """
+        return self._consultar(
+            *self._sentencia_consulta(nombre, tipo, material, color, precio_min, precio_max)
+        )
+
+    def paginar(
+        self,
+        cursor: Optional[Tuple] = None,
+        limite: int = 50,
+        nombre: Optional[str] = None,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+        por_precio: bool = False,
+    ) -> Tuple[List[Mueble], Optional[Tuple]]:
+        """
+        Página de la consulta con paginación por clave (keyset) en SQL.
+        El cursor es el id de fila, o (precio, id) si por_precio.
+        """
+        if limite <= 0:
+            raise ValueError("El límite de la página debe ser mayor a 0")
+        if cursor is not None and len(cursor) != (2 if por_precio else 1):
+            raise ValueError("El cursor no corresponde a este orden de paginación")
+        condiciones, parametros = self._condiciones_consulta(
+            nombre, tipo, material, color, precio_min, precio_max
+        )
+        if cursor is not None:
+            condiciones.append("(precio, id) > (?, ?)" if por_precio else "id > ?")
+            parametros.extend(cursor)
+        donde = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        orden = "precio, id" if por_precio else "id"
+        with self._pool.conexion() as conexion:
+            filas = conexion.execute(
+                f"SELECT id, registro, precio FROM muebles{donde} ORDER BY {orden} LIMIT ?",
+                (*parametros, limite),
+            ).fetchall()
+        muebles = [self._mueble(fila, registro) for fila, registro, _ in filas]
+        if len(filas) < limite:
+            return muebles, None
+        fila, _, precio = filas[-1]
+        return muebles, ((precio, fila) if por_precio else (fila,))
+
+    def _top_k(
+        self,
+        k: int,
+        descendente: bool,
+        tipo: Optional[type],
+        material: Optional[str],
+        color: Optional[str],
+    ) -> List[Mueble]:
+        """Extremos por precio con ORDER BY ... LIMIT sobre el índice de precio."""
+        if k <= 0:
+            return []
+        condiciones, parametros = self._condiciones_consulta(
+            None, tipo, material, color, None, None
+        )
+        donde = f" WHERE {' AND '.join(condiciones)}" if condiciones else ""
+        orden = "precio DESC, id DESC" if descendente else "precio, id"
+        return self._consultar(
+            f"SELECT id, registro FROM muebles{donde} ORDER BY {orden} LIMIT ?",
+            (*parametros, k),
+        )
+
+    def _top_k_por_tipo(self, k: int, descendente: bool) -> Dict[str, List[Mueble]]:
+        """Extremos por tipo con una función de ventana (una sola consulta)."""
+        if k <= 0:
+            return {}
+        orden = "precio DESC, id DESC" if descendente else "precio, id"
+        with self._pool.conexion() as conexion:
+            filas = conexion.execute(
+                "SELECT tipo, id, registro FROM ("
+                "SELECT tipo, id, registro, precio, "
+                f"ROW_NUMBER() OVER (PARTITION BY tipo ORDER BY {orden}) AS puesto "
+                f"FROM muebles) WHERE puesto <= ? ORDER BY tipo, puesto",
+                (k,),
+            ).fetchall()
+        resultado: Dict[str, List[Mueble]] = {}
+        for tipo, fila, registro in filas:
+            resultado.setdefault(tipo, []).append(self._mueble(fila, registro))
+        return resultado
+
+    def explicar_consulta(
+        self,
+        nombre: Optional[str] = None,
+        tipo: Optional[type] = None,
+        material: Optional[str] = None,
+        color: Optional[str] = None,
+        precio_min: Optional[float] = None,
+        precio_max: Optional[float] = None,
+    ) -> "PlanSQLite":
+        """Plan de SQLite (EXPLAIN QUERY PLAN) para la consulta compuesta."""
+        sentencia, parametros = self._sentencia_consulta(
+            nombre, tipo, material, color, precio_min, precio_max
+        )
+        with self._pool.conexion() as conexion:
+            pasos = [
+                fila[-1] for fila in conexion.execute(f"EXPLAIN QUERY PLAN {sentencia}", parametros)
+            ]
+        return PlanSQLite(sentencia, pasos)
+
+    def calcular_valor_inventario(self) -> float:
+        """Suma de precios calculada en SQL más el valor de los comedores."""
+        with self._pool.conexion() as conexion:
+            (valor_total,) = conexion.execute(
+                "SELECT COALESCE(SUM(precio), 0) FROM muebles"
+            ).fetchone()
+        for comedor in self._comedores:
+            try:
+                valor_total += comedor.calcular_precio_total()
+            except Exception:
+                continue
+        return round(valor_total, 2)
+
+    def aplicar_descuento(self, categoria: str, porcentaje: float) -> str:
+        """Aplica el descuento y lo guarda en la base."""
+        mensaje = super().aplicar_descuento(categoria, porcentaje)
+        if not mensaje.startswith("Error"):
+            with self._pool.transaccion() as conexion:
+                conexion.executemany(
+                    "INSERT OR REPLACE INTO descuentos (categoria, tasa) VALUES (?, ?)",
+                    self._descuentos.activos.items(),
+                )
+        return mensaje
+
+    def realizar_venta(self, mueble: Mueble, cliente: str = "Cliente Anónimo") -> Dict:
+        """
+        Registra la venta y borra el mueble en una sola transacción.
+
+        Args:
+            mueble: Mueble a vender
+            cliente: Nombre del cliente
+        Returns:
+            Dict: Información de la venta realizada o error
+        """
+        fila = self.fila_de(mueble)
+        if fila is None:
+            return {"error": "El mueble no está disponible en inventario"}
+        try:
+            with self._escritura(), self._pool.transaccion() as conexion:
+                resultado = conexion.execute(_PRECIO_MUEBLE, (fila,)).fetchone()
+                if resultado is None:
+                    return {"error": "El mueble no está disponible en inventario"}
+                tipo, nombre, precio_original = resultado
+                descuento_aplicado = self._descuentos.tasa_por_nombre(tipo)
+                venta = {
+                    "mueble": nombre or tipo,
+                    "cliente": cliente,
+                    "precio_original": precio_original,
+                    "descuento": descuento_aplicado * 100,
+                    "precio_final": round(precio_original * (1 - descuento_aplicado), 2),
+                    "fecha": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                }
+                if self._diario is not None:
+                    self._diario.registrar(
+                        {"venta": venta, "mueble": self._registro_diario(mueble)}
+                    )
+                conexion.execute(_INSERTAR_VENTA, tuple(venta.values()))
+                conexion.execute(_BORRAR_MUEBLE, (fila,))
+        except sqlite3.Error as e:
+            return {"error": f"Error al procesar la venta: {str(e)}"}
+        with self._candado_objetos:
+            self._objetos.pop(fila, None)
+            self._filas.pop(mueble, None)
+        _dejar_de_observar(mueble, self._observador)
+        return venta
+
+    def realizar_ventas(
+        self, muebles: Iterable[Mueble], cliente: str = "Cliente Anónimo"
+    ) -> List[Dict]:
+        """
+        Vende un lote en una sola transacción con una única lectura del reloj.
+
+        Args:
+            muebles: Muebles a vender
+            cliente: Nombre del cliente
+        Returns:
+            List[Dict]: Resultado de cada mueble, en el mismo orden (venta o error)
+        """
+        muebles = list(muebles)
+        fecha = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        resultados: List[Dict] = []
+        vendidos: List[Tuple[Mueble, int, Dict]] = []
+        try:
+            with self._escritura(), self._pool.transaccion() as conexion:
+                incluidas = set()
+                for mueble in muebles:
+                    fila = self.fila_de(mueble)
+                    resultado = None
+                    if fila is not None and fila not in incluidas:
+                        resultado = conexion.execute(_PRECIO_MUEBLE, (fila,)).fetchone()
+                    if resultado is None:
+                        resultados.append({"error": "El mueble no está disponible en inventario"})
+                        continue
+                    tipo, nombre, precio_original = resultado
+                    descuento_aplicado = self._descuentos.tasa_por_nombre(tipo)
+                    venta = {
+                        "mueble": nombre or tipo,
+                        "cliente": cliente,
+                        "precio_original": precio_original,
+                        "descuento": descuento_aplicado * 100,
+                        "precio_final": round(precio_original * (1 - descuento_aplicado), 2),
+                        "fecha": fecha,
+                    }
+                    incluidas.add(fila)
+                    vendidos.append((mueble, fila, venta))
+                    resultados.append(venta)
+                if self._diario is not None:
+                    self._diario.registrar_lote(
+                        {"venta": venta, "mueble": self._registro_diario(mueble)}
+                        for mueble, _, venta in vendidos
+                    )
+                conexion.executemany(
+                    _INSERTAR_VENTA, [tuple(venta.values()) for _, _, venta in vendidos]
+                )
+                conexion.executemany(_BORRAR_MUEBLE, [(fila,) for _, fila, _ in vendidos])
+        except sqlite3.Error as e:
+            return [{"error": f"Error al procesar la venta: {str(e)}"} for _ in muebles]
+        with self._candado_objetos:
+            for mueble, fila, _ in vendidos:
+                self._objetos.pop(fila, None)
+                self._filas.pop(mueble, None)
+        for mueble, _, _ in vendidos:
+            _dejar_de_observar(mueble, self._observador)
+        return resultados
+
+    def abrir_diario(
+        self,
+        ruta: str,
+        tamaño_grupo: int = 32,
+        intervalo_fsync: float = 0.05,
+    ) -> int:
+        """
+        Anexa las ventas nuevas a un diario sin reproducirlo: la base ya
+        guarda las ventas de forma transaccional.
+
+        Returns:
+            int: Siempre 0
+        """
+        from services.diario import DiarioVentas
+
+        self.cerrar_diario()
+        self._diario = DiarioVentas(ruta, tamaño_grupo, intervalo_fsync)
+        return 0
+
+    def guardar_snapshot(self, ruta: str) -> int:
+        """Guarda el inventario de la base en un snapshot binario."""
+        from services.snapshot import escribir_snapshot
+
+        with self._pool.conexion() as conexion:
+            filas = conexion.execute("SELECT id, registro, precio FROM muebles ORDER BY id")
+            return escribir_snapshot(
+                ruta,
+                ((self._mueble(fila, registro), precio) for fila, registro, precio in filas),
+                {"nombre": self._nombre, "descuentos_activos": self._descuentos.activos},
+            )
+
+    @classmethod
+    def desde_snapshot(
+        cls,
+        ruta: str,
+        motor_columnar: bool = False,
+        motor_precios: Optional["MotorPrecios"] = None,
+        *,
+        ruta_base: Optional[Union[str, "Path"]] = None,
+    ) -> "TiendaSQLite":
+        """
+        Carga el contenido de un snapshot en una base SQLite.
+        Los muebles se agregan a los que ya tenga la base.
+
+        Args:
+            ruta: Archivo escrito con guardar_snapshot
+            motor_columnar: Debe ser False; las consultas se resuelven en SQL
+            motor_precios: Reglas de precio de la tienda (ver TiendaMuebles)
+            ruta_base: Archivo de la base de datos (obligatorio)
+
+        Returns:
+            TiendaSQLite: Tienda con los muebles y descuentos guardados
+
+        Raises:
+            ValueError: Si falta ruta_base o se pide el motor columnar
+        """
+        from services.snapshot import TiendaSnapshot
+
+        if ruta_base is None:
+            raise ValueError("TiendaSQLite.desde_snapshot necesita ruta_base")
+        if motor_columnar:
+            raise ValueError("TiendaSQLite no usa el motor columnar")
+        with TiendaSnapshot(ruta) as snapshot:
+            tienda = cls(
+                ruta_base,
+                snapshot.nombre or "Mueblería OOP",
+                motor_precios=motor_precios,
+            )
+            tienda.agregar_muebles(snapshot.iterar_muebles())
+            tienda._descuentos.cargar(snapshot.metadatos.get("descuentos_activos", {}))
+        with tienda._pool.transaccion() as conexion:
+            conexion.executemany(
+                "INSERT OR REPLACE INTO descuentos (categoria, tasa) VALUES (?, ?)",
+                tienda._descuentos.activos.items(),
+            )
+        tienda._estadisticas.registrar_descuentos(tienda._descuentos.activos)
+        return tienda
+
+    def obtener_estadisticas(self) -> dict:
+        """Estadísticas calculadas con agregados SQL."""
+        with self._pool.conexion() as conexion:
+            total, valor = conexion.execute(
+                "SELECT COUNT(*), COALESCE(SUM(precio), 0) FROM muebles"
+            ).fetchone()
+            tipos = dict(
+                conexion.execute(
+                    "SELECT tipo, COUNT(*) FROM muebles GROUP BY tipo ORDER BY MIN(id)"
+                )
+            )
+            ventas, valor_ventas = conexion.execute(
+                "SELECT COUNT(*), COALESCE(SUM(precio_final), 0) FROM ventas"
+            ).fetchone()
+        return {
+            "total_muebles": total,
+            "valor_inventario": round(valor, 2),
+            "tipos_muebles": tipos,
+            "descuentos_activos": self._descuentos.activos.copy(),
+            "ventas_realizadas": ventas,
+            "total_muebles_vendidos": ventas,
+            "valor_total_ventas": valor_ventas,
+            "total_comedores": len(self._comedores),
+        }
+
+
+class PlanSQLite:
+    """Plan de una consulta compuesta elegido por SQLite."""
+
+    def __init__(self, sentencia: str, pasos: List[str]):
+        """
+        Constructor del plan.
+
+        Args:
+            sentencia: SQL ejecutado por consultar
+            pasos: Detalle de cada paso de EXPLAIN QUERY PLAN
+        """
+        self.sentencia = sentencia
+        self.pasos = pasos
+
+    def como_dict(self) -> Dict:
+        """Representación del plan como diccionario."""
+        return {"sentencia": self.sentencia, "pasos": self.pasos}
+
+    def __str__(self) -> str:
+        """Sentencia seguida de los pasos del plan."""
+        return "\n".join([self.sentencia] + [f"  {paso}" for paso in self.pasos])
@@ -0,0 +1,351 @@
+"""
+API HTTP con respuestas JSON sobre TiendaMuebles.
+Solo usa la biblioteca estándar (http.server) y atiende las conexiones con un
+pool de hilos, para integrar la tienda con otros programas o someterla a carga.
+
+Rutas:
+    GET  /muebles                  catálogo (filtros: nombre, tipo, material, color,
+                                   precio_min, precio_max; paginado: cursor, limite)
+    GET  /muebles/<id>             un mueble
+    GET  /estadisticas             estadísticas de la tienda
+    POST /ventas                   {"ids": [...], "cliente": "..."}
+    POST /descuentos               {"categoria": "...", "porcentaje": 10}
+"""
+
+import base64
+import binascii
+import json
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from models.mueble import Mueble
+from services.catalogo import TIPOS_MUEBLE, normalizar_tipo
+from services.tienda import TiendaMuebles
+
+
+class ErrorPeticion(Exception):
+    """Petición inválida; se responde con el estado indicado."""
+
+    def __init__(self, mensaje: str, estado: HTTPStatus = HTTPStatus.BAD_REQUEST):
+        super().__init__(mensaje)
+        self.estado = estado
+
+
+def mueble_a_dict(mueble: Mueble, tienda: TiendaMuebles) -> Optional[Dict]:
+    """
+    Representación JSON de un mueble.
+
+    Args:
+        mueble: Mueble a serializar
+        tienda: Tienda que da su identificador y su precio
+
+    Returns:
+        Dict: id, tipo, nombre, material, color y precio, o None si el mueble
+        ya no está en la tienda
+    """
+    identificador = tienda.identificador(mueble)
+    if identificador is None:
+        return None
+    return {
+        "id": identificador,
+        "tipo": type(mueble).__name__,
+        "nombre": mueble.nombre,
+        "material": mueble.material,
+        "color": mueble.color,
+        "precio": round(tienda.precio(mueble), 2),
+    }
+
+
+def _numero(parametros: Dict[str, List[str]], nombre: str, defecto: float) -> float:
+    """Lee un parámetro numérico de la consulta."""
+    valores = parametros.get(nombre)
+    if not valores:
+        return defecto
+    try:
+        return float(valores[0])
+    except ValueError:
+        raise ErrorPeticion(f"El parámetro '{nombre}' debe ser numérico") from None
+
+
+def _entero(parametros: Dict[str, List[str]], nombre: str, defecto: int) -> int:
+    """Lee un parámetro entero de la consulta (se rechazan inf y nan)."""
+    try:
+        return int(_numero(parametros, nombre, defecto))
+    except (OverflowError, ValueError):
+        raise ErrorPeticion(f"El parámetro '{nombre}' debe ser un número finito") from None
+
+
+def _codificar_cursor(cursor: Tuple) -> str:
+    """Convierte el cursor de TiendaMuebles.paginar en un texto opaco para la URL."""
+    datos = json.dumps(list(cursor), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(datos).decode().rstrip("=")
+
+
+def _decodificar_cursor(texto: str) -> Tuple:
+    """Recupera el cursor de paginar a partir del texto que se entregó al cliente."""
+    try:
+        datos = base64.urlsafe_b64decode(texto + "=" * (-len(texto) % 4))
+        cursor = json.loads(datos)
+    except (binascii.Error, ValueError):
+        raise ErrorPeticion("Cursor inválido") from None
+    if not isinstance(cursor, list) or not all(
+        isinstance(valor, (int, float)) and not isinstance(valor, bool) for valor in cursor
+    ):
+        raise ErrorPeticion("Cursor inválido")
+    return tuple(cursor)
+
+
+class ManejadorTienda(BaseHTTPRequestHandler):
+    """
+    Atiende las peticiones de una conexión.
+
+    Usa HTTP/1.1 con Content-Length en todas las respuestas, por lo que la
+    conexión se mantiene abierta entre peticiones (keep-alive). Las lecturas
+    llevan un ETag con la versión de la tienda: si el cliente lo reenvía en
+    If-None-Match y nada cambió, se responde 304 sin recalcular la consulta.
+    """
+
+    protocol_version = "HTTP/1.1"
+    # Segundos que una conexión inactiva conserva su hilo del pool
+    timeout = 5
+    server: "ServidorTienda"
+
+    def log_message(self, formato: str, *argumentos) -> None:
+        """Solo registra peticiones si el servidor lo pide."""
+        if self.server.registrar_peticiones:
+            super().log_message(formato, *argumentos)
+
+    def _responder(
+        self, estado: HTTPStatus, cuerpo: Optional[object] = None, etag: Optional[str] = None
+    ) -> None:
+        """Envía una respuesta JSON (o vacía para 304)."""
+        datos = b"" if cuerpo is None else json.dumps(cuerpo, ensure_ascii=False).encode()
+        self.send_response(estado)
+        if etag is not None:
+            self.send_header("ETag", etag)
+        if cuerpo is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(datos)))
+        self.end_headers()
+        if datos:
+            self.wfile.write(datos)
+
+    def _leer_cuerpo(self) -> Dict:
+        """Lee el cuerpo JSON de la petición."""
+        try:
+            longitud = int(self.headers.get("Content-Length") or 0)
+        except ValueError:
+            longitud = -1
+        if longitud < 0:
+            # Sin una longitud válida no se sabe dónde empieza la próxima petición
+            self.close_connection = True
+            raise ErrorPeticion("Content-Length inválido")
+        try:
+            cuerpo = json.loads(self.rfile.read(longitud) or b"{}")
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            raise ErrorPeticion("El cuerpo debe ser JSON válido") from None
+        if not isinstance(cuerpo, dict):
+            raise ErrorPeticion("El cuerpo debe ser un objeto JSON")
+        return cuerpo
+
+    def _atender(self, metodo) -> None:
+        """Ejecuta el método de la ruta y convierte los errores en respuestas."""
+        try:
+            metodo()
+        except ErrorPeticion as e:
+            self._responder(e.estado, {"error": str(e)})
+
+    def do_GET(self) -> None:
+        """Lecturas con soporte de GET condicional."""
+        self._atender(self._get)
+
+    def do_POST(self) -> None:
+        """Operaciones que modifican la tienda."""
+        self._atender(self._post)
+
+    def _get(self) -> None:
+        url = urlsplit(self.path)
+        partes = [parte for parte in url.path.split("/") if parte]
+        tienda = self.server.tienda
+        # La versión se lee antes de consultar: si cambia durante la consulta,
+        # el cliente recibirá un 200 en la próxima petición
+        etag = f'"v{tienda.version}"'
+        if partes == ["muebles"]:
+
+            def consulta() -> Dict:
+                return self._listar(parse_qs(url.query))
+
+        elif len(partes) == 2 and partes[0] == "muebles":
+
+            def consulta() -> Dict:
+                return self._detalle(partes[1])
+
+        elif partes == ["estadisticas"]:
+            consulta = tienda.obtener_estadisticas
+        else:
+            raise ErrorPeticion("Ruta no encontrada", HTTPStatus.NOT_FOUND)
+        if self.headers.get("If-None-Match") == etag:
+            self._responder(HTTPStatus.NOT_MODIFIED, etag=etag)
+            return
+        self._responder(HTTPStatus.OK, consulta(), etag=etag)
+
+    def _post(self) -> None:
+        ruta = urlsplit(self.path).path.rstrip("/")
+        tienda = self.server.tienda
+        cuerpo = self._leer_cuerpo()
+        if ruta == "/ventas":
+            ids = cuerpo.get("ids")
+            if not isinstance(ids, list) or not ids:
+                raise ErrorPeticion("Se espera 'ids' con una lista de identificadores")
+            cliente = str(cuerpo.get("cliente") or "Cliente Anónimo")
+            muebles = [self._mueble(identificador, exigir=False) for identificador in ids]
+            resultados = tienda.realizar_ventas([m for m in muebles if m is not None], cliente)
+            # Los ids desconocidos se informan en su posición
+            iterador = iter(resultados)
+            respuesta = [
+                next(iterador) if m is not None else {"error": "Mueble no encontrado"}
+                for m in muebles
+            ]
+            self._responder(HTTPStatus.OK, {"resultados": respuesta})
+        elif ruta == "/descuentos":
+            try:
+                porcentaje = float(cuerpo.get("porcentaje"))
+            except (TypeError, ValueError):
+                raise ErrorPeticion("Se espera 'porcentaje' numérico") from None
+            mensaje = tienda.aplicar_descuento(str(cuerpo.get("categoria") or ""), porcentaje)
+            if mensaje.startswith("Error"):
+                raise ErrorPeticion(mensaje)
+            self._responder(HTTPStatus.OK, {"mensaje": mensaje})
+        else:
+            raise ErrorPeticion("Ruta no encontrada", HTTPStatus.NOT_FOUND)
+
+    def _mueble(self, identificador, exigir: bool = True) -> Optional[Mueble]:
+        """Busca un mueble por id; con exigir, responde 404 si no existe."""
+        try:
+            mueble = self.server.tienda.obtener_mueble(int(identificador))
+        except (TypeError, ValueError):
+            mueble = None
+        if mueble is None and exigir:
+            raise ErrorPeticion("Mueble no encontrado", HTTPStatus.NOT_FOUND)
+        return mueble
+
+    def _detalle(self, identificador: str) -> Dict:
+        """Un mueble por id; 404 si no existe o se vendió mientras se leía."""
+        datos = mueble_a_dict(self._mueble(identificador), self.server.tienda)
+        if datos is None:
+            raise ErrorPeticion("Mueble no encontrado", HTTPStatus.NOT_FOUND)
+        return datos
+
+    def _listar(self, parametros: Dict[str, List[str]]) -> Dict:
+        """
+        Una página del catálogo filtrado, paginado por cursor (TiendaMuebles.paginar).
+
+        Solo se leen los muebles de la página. La respuesta trae en "siguiente"
+        el cursor para pedir la próxima página (null si no hay más); como
+        apunta al último mueble entregado, las ventas y altas entre páginas no
+        hacen que se repitan ni se salteen muebles.
+        """
+        criterios = {
+            campo: parametros[campo][0]
+            for campo in ("nombre", "material", "color")
+            if campo in parametros
+        }
+        for campo in ("precio_min", "precio_max"):
+            if campo in parametros:
+                criterios[campo] = _numero(parametros, campo, 0)
+        if "tipo" in parametros:
+            tipo = TIPOS_MUEBLE.get(normalizar_tipo(parametros["tipo"][0]))
+            if tipo is None:
+                raise ErrorPeticion(f"Tipo de mueble desconocido: {parametros['tipo'][0]}")
+            criterios["tipo"] = tipo
+        if "desde" in parametros:
+            raise ErrorPeticion("'desde' no se admite: usar el 'cursor' de la página anterior")
+        limite = _entero(parametros, "limite", 100)
+        if limite <= 0:
+            raise ErrorPeticion("'limite' debe ser mayor a 0")
+        cursor = _decodificar_cursor(parametros["cursor"][0]) if "cursor" in parametros else None
+        try:
+            muebles, siguiente = self.server.tienda.paginar(cursor, limite, **criterios)
+        except ValueError:
+            raise ErrorPeticion("Cursor inválido") from None
+        pagina = (mueble_a_dict(m, self.server.tienda) for m in muebles)
+        # Los vendidos entre la consulta y la serialización se omiten
+        return {
+            "muebles": [datos for datos in pagina if datos is not None],
+            "siguiente": None if siguiente is None else _codificar_cursor(siguiente),
+        }
+
+
+class ServidorTienda(HTTPServer):
+    """
+    Servidor HTTP que atiende cada conexión en un pool de hilos fijo.
+
+    A diferencia de ThreadingHTTPServer no crea un hilo por conexión: la
+    cantidad de hilos queda acotada por max_hilos. Como las conexiones
+    keep-alive ocupan su hilo mientras están abiertas, las inactivas se
+    cierran tras ManejadorTienda.timeout segundos.
+
+    La tienda debe estar en modo concurrente.
+    """
+
+    allow_reuse_address = True
+
+    def __init__(
+        self,
+        tienda: TiendaMuebles,
+        direccion: Tuple[str, int] = ("127.0.0.1", 8000),
+        max_hilos: int = 32,
+        registrar_peticiones: bool = False,
+    ):
+        """
+        Crea el servidor y lo asocia a la dirección.
+
+        Args:
+            tienda: Tienda en modo concurrente
+            direccion: (host, puerto); el puerto 0 elige uno libre
+            max_hilos: Conexiones atendidas a la vez
+            registrar_peticiones: Si escribir cada petición en stderr
+        """
+        if not tienda.concurrente:
+            raise ValueError("La tienda debe crearse con concurrente=True")
+        super().__init__(direccion, ManejadorTienda)
+        self.tienda = tienda
+        self.registrar_peticiones = registrar_peticiones
+        self._pool = ThreadPoolExecutor(max_workers=max_hilos, thread_name_prefix="http")
+
+    def process_request(self, request, client_address) -> None:
+        """Delegar la conexión al pool en lugar de atenderla en el hilo principal."""
+        self._pool.submit(self._procesar, request, client_address)
+
+    def _procesar(self, request, client_address) -> None:
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self) -> None:
+        """Cierra el socket y espera a las conexiones en curso."""
+        super().server_close()
+        self._pool.shutdown(wait=True)
+
+
+def servir(tienda: TiendaMuebles, host: str = "127.0.0.1", puerto: int = 8000) -> None:
+    """
+    Atiende peticiones hasta que se interrumpa el proceso.
+
+    Args:
+        tienda: Tienda en modo concurrente
+        host: Interfaz donde escuchar
+        puerto: Puerto TCP
+    """
+    with ServidorTienda(tienda, (host, puerto)) as servidor:
+        print(f"API de {tienda.nombre} en http://{host}:{servidor.server_address[1]}")
+        try:
+            servidor.serve_forever()
+        except KeyboardInterrupt:
+            pass
@@ -6,6 +6,7 @@ Interfaz de usuario usando Rich para crear un menú interactivo y atractivo.
 """
 
 import time
+from contextlib import ExitStack
 from typing import List, Optional
 
 from rich.console import Console
@@ -15,7 +16,9 @@ from rich.text import Text
 from models.mueble import Mueble
 
 # Corrección de imports para ejecución directa
+from services.reportes import FORMATOS_REPORTE
 from services.tienda import TiendaMuebles
+from ui.vista_catalogo import COLUMNAS_VISTA, Fila, VistaCatalogo
 
 # TODO: Importar los servicios y modelos
 
@@ -52,30 +55,14 @@ class MenuTienda:
     def mostrar_catalogo_completo(self):
         """Muestra todos los muebles disponibles en una tabla."""
 
-        # Implementar visualización del catálogo
-        muebles = self.tienda._inventario  # Acceso directo para el ejemplo
+        # Solo se leen y dibujan las páginas que se muestran
+        vista = VistaCatalogo(self.tienda)
 
-        if not muebles:
+        if not vista.pagina(0):
             self.console.print("[yellow]No hay muebles en el inventario.[/yellow]")
             return
 
-        table = Table(title="📋 Catálogo de Muebles")
-        table.add_column("ID", style="cyan", no_wrap=True)
-        table.add_column("Nombre", style="magenta")
-        table.add_column("Tipo", style="green")
-        table.add_column("Material", style="yellow")
-        table.add_column("Color", style="blue")
-        table.add_column("Precio", style="red", justify="right")
-
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
-                table.add_row(str(i), mueble.nombre, tipo, mueble.material, mueble.color, precio)
-            except Exception as e:
-                table.add_row(str(i), mueble.nombre, "Error", "-", "-", "Error")
-
-        self.console.print(table)
+        self._navegar_vista(vista, "📋 Catálogo de Muebles")
 
     def buscar_muebles_interactivo(self):
         """Interfaz interactiva para buscar muebles."""
@@ -90,16 +77,16 @@ class MenuTienda:
 
         with self.console.status("[bold green]Buscando muebles..."):
             time.sleep(0.5)  # Simular tiempo de búsqueda
-            resultados = self.tienda.buscar_muebles_por_nombre(termino_busqueda)
+            vista = VistaCatalogo(self.tienda, nombre=termino_busqueda)
+            primera = vista.pagina(0)
 
-        if not resultados:
+        if not primera:
             self.console.print(
                 f"[yellow]No se encontraron muebles que contengan '{termino_busqueda}'.[/yellow]"
             )
             return
 
-        self.console.print(f"\n[green]Se encontraron {len(resultados)} resultado(s):[/green]")
-        self._mostrar_lista_muebles(resultados)
+        self._navegar_vista(vista, f"Resultados para '{termino_busqueda}'")
 
     def filtrar_por_precio_interactivo(self):
         """Interfaz interactiva para filtrar por precio."""
@@ -119,18 +106,21 @@ class MenuTienda:
 
         with self.console.status("[bold green]Filtrando muebles..."):
             time.sleep(0.3)
-            resultados = self.tienda.filtrar_por_precio(precio_min, precio_max)
+            vista = VistaCatalogo(
+                self.tienda,
+                por_precio=True,
+                precio_min=max(precio_min, 0),
+                precio_max=precio_max,
+            )
+            primera = vista.pagina(0)
 
-        if not resultados:
+        if not primera:
             self.console.print(
                 f"[yellow]No hay muebles en el rango ${precio_min} - ${precio_max}.[/yellow]"
             )
             return
 
-        self.console.print(
-            f"\n[green]Se encontraron {len(resultados)} mueble(s) en el rango:[/green]"
-        )
-        self._mostrar_lista_muebles(resultados)
+        self._navegar_vista(vista, "Muebles en el rango (de menor a mayor precio)")
 
     def filtrar_por_material_interactivo(self):
         """Interfaz interactiva para filtrar por material."""
@@ -145,14 +135,14 @@ class MenuTienda:
 
         with self.console.status(f"[bold green]Buscando muebles de {material}..."):
             time.sleep(0.3)
-            resultados = self.tienda.filtrar_por_material(material)
+            vista = VistaCatalogo(self.tienda, material=material)
+            primera = vista.pagina(0)
 
-        if not resultados:
+        if not primera:
             self.console.print(f"[yellow]No hay muebles de material '{material}'.[/yellow]")
             return
 
-        self.console.print(f"\n[green]Muebles de {material} encontrados:[/green]")
-        self._mostrar_lista_muebles(resultados)
+        self._navegar_vista(vista, f"Muebles de {material} encontrados")
 
     def mostrar_comedores(self):
         """Muestra todos los comedores disponibles."""
@@ -171,22 +161,22 @@ class MenuTienda:
     def realizar_venta_interactiva(self):
         """Interfaz interactiva para realizar ventas."""
 
-        muebles = self.tienda._inventario
+        # La numeración es la de la vista: solo se leen las páginas recorridas
+        vista = VistaCatalogo(self.tienda)
 
-        if not muebles:
+        if not vista.pagina(0):
             self.console.print("[red]No hay muebles disponibles para venta.[/red]")
             return
 
         self.console.print("[cyan]Selecciona un mueble para vender:[/cyan]")
-        self._mostrar_lista_muebles(muebles, numerada=True)
 
         try:
-            indice = IntPrompt.ask(
-                "Número del mueble",
-                choices=[str(i) for i in range(1, len(muebles) + 1)],
+            mueble_seleccionado = self._navegar_vista(
+                vista, "Muebles disponibles", seleccionar=True
             )
-
-            mueble_seleccionado = muebles[indice - 1]
+            if mueble_seleccionado is None:
+                self.console.print("[yellow]Venta cancelada.[/yellow]")
+                return
 
             # Mostrar detalles del mueble
             self.console.print(f"\n[green]Mueble seleccionado:[/green]")
@@ -260,11 +250,22 @@ class MenuTienda:
         # Preguntar si desea guardar el reporte
         guardar = Confirm.ask("¿Deseas guardar el reporte en un archivo?")
         if guardar:
-            filename = Prompt.ask("Nombre del archivo", default="reporte_inventario.txt")
+            formato = Prompt.ask("Formato", choices=[*FORMATOS_REPORTE, "todos"], default="texto")
+            base = Prompt.ask("Nombre del archivo (sin extensión)", default="reporte_inventario")
+            formatos = list(FORMATOS_REPORTE) if formato == "todos" else [formato]
+            rutas = {f: base + FORMATOS_REPORTE[f].extension for f in formatos}
             try:
-                with open(filename, "w", encoding="utf-8") as f:
-                    f.write(reporte)
-                self.console.print(f"[green]Reporte guardado en {filename}[/green]")
+                # Un solo recorrido del inventario escribe todos los archivos
+                with ExitStack() as pila:
+                    destinos = {
+                        f: pila.enter_context(open(ruta, "w", encoding="utf-8", newline=""))
+                        for f, ruta in rutas.items()
+                    }
+                    cantidad = self.tienda.escribir_reporte(destinos)
+                self.console.print(
+                    f"[green]Reporte de {cantidad} muebles guardado en "
+                    f"{', '.join(rutas.values())}[/green]"
+                )
             except Exception as e:
                 self.console.print(f"[red]Error al guardar: {str(e)}[/red]")
 
@@ -278,6 +279,9 @@ class MenuTienda:
             "cama",
             "armario",
             "escritorio",
+            "asiento",
+            "superficie",
+            "almacenamiento",
         ]
 
         self.console.print("[cyan]Categorías disponibles:[/cyan]")
@@ -303,43 +307,82 @@ class MenuTienda:
         except (ValueError, IndexError):
             self.console.print("[red]Selección inválida.[/red]")
 
-    def _mostrar_lista_muebles(self, muebles: List["Mueble"], numerada: bool = False):
+    def _mostrar_pagina(self, filas: List[Fila], titulo: str, pie: str):
         """
-        Muestra una lista de muebles en formato tabla.
+        Dibuja una sola página de la vista como tabla.
         Método auxiliar privado.
 
         Args:
-            muebles: Lista de muebles a mostrar
-            numerada: Si incluir números para selección
+            filas: Filas ya formateadas de la página
+            titulo: Título de la tabla
+            pie: Texto bajo la tabla (posición en la vista)
         """
+        table = Table(title=titulo, caption=pie)
+        table.add_column("#", style="cyan", no_wrap=True)
+        estilos = ("magenta", "green", "yellow", "blue", "red")
+        for columna, estilo in zip(COLUMNAS_VISTA, estilos):
+            alineacion = "right" if columna == "Precio" else "left"
+            table.add_column(columna, style=estilo, justify=alineacion)
 
-        table = Table()
+        for numero, _, celdas in filas:
+            table.add_row(str(numero), *celdas)
 
-        if numerada:
-            table.add_column("#", style="cyan", no_wrap=True)
-
-        table.add_column("Nombre", style="magenta")
-        table.add_column("Tipo", style="green")
-        table.add_column("Material", style="yellow")
-        table.add_column("Precio", style="red", justify="right")
+        self.console.print(table)
 
-        for i, mueble in enumerate(muebles, 1):
-            try:
-                precio = f"${mueble.calcular_precio():.2f}"
-                tipo = type(mueble).__name__
+    def _navegar_vista(
+        self, vista: VistaCatalogo, titulo: str, seleccionar: bool = False
+    ) -> Optional["Mueble"]:
+        """
+        Muestra la vista de a una página y permite avanzar, retroceder o salir.
+        Método auxiliar privado.
 
-                row_data = [mueble.nombre, tipo, mueble.material, precio]
-                if numerada:
-                    row_data.insert(0, str(i))
+        Args:
+            vista: Vista paginada a recorrer
+            titulo: Título de las tablas
+            seleccionar: Si aceptar un número de fila y devolver ese mueble
 
-                table.add_row(*row_data)
-            except Exception:
-                row_data = [mueble.nombre, "Error", mueble.material, "Error"]
-                if numerada:
-                    row_data.insert(0, str(i))
-                table.add_row(*row_data)
+        Returns:
+            Optional[Mueble]: Mueble elegido (solo con seleccionar) o None
+        """
+        indice = 0
+        while True:
+            filas = vista.pagina(indice)
+            total = vista.total
+            pie = f"Página {indice + 1} · filas {filas[0][0]}-{filas[-1][0]}" if filas else ""
+            if total is not None:
+                pie += f" de {total}"
+            self._mostrar_pagina(filas, titulo, pie)
+
+            hay_siguiente = vista.hay_siguiente(indice)
+            if not seleccionar and not hay_siguiente and indice == 0:
+                return None
+            opciones = []
+            if seleccionar:
+                opciones.append("número = elegir")
+            if hay_siguiente:
+                opciones.append("s = siguiente")
+            if indice > 0:
+                opciones.append("a = anterior")
+            opciones.append("q = salir")
+            respuesta = (
+                Prompt.ask(", ".join(opciones), default="s" if hay_siguiente else "q")
+                .strip()
+                .lower()
+            )
 
-        self.console.print(table)
+            if respuesta == "s" and hay_siguiente:
+                indice += 1
+            elif respuesta == "a" and indice > 0:
+                indice -= 1
+            elif respuesta == "q":
+                return None
+            else:
+                mueble = (
+                    vista.mueble(int(respuesta)) if seleccionar and respuesta.isdigit() else None
+                )
+                if mueble is not None:
+                    return mueble
+                self.console.print("[red]Opción inválida.[/red]")
 
     def _mostrar_comprobante_venta(self, venta: dict):
         """
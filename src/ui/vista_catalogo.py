@@ -0,0 +1,209 @@
+"""
+Vista paginada del catálogo para la interfaz de consola.
+Lee de la tienda solo las páginas que se muestran y guarda sus filas ya
+formateadas, de modo que recorrer un inventario grande no congela la terminal.
+No depende de Rich: el menú decide cómo dibujar cada página.
+"""
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from models.mueble import Mueble
+from services.tienda import TiendaMuebles
+
+# Filas por página y páginas formateadas que se conservan
+TAMAÑO_PAGINA_VISTA = 20
+PAGINAS_EN_CACHE = 8
+
+# Columnas de cada fila formateada
+COLUMNAS_VISTA = ("Nombre", "Tipo", "Material", "Color", "Precio")
+
+# Fila de la vista: número global, mueble y celdas ya formateadas
+Fila = Tuple[int, Mueble, Tuple[str, ...]]
+
+
+def formatear_fila(
+    mueble: Mueble, precio_de: Optional[Callable[[Mueble], float]] = None
+) -> Tuple[str, ...]:
+    """
+    Celdas de un mueble en el orden de COLUMNAS_VISTA.
+
+    Args:
+        mueble: Mueble a mostrar
+        precio_de: Precio del mueble (por defecto su calcular_precio)
+
+    Returns:
+        Tuple[str, ...]: Nombre, tipo, material, color y precio como texto
+    """
+    tipo = type(mueble).__name__
+    try:
+        valor = mueble.calcular_precio() if precio_de is None else precio_de(mueble)
+        precio = f"${valor:.2f}"
+    except Exception:
+        tipo, precio = "Error", "Error"
+    return (mueble.nombre, tipo, mueble.material, mueble.color, precio)
+
+
+class VistaCatalogo:
+    """
+    Ventana paginada sobre el catálogo (o sobre una consulta).
+
+    Las páginas se piden a TiendaMuebles.paginar con cursores de clave, solo
+    cuando se muestran por primera vez. Las filas formateadas de las últimas
+    PAGINAS_EN_CACHE páginas vistas se conservan (LRU), así que volver atrás
+    no recalcula precios ni vuelve a consultar. Si la tienda cambia (su
+    versión avanza), la caché se descarta y las páginas se vuelven a leer.
+
+    Los cursores de cada página se guardan: ir a la página k solo lee las
+    páginas intermedias que todavía no se conocen.
+
+    Conceptos aplicados:
+    - Encapsulación: Cursores, caché y lectura perezosa quedan ocultos al menú
+    - Separación de responsabilidades: La vista no sabe cómo se dibujan las filas
+    """
+
+    def __init__(
+        self,
+        tienda: TiendaMuebles,
+        tamaño_pagina: int = TAMAÑO_PAGINA_VISTA,
+        paginas_en_cache: int = PAGINAS_EN_CACHE,
+        **criterios,
+    ):
+        """
+        Constructor de la vista.
+
+        Args:
+            tienda: Tienda de la que se leen los muebles
+            tamaño_pagina: Filas por página
+            paginas_en_cache: Páginas formateadas que se conservan
+            **criterios: Filtros de TiendaMuebles.paginar (nombre, tipo, material,
+                color, precio_min, precio_max, por_precio)
+        """
+        if tamaño_pagina <= 0 or paginas_en_cache <= 0:
+            raise ValueError("El tamaño de página y la caché deben ser mayores a 0")
+        self._tienda = tienda
+        self._tamaño = tamaño_pagina
+        self._max_cache = paginas_en_cache
+        self._criterios = criterios
+        # Cursor con el que se lee cada página conocida (None: la primera)
+        self._cursores: List[Optional[Tuple]] = [None]
+        # Índice de la última página, una vez que se llegó al final
+        self._ultima: Optional[int] = None
+        self._paginas: "OrderedDict[int, List[Fila]]" = OrderedDict()
+        self._version = tienda.version
+        self._lecturas = 0
+
+    @property
+    def tamaño_pagina(self) -> int:
+        """Filas por página."""
+        return self._tamaño
+
+    @property
+    def total(self) -> Optional[int]:
+        """Muebles del catálogo completo (None si la vista tiene filtros)."""
+        if self._criterios:
+            return None
+        return self._tienda.obtener_estadisticas().get("total_muebles", 0)
+
+    def _validar_cache(self) -> None:
+        """Descarta las filas formateadas si la tienda cambió."""
+        version = self._tienda.version
+        if version != self._version:
+            self._paginas.clear()
+            self._ultima = None
+            self._version = version
+
+    def _leer(self, indice: int) -> List[Fila]:
+        """Lee una página de la tienda y actualiza los cursores."""
+        muebles, siguiente = self._tienda.paginar(
+            self._cursores[indice], self._tamaño, **self._criterios
+        )
+        self._lecturas += 1
+        if indice + 1 < len(self._cursores) and self._cursores[indice + 1] != siguiente:
+            # La página cambió de límites: los cursores posteriores ya no valen
+            del self._cursores[indice + 1 :]
+            for otra in [k for k in self._paginas if k > indice]:
+                del self._paginas[otra]
+        if siguiente is None or not muebles:
+            self._ultima = indice if muebles or indice == 0 else indice - 1
+        elif indice + 1 == len(self._cursores):
+            self._cursores.append(siguiente)
+        inicio = indice * self._tamaño
+        return [
+            (inicio + posicion, mueble, formatear_fila(mueble, self._tienda.precio))
+            for posicion, mueble in enumerate(muebles, 1)
+        ]
+
+    def pagina(self, indice: int) -> List[Fila]:
+        """
+        Filas de una página (vacía si no existe).
+
+        Args:
+            indice: Número de página, desde 0
+
+        Returns:
+            List[Fila]: (número global desde 1, mueble, celdas formateadas)
+        """
+        if indice < 0:
+            return []
+        self._validar_cache()
+        filas = self._paginas.get(indice)
+        if filas is not None:
+            self._paginas.move_to_end(indice)
+            return filas
+        # Leer en orden las páginas intermedias que todavía no tienen cursor
+        while len(self._cursores) <= indice:
+            if self._ultima is not None:
+                return []
+            intermedia = len(self._cursores) - 1
+            self._guardar(intermedia, self._leer(intermedia))
+        if self._ultima is not None and indice > self._ultima:
+            return []
+        filas = self._leer(indice)
+        self._guardar(indice, filas)
+        return filas
+
+    def _guardar(self, indice: int, filas: List[Fila]) -> None:
+        """Agrega una página a la caché y descarta la menos usada si sobra."""
+        if not filas and indice > 0:
+            return
+        self._paginas[indice] = filas
+        if len(self._paginas) > self._max_cache:
+            self._paginas.popitem(last=False)
+
+    def hay_siguiente(self, indice: int) -> bool:
+        """
+        Indica si después de la página dada puede haber más muebles.
+
+        Args:
+            indice: Página ya mostrada
+
+        Returns:
+            bool: False si se sabe que es la última
+        """
+        self.pagina(indice)
+        return self._ultima is None or indice < self._ultima
+
+    def mueble(self, numero: int) -> Optional[Mueble]:
+        """
+        Mueble por su número global, tal como se mostró en la vista.
+
+        Args:
+            numero: Número de fila (desde 1)
+
+        Returns:
+            Optional[Mueble]: El mueble o None si el número no existe
+        """
+        if numero < 1:
+            return None
+        indice, posicion = divmod(numero - 1, self._tamaño)
+        filas = self.pagina(indice)
+        return filas[posicion][1] if posicion < len(filas) else None
+
+    def estadisticas_cache(self) -> Dict[str, int]:
+        """Páginas conocidas, en caché y lecturas hechas a la tienda."""
+        return {
+            "paginas_conocidas": len(self._cursores),
+            "paginas_en_cache": len(self._paginas),
+            "lecturas": self._lecturas,
+        }
@@ -0,0 +1,170 @@
+"""
+Pruebas para la memoización de calcular_precio.
+"""
+
+import gc
+import weakref
+
+import pytest
+
+from src.models import precio_cache
+from src.models.concretos.armario import Armario
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofa import Sofa
+from src.models.concretos.sillon import Sillon
+from src.models.concretos.sofacama import SofaCama
+from src.models.precio_cache import PrecioCacheable
+
+
+@pytest.fixture(autouse=True)
+def contadores_limpios():
+    """Reiniciar los contadores de la caché antes de cada prueba."""
+    PrecioCacheable.reiniciar_estadisticas_cache()
+    yield
+    PrecioCacheable.reiniciar_estadisticas_cache()
+
+
+class TestPrecioMemoizado:
+    """Pruebas de aciertos y fallos de la caché."""
+
+    def test_segunda_llamada_es_acierto(self):
+        """Probar que la segunda llamada usa el valor cacheado."""
+        silla = Silla("Silla", "Madera", "Café", 100.0, material_tapizado="cuero")
+        primero = silla.calcular_precio()
+        segundo = silla.calcular_precio()
+
+        assert primero == segundo
+        assert PrecioCacheable.obtener_estadisticas_cache() == {"aciertos": 1, "fallos": 1}
+
+    def test_reiniciar_contadores(self):
+        """Probar que los contadores se pueden reiniciar."""
+        Silla("Silla", "Madera", "Café", 100.0).calcular_precio()
+        PrecioCacheable.reiniciar_estadisticas_cache()
+
+        assert PrecioCacheable.obtener_estadisticas_cache() == {"aciertos": 0, "fallos": 0}
+
+    def test_contadores_por_clase(self):
+        """Probar que cada clase lleva sus contadores y la raíz los suma."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        silla.calcular_precio()
+        silla.calcular_precio()
+        Mesa("Mesa", "Madera", "Natural", 200.0).calcular_precio()
+
+        assert Silla.obtener_estadisticas_cache() == {"aciertos": 1, "fallos": 1}
+        assert Mesa.obtener_estadisticas_cache() == {"aciertos": 0, "fallos": 1}
+        assert PrecioCacheable.obtener_estadisticas_cache() == {"aciertos": 1, "fallos": 2}
+
+
+class TestInvalidacionPorSetters:
+    """Pruebas de invalidación al modificar atributos."""
+
+    def test_precio_base(self):
+        """Probar que cambiar el precio base recalcula el precio."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        antes = silla.calcular_precio()
+        silla.precio_base = 200.0
+
+        assert silla.calcular_precio() == pytest.approx(antes * 2)
+
+    def test_material_tapizado(self):
+        """Probar que cambiar el tapizado recalcula el factor de comodidad."""
+        sofa = Sofa("Sofá", "Madera", "Gris", 500.0, material_tapizado="tela")
+        antes = sofa.calcular_precio()
+        sofa.material_tapizado = "cuero"
+
+        assert sofa.calcular_precio() > antes
+
+    def test_dimensiones_y_capacidad(self):
+        """Probar que cambiar largo y capacidad de una mesa recalcula el precio."""
+        mesa = Mesa("Mesa", "Madera", "Natural", 200.0)
+        antes = mesa.calcular_precio()
+        mesa.largo = 300.0
+        despues_largo = mesa.calcular_precio()
+        mesa.capacidad_personas = 8
+
+        assert despues_largo > antes
+        assert mesa.calcular_precio() == despues_largo + 100
+
+    def test_atributo_publico_en_clase_simple(self):
+        """Probar invalidación en clases con atributos públicos."""
+        armario = Armario("Armario", "Madera", "Blanco", 500, num_puertas=2)
+        antes = armario.calcular_precio()
+        armario.num_puertas = 4
+
+        assert armario.calcular_precio() == antes + 100
+
+    def test_atributo_publico_sillon(self):
+        """Probar que el sillón invalida el precio al cambiar su tapizado."""
+        sillon = Sillon("Sillón", "Cuero", "Marrón", 800)
+        antes = sillon.calcular_precio()
+        sillon.material_tapizado = "cuero"
+
+        assert sillon.material_tapizado == "cuero"
+        assert sillon.calcular_precio() == antes + 200
+
+    def test_invalidar_precio_explicito(self):
+        """Probar la invalidación manual."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        silla.calcular_precio()
+        silla.invalidar_precio()
+        silla.calcular_precio()
+
+        assert PrecioCacheable.obtener_estadisticas_cache()["fallos"] == 2
+
+
+class TestPrecioMemoizadoHerenciaMultiple:
+    """Pruebas de la caché con SofaCama y super()."""
+
+    def test_sofacama_no_reutiliza_precio_de_sofa(self):
+        """Probar que la llamada a super() no devuelve el precio cacheado del hijo."""
+        sofacama = SofaCama("SofaCama", "Metal", "Azul", 600.0, mecanismo_conversion="electrico")
+        precio = sofacama.calcular_precio()
+
+        assert precio == Sofa.calcular_precio(sofacama) + 300 + 250 + 300
+        assert sofacama.calcular_precio() == precio
+
+
+class TestObservadores:
+    """Pruebas de la notificación de cambios a los observadores."""
+
+    def test_setter_notifica(self):
+        """Probar que los setters avisan al observador suscrito."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        avisos = []
+        silla.agregar_observador(avisos.append)
+        try:
+            silla.material = "Metal"
+            silla.precio_base = 150.0
+        finally:
+            silla.quitar_observador(avisos.append)
+        silla.color = "Negro"
+
+        assert avisos == [silla, silla]
+
+    def test_clase_plana_notifica(self):
+        """Probar que los atributos públicos de las clases planas también avisan."""
+        armario = Armario("Armario", "Madera", "Blanco", 500)
+        avisos = []
+        armario.agregar_observador(avisos.append)
+        try:
+            armario.nombre = "Ropero"
+        finally:
+            armario.quitar_observador(avisos.append)
+
+        assert avisos == [armario]
+        assert armario.nombre == "Ropero"
+
+    @pytest.mark.parametrize("clase", [Silla, Armario, SofaCama])
+    def test_instancia_liberada_descarta_observadores(self, clase):
+        """Probar que los observadores no sobreviven a la instancia ni pasan a otra con su id."""
+        mueble = clase("Mueble", "Madera", "Blanco", 100.0)
+        referencia = weakref.ref(mueble)
+        clave = id(mueble)
+        mueble.agregar_observador(print)
+        del mueble
+        gc.collect()
+
+        assert referencia() is None
+        assert clave not in precio_cache._observadores
+        assert clave not in precio_cache._referencias
@@ -0,0 +1,66 @@
+"""
+Pruebas del layout compacto (__slots__) de la jerarquía de muebles.
+"""
+
+import pytest
+
+from src.models.concretos.armario import Armario
+from src.models.concretos.cajonera import Cajonera
+from src.models.concretos.escritorio import Escritorio
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sillon import Sillon
+from src.models.concretos.sofa import Sofa
+from src.models.concretos.sofacama import SofaCama
+
+
+class TestLayoutCompacto:
+    """Pruebas de instancias sin __dict__."""
+
+    @pytest.mark.parametrize(
+        "mueble",
+        [
+            Silla("Silla", "Madera", "Café", 100.0),
+            Mesa("Mesa", "Madera", "Natural", 200.0),
+            Sofa("Sofá", "Tela", "Gris", 500.0),
+            Armario("Armario", "Madera", "Blanco", 500),
+            Cajonera("Cajonera", "Madera", "Blanco", 200),
+            Escritorio("Escritorio", "Metal", "Negro", 400),
+            Sillon("Sillón", "Cuero", "Marrón", 800),
+        ],
+    )
+    def test_sin_diccionario_de_instancia(self, mueble):
+        """Probar que las instancias no tienen __dict__."""
+        mueble.calcular_precio()
+
+        assert not hasattr(mueble, "__dict__")
+
+    def test_atributo_inexistente_falla(self):
+        """Probar que no se pueden crear atributos arbitrarios."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+
+        with pytest.raises(AttributeError):
+            silla.atributo_inventado = 1
+
+
+class TestLayoutHerenciaMultiple:
+    """Pruebas del diamante SofaCama(Sofa, Cama) con slots."""
+
+    def test_sofacama_funciona(self):
+        """Probar que SofaCama combina slots de Sofa y atributos de Cama."""
+        sofacama = SofaCama("SofaCama", "Metal", "Azul", 600.0, tamaño_cama="queen")
+        sofacama.transformar()
+
+        assert sofacama.tamaño == "queen"
+        assert sofacama.modo_actual == "cama"
+        assert sofacama.tiene_brazos is True
+        assert sofacama.calcular_precio() > 600.0
+
+    def test_sofacama_guarda_atributos_de_cama_en_slots(self):
+        """Probar que los atributos de cama de SofaCama no ocupan el __dict__ heredado."""
+        sofacama = SofaCama("SofaCama", "Metal", "Azul", 600.0, tamaño_cama="king")
+        sofacama.calcular_precio()
+
+        assert sofacama.__dict__ == {}
+        assert sofacama.tamaño_cama == "king"
+        assert sofacama.incluye_colchon is True
@@ -0,0 +1,179 @@
+"""
+Pruebas para el cargador de catálogos en streaming.
+"""
+
+import json
+
+import pytest
+
+from src.services.catalogo import (
+    ErrorCatalogo,
+    cargar_catalogo,
+    crear_mueble,
+    leer_catalogo,
+    normalizar_tipo,
+)
+from src.services.tienda import TiendaMuebles
+
+CSV_CATALOGO = """\
+tipo,nombre,material,color,precio_base,\
+tiene_respaldo,material_tapizado,num_puertas,tamaño_cama
+Silla,Silla Clásica,Madera,Café,150.0,sí,tela,,
+mesa,Mesa Roble,Roble,Natural,500,,,,
+Armario,Armario Doble,Madera,Blanco,600,,,4,
+Sofá-Cama,SofaCama Beige,Tela,Beige,1500,,,,queen
+Lámpara,Lámpara,Metal,Negro,50,,,,
+Silla,Silla Rota,Madera,Café,abc,,,,
+"""
+
+
+@pytest.fixture
+def archivo_csv(tmp_path):
+    """Fixture con un CSV de catálogo mixto."""
+    ruta = tmp_path / "catalogo.csv"
+    ruta.write_text(CSV_CATALOGO, encoding="utf-8")
+    return ruta
+
+
+class TestNormalizarTipo:
+    """Pruebas de normalización del tipo."""
+
+    @pytest.mark.parametrize(
+        "tipo, esperado",
+        [("Sofá-Cama", "sofacama"), (" SILLÓN ", "sillon"), ("sofa_cama", "sofacama")],
+    )
+    def test_normalizar(self, tipo, esperado):
+        """Probar tildes, mayúsculas y separadores."""
+        assert normalizar_tipo(tipo) == esperado
+
+
+class TestCrearMueble:
+    """Pruebas de construcción de muebles a partir de registros."""
+
+    def test_convierte_tipos_segun_constructor(self):
+        """Probar la conversión de texto a bool, int y float."""
+        silla = crear_mueble(
+            {
+                "tipo": "silla",
+                "nombre": "Silla",
+                "material": "Madera",
+                "color": "Café",
+                "precio_base": "99.5",
+                "tiene_ruedas": "true",
+                "altura_regulable": "0",
+            }
+        )
+
+        assert type(silla).__name__ == "Silla"
+        assert silla.precio_base == 99.5
+        assert silla.tiene_ruedas is True
+        assert silla.altura_regulable is False
+
+    def test_valores_json_se_usan_tal_cual(self):
+        """Probar que los valores ya tipados no se convierten."""
+        cama = crear_mueble(
+            {
+                "tipo": "Cama",
+                "nombre": "Cama",
+                "material": "Pino",
+                "color": "Natural",
+                "precio_base": 300,
+                "tamaño": "king",
+                "incluye_colchon": True,
+            }
+        )
+
+        assert cama.tamaño == "king"
+        assert cama.incluye_colchon is True
+
+    @pytest.mark.parametrize(
+        "registro, mensaje",
+        [
+            ({"nombre": "X"}, "tipo"),
+            ({"tipo": "nave"}, "desconocido"),
+            ({"tipo": "mesa", "nombre": "Mesa"}, "obligatorio"),
+            (
+                {
+                    "tipo": "silla",
+                    "nombre": "S",
+                    "material": "M",
+                    "color": "C",
+                    "precio_base": "1",
+                    "tiene_ruedas": "quizás",
+                },
+                "booleano",
+            ),
+        ],
+    )
+    def test_errores(self, registro, mensaje):
+        """Probar los errores de registros inválidos."""
+        with pytest.raises(ErrorCatalogo, match=mensaje):
+            crear_mueble(registro)
+
+
+class TestCargarCatalogo:
+    """Pruebas de la carga por lotes."""
+
+    def test_cargar_csv(self, archivo_csv):
+        """Probar la carga de un CSV con filas válidas e inválidas."""
+        tienda = TiendaMuebles()
+        resumen = cargar_catalogo(tienda, archivo_csv, tamaño_lote=2)
+
+        assert resumen["aceptados"] == 4
+        assert resumen["rechazados"] == 2
+        assert sorted(linea for linea, _ in resumen["errores"]) == [6, 7]
+        tipos = [type(m).__name__ for m in tienda.listar_muebles()]
+        assert tipos == ["Silla", "Mesa", "Armario", "SofaCama"]
+        assert tienda.listar_muebles()[3].tamaño_cama == "queen"
+
+    def test_cargar_jsonl(self, tmp_path):
+        """Probar la carga de JSON Lines con líneas vacías e inválidas."""
+        ruta = tmp_path / "catalogo.jsonl"
+        registros = [
+            {
+                "tipo": "sillon",
+                "nombre": "Sillón",
+                "material": "Cuero",
+                "color": "Marrón",
+                "precio_base": 800,
+                "es_reclinable": True,
+            },
+            {
+                "tipo": "cajonera",
+                "nombre": "Cajonera",
+                "material": "Pino",
+                "color": "Blanco",
+                "precio_base": 200,
+                "num_cajones": 5,
+            },
+        ]
+        lineas = [json.dumps(r, ensure_ascii=False) for r in registros]
+        ruta.write_text(lineas[0] + "\n\n{roto\n[1, 2]\n" + lineas[1] + "\n", encoding="utf-8")
+
+        resumen = cargar_catalogo(TiendaMuebles(), ruta)
+
+        assert resumen["aceptados"] == 2
+        assert resumen["errores"] == [(3, "JSON inválido"), (4, "Se esperaba un objeto JSON")]
+
+    def test_max_errores(self, archivo_csv):
+        """Probar que se limita el detalle de errores pero no el conteo."""
+        resumen = cargar_catalogo(TiendaMuebles(), archivo_csv, max_errores=1)
+
+        assert resumen["rechazados"] == 2
+        assert len(resumen["errores"]) == 1
+
+    def test_lectura_perezosa(self, archivo_csv):
+        """Probar que el lector es un generador."""
+        filas = leer_catalogo(archivo_csv)
+
+        assert next(filas)[1]["nombre"] == "Silla Clásica"
+
+    def test_formato_no_soportado(self, tmp_path):
+        """Probar que un formato desconocido se rechaza."""
+        with pytest.raises(ValueError):
+            leer_catalogo(tmp_path / "catalogo.xml")
+
+    def test_tamaño_lote_invalido(self, archivo_csv):
+        """Probar que el tamaño de lote debe ser positivo."""
+        with pytest.raises(ValueError):
+            cargar_catalogo(TiendaMuebles(), archivo_csv, tamaño_lote=0)
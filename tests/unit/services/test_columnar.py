@@ -0,0 +1,356 @@
+"""
+Pruebas para el motor columnar del inventario.
+"""
+
+import random
+
+import pytest
+
+from src.models.categorias.asientos import Asiento
+from src.models.concretos.armario import Armario
+from src.models.concretos.cajonera import Cajonera
+from src.models.concretos.cama import Cama
+from src.models.concretos.escritorio import Escritorio
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sillon import Sillon
+from src.models.concretos.sofa import Sofa
+from src.models.concretos.sofacama import SofaCama
+from src.services.columnar import ColumnaCodificada, InventarioColumnar, crear_columna
+from src.services.reglas_precio import MotorPrecios
+
+
+def generar_catalogo(cantidad: int, semilla: int = 7) -> list:
+    """Genera muebles aleatorios de todas las clases concretas."""
+    azar = random.Random(semilla)
+    tapizados = [None, "tela", "Cuero", "lino", ""]
+    materiales = ["Madera", "Metal", "Vidrio"]
+
+    def precio():
+        return round(azar.uniform(10, 3000), azar.choice([0, 1, 2]))
+
+    fabricas = [
+        lambda: Silla(
+            "Silla",
+            azar.choice(materiales),
+            "Café",
+            precio(),
+            azar.random() < 0.5,
+            azar.choice(tapizados),
+            azar.random() < 0.5,
+            azar.random() < 0.5,
+        ),
+        lambda: Sofa(
+            "Sofá",
+            azar.choice(materiales),
+            "Gris",
+            precio(),
+            azar.randint(1, 6),
+            azar.random() < 0.5,
+            azar.choice(tapizados),
+            azar.random() < 0.5,
+            azar.random() < 0.5,
+            azar.random() < 0.5,
+        ),
+        lambda: SofaCama(
+            "SofaCama",
+            azar.choice(materiales),
+            "Azul",
+            precio(),
+            azar.randint(1, 5),
+            azar.choice(tapizados),
+            azar.choice(["individual", "matrimonial", "queen", "king"]),
+            azar.random() < 0.5,
+            azar.choice(["plegable", "hidraulico", "electrico"]),
+        ),
+        lambda: Mesa(
+            "Mesa",
+            azar.choice(materiales),
+            "Natural",
+            precio(),
+            azar.choice(["rectangular", "redonda", "ovalada"]),
+            azar.uniform(40, 300),
+            azar.uniform(40, 200),
+            75.0,
+            azar.randint(1, 12),
+        ),
+        lambda: Cama(
+            "Cama",
+            azar.choice(materiales),
+            "Blanco",
+            precio(),
+            azar.choice(["individual", "matrimonial", "queen", "king"]),
+            azar.random() < 0.5,
+            azar.random() < 0.5,
+        ),
+        lambda: Armario(
+            "Armario",
+            azar.choice(materiales),
+            "Blanco",
+            int(precio()),
+            azar.randint(1, 6),
+            azar.randint(0, 6),
+            azar.random() < 0.5,
+        ),
+        lambda: Cajonera(
+            "Cajonera",
+            azar.choice(materiales),
+            "Blanco",
+            int(precio()),
+            azar.randint(1, 8),
+            azar.random() < 0.5,
+        ),
+        lambda: Escritorio(
+            "Escritorio",
+            azar.choice(materiales),
+            "Negro",
+            int(precio()),
+            azar.choice(["rectangular", "L"]),
+            azar.random() < 0.5,
+            azar.randint(0, 5),
+            azar.uniform(0.8, 2.5),
+            azar.random() < 0.5,
+        ),
+        lambda: Sillon(
+            "Sillón",
+            azar.choice(materiales),
+            "Marrón",
+            int(precio()),
+            azar.randint(1, 3),
+            True,
+            azar.choice(tapizados),
+            azar.random() < 0.5,
+            azar.random() < 0.5,
+            azar.random() < 0.5,
+        ),
+    ]
+    return [azar.choice(fabricas)() for _ in range(cantidad)]
+
+
+@pytest.fixture
+def catalogo():
+    """Fixture con un catálogo aleatorio variado."""
+    return generar_catalogo(600)
+
+
+class TestInventarioColumnarPrecios:
+    """Pruebas de cálculo de precios por lotes."""
+
+    def test_precios_identicos_a_calcular_precio(self, catalogo):
+        """Probar que los precios por bloque coinciden exactamente con cada calcular_precio."""
+        motor = InventarioColumnar()
+        for mueble in catalogo:
+            motor.agregar(mueble)
+        muebles, precios = motor.calcular_precios()
+
+        assert len(muebles) == len(catalogo)
+        for mueble, precio in zip(muebles, precios):
+            assert precio == mueble.calcular_precio(), type(mueble).__name__
+
+    def test_valor_total(self, catalogo):
+        """Probar que el valor total coincide con la suma de precios."""
+        motor = InventarioColumnar()
+        for mueble in catalogo:
+            motor.agregar(mueble)
+
+        esperado = sum(m.calcular_precio() for m in catalogo)
+        assert motor.valor_total() == pytest.approx(esperado)
+
+    def test_subclase_que_redefine_el_precio(self):
+        """Probar que una subclase que redefine el precio no usa las reglas de su clase."""
+
+        class SillaPremium(Silla):
+            def calcular_precio(self) -> float:
+                return 999.0
+
+        motor = InventarioColumnar()
+        motor.agregar(SillaPremium("Premium", "Madera", "Café", 100.0))
+
+        assert motor.calcular_precios()[1] == [999.0]
+
+    def test_reglas_nuevas_revaluan_los_bloques(self):
+        """Probar que revaluar aplica las reglas nuevas y que leer no las aplica."""
+        reglas = MotorPrecios()
+        motor = InventarioColumnar(reglas)
+        cama = Cama("Cama", "Madera", "Blanco", 500.0, "king")
+        motor.agregar(cama)
+        assert motor.valor_total() == cama.calcular_precio()
+
+        nuevas = reglas.reglas()
+        nuevas["Cama"]["recargos"][0]["valores"]["king"] = 1000
+        reglas.cargar(nuevas)
+        assert motor.valor_total() == cama.calcular_precio()
+        motor.revaluar()
+
+        assert motor.valor_total() == cama.calcular_precio() + 400
+
+
+class TestInventarioColumnarAltasBajas:
+    """Pruebas de altas, bajas y consultas."""
+
+    def test_quitar_intercambia_con_la_ultima_fila(self, catalogo):
+        """Probar que las bajas mantienen columnas y precios alineados."""
+        motor = InventarioColumnar()
+        for mueble in catalogo:
+            motor.agregar(mueble)
+        motor.calcular_precios()
+        for mueble in catalogo[::3]:
+            assert motor.quitar(mueble) is True
+
+        assert motor.quitar(catalogo[0]) is False
+        muebles, precios = motor.calcular_precios()
+        assert len(motor) == len(catalogo) - len(catalogo[::3])
+        assert all(p == m.calcular_precio() for m, p in zip(muebles, precios))
+
+    def test_agregar_duplicado(self):
+        """Probar que un mueble no se agrega dos veces."""
+        motor = InventarioColumnar()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+
+        assert motor.agregar(silla) is True
+        assert motor.agregar(silla) is False
+        assert silla in motor
+
+    def test_filtrar_por_tipo(self, catalogo):
+        """Probar la selección por clase y categoría en orden de alta."""
+        motor = InventarioColumnar()
+        for mueble in catalogo:
+            motor.agregar(mueble)
+        for mueble in catalogo[::4]:
+            motor.quitar(mueble)
+        motor.agregar(catalogo[0])
+
+        quitados = {id(m) for m in catalogo[::4]}
+        restantes = [m for m in catalogo if id(m) not in quitados] + [catalogo[0]]
+        assert motor.filtrar(tipo=Asiento) == [m for m in restantes if isinstance(m, Asiento)]
+        assert motor.filtrar(tipo=Mesa) == [m for m in restantes if isinstance(m, Mesa)]
+
+    def test_filtros_combinados(self, catalogo):
+        """Probar material, color y rango de precios sobre las columnas."""
+        motor = InventarioColumnar()
+        motor.agregar_lote(catalogo)
+        for mueble in catalogo[::6]:
+            motor.quitar(mueble)
+        restantes = [m for m in catalogo if m in motor]
+
+        assert motor.filtrar(material=" madera ") == [
+            m for m in restantes if m.material == "Madera"
+        ]
+        assert motor.filtrar(tipo=Asiento, material="METAL", color="gris") == [
+            m
+            for m in restantes
+            if isinstance(m, Asiento) and (m.material, m.color) == ("Metal", "Gris")
+        ]
+        en_rango = motor.filtrar(precio_min=500, precio_max=1500, por_precio=True)
+        assert en_rango == sorted(
+            (m for m in restantes if 500 <= m.calcular_precio() <= 1500),
+            key=lambda m: m.calcular_precio(),
+        )
+        assert motor.filtrar(material="Piedra") == []
+
+    def test_conteo_por_tipo(self, catalogo):
+        """Probar que el conteo sale del largo de cada bloque."""
+        motor = InventarioColumnar()
+        motor.agregar_lote(catalogo)
+        for mueble in catalogo[::2]:
+            motor.quitar(mueble)
+
+        esperado = {}
+        for mueble in catalogo[1::2]:
+            esperado[type(mueble).__name__] = esperado.get(type(mueble).__name__, 0) + 1
+        assert motor.conteo_por_tipo() == esperado
+
+
+class TestInventarioColumnarColumnas:
+    """Pruebas de las columnas tipadas."""
+
+    def test_tipo_de_cada_columna(self):
+        """Probar que cada atributo se guarda con la representación de sus valores."""
+        assert crear_columna([True, False]).typecode == "b"
+        assert crear_columna([3, 4]).typecode == "q"
+        assert crear_columna([3, 4.5]).typecode == "d"
+        assert isinstance(crear_columna(["tela", None, "tela"]), ColumnaCodificada)
+        assert isinstance(crear_columna([2**70]), ColumnaCodificada)
+
+    def test_columnas_de_los_atributos_de_las_reglas(self):
+        """Probar que las columnas guardan los atributos que leen las reglas."""
+        sillas = [
+            Silla("Silla", "Madera", "Café", 100.0 + i, i % 2 == 0, ["tela", None][i % 2])
+            for i in range(4)
+        ]
+        motor = InventarioColumnar()
+        motor.agregar_lote(sillas)
+
+        assert motor.columna(Silla, "precio_base") == [100.0, 101.0, 102.0, 103.0]
+        assert motor.columna(Silla, "tiene_respaldo") == [1, 0, 1, 0]
+        assert motor.columna(Silla, "material_tapizado") == ["tela", None, "tela", None]
+        assert motor.columna(Silla, "largo") == []
+
+    def test_codificada_evalua_una_vez_por_valor(self):
+        """Probar que mapear llama a la función una vez por valor distinto."""
+        columna = ColumnaCodificada(["tela", "cuero", "tela", None, "tela"])
+        llamadas = []
+
+        def largo(valor):
+            llamadas.append(valor)
+            return len(valor or "")
+
+        assert columna.mapear(largo) == [4, 5, 4, 0, 4]
+        assert llamadas == ["tela", "cuero", None]
+        assert columna.filas_donde(lambda v: v == "tela") == [0, 2, 4]
+
+    def test_actualizar_reescribe_la_fila(self):
+        """Probar que un cambio reescribe columnas y precio, aunque cambie el tipo."""
+        armarios = [Armario(f"A{i}", "Madera", "Blanco", 500, i + 1) for i in range(3)]
+        motor = InventarioColumnar()
+        motor.agregar_lote(armarios)
+
+        armarios[1].precio_base = 650.5
+        armarios[1].material = "Roble"
+        motor.actualizar(armarios[1])
+
+        assert motor.columna(Armario, "precio_base") == [500, 650.5, 500]
+        assert motor.filtrar(material="roble") == [armarios[1]]
+        assert motor.calcular_precios()[1] == [a.calcular_precio() for a in armarios]
+
+
+class TestInventarioColumnarCachePrecios:
+    """Pruebas de la columna de precios por bloque."""
+
+    class Contador(Silla):
+        """Clase sin reglas: su bloque llama a calcular_precio."""
+
+        llamadas = 0
+
+        def calcular_precio(self) -> float:
+            type(self).llamadas += 1
+            return self.precio_base
+
+    def test_altas_solo_calculan_filas_nuevas(self):
+        """Probar que una alta valúa solo su fila y que leer no valúa nada."""
+        Contador = self.Contador
+        Contador.llamadas = 0
+        motor = InventarioColumnar()
+        for i in range(100):
+            motor.agregar(Contador(f"S{i}", "Madera", "Café", 1.0 + i))
+        assert motor.valor_total() == sum(1.0 + i for i in range(100))
+        assert motor.valor_total() == sum(1.0 + i for i in range(100))
+        assert Contador.llamadas == 100
+
+        motor.agregar(Contador("Nueva", "Madera", "Café", 1000.0))
+
+        assert motor.valor_total() == sum(1.0 + i for i in range(100)) + 1000.0
+        assert Contador.llamadas == 101
+
+    def test_altas_por_lote_y_bajas(self, catalogo):
+        """Probar que lotes y bajas mantienen los precios alineados con sus filas."""
+        motor = InventarioColumnar()
+        for mueble in catalogo[:300]:
+            motor.agregar(mueble)
+        assert motor.agregar_lote(catalogo[250:]) == len(catalogo) - 300
+        for mueble in catalogo[::5]:
+            motor.quitar(mueble)
+
+        muebles, precios = motor.calcular_precios()
+        assert len(muebles) == len(catalogo) - len(catalogo[::5])
+        assert all(p == m.calcular_precio() for m, p in zip(muebles, precios))
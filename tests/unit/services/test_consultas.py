@@ -0,0 +1,83 @@
+"""
+Pruebas para el planificador de consultas compuestas.
+"""
+
+from src.services.consultas import Predicado, planificar
+
+
+def predicado(campo, candidatos, condicion, ordenado=True):
+    """Predicado sobre una lista de enteros con estimación exacta."""
+    return Predicado(
+        campo,
+        f"{campo}?",
+        len(candidatos),
+        lambda: list(candidatos),
+        condicion,
+        ordenado=ordenado,
+    )
+
+
+class TestPlanificar:
+    """Pruebas de la elección y ejecución del plan."""
+
+    def test_sin_predicados_recorre_todo(self):
+        """Probar que sin predicados se usa el recorrido completo."""
+        plan = planificar([], 10)
+
+        assert plan.acceso is None
+        assert plan.ejecutar(lambda: [1, 2, 3], int) == [1, 2, 3]
+        assert "RECORRIDO COMPLETO" in str(plan)
+
+    def test_elige_el_mas_selectivo(self):
+        """Probar que el acceso es el predicado con menos candidatos."""
+        pares = predicado("par", [0, 2, 4, 6, 8], lambda n: n % 2 == 0)
+        chicos = predicado("chico", [0, 1, 2], lambda n: n < 3)
+        todos = predicado("todos", list(range(10)), lambda n: True)
+        plan = planificar([pares, todos, chicos], 10)
+
+        assert plan.acceso is chicos
+        assert plan.filtros == [pares, todos]
+        assert plan.ejecutar(lambda: list(range(10)), int) == [0, 2]
+        assert plan.costo == 3 * 3
+
+    def test_empate_respeta_orden_recibido(self):
+        """Probar que ante estimaciones iguales se conserva el orden de los predicados."""
+        primero = predicado("a", [1, 2], lambda n: True)
+        segundo = predicado("b", [2, 1], lambda n: True)
+
+        assert planificar([primero, segundo], 5).acceso is primero
+
+    def test_acceso_desordenado_se_reordena(self):
+        """Probar que un acceso en otro orden se devuelve en orden de inserción."""
+        precio = predicado("precio", [5, 3, 1], lambda n: True, ordenado=False)
+        plan = planificar([precio], 10)
+
+        assert plan.ejecutar(lambda: [], int) == [1, 3, 5]
+        assert "ORDENAR" in str(plan)
+
+    def test_como_dict(self):
+        """Probar la representación del plan como diccionario."""
+        plan = planificar([predicado("a", [1], lambda n: True), predicado("b", [1, 2], bool)], 4)
+        datos = plan.como_dict()
+
+        assert datos["acceso"].startswith("índice a")
+        assert [f["campo"] for f in datos["filtros"]] == ["b"]
+        assert datos["estimacion"] == 1
+
+    def test_pagina_retoma_despues_del_cursor(self):
+        """Probar que la página retoma después del cursor y respeta el límite."""
+        pares = predicado("par", [0, 2, 4, 6, 8], lambda n: n % 2 == 0)
+        mayores = predicado("mayor", list(range(3, 10)), lambda n: n > 2)
+        plan = planificar([mayores, pares], 10)
+
+        assert plan.pagina(None, int, -1, 2) == [4, 6]
+        assert plan.pagina(None, int, 4, 10) == [6, 8]
+
+    def test_pagina_sin_predicados_usa_el_recorrido(self):
+        """Probar que sin predicados la página sale del recorrido desde el cursor."""
+        plan = planificar([], 5)
+
+        def desde(secuencia):
+            return ((n, n) for n in range(secuencia + 1, 5))
+
+        assert plan.pagina(desde, int, 1, 2) == [2, 3]
@@ -0,0 +1,118 @@
+"""
+Pruebas para la tabla de descuentos con herencia.
+"""
+
+import pytest
+
+from src.models.concretos.armario import Armario
+from src.models.concretos.cama import Cama
+from src.models.concretos.escritorio import Escritorio
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sillon import Sillon
+from src.models.concretos.sofa import Sofa
+from src.models.concretos.sofacama import SofaCama
+from src.services.descuentos import TablaDescuentos, linaje, resolver_categoria
+
+
+class TestResolverCategoria:
+    """Pruebas de la interpretación de nombres de categoría."""
+
+    @pytest.mark.parametrize(
+        "categoria, esperado",
+        [
+            ("sillas", "Silla"),
+            ("Silla", "Silla"),
+            ("sofás", "Sofa"),
+            ("escritorios", "Escritorio"),
+            ("sillones", "Sillon"),
+            ("Sofá-Camas", "SofaCama"),
+            ("asientos", "Asiento"),
+            ("superficies", "Superficie"),
+            ("Almacenamiento", "Almacenamiento"),
+            ("muebles", "Mueble"),
+        ],
+    )
+    def test_singular_plural_y_tildes(self, categoria, esperado):
+        """Probar que plurales, tildes y separadores llevan a la clase correcta."""
+        assert resolver_categoria(categoria) == esperado
+
+    def test_categoria_desconocida(self):
+        """Probar que una categoría inexistente no se adivina."""
+        assert resolver_categoria("lámparas") is None
+        assert resolver_categoria("") is None
+
+
+class TestLinaje:
+    """Pruebas del orden en que se heredan los descuentos."""
+
+    def test_sigue_el_mro(self):
+        """Probar que SofaCama hereda de Sofa, Asiento y Cama en orden del MRO."""
+        nombres = linaje(SofaCama)
+
+        assert nombres[:4] == ["SofaCama", "Sofa", "Asiento", "Cama"]
+        assert "Mueble" in nombres
+
+    def test_categorias_declaradas(self):
+        """Probar que las clases sin herencia de categoría se asocian a ella."""
+        assert "Asiento" in linaje(Sillon)
+        assert "Superficie" in linaje(Escritorio)
+        assert "Almacenamiento" in linaje(Armario)
+        assert "Mueble" in linaje(Armario)
+
+
+class TestTablaDescuentos:
+    """Pruebas de la tabla compilada."""
+
+    def test_categoria_se_hereda(self):
+        """Probar que un descuento a Asiento alcanza a sillas, sofás y sillones."""
+        tabla = TablaDescuentos()
+        tabla.aplicar("asientos", 0.1)
+
+        for clase in (Silla, Sofa, SofaCama, Sillon):
+            assert tabla.tasa(clase) == 0.1
+        assert tabla.tasa(Mesa) == 0
+        assert tabla.activos == {"Asiento": 0.1}
+
+    def test_mas_especifico_gana(self):
+        """Probar que el descuento de la clase gana sobre el de su categoría."""
+        tabla = TablaDescuentos({"Asiento": 0.1, "Silla": 0.3})
+
+        assert tabla.tasa(Silla) == 0.3
+        assert tabla.tasa(Sofa) == 0.1
+
+    def test_herencia_multiple(self):
+        """Probar que SofaCama toma el descuento de Sofa o, si no hay, el de Cama."""
+        tabla = TablaDescuentos({"Cama": 0.15})
+        assert tabla.tasa(SofaCama) == 0.15
+
+        tabla.aplicar("sofás", 0.2)
+        assert tabla.tasa(SofaCama) == 0.2
+        assert tabla.tasa(Cama) == 0.15
+
+    def test_tabla_precompilada(self):
+        """Probar que la tabla tiene la tasa efectiva de cada tipo concreto."""
+        tabla = TablaDescuentos({"Mueble": 0.05, "Almacenamiento": 0.1})
+
+        compilada = tabla.tabla()
+
+        assert compilada["Armario"] == compilada["Cajonera"] == 0.1
+        assert compilada["Mesa"] == compilada["Sillon"] == 0.05
+        assert tabla.tasa_por_nombre("Armario") == 0.1
+        assert tabla.tasa_por_nombre("Desconocido") == 0
+
+    def test_clase_no_registrada(self):
+        """Probar que una subclase fuera del catálogo hereda el descuento."""
+
+        class SillaGamer(Silla):
+            pass
+
+        tabla = TablaDescuentos({"Silla": 0.25})
+
+        assert tabla.tasa(SillaGamer) == 0.25
+
+    def test_carga_ignora_categorias_inexistentes(self):
+        """Probar que cargar normaliza nombres y descarta los desconocidos."""
+        tabla = TablaDescuentos({"sillas": 0.1, "Lampara": 0.5})
+
+        assert tabla.activos == {"Silla": 0.1}
@@ -0,0 +1,184 @@
+"""
+Pruebas para el diario de ventas y su reproducción en la tienda.
+"""
+
+import os
+import time
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.diario import DiarioVentas
+from src.services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def contador_fsync(monkeypatch):
+    """Fixture que cuenta las llamadas a os.fsync."""
+    llamadas = []
+    original = os.fsync
+
+    def fsync(descriptor):
+        llamadas.append(descriptor)
+        original(descriptor)
+
+    monkeypatch.setattr(os, "fsync", fsync)
+    return llamadas
+
+
+def crear_tienda() -> TiendaMuebles:
+    """Tienda con el mismo catálogo en cada arranque."""
+    tienda = TiendaMuebles()
+    tienda.agregar_muebles(
+        [
+            Silla("Silla Clásica", "Madera", "Café", 100),
+            Silla("Silla Clásica", "Madera", "Café", 100),
+            Mesa("Mesa Comedor", "Vidrio", "Negro", 300),
+        ]
+    )
+    return tienda
+
+
+class TestDiarioVentas:
+    """Pruebas del archivo de solo anexado."""
+
+    def test_registrar_y_leer(self, tmp_path):
+        """Probar que los eventos se leen en orden."""
+        ruta = tmp_path / "ventas.jsonl"
+        with DiarioVentas(ruta) as diario:
+            diario.registrar({"n": 1})
+            diario.registrar({"n": 2, "cliente": "Señora Núñez"})
+
+        assert list(DiarioVentas.leer(ruta)) == [{"n": 1}, {"n": 2, "cliente": "Señora Núñez"}]
+
+    def test_registrar_lote(self, tmp_path, contador_fsync):
+        """Probar que un lote se escribe junto y cuenta para el grupo."""
+        ruta = tmp_path / "ventas.jsonl"
+        diario = DiarioVentas(ruta, tamaño_grupo=10, intervalo_fsync=3600)
+        diario.registrar_lote({"n": n} for n in range(12))
+        diario.registrar_lote([])
+
+        assert len(contador_fsync) == 1
+        diario.cerrar()
+        assert [e["n"] for e in DiarioVentas.leer(ruta)] == list(range(12))
+
+    def test_commit_agrupado(self, tmp_path, contador_fsync):
+        """Probar que el fsync se hace una vez por grupo de registros."""
+        diario = DiarioVentas(tmp_path / "ventas.jsonl", tamaño_grupo=10, intervalo_fsync=3600)
+        for n in range(25):
+            diario.registrar({"n": n})
+
+        assert len(contador_fsync) == 2
+        assert diario.pendientes == 5
+        diario.cerrar()
+        assert len(contador_fsync) == 3
+        assert diario.pendientes == 0
+
+    def test_commit_por_intervalo(self, tmp_path, contador_fsync):
+        """Probar que con intervalo cero se sincroniza cada registro."""
+        diario = DiarioVentas(tmp_path / "ventas.jsonl", tamaño_grupo=100, intervalo_fsync=0)
+        diario.registrar({"n": 1})
+        diario.registrar({"n": 2})
+        diario.cerrar()
+
+        assert len(contador_fsync) == 2
+
+    def test_cola_de_rafaga_se_sincroniza_sola(self, tmp_path, contador_fsync):
+        """Probar que los últimos registros de una ráfaga llegan a fsync sin más escrituras."""
+        diario = DiarioVentas(tmp_path / "ventas.jsonl", tamaño_grupo=100, intervalo_fsync=0.05)
+        try:
+            for n in range(5):
+                diario.registrar({"n": n})
+
+            limite = time.monotonic() + 5
+            while diario.pendientes and time.monotonic() < limite:
+                time.sleep(0.01)
+
+            assert diario.pendientes == 0
+            assert len(contador_fsync) >= 1
+        finally:
+            diario.cerrar()
+
+    def test_cola_incompleta_se_descarta(self, tmp_path):
+        """Probar que una línea cortada por una caída no corrompe el diario."""
+        ruta = tmp_path / "ventas.jsonl"
+        ruta.write_text('{"n": 1}\n{"n": 2, "cli', encoding="utf-8")
+
+        with DiarioVentas(ruta) as diario:
+            diario.registrar({"n": 3})
+
+        assert list(DiarioVentas.leer(ruta)) == [{"n": 1}, {"n": 3}]
+
+    def test_leer_inexistente(self, tmp_path):
+        """Probar que un diario inexistente no tiene eventos."""
+        assert list(DiarioVentas.leer(tmp_path / "no_existe.jsonl")) == []
+
+    def test_tamaño_grupo_invalido(self, tmp_path):
+        """Probar que el tamaño de grupo debe ser positivo."""
+        with pytest.raises(ValueError):
+            DiarioVentas(tmp_path / "ventas.jsonl", tamaño_grupo=0)
+
+
+class TestTiendaDiario:
+    """Pruebas de la reproducción de ventas al iniciar la tienda."""
+
+    def test_reproduccion_tras_reinicio(self, tmp_path):
+        """Probar que inventario y totales se reconstruyen desde el diario."""
+        ruta = tmp_path / "ventas.jsonl"
+        tienda = crear_tienda()
+        assert tienda.abrir_diario(ruta) == 0
+        silla, _, mesa = tienda.listar_muebles()
+        tienda.realizar_venta(silla, "Ana")
+        tienda.realizar_venta(mesa, "Luis")
+        esperadas = tienda.obtener_estadisticas()
+        tienda.cerrar_diario()
+
+        reiniciada = crear_tienda()
+        assert reiniciada.abrir_diario(ruta) == 2
+        estadisticas = reiniciada.obtener_estadisticas()
+
+        for clave in (
+            "total_muebles",
+            "valor_inventario",
+            "tipos_muebles",
+            "ventas_realizadas",
+            "total_muebles_vendidos",
+            "valor_total_ventas",
+        ):
+            assert estadisticas[clave] == esperadas[clave]
+        assert [m.nombre for m in reiniciada.listar_muebles()] == ["Silla Clásica"]
+        assert reiniciada.filtrar_por_material("vidrio") == []
+        reiniciada.cerrar_diario()
+
+    def test_ventas_nuevas_se_anexan(self, tmp_path):
+        """Probar que tras reproducir se siguen registrando ventas."""
+        ruta = tmp_path / "ventas.jsonl"
+        tienda = crear_tienda()
+        tienda.abrir_diario(ruta)
+        tienda.realizar_venta(tienda.listar_muebles()[0])
+        tienda.cerrar_diario()
+
+        tienda = crear_tienda()
+        tienda.abrir_diario(ruta)
+        tienda.realizar_venta(tienda.listar_muebles()[0])
+        tienda.cerrar_diario()
+
+        assert len(list(DiarioVentas.leer(ruta))) == 2
+        tienda = crear_tienda()
+        assert tienda.abrir_diario(ruta) == 2
+        assert [m.nombre for m in tienda.listar_muebles()] == ["Mesa Comedor"]
+        tienda.cerrar_diario()
+
+    def test_venta_sin_mueble_en_catalogo(self, tmp_path):
+        """Probar que una venta de un mueble ausente solo suma a los totales."""
+        ruta = tmp_path / "ventas.jsonl"
+        with DiarioVentas(ruta) as diario:
+            diario.registrar({"venta": {"mueble": "Otro", "precio_final": 50.0}, "mueble": None})
+
+        tienda = crear_tienda()
+        assert tienda.abrir_diario(ruta) == 1
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 3
+        assert estadisticas["valor_total_ventas"] == 50.0
+        tienda.cerrar_diario()
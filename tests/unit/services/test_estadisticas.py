@@ -0,0 +1,90 @@
+"""
+Pruebas para las estadísticas incrementales del inventario.
+"""
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.estadisticas import EstadisticasInventario
+
+
+class TestEstadisticasInventario:
+    """Pruebas del agregado de estadísticas."""
+
+    def test_estado_inicial(self):
+        """Probar que todos los contadores empiezan en cero."""
+        stats = EstadisticasInventario().como_dict()
+
+        assert stats["total_muebles"] == 0
+        assert stats["valor_inventario"] == 0
+        assert stats["tipos_muebles"] == {}
+        assert stats["ventas_realizadas"] == 0
+
+    def test_altas_y_bajas(self):
+        """Probar que altas y bajas mantienen conteos y valor."""
+        stats = EstadisticasInventario()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        mesa = Mesa("Mesa", "Madera", "Natural", 200.0)
+        stats.registrar_alta(silla, 110.1)
+        stats.registrar_alta(mesa, 220.2)
+        stats.registrar_baja(silla, 110.1)
+
+        assert stats.total_muebles == 1
+        assert stats.valor_inventario == 220.2
+        assert stats.como_dict()["tipos_muebles"] == {"Mesa": 1}
+
+    def test_valor_sin_error_acumulado(self):
+        """Probar que muchas altas y bajas no acumulan error de redondeo."""
+        stats = EstadisticasInventario()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        for _ in range(1000):
+            stats.registrar_alta(silla, 0.1)
+        for _ in range(1000):
+            stats.registrar_baja(silla, 0.1)
+
+        assert stats.valor_inventario == 0
+
+    def test_cambio_de_precio(self):
+        """Probar que un cambio de precio ajusta solo el valor del inventario."""
+        stats = EstadisticasInventario()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        stats.registrar_alta(silla, 110.1)
+        stats.registrar_cambio_precio(110.1, 250.25)
+
+        assert stats.total_muebles == 1
+        assert stats.valor_inventario == 250.25
+        stats.registrar_baja(silla, 250.25)
+        assert stats.valor_inventario == 0
+
+    def test_ventas_y_descuentos(self):
+        """Probar contadores de ventas y copia de descuentos."""
+        stats = EstadisticasInventario()
+        descuentos = {"Silla": 0.1}
+        stats.registrar_venta(90.0)
+        stats.registrar_venta(10.5)
+        stats.registrar_descuentos(descuentos)
+        descuentos["Mesa"] = 0.2
+
+        resultado = stats.como_dict()
+        assert resultado["ventas_realizadas"] == 2
+        assert stats.total_muebles_vendidos == 2
+        assert stats.valor_total_ventas == 100.5
+        assert resultado["descuentos_activos"] == {"Silla": 0.1}
+
+    def test_bajas_y_ventas_por_lote(self):
+        """Probar que los lotes equivalen a registrar de a uno."""
+        por_lote = EstadisticasInventario()
+        individual = EstadisticasInventario()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        mesa = Mesa("Mesa", "Madera", "Natural", 200.0)
+        pares = [(silla, 110.1), (mesa, 220.2), (silla, 90.3)]
+        for stats in (por_lote, individual):
+            stats.registrar_altas(pares)
+        por_lote.registrar_bajas(pares[:2])
+        por_lote.registrar_ventas(iter([99.1, 198.2]))
+        for mueble, precio in pares[:2]:
+            individual.registrar_baja(mueble, precio)
+        individual.registrar_venta(99.1)
+        individual.registrar_venta(198.2)
+
+        assert por_lote.como_dict() == individual.como_dict()
+        assert por_lote.como_dict()["tipos_muebles"] == {"Silla": 1}
@@ -0,0 +1,333 @@
+"""
+Pruebas para los índices secundarios del inventario.
+"""
+
+import random
+
+import pytest
+
+from src.models.categorias.asientos import Asiento
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofa import Sofa
+from src.services.indices import (
+    IndiceHash,
+    IndicePrecios,
+    IndiceTipos,
+    IndiceTrigramas,
+    normalizar_texto,
+    trigramas,
+)
+
+
+class TestNormalizarTexto:
+    """Pruebas de la normalización de claves."""
+
+    def test_normaliza_mayusculas_y_espacios(self):
+        """Probar que se ignoran mayúsculas y espacios extremos."""
+        assert normalizar_texto("  Madera ") == "madera"
+
+    def test_valores_vacios(self):
+        """Probar que valores vacíos o no textuales producen clave vacía."""
+        assert normalizar_texto(None) == ""
+        assert normalizar_texto("") == ""
+        assert normalizar_texto(123) == ""
+
+
+class TestIndiceHash:
+    """Pruebas del índice hash por atributo."""
+
+    def test_buscar_respeta_orden_de_insercion(self):
+        """Probar que los resultados mantienen el orden de inserción."""
+        indice = IndiceHash(lambda m: m.material)
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        mesa = Mesa("Mesa", "MADERA ", "Natural", 200.0)
+        indice.agregar(silla)
+        indice.agregar(mesa)
+
+        assert indice.buscar("madera") == [silla, mesa]
+
+    def test_quitar_elimina_grupo_vacio(self):
+        """Probar que quitar el último mueble elimina la clave."""
+        indice = IndiceHash(lambda m: m.material)
+        silla = Silla("Silla", "Metal", "Negro", 100.0)
+        indice.agregar(silla)
+        indice.quitar(silla)
+
+        assert indice.buscar("metal") == []
+        assert indice.claves() == []
+
+    def test_quitar_usa_clave_original(self):
+        """Probar que se puede quitar aunque el atributo haya cambiado."""
+        indice = IndiceHash(lambda m: m.material)
+        silla = Silla("Silla", "Metal", "Negro", 100.0)
+        indice.agregar(silla)
+        silla.material = "Madera"
+        indice.quitar(silla)
+
+        assert indice.buscar("metal") == []
+
+    def test_actualizar_conserva_orden_de_insercion(self):
+        """Probar que un mueble que cambia de clave entra al grupo en su lugar."""
+        muebles = [Silla(f"Silla {i}", "Madera", "Café", 100.0) for i in range(4)]
+        orden = {id(m): i for i, m in enumerate(muebles)}
+        indice = IndiceHash(lambda m: m.material, lambda m: orden[id(m)])
+        indice.agregar_lote(muebles)
+        muebles[0].material = "Metal"
+        indice.actualizar(muebles[0])
+        muebles[2].material = "Metal"
+        indice.actualizar(muebles[2])
+        muebles[0].material = "Madera"
+        indice.actualizar(muebles[0])
+
+        assert indice.buscar("madera") == [muebles[0], muebles[1], muebles[3]]
+        assert indice.buscar("metal") == [muebles[2]]
+
+    def test_quitar_mueble_no_indexado(self):
+        """Probar que quitar un mueble ausente no falla."""
+        indice = IndiceHash(lambda m: m.material)
+        indice.quitar(Silla("Silla", "Metal", "Negro", 100.0))
+
+        assert indice.claves() == []
+
+    def test_contar_y_coincide(self):
+        """Probar el conteo por clave y la comprobación de un mueble suelto."""
+        indice = IndiceHash(lambda m: m.material)
+        silla = Silla("Silla", " Madera ", "Café", 100.0)
+        mesa = Mesa("Mesa", "madera", "Café", 200.0)
+        indice.agregar_lote([silla, mesa])
+
+        assert indice.contar("MADERA") == 2
+        assert indice.contar("metal") == 0
+        assert indice.coincide(silla, "madera")
+        assert not indice.coincide(silla, "metal")
+
+
+class TestIndiceTipos:
+    """Pruebas del índice por clase."""
+
+    def test_buscar_por_categoria_respeta_orden_de_insercion(self):
+        """Probar que una categoría reúne sus subclases en orden de inserción."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        mesa = Mesa("Mesa", "Madera", "Café", 200.0)
+        sofa = Sofa("Sofá", "Tela", "Gris", 400.0)
+        otra_silla = Silla("Otra", "Metal", "Negro", 80.0)
+        muebles = [silla, mesa, sofa, otra_silla]
+        orden = {id(m): i for i, m in enumerate(muebles)}
+        indice = IndiceTipos(lambda m: orden[id(m)])
+        indice.agregar_lote(muebles)
+
+        assert indice.buscar(Asiento) == [silla, sofa, otra_silla]
+        assert indice.buscar(Silla) == [silla, otra_silla]
+        assert indice.contar(Asiento) == 3
+
+    def test_quitar(self):
+        """Probar que quitar actualiza búsquedas y conteos."""
+        indice = IndiceTipos(lambda m: 0)
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        indice.agregar(silla)
+        indice.quitar(silla)
+        indice.quitar(silla)
+
+        assert indice.buscar(Silla) == []
+        assert indice.contar(Silla) == 0
+
+
+class TestIndicePrecios:
+    """Pruebas del índice ordenado por precio."""
+
+    def test_rango_ordenado_por_precio(self):
+        """Probar que el rango se devuelve ordenado de menor a mayor."""
+        indice = IndicePrecios()
+        cara = Silla("Cara", "Madera", "Café", 300.0)
+        barata = Silla("Barata", "Madera", "Café", 50.0)
+        media = Silla("Media", "Madera", "Café", 120.0)
+        indice.agregar(cara, 300.0)
+        indice.agregar(barata, 50.0)
+        indice.agregar(media, 120.0)
+
+        assert indice.rango(0, float("inf")) == [barata, media, cara]
+        assert indice.rango(50.0, 120.0) == [barata, media]
+
+    def test_precios_iguales_mantienen_orden_de_insercion(self):
+        """Probar el desempate por orden de inserción."""
+        indice = IndicePrecios()
+        primera = Silla("Primera", "Madera", "Café", 100.0)
+        segunda = Silla("Segunda", "Madera", "Café", 100.0)
+        indice.agregar(primera, 100.0)
+        indice.agregar(segunda, 100.0)
+
+        assert indice.rango(100.0, 100.0) == [primera, segunda]
+
+    def test_desde_cursor(self):
+        """Probar que retomar desde la clave de un mueble sigue el orden por precio."""
+        indice = IndicePrecios()
+        muebles = [Silla(f"S{i}", "Madera", "Café", 10.0) for i in range(6)]
+        for mueble, precio in zip(muebles, [30.0, 10.0, 20.0, 20.0, 50.0, 40.0]):
+            indice.agregar(mueble, precio)
+        cursor = indice.clave_de(muebles[2])
+
+        assert list(indice.desde(0, 45, cursor)) == [muebles[3], muebles[0], muebles[5]]
+        assert list(indice.desde(0, 45)) == indice.rango(0, 45)
+        assert list(indice.desde(50, 10)) == []
+
+    def test_contar_coincide_con_rango(self):
+        """Probar que el conteo por rango coincide con el largo del rango."""
+        indice = IndicePrecios()
+        rng = random.Random(3)
+        for i in range(200):
+            indice.agregar(Silla(f"S{i}", "Madera", "Café", 10.0), float(rng.randint(1, 50)))
+
+        for minimo, maximo in [(0, 100), (10, 20), (25, 25), (30, 10), (60, 70)]:
+            assert indice.contar(minimo, maximo) == len(indice.rango(minimo, maximo))
+
+    def test_quitar(self):
+        """Probar que quitar elimina el mueble correcto."""
+        indice = IndicePrecios()
+        primera = Silla("Primera", "Madera", "Café", 100.0)
+        segunda = Silla("Segunda", "Madera", "Café", 100.0)
+        indice.agregar(primera, 100.0)
+        indice.agregar(segunda, 100.0)
+        indice.quitar(primera)
+        indice.quitar(primera)
+
+        assert indice.rango(0, 1000) == [segunda]
+        assert len(indice) == 1
+        assert indice.precio_de(primera) is None
+        assert indice.precio_de(segunda) == 100.0
+
+    @pytest.mark.parametrize("tamaños", [[50, 3], [3, 50], [100, 100, 1]])
+    def test_agregar_lote_mezcla_con_existentes(self, tamaños):
+        """Probar que los lotes sucesivos quedan como con altas individuales."""
+        azar = random.Random(len(tamaños))
+        por_lote = IndicePrecios()
+        individual = IndicePrecios()
+        for tamaño in tamaños:
+            pares = [
+                (Silla("Silla", "Madera", "Café", 10.0), float(azar.randint(1, 20)))
+                for _ in range(tamaño)
+            ]
+            por_lote.agregar_lote(pares)
+            for mueble, precio in pares:
+                individual.agregar(mueble, precio)
+
+        assert por_lote.rango(0, 100) == individual.rango(0, 100)
+
+    @pytest.mark.parametrize("cantidad", [5, 300])
+    def test_quitar_lote(self, cantidad):
+        """Probar la baja por lotes con pocos y con muchos muebles."""
+        azar = random.Random(cantidad)
+        muebles = [Silla(f"Silla {i}", "Madera", "Café", 100.0) for i in range(1000)]
+        por_lote = IndicePrecios()
+        individual = IndicePrecios()
+        pares = [(m, float(azar.randint(1, 50))) for m in muebles]
+        por_lote.agregar_lote(pares)
+        individual.agregar_lote(pares)
+        quitar = azar.sample(muebles, cantidad)
+
+        por_lote.quitar_lote(quitar + quitar[:3])
+        for mueble in quitar:
+            individual.quitar(mueble)
+
+        assert por_lote.rango(0, 100) == individual.rango(0, 100)
+        assert len(por_lote) == 1000 - cantidad
+        assert all(por_lote.precio_de(m) is None for m in quitar)
+
+    def test_rango_invertido(self):
+        """Probar que un rango invertido no devuelve resultados."""
+        indice = IndicePrecios()
+        indice.agregar(Silla("Silla", "Madera", "Café", 100.0), 100.0)
+
+        assert indice.rango(200, 100) == []
+
+
+class TestIndiceTrigramas:
+    """Pruebas del índice invertido de trigramas."""
+
+    def test_trigramas(self):
+        """Probar la descomposición en trigramas."""
+        assert trigramas("silla") == {"sil", "ill", "lla"}
+        assert trigramas("si") == set()
+
+    def test_buscar_parcial_sin_mayusculas(self):
+        """Probar búsqueda parcial sin distinguir mayúsculas."""
+        indice = IndiceTrigramas()
+        silla = Silla("Silla Clásica", "Madera", "Café", 100.0)
+        mesa = Mesa("Mesa CLÁSICA", "Madera", "Natural", 200.0)
+        indice.agregar(silla, silla.nombre)
+        indice.agregar(mesa, mesa.nombre)
+
+        assert indice.buscar("clásica") == [silla, mesa]
+        assert indice.buscar("mesa") == [mesa]
+        assert indice.buscar("sofá") == []
+
+    def test_estimar_es_cota_superior(self):
+        """Probar que la estimación nunca es menor que los resultados reales."""
+        indice = IndiceTrigramas()
+        for nombre in ["Silla Clásica", "Silla Oficina", "Mesa Clásica", "Lámpara"]:
+            mueble = Silla(nombre, "Madera", "Café", 100.0)
+            indice.agregar(mueble, nombre)
+
+        for termino in ["silla", "clásica", "sica", "la", "xyz"]:
+            assert indice.estimar(termino) >= len(indice.buscar(termino))
+        assert indice.estimar("xyz") == 0
+        assert indice.estimar("la") == 4
+
+    def test_terminos_cortos(self):
+        """Probar términos de menos de tres caracteres."""
+        indice = IndiceTrigramas()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        indice.agregar(silla, silla.nombre)
+
+        assert indice.buscar("LL") == [silla]
+        assert indice.buscar("x") == []
+
+    def test_trigramas_presentes_sin_subcadena(self):
+        """Probar que se descartan candidatos con trigramas pero sin subcadena."""
+        indice = IndiceTrigramas()
+        silla = Silla("abcd bcde", "Madera", "Café", 100.0)
+        indice.agregar(silla, silla.nombre)
+
+        assert indice.buscar("abcde") == []
+
+    def test_quitar_poda_trigramas(self):
+        """Probar que quitar un mueble poda los trigramas vacíos."""
+        indice = IndiceTrigramas()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        indice.agregar(silla, silla.nombre)
+        indice.quitar(silla)
+        indice.quitar(silla)
+
+        assert indice.buscar("silla") == []
+        assert indice._postings == {}
+
+    def test_actualizar_nombre(self):
+        """Probar que el nombre nuevo reemplaza al viejo y se conserva el orden."""
+        indice = IndiceTrigramas()
+        primera = Silla("Silla Roja", "Madera", "Rojo", 100.0)
+        segunda = Silla("Silla Azul", "Madera", "Azul", 100.0)
+        indice.agregar(primera, primera.nombre)
+        indice.agregar(segunda, segunda.nombre)
+        primera.nombre = "Banco Rojo"
+        indice.actualizar(primera, primera.nombre)
+
+        assert indice.buscar("banco") == [primera]
+        assert indice.buscar("silla") == [segunda]
+        assert indice.buscar("rojo") == [primera]
+        assert indice.buscar("a") == [primera, segunda]
+
+    def test_equivale_a_busqueda_lineal(self):
+        """Probar que coincide con la búsqueda lineal original."""
+        generador = random.Random(42)
+        palabras = ["Silla", "Mesa", "Sofá", "Clásica", "Roble", "Oficina", "Moderna"]
+        muebles = [
+            Silla(" ".join(generador.sample(palabras, 3)), "Madera", "Café", 100.0)
+            for _ in range(200)
+        ]
+        indice = IndiceTrigramas()
+        for mueble in muebles:
+            indice.agregar(mueble, mueble.nombre)
+
+        for termino in ["sil", "a m", "clásica", "of", "roble sofá", "zzz", "a"]:
+            esperado = [m for m in muebles if termino in m.nombre.lower()]
+            assert indice.buscar(termino) == esperado
@@ -0,0 +1,116 @@
+"""
+Pruebas para el almacén del inventario.
+"""
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.inventario import Inventario
+
+
+@pytest.fixture
+def muebles():
+    """Fixture con tres muebles distintos."""
+    return [
+        Silla("Silla 1", "Madera", "Café", 100.0),
+        Mesa("Mesa", "Madera", "Natural", 200.0),
+        Silla("Silla 2", "Metal", "Negro", 120.0),
+    ]
+
+
+class TestInventario:
+    """Pruebas del inventario indexado por identidad."""
+
+    def test_agregar_y_pertenencia(self, muebles):
+        """Probar alta y pertenencia por identidad."""
+        inventario = Inventario()
+        for mueble in muebles:
+            assert inventario.agregar(mueble) is True
+
+        assert len(inventario) == 3
+        assert muebles[1] in inventario
+        assert Silla("Silla 1", "Madera", "Café", 100.0) not in inventario
+
+    def test_agregar_duplicado(self, muebles):
+        """Probar que un mueble no se agrega dos veces."""
+        inventario = Inventario()
+        inventario.agregar(muebles[0])
+
+        assert inventario.agregar(muebles[0]) is False
+        assert len(inventario) == 1
+
+    def test_quitar_conserva_orden(self, muebles):
+        """Probar que quitar mantiene el orden del resto."""
+        inventario = Inventario()
+        for mueble in muebles:
+            inventario.agregar(mueble)
+
+        assert inventario.quitar(muebles[1]) is True
+        assert inventario.quitar(muebles[1]) is False
+        assert list(inventario) == [muebles[0], muebles[2]]
+        assert inventario.listar() == [muebles[0], muebles[2]]
+
+    def test_acceso_por_posicion(self, muebles):
+        """Probar el acceso por índice, incluidos negativos."""
+        inventario = Inventario()
+        for mueble in muebles:
+            inventario.agregar(mueble)
+
+        assert inventario[0] is muebles[0]
+        assert inventario[-1] is muebles[2]
+        with pytest.raises(IndexError):
+            inventario[3]
+
+    def test_inventario_vacio(self):
+        """Probar el inventario vacío."""
+        inventario = Inventario()
+
+        assert not inventario
+        assert inventario.listar() == []
+
+    def test_desde_retoma_despues_de_una_secuencia(self, muebles):
+        """Probar que el recorrido desde un cursor ignora bajas y ve las altas."""
+        inventario = Inventario()
+        for mueble in muebles:
+            inventario.agregar(mueble)
+        cursor = inventario.orden(muebles[0])
+        inventario.quitar(muebles[1])
+        nueva = Silla("Silla 3", "Metal", "Gris", 90.0)
+        inventario.agregar(nueva)
+
+        assert [m for _, m in inventario.desde(cursor)] == [muebles[2], nueva]
+        assert [m for _, m in inventario.desde()] == [muebles[0], muebles[2], nueva]
+        assert inventario.orden(nueva) > inventario.orden(muebles[2])
+
+    def test_obtener_por_orden(self, monkeypatch, muebles):
+        """Probar la búsqueda por secuencia antes y después de compactar."""
+        monkeypatch.setattr("src.services.inventario.MIN_HUECOS_COMPACTAR", 1)
+        inventario = Inventario()
+        for mueble in muebles:
+            inventario.agregar(mueble)
+        secuencias = [inventario.orden(mueble) for mueble in muebles]
+        inventario.quitar(muebles[0])
+        inventario.quitar(muebles[1])
+
+        assert inventario.obtener_por_orden(secuencias[2]) is muebles[2]
+        assert inventario.obtener_por_orden(secuencias[0]) is None
+        assert inventario.obtener_por_orden(secuencias[1]) is None
+        assert inventario.obtener_por_orden(99) is None
+
+    def test_compactar_conserva_secuencias(self, monkeypatch):
+        """Probar que compactar el registro no cambia secuencias ni recorridos."""
+        monkeypatch.setattr("src.services.inventario.MIN_HUECOS_COMPACTAR", 4)
+        inventario = Inventario()
+        sillas = [Silla(f"Silla {i}", "Madera", "Café", 100.0) for i in range(20)]
+        for silla in sillas:
+            inventario.agregar(silla)
+        cursor = inventario.orden(sillas[9])
+        for silla in sillas[:15]:
+            if silla is not sillas[9]:
+                inventario.quitar(silla)
+
+        assert len(inventario._registro) < 20
+        assert [m for _, m in inventario.desde(cursor)] == sillas[15:]
+        assert [m for _, m in inventario.desde()] == [sillas[9]] + sillas[15:]
+        assert inventario.orden(sillas[19]) == 19
@@ -0,0 +1,148 @@
+"""
+Pruebas para el motor de reglas de precio.
+"""
+
+import json
+import os
+
+import pytest
+
+from src.models.concretos.cama import Cama
+from src.models.concretos.escritorio import Escritorio
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sillon import Sillon
+from src.models.concretos.sofacama import SofaCama
+from src.services.reglas_precio import (
+    REGLAS_PREDETERMINADAS,
+    ErrorReglas,
+    MotorPrecios,
+    compilar_reglas,
+)
+from tests.unit.services.test_columnar import generar_catalogo
+
+
+class TestReglasPredeterminadas:
+    """Pruebas de equivalencia con calcular_precio."""
+
+    def test_catalogo_aleatorio(self):
+        """Probar que las reglas dan el mismo precio y tipo que cada clase."""
+        catalogo = generar_catalogo(3000)
+
+        precios = MotorPrecios().evaluar(catalogo)
+
+        for mueble, precio in zip(catalogo, precios):
+            esperado = mueble.calcular_precio()
+            assert precio == esperado, mueble
+            assert type(precio) is type(esperado)
+
+    @pytest.mark.parametrize(
+        "mueble",
+        [
+            Silla("Silla", "Madera", "Café", 100.0, True, "CUERO", True, True),
+            Mesa("Mesa", "Roble", "Natural", 300.0, "redonda", 120, 80, 75, 5),
+            Mesa("Mesa", "Roble", "Natural", 300.0, "rectangular", 200, 100, 75, 8),
+            Cama("Cama", "Pino", "Blanco", 500.0, "queen", True, True),
+            SofaCama("Sofá Cama", "Tela", "Gris", 900, 2, "cuero", "king", True, "electrico"),
+            Escritorio("Escritorio", "Metal", "Negro", 250, "L", True, 3, 1.6, True),
+            Sillon("Sillón", "Madera", "Marrón", 400, material_tapizado=""),
+        ],
+    )
+    def test_casos_limite(self, mueble):
+        """Probar tramos, tablas sin coincidencia y tapizados vacíos."""
+        assert MotorPrecios().precio(mueble) == mueble.calcular_precio()
+
+    def test_subclase_que_redefine_precio(self):
+        """Probar que una subclase con su propio calcular_precio no usa las reglas."""
+
+        class SillaFija(Silla):
+            def calcular_precio(self):
+                return 1.0
+
+        assert MotorPrecios().evaluar([SillaFija("S", "M", "C", 100.0)]) == [1.0]
+
+    def test_valor_total(self):
+        """Probar la suma redondeada de un lote."""
+        catalogo = generar_catalogo(200)
+
+        assert MotorPrecios().valor_total(catalogo) == round(
+            sum(m.calcular_precio() for m in catalogo), 2
+        )
+
+
+class TestCargaDeReglas:
+    """Pruebas de validación y recarga en caliente."""
+
+    def test_reemplazar_reglas(self):
+        """Probar que un nuevo juego de reglas se aplica de inmediato."""
+        motor = MotorPrecios()
+        cama = Cama("Cama", "Pino", "Blanco", 500.0, "king")
+        reglas = motor.reglas()
+        reglas["Cama"]["recargos"][0]["valores"]["king"] = 1000
+
+        motor.cargar(reglas)
+
+        assert motor.precio(cama) == 1500.0
+        assert motor.version == 2
+        assert REGLAS_PREDETERMINADAS["Cama"]["recargos"][0]["valores"]["king"] == 600
+
+    def test_clase_sin_reglas_usa_calcular_precio(self):
+        """Probar el respaldo para clases que el juego de reglas no describe."""
+        motor = MotorPrecios({"Mesa": REGLAS_PREDETERMINADAS["Mesa"]})
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+
+        assert motor.precio(silla) == silla.calcular_precio()
+
+    @pytest.mark.parametrize(
+        "reglas",
+        [
+            {"Cama": {"recargos": [{"desconocido": "x"}]}},
+            {"Cama": {"recargos": [{"si": "incluye_colchon"}]}},
+            {"Cama": {"precio": 1}},
+            {"Cama": {"redondeo": "mucho"}},
+            {"Cama": {"hereda": "Mueble"}},
+            {"A": {"hereda": "B"}, "B": {"hereda": "A"}},
+        ],
+    )
+    def test_reglas_invalidas(self, reglas):
+        """Probar que las reglas inválidas se rechazan y no reemplazan las vigentes."""
+        motor = MotorPrecios()
+
+        with pytest.raises(ErrorReglas):
+            motor.cargar(reglas)
+        assert motor.version == 1
+        assert motor.reglas() == REGLAS_PREDETERMINADAS
+
+    def test_herencia(self):
+        """Probar que hereda parte del precio final de otra clase."""
+        programas = compilar_reglas(REGLAS_PREDETERMINADAS)
+
+        assert programas["SofaCama"].base is programas["Sofa"]
+
+    def test_recarga_desde_archivo(self, tmp_path):
+        """Probar que recargar solo relee el archivo cuando cambió."""
+        ruta = tmp_path / "reglas.json"
+        ruta.write_text(json.dumps(REGLAS_PREDETERMINADAS), encoding="utf-8")
+        motor = MotorPrecios.desde_archivo(ruta)
+        cama = Cama("Cama", "Pino", "Blanco", 500.0, "queen", True)
+        assert motor.precio(cama) == cama.calcular_precio()
+        assert motor.recargar() is False
+
+        reglas = json.loads(ruta.read_text(encoding="utf-8"))
+        reglas["Cama"]["recargos"][1]["monto"] = 0
+        ruta.write_text(json.dumps(reglas), encoding="utf-8")
+        os.utime(ruta, ns=(0, os.stat(ruta).st_mtime_ns + 1))
+
+        assert motor.recargar() is True
+        assert motor.precio(cama) == 900.0
+
+    def test_recarga_invalida_conserva_reglas(self, tmp_path):
+        """Probar que un archivo roto no reemplaza las reglas vigentes."""
+        ruta = tmp_path / "reglas.json"
+        ruta.write_text(json.dumps(REGLAS_PREDETERMINADAS), encoding="utf-8")
+        motor = MotorPrecios.desde_archivo(ruta)
+        ruta.write_text("{no es json", encoding="utf-8")
+
+        with pytest.raises(ErrorReglas):
+            motor.recargar()
+        assert motor.reglas() == REGLAS_PREDETERMINADAS
@@ -0,0 +1,138 @@
+"""
+Pruebas para los reportes de inventario por flujo.
+"""
+
+import csv
+import io
+import json
+import os
+import tracemalloc
+from itertools import repeat
+
+import pytest
+
+from src.models.concretos.cama import Cama
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.catalogo import cargar_catalogo
+from src.services.reportes import EscritorReporte, ReporteTexto, escribir_reporte
+from src.services.tienda import TiendaMuebles
+
+
+@pytest.fixture
+def tienda():
+    """Fixture para una tienda con un inventario pequeño y un descuento."""
+    tienda = TiendaMuebles("Tienda Reporte")
+    tienda.agregar_mueble(Silla("Silla Clásica", "Madera", "Café", 100.0))
+    tienda.agregar_mueble(Mesa("Mesa, Comedor", "Vidrio", "Negro", 300.0))
+    tienda.agregar_mueble(Cama("Cama Queen", "Madera", "Blanco", 500.0, tamaño="queen"))
+    tienda.aplicar_descuento("sillas", 10)
+    return tienda
+
+
+class TestEscribirReporte:
+    """Pruebas del recorrido con varios formatos."""
+
+    def test_todos_los_formatos(self, tienda):
+        """Probar que un solo llamado llena texto, CSV y JSON Lines."""
+        texto, tabla, lineas = io.StringIO(), io.StringIO(newline=""), io.StringIO()
+
+        cantidad = tienda.escribir_reporte({"texto": texto, "csv": tabla, "jsonl": lineas})
+
+        assert cantidad == 3
+        contenido = texto.getvalue()
+        assert contenido.startswith(tienda.generar_reporte_inventario())
+        assert "- Silla: Silla Clásica | Madera | Café | $110.00" in contenido
+        assert contenido.endswith("Muebles listados: 3\n")
+        filas = list(csv.DictReader(io.StringIO(tabla.getvalue())))
+        assert [f["nombre"] for f in filas] == ["Silla Clásica", "Mesa, Comedor", "Cama Queen"]
+        assert float(filas[2]["precio"]) == 900.0
+        registros = [json.loads(linea) for linea in lineas.getvalue().splitlines()]
+        assert registros[2]["tipo"] == "Cama"
+        assert registros[2]["tamaño"] == "queen"
+        assert registros[2]["precio"] == 900.0
+
+    def test_una_sola_pasada(self, tienda):
+        """Probar que cada mueble se lee una vez aunque haya varios formatos."""
+        lecturas = []
+
+        def muebles():
+            for mueble in tienda.listar_muebles():
+                lecturas.append(mueble)
+                yield mueble
+
+        escribir_reporte("Tienda", {}, muebles(), {"texto": io.StringIO(), "csv": io.StringIO()})
+
+        assert len(lecturas) == 3
+
+    def test_jsonl_se_puede_recargar(self, tienda, tmp_path):
+        """Probar que el JSON Lines del reporte sirve como catálogo."""
+        ruta = tmp_path / "reporte.jsonl"
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            tienda.escribir_reporte({"jsonl": archivo})
+
+        copia = TiendaMuebles()
+        resultado = cargar_catalogo(copia, ruta)
+
+        assert resultado["aceptados"] == 3
+        assert copia.calcular_valor_inventario() == tienda.calcular_valor_inventario()
+
+    def test_formato_desconocido(self, tienda):
+        """Probar que un formato inexistente se rechaza antes de escribir."""
+        with pytest.raises(ValueError):
+            tienda.escribir_reporte({"pdf": io.StringIO()})
+
+    def test_memoria_constante(self):
+        """Probar que la memoria no crece con la cantidad de muebles."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        with open(os.devnull, "w", encoding="utf-8", newline="") as nulo:
+            tracemalloc.start()
+            try:
+                escribir_reporte(
+                    "Tienda",
+                    {},
+                    repeat(silla, 20000),
+                    {"texto": nulo, "csv": nulo, "jsonl": nulo},
+                )
+                _, pico = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert pico < 256 * 1024
+
+
+class TestReporteTexto:
+    """Pruebas del formato de texto."""
+
+    def test_resumen_sin_detalle(self, tienda):
+        """Probar que el resumen conserva el formato de generar_reporte_inventario."""
+        reporte = tienda.generar_reporte_inventario()
+
+        assert reporte.startswith("=== REPORTE DE INVENTARIO - Tienda Reporte ===\n\n")
+        assert "DESCUENTOS ACTIVOS:\n- Silla: 10.0%\n" in reporte
+        assert "DETALLE" not in reporte
+
+    def test_escritor_sin_detalle_ignora_muebles(self):
+        """Probar que sin detalle solo se escribe el resumen."""
+        salida = io.StringIO()
+        escribir = ReporteTexto(salida, detalle=False)
+
+        escribir.mueble(Silla("Silla", "Madera", "Café", 100.0), 110.0)
+        escribir.cierre(1)
+
+        assert salida.getvalue() == ""
+
+
+class TestEscritorReporte:
+    """Pruebas de la clase base de los formatos."""
+
+    def test_es_abstracta(self):
+        """Probar que un formato sin mueble no se puede instanciar."""
+
+        class SinMueble(EscritorReporte):
+            pass
+
+        with pytest.raises(TypeError):
+            EscritorReporte(io.StringIO())
+        with pytest.raises(TypeError):
+            SinMueble(io.StringIO())
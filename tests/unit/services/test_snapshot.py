@@ -0,0 +1,158 @@
+"""
+Pruebas para el snapshot binario del inventario.
+"""
+
+import struct
+
+import pytest
+
+from src.models.concretos.cama import Cama
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.snapshot import ErrorSnapshot, TiendaSnapshot
+from src.services.tienda import TiendaMuebles
+from tests.unit.services.test_columnar import generar_catalogo
+
+
+@pytest.fixture
+def tienda():
+    """Fixture con una tienda pequeña y un descuento activo."""
+    tienda = TiendaMuebles("Mueblería Snapshot")
+    tienda.agregar_mueble(Silla("Silla Clásica", "Madera", "Café", 100))
+    tienda.agregar_mueble(Mesa("Mesa Comedor", "Vidrio", "Negro", 300))
+    tienda.agregar_mueble(Cama("Cama Queen", " madera ", "Blanco", 500, "queen"))
+    tienda.agregar_mueble(Silla("Silla Oficina", "Metal", "Negro", 150, tiene_ruedas=True))
+    tienda.aplicar_descuento("Silla", 10)
+    return tienda
+
+
+@pytest.fixture
+def ruta(tmp_path, tienda):
+    """Fixture con el snapshot de la tienda ya guardado."""
+    ruta = tmp_path / "inventario.snap"
+    tienda.guardar_snapshot(ruta)
+    return ruta
+
+
+def nombres(muebles):
+    return [m.nombre for m in muebles]
+
+
+class TestTiendaSnapshot:
+    """Pruebas de la tienda de solo lectura."""
+
+    def test_consultas_equivalentes(self, tienda, ruta):
+        """Probar que las consultas coinciden con la tienda original."""
+        with TiendaSnapshot(ruta) as snapshot:
+            assert len(snapshot) == 4
+            assert snapshot.nombre == "Mueblería Snapshot"
+            assert nombres(snapshot.buscar_muebles_por_nombre("SILLA")) == nombres(
+                tienda.buscar_muebles_por_nombre("silla")
+            )
+            assert nombres(snapshot.filtrar_por_material("MADERA")) == [
+                "Silla Clásica",
+                "Cama Queen",
+            ]
+            assert nombres(snapshot.filtrar_por_color("negro")) == ["Mesa Comedor", "Silla Oficina"]
+            for rango in [(0, float("inf")), (150, 400), (-5, 100), (400, 100)]:
+                assert nombres(snapshot.filtrar_por_precio(*rango)) == nombres(
+                    tienda.filtrar_por_precio(*rango)
+                )
+            assert snapshot.calcular_valor_inventario() == tienda.calcular_valor_inventario()
+
+    def test_estadisticas(self, tienda, ruta):
+        """Probar que las estadísticas se leen de los metadatos."""
+        with TiendaSnapshot(ruta) as snapshot:
+            estadisticas = snapshot.obtener_estadisticas()
+
+        original = tienda.obtener_estadisticas()
+        for clave in ("total_muebles", "valor_inventario", "tipos_muebles", "descuentos_activos"):
+            assert estadisticas[clave] == original[clave]
+
+    def test_construccion_perezosa(self, ruta):
+        """Probar que solo se construyen los muebles consultados y se reutilizan."""
+        with TiendaSnapshot(ruta) as snapshot:
+            assert snapshot._muebles == {}
+            cama = snapshot.filtrar_por_precio(400, 1000)
+            assert len(snapshot._muebles) == 1
+            assert snapshot.obtener(-2) is cama[0]
+            with pytest.raises(IndexError):
+                snapshot.obtener(4)
+
+    def test_ida_y_vuelta_exacta(self, tmp_path):
+        """Probar que los muebles reconstruidos conservan atributos y precio."""
+        muebles = generar_catalogo(500)
+        tienda = TiendaMuebles()
+        tienda.agregar_muebles(muebles)
+        ruta = tmp_path / "grande.snap"
+        assert tienda.guardar_snapshot(ruta) == len(tienda.listar_muebles())
+
+        with TiendaSnapshot(ruta) as snapshot:
+            for original, copia in zip(tienda.listar_muebles(), snapshot.iterar_muebles()):
+                assert type(copia).__name__ == type(original).__name__
+                assert copia.calcular_precio() == original.calcular_precio()
+                assert copia.obtener_descripcion() == original.obtener_descripcion()
+
+    def test_snapshot_vacio(self, tmp_path):
+        """Probar un snapshot sin muebles."""
+        ruta = tmp_path / "vacio.snap"
+        TiendaMuebles().guardar_snapshot(ruta)
+
+        with TiendaSnapshot(ruta) as snapshot:
+            assert len(snapshot) == 0
+            assert snapshot.filtrar_por_precio() == []
+            assert snapshot.buscar_muebles_por_nombre("silla") == []
+
+
+class TestFormatoSnapshot:
+    """Pruebas de validación del formato."""
+
+    def test_archivo_ajeno(self, tmp_path):
+        """Probar que se rechaza un archivo que no es snapshot."""
+        ruta = tmp_path / "otro.snap"
+        ruta.write_bytes(b"no es un snapshot" * 10)
+        with pytest.raises(ErrorSnapshot, match="no es un snapshot"):
+            TiendaSnapshot(ruta)
+
+    @pytest.mark.parametrize("contenido", [b"", b"MUEBSNAP"])
+    def test_archivo_vacio_o_truncado(self, tmp_path, contenido):
+        """Probar que se rechazan archivos vacíos o truncados."""
+        ruta = tmp_path / "roto.snap"
+        ruta.write_bytes(contenido)
+        with pytest.raises(ErrorSnapshot):
+            TiendaSnapshot(ruta)
+
+    def test_version_no_soportada(self, ruta):
+        """Probar que se rechaza una versión desconocida."""
+        datos = bytearray(ruta.read_bytes())
+        struct.pack_into("<H", datos, 8, 99)
+        ruta.write_bytes(bytes(datos))
+        with pytest.raises(ErrorSnapshot, match="99"):
+            TiendaSnapshot(ruta)
+
+    def test_mueble_no_soportado(self, tmp_path):
+        """Probar que un tipo fuera del catálogo no se puede guardar."""
+
+        class Banco(Silla):
+            pass
+
+        tienda = TiendaMuebles()
+        tienda.agregar_mueble(Banco("Banco", "Madera", "Café", 50))
+        # La tienda importa el servicio por otra ruta, se compara por ValueError
+        with pytest.raises(ValueError, match="no soportado"):
+            tienda.guardar_snapshot(tmp_path / "banco.snap")
+
+
+class TestTiendaDesdeSnapshot:
+    """Pruebas de la carga en una tienda modificable."""
+
+    def test_desde_snapshot(self, tienda, ruta):
+        """Probar que se recupera inventario, nombre y descuentos."""
+        copia = TiendaMuebles.desde_snapshot(ruta)
+
+        assert copia.nombre == tienda.nombre
+        assert nombres(copia.listar_muebles()) == nombres(tienda.listar_muebles())
+        assert copia.obtener_estadisticas()["descuentos_activos"] == {"Silla": 0.1}
+        silla = copia.listar_muebles()[0]
+        venta = copia.realizar_venta(silla)
+        assert venta["precio_final"] == round(silla.calcular_precio() * 0.9, 2)
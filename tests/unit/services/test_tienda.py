@@ -0,0 +1,913 @@
+"""
+Pruebas para el servicio TiendaMuebles.
+"""
+
+import json
+import os
+import random
+import sys
+import threading
+
+import pytest
+
+from src.models.categorias.asientos import Asiento
+from src.models.concretos.cama import Cama
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofa import Sofa
+from src.models.concretos.sofacama import SofaCama
+from src.services.reglas_precio import MotorPrecios
+from src.services.tienda import TiendaMuebles
+from tests.unit.services.test_columnar import generar_catalogo
+
+
+@pytest.fixture
+def tienda():
+    """Fixture para una tienda con un inventario pequeño."""
+    tienda = TiendaMuebles("Tienda Test")
+    tienda.agregar_mueble(Silla("Silla Clásica", "Madera", "Café", 100.0))
+    tienda.agregar_mueble(Mesa("Mesa Comedor", "Vidrio", "Negro", 300.0))
+    tienda.agregar_mueble(Cama("Cama Queen", " madera ", "Blanco", 500.0, tamaño="queen"))
+    tienda.agregar_mueble(Silla("Silla Oficina", "Metal", "Negro", 150.0))
+    return tienda
+
+
+class TestTiendaInventario:
+    """Pruebas de gestión del inventario."""
+
+    def test_agregar_mueble_duplicado(self, tienda):
+        """Probar que no se puede agregar dos veces el mismo mueble."""
+        silla = Silla("Silla Nueva", "Madera", "Café", 100.0)
+        tienda.agregar_mueble(silla)
+
+        assert tienda.agregar_mueble(silla).startswith("Error")
+        assert len(tienda._inventario) == 5
+
+
+class TestTiendaFiltrosIndexados:
+    """Pruebas de los filtros respaldados por índices."""
+
+    def test_filtrar_por_material_normaliza(self, tienda):
+        """Probar que el filtro por material ignora mayúsculas y espacios."""
+        resultados = tienda.filtrar_por_material("MADERA")
+
+        assert [m.nombre for m in resultados] == ["Silla Clásica", "Cama Queen"]
+
+    def test_filtrar_por_color(self, tienda):
+        """Probar el filtro por color."""
+        resultados = tienda.filtrar_por_color("negro")
+
+        assert [m.nombre for m in resultados] == ["Mesa Comedor", "Silla Oficina"]
+
+    @pytest.mark.parametrize("valor", ["", "   ", None])
+    def test_filtros_con_valor_vacio(self, tienda, valor):
+        """Probar que un valor vacío no devuelve resultados."""
+        assert tienda.filtrar_por_material(valor) == []
+        assert tienda.filtrar_por_color(valor) == []
+
+    def test_venta_actualiza_indices(self, tienda):
+        """Probar que vender un mueble lo elimina de los índices."""
+        silla = tienda.filtrar_por_material("metal")[0]
+        tienda.realizar_venta(silla, "Cliente")
+
+        assert tienda.filtrar_por_material("metal") == []
+        assert [m.nombre for m in tienda.filtrar_por_color("negro")] == ["Mesa Comedor"]
+
+
+class TestTiendaFiltroPrecio:
+    """Pruebas del filtro por rango de precio."""
+
+    def test_filtrar_por_precio_ordenado(self, tienda):
+        """Probar que los resultados vienen ordenados por precio."""
+        resultados = tienda.filtrar_por_precio(0, float("inf"))
+        precios = [m.calcular_precio() for m in resultados]
+
+        assert len(resultados) == 4
+        assert precios == sorted(precios)
+
+    def test_filtrar_por_precio_limites_inclusivos(self, tienda):
+        """Probar que los límites del rango son inclusivos."""
+        silla = tienda.buscar_muebles_por_nombre("Clásica")[0]
+        precio = silla.calcular_precio()
+
+        assert silla in tienda.filtrar_por_precio(precio, precio)
+
+    def test_filtrar_por_precio_minimo_negativo(self, tienda):
+        """Probar que un mínimo negativo se trata como cero."""
+        assert len(tienda.filtrar_por_precio(-100)) == 4
+
+    def test_venta_actualiza_indice_precios(self, tienda):
+        """Probar que un mueble vendido ya no aparece en el filtro."""
+        silla = tienda.buscar_muebles_por_nombre("Oficina")[0]
+        tienda.realizar_venta(silla)
+
+        assert silla not in tienda.filtrar_por_precio()
+
+
+class TestTiendaBusquedaNombre:
+    """Pruebas de búsqueda por nombre."""
+
+    def test_buscar_parcial(self, tienda):
+        """Probar búsqueda parcial sin distinguir mayúsculas."""
+        resultados = tienda.buscar_muebles_por_nombre("  SILLA ")
+
+        assert [m.nombre for m in resultados] == ["Silla Clásica", "Silla Oficina"]
+
+    @pytest.mark.parametrize("termino", ["", "   ", None])
+    def test_buscar_termino_vacio(self, tienda, termino):
+        """Probar que un término vacío no devuelve resultados."""
+        assert tienda.buscar_muebles_por_nombre(termino) == []
+
+    def test_venta_actualiza_indice_nombres(self, tienda):
+        """Probar que un mueble vendido ya no aparece en la búsqueda."""
+        cama = tienda.buscar_muebles_por_nombre("cama")[0]
+        tienda.realizar_venta(cama)
+
+        assert tienda.buscar_muebles_por_nombre("cama") == []
+
+
+class TestTiendaVentas:
+    """Pruebas de ventas."""
+
+    def test_listar_muebles_orden_estable(self, tienda):
+        """Probar que el listado conserva el orden de inserción."""
+        nombres = [m.nombre for m in tienda.listar_muebles()]
+
+        assert nombres == ["Silla Clásica", "Mesa Comedor", "Cama Queen", "Silla Oficina"]
+
+    def test_realizar_venta(self, tienda):
+        """Probar una venta simple."""
+        mesa = tienda.listar_muebles()[1]
+        venta = tienda.realizar_venta(mesa, "Ana")
+
+        assert venta["cliente"] == "Ana"
+        assert venta["precio_final"] == round(mesa.calcular_precio(), 2)
+        assert mesa not in tienda.listar_muebles()
+
+    def test_vender_mueble_ya_vendido(self, tienda):
+        """Probar que no se puede vender dos veces el mismo mueble."""
+        mesa = tienda.listar_muebles()[1]
+        tienda.realizar_venta(mesa)
+
+        assert "error" in tienda.realizar_venta(mesa)
+
+
+class TestTiendaVentasPorLote:
+    """Pruebas de la venta de varios muebles a la vez."""
+
+    def test_equivale_a_ventas_individuales(self, tienda):
+        """Probar que el lote deja la tienda igual que vender de a uno."""
+        otra = TiendaMuebles("Tienda Test")
+        for mueble in tienda.listar_muebles():
+            otra.agregar_mueble(mueble)
+        tienda.aplicar_descuento("Silla", 10)
+        otra.aplicar_descuento("Silla", 10)
+        silla, mesa, _, oficina = tienda.listar_muebles()
+
+        resultados = tienda.realizar_ventas([silla, oficina, mesa], "Ana")
+        individuales = [otra.realizar_venta(m, "Ana") for m in (silla, oficina, mesa)]
+
+        for lote, individual in zip(resultados, individuales):
+            lote.pop("fecha")
+            individual.pop("fecha")
+            assert lote == individual
+        assert tienda.obtener_estadisticas() == otra.obtener_estadisticas()
+        assert tienda.filtrar_por_precio() == otra.filtrar_por_precio()
+        assert tienda.buscar_muebles_por_nombre("silla") == []
+
+    def test_una_sola_fecha(self, tienda):
+        """Probar que todo el lote comparte la misma marca de tiempo."""
+        resultados = tienda.realizar_ventas(tienda.listar_muebles())
+
+        assert len({venta["fecha"] for venta in resultados}) == 1
+
+    def test_resultados_por_mueble(self, tienda):
+        """Probar errores individuales sin cancelar el resto del lote."""
+        silla, mesa, cama, _ = tienda.listar_muebles()
+        tienda.realizar_venta(mesa)
+        ajena = Silla("Ajena", "Madera", "Café", 50.0)
+
+        resultados = tienda.realizar_ventas([silla, mesa, silla, ajena, cama])
+
+        assert ["error" in r for r in resultados] == [False, True, True, True, False]
+        assert tienda.obtener_estadisticas()["ventas_realizadas"] == 3
+        assert [m.nombre for m in tienda.listar_muebles()] == ["Silla Oficina"]
+
+    def test_lote_vacio(self, tienda):
+        """Probar que un lote vacío no cambia nada."""
+        assert tienda.realizar_ventas([]) == []
+        assert tienda.obtener_estadisticas()["ventas_realizadas"] == 0
+
+    def test_lote_grande(self):
+        """Probar un lote que supera el umbral de reconstrucción del índice."""
+        tienda = TiendaMuebles(motor_columnar=True)
+        muebles = [Mesa(f"Mesa {i}", "Roble", "Natural", 100.0 + i % 7) for i in range(500)]
+        tienda.agregar_muebles(muebles)
+
+        resultados = tienda.realizar_ventas(muebles[::2])
+
+        assert all("error" not in r for r in resultados)
+        restantes = muebles[1::2]
+        assert tienda.listar_muebles() == restantes
+        assert sorted(map(id, tienda.filtrar_por_precio())) == sorted(map(id, restantes))
+        assert tienda.calcular_valor_inventario() == round(
+            sum(m.calcular_precio() for m in restantes), 2
+        )
+
+
+class TestTiendaEstadisticas:
+    """Pruebas de las estadísticas de la tienda."""
+
+    def test_estadisticas_coinciden_con_recalculo(self, tienda):
+        """Probar que el agregado coincide con recalcular desde cero."""
+        tienda.realizar_venta(tienda.listar_muebles()[0])
+        stats = tienda.obtener_estadisticas()
+        muebles = tienda.listar_muebles()
+
+        assert stats["total_muebles"] == len(muebles)
+        assert stats["valor_inventario"] == round(sum(m.calcular_precio() for m in muebles), 2)
+        assert stats["tipos_muebles"] == {"Mesa": 1, "Cama": 1, "Silla": 1}
+        assert stats["ventas_realizadas"] == 1
+        assert stats["total_muebles_vendidos"] == 1
+        assert stats["total_comedores"] == 0
+
+    def test_estadisticas_reflejan_descuentos(self, tienda):
+        """Probar que los descuentos aplicados aparecen en las estadísticas."""
+        tienda.aplicar_descuento("sillas", 10)
+
+        assert tienda.obtener_estadisticas()["descuentos_activos"] == {"Silla": 0.1}
+
+    def test_descuento_por_categoria_heredado(self, tienda):
+        """Probar que un descuento a una categoría se aplica a sus subclases."""
+        sofacama = SofaCama("Sofá Cama", "Tela", "Gris", 900)
+        tienda.agregar_mueble(sofacama)
+
+        assert tienda.aplicar_descuento("Camas", 20).endswith("'Cama'")
+        venta = tienda.realizar_venta(sofacama)
+
+        assert venta["descuento"] == 20
+        assert venta["precio_final"] == round(venta["precio_original"] * 0.8, 2)
+
+    def test_descuento_categoria_desconocida(self, tienda):
+        """Probar que una categoría inexistente se rechaza sin guardarse."""
+        assert tienda.aplicar_descuento("lámparas", 10).startswith("Error")
+        assert tienda.obtener_estadisticas()["descuentos_activos"] == {}
+
+    def test_alias_estadisticas(self, tienda):
+        """Probar que estadisticas() es equivalente a obtener_estadisticas()."""
+        assert tienda.estadisticas() == tienda.obtener_estadisticas()
+
+    def test_reporte_usa_estadisticas(self, tienda):
+        """Probar que el reporte incluye los totales."""
+        reporte = tienda.generar_reporte_inventario()
+
+        assert "Total de muebles: 4" in reporte
+        assert "- Silla: 2 unidades" in reporte
+
+
+class TestTiendaCambiosDespuesDelAlta:
+    """Pruebas de la reindexación de muebles modificados después de agregarlos."""
+
+    def test_cambio_de_precio_base(self, tienda):
+        """Probar que el índice de precios y el valor del inventario siguen al mueble."""
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        valor_antes = tienda.calcular_valor_inventario()
+        precio_antes = tienda.precio(silla)
+        silla.precio_base = 1000.0
+
+        assert silla not in tienda.filtrar_por_precio(0, 500)
+        assert tienda.filtrar_por_precio(900, 5000)[-1] is silla
+        assert tienda.mas_caros(1) == [silla]
+        assert tienda.calcular_valor_inventario() == pytest.approx(
+            valor_antes + tienda.precio(silla) - precio_antes
+        )
+        assert tienda.obtener_estadisticas()["valor_inventario"] == pytest.approx(
+            tienda.calcular_valor_inventario()
+        )
+
+    def test_cambio_de_material_y_color(self, tienda):
+        """Probar que el mueble cambia de grupo y conserva el orden de inserción."""
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        silla.material = "Metal"
+        silla.color = "Negro"
+
+        assert [m.nombre for m in tienda.filtrar_por_material("madera")] == ["Cama Queen"]
+        assert [m.nombre for m in tienda.filtrar_por_material("metal")] == [
+            "Silla Clásica",
+            "Silla Oficina",
+        ]
+        assert tienda.filtrar_por_color("negro")[0] is silla
+        assert tienda.consultar(material="madera", color="café") == []
+
+    def test_cambio_de_nombre(self, tienda):
+        """Probar que la búsqueda por nombre encuentra el nombre nuevo y no el viejo."""
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        silla.nombre = "Banco"
+
+        assert tienda.buscar_muebles_por_nombre("banco") == [silla]
+        assert tienda.buscar_muebles_por_nombre("clásica") == []
+        assert [m.nombre for m in tienda.buscar_muebles_por_nombre("silla")] == ["Silla Oficina"]
+
+    def test_mueble_vendido_no_afecta(self, tienda):
+        """Probar que modificar un mueble ya vendido no toca la tienda."""
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        tienda.realizar_venta(silla, "Cliente")
+        estadisticas = tienda.obtener_estadisticas()
+        silla.precio_base = 5000.0
+        silla.material = "Metal"
+
+        assert tienda.obtener_estadisticas() == estadisticas
+        assert silla not in tienda.filtrar_por_material("metal")
+
+    def test_mismo_mueble_en_dos_tiendas(self):
+        """Probar que ambas tiendas reindexan el mueble, también con el motor columnar."""
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        normal = TiendaMuebles("Normal")
+        columnar = TiendaMuebles("Columnar", motor_columnar=True)
+        for t in (normal, columnar):
+            t.agregar_mueble(silla)
+            t.calcular_valor_inventario()
+        silla.precio_base = 400.0
+
+        assert normal.calcular_valor_inventario() == pytest.approx(silla.calcular_precio())
+        assert columnar.calcular_valor_inventario() == pytest.approx(silla.calcular_precio())
+
+
+class TestTiendaMotorColumnar:
+    """Pruebas de la tienda con el motor columnar activado."""
+
+    def test_valor_y_tipos_con_motor_columnar(self):
+        """Probar que ambos modos producen los mismos resultados."""
+        muebles = [
+            Silla("Silla", "Madera", "Café", 100.0),
+            Mesa("Mesa", "Vidrio", "Negro", 300.0),
+            Cama("Cama", "Madera", "Blanco", 500.0),
+        ]
+        normal = TiendaMuebles("Normal")
+        columnar = TiendaMuebles("Columnar", motor_columnar=True)
+        for mueble in muebles:
+            normal.agregar_mueble(mueble)
+            columnar.agregar_mueble(mueble)
+        columnar.realizar_venta(muebles[2])
+        normal.realizar_venta(muebles[2])
+
+        assert columnar.calcular_valor_inventario() == normal.calcular_valor_inventario()
+        assert columnar.obtener_muebles_por_tipo(Silla) == normal.obtener_muebles_por_tipo(Silla)
+        assert columnar.obtener_muebles_por_tipo(Cama) == []
+
+    def test_por_tipo_en_orden_de_insercion(self):
+        """Probar que el motor columnar no cambia el orden de obtener_muebles_por_tipo."""
+        muebles = [
+            (Silla if i % 3 else Sofa)(f"Asiento {i}", "Madera", "Café", 100.0 + i)
+            for i in range(60)
+        ]
+        normal = TiendaMuebles("Normal")
+        columnar = TiendaMuebles("Columnar", motor_columnar=True)
+        for tienda in (normal, columnar):
+            tienda.agregar_muebles(muebles)
+            tienda.realizar_ventas(muebles[::7])
+
+        assert [m.nombre for m in columnar.obtener_muebles_por_tipo(Asiento)] == [
+            m.nombre for m in normal.obtener_muebles_por_tipo(Asiento)
+        ]
+
+    def test_filtros_y_estadisticas_sobre_columnas(self):
+        """Probar que filtros y estadísticas del motor columnar coinciden con los índices."""
+        muebles = generar_catalogo(300)
+        normal = TiendaMuebles("Normal")
+        columnar = TiendaMuebles("Columnar", motor_columnar=True)
+        for tienda in (normal, columnar):
+            tienda.agregar_muebles(muebles)
+            tienda.realizar_ventas(muebles[::5])
+        muebles[1].material = "Roble"
+
+        for material in ("madera", "Roble", "Piedra"):
+            assert columnar.filtrar_por_material(material) == normal.filtrar_por_material(material)
+        assert columnar.filtrar_por_color(" gris") == normal.filtrar_por_color(" gris")
+        assert columnar.filtrar_por_precio(200, 900) == normal.filtrar_por_precio(200, 900)
+        esperadas = normal.obtener_estadisticas()
+        obtenidas = columnar.obtener_estadisticas()
+        assert obtenidas["valor_inventario"] == pytest.approx(esperadas["valor_inventario"])
+        del esperadas["valor_inventario"], obtenidas["valor_inventario"]
+        assert obtenidas == esperadas
+
+
+class TestTiendaReglasPrecio:
+    """Pruebas de la tienda con motor de reglas de precio."""
+
+    @staticmethod
+    def reglas_king(motor, recargo):
+        reglas = motor.reglas()
+        reglas["Cama"]["recargos"][0]["valores"]["king"] = recargo
+        return reglas
+
+    def test_sin_reglas_propias_coincide_con_calcular_precio(self):
+        """Probar que las reglas predeterminadas no cambian ningún precio."""
+        cama = Cama("Cama", "Madera", "Blanco", 500.0, "king")
+        tienda = TiendaMuebles("Reglas", motor_precios=MotorPrecios())
+
+        assert tienda.precio(cama) == cama.calcular_precio()
+
+    def test_cargar_reglas_revalua_inventario(self):
+        """Probar que nuevas reglas actualizan valor, filtros, estadísticas y ventas."""
+        motor = MotorPrecios()
+        cama = Cama("Cama", "Madera", "Blanco", 500.0, "king")
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        tienda = TiendaMuebles("Reglas", motor_columnar=True, motor_precios=motor)
+        tienda.agregar_muebles([cama, silla])
+        valor = tienda.calcular_valor_inventario()
+
+        tienda.cargar_reglas(self.reglas_king(motor, 1000))
+
+        assert tienda.precio(cama) == cama.calcular_precio() + 400
+        assert tienda.calcular_valor_inventario() == valor + 400
+        assert tienda.consultar(precio_min=cama.calcular_precio() + 400) == [cama]
+        assert tienda.obtener_estadisticas()["valor_inventario"] == valor + 400
+        venta = tienda.realizar_venta(cama)
+        assert venta["precio_original"] == cama.calcular_precio() + 400
+
+    def test_recargar_reglas_desde_archivo(self, tmp_path):
+        """Probar que recargar lee el archivo solo cuando cambió."""
+        ruta = tmp_path / "reglas.json"
+        ruta.write_text(json.dumps(MotorPrecios().reglas()), encoding="utf-8")
+        motor = MotorPrecios.desde_archivo(ruta)
+        cama = Cama("Cama", "Madera", "Blanco", 500.0, "king")
+        tienda = TiendaMuebles("Reglas", motor_precios=motor)
+        tienda.agregar_mueble(cama)
+
+        assert tienda.recargar_reglas() is False
+        ruta.write_text(json.dumps(self.reglas_king(motor, 1000)), encoding="utf-8")
+        os.utime(ruta, ns=(0, 0))
+        assert tienda.recargar_reglas() is True
+        assert tienda.calcular_valor_inventario() == cama.calcular_precio() + 400
+
+    def test_cargar_reglas_sin_motor(self):
+        """Probar que una tienda sin motor de precios rechaza reglas."""
+        with pytest.raises(ValueError):
+            TiendaMuebles("Simple").cargar_reglas({})
+
+
+class TestTiendaConsultaCompuesta:
+    """Pruebas de consultar y explicar_consulta."""
+
+    def test_equivale_a_intersectar_filtros(self):
+        """Probar contra la intersección manual de los filtros sobre datos aleatorios."""
+        rng = random.Random(18)
+        clases = [Silla, Mesa, Cama]
+        materiales = ["Madera", "Metal", "Vidrio"]
+        colores = ["Negro", "Blanco", "Café", "Gris"]
+        tienda = TiendaMuebles()
+        tienda.agregar_muebles(
+            rng.choice(clases)(
+                f"{rng.choice(['Clásica', 'Moderna', 'Rústica'])} {i}",
+                rng.choice(materiales),
+                rng.choice(colores),
+                float(rng.randint(50, 900)),
+            )
+            for i in range(300)
+        )
+        tienda.realizar_ventas(tienda.listar_muebles()[::7])
+
+        for _ in range(100):
+            criterios = {
+                "nombre": rng.choice([None, "clás", "moderna 1", "ca", "xyz"]),
+                "tipo": rng.choice([None, Silla, Cama]),
+                "material": rng.choice([None, "MADERA", "metal"]),
+                "color": rng.choice([None, "negro", " gris "]),
+                "precio_min": rng.choice([None, 100, 400]),
+                "precio_max": rng.choice([None, 300, 800]),
+            }
+            esperados = [
+                m
+                for m in tienda.listar_muebles()
+                if (criterios["nombre"] is None or criterios["nombre"] in m.nombre.lower())
+                and (criterios["tipo"] is None or isinstance(m, criterios["tipo"]))
+                and (
+                    criterios["material"] is None
+                    or m.material.lower() == criterios["material"].strip().lower()
+                )
+                and (
+                    criterios["color"] is None
+                    or m.color.lower() == criterios["color"].strip().lower()
+                )
+                and (criterios["precio_min"] or 0) <= m.calcular_precio()
+                and (
+                    criterios["precio_max"] is None
+                    or m.calcular_precio() <= criterios["precio_max"]
+                )
+            ]
+            assert tienda.consultar(**criterios) == esperados, criterios
+
+    def test_explicar_elige_indice_mas_selectivo(self, tienda):
+        """Probar que el plan usa el índice con menos candidatos."""
+        plan = tienda.explicar_consulta(nombre="silla", color="blanco", precio_max=1000)
+
+        assert plan.acceso.campo == "color"
+        assert plan.acceso.estimacion == 1
+        assert [p.campo for p in plan.filtros] == ["nombre", "precio"]
+        assert str(plan).startswith("ACCESO índice color")
+        assert tienda.consultar(nombre="silla", color="blanco", precio_max=1000) == []
+
+    def test_sin_criterios_y_tras_una_venta(self, tienda):
+        """Probar la consulta vacía y que las ventas se reflejan en el resultado."""
+        assert tienda.consultar() == tienda.listar_muebles()
+        silla = tienda.consultar(tipo=Silla, color="negro")[0]
+        tienda.realizar_venta(silla)
+
+        assert tienda.consultar(tipo=Silla, color="negro") == []
+        assert tienda.explicar_consulta(tipo=Silla).acceso.estimacion == 1
+
+
+class TestTiendaPaginacion:
+    """Pruebas de los generadores iter_* y de la paginación por cursor."""
+
+    def test_generadores_coinciden_con_listas(self, tienda):
+        """Probar que cada iter_* produce lo mismo que su versión en lista."""
+        assert list(tienda.iter_muebles()) == tienda.listar_muebles()
+        assert list(tienda.iter_buscar_muebles_por_nombre("silla")) == (
+            tienda.buscar_muebles_por_nombre("silla")
+        )
+        assert list(tienda.iter_filtrar_por_precio(120, 600)) == tienda.filtrar_por_precio(120, 600)
+        assert list(tienda.iter_filtrar_por_material("MADERA")) == (
+            tienda.filtrar_por_material("MADERA")
+        )
+        assert list(tienda.iter_filtrar_por_color("negro")) == tienda.filtrar_por_color("negro")
+        assert list(tienda.iter_muebles_por_tipo(Silla)) == tienda.obtener_muebles_por_tipo(Silla)
+        assert list(tienda.iter_buscar_muebles_por_nombre("  ")) == []
+        assert list(tienda.iter_filtrar_por_material(None)) == []
+
+    def test_generador_es_perezoso(self, tienda):
+        """Probar que el generador pide páginas a medida que se consume."""
+        paginas = []
+        original = tienda.paginar
+
+        def espiar(*args, **kwargs):
+            paginas.append(args[1])
+            return original(*args, **kwargs)
+
+        tienda.paginar = espiar
+        generador = tienda.iter_consultar(tamaño_pagina=1)
+        assert next(generador).nombre == "Silla Clásica"
+        assert paginas == [1]
+        assert len(list(generador)) == 3
+        assert paginas == [1, 2, 4]
+
+    @pytest.mark.parametrize("por_precio", [False, True])
+    def test_cursor_estable_con_altas_y_ventas(self, por_precio):
+        """Probar que vender y agregar entre páginas no repite ni saltea muebles."""
+        rng = random.Random(19)
+        tienda = TiendaMuebles()
+        tienda.agregar_muebles(
+            Silla(f"Silla {i}", "Madera", "Café", float(rng.randint(50, 500))) for i in range(100)
+        )
+        vistos = []
+        vendidos = []
+        pagina, cursor = tienda.paginar(limite=7, por_precio=por_precio)
+        while True:
+            vistos.extend(pagina)
+            ids_vistos = {id(m) for m in vistos}
+            pendientes = [m for m in tienda.listar_muebles() if id(m) not in ids_vistos]
+            if pendientes:
+                vendido = rng.choice(pendientes)
+                tienda.realizar_venta(vendido)
+                vendidos.append(vendido)
+            tienda.agregar_mueble(Silla("Nueva", "Metal", "Gris", float(rng.randint(50, 500))))
+            if cursor is None:
+                break
+            pagina, cursor = tienda.paginar(cursor, 7, por_precio=por_precio)
+
+        ids = [id(m) for m in vistos]
+        assert len(ids) == len(set(ids))
+        assert not {id(m) for m in vendidos} & set(ids)
+        originales = {id(m) for m in vistos if m.nombre != "Nueva"}
+        assert len(originales) + sum(m.nombre != "Nueva" for m in vendidos) == 100
+        if por_precio:
+            precios = [m.calcular_precio() for m in vistos]
+            assert precios == sorted(precios)
+
+    def test_paginar_con_criterios(self, tienda):
+        """Probar páginas de una consulta compuesta y el final de la paginación."""
+        pagina, cursor = tienda.paginar(limite=1, color="negro")
+        assert [m.nombre for m in pagina] == ["Mesa Comedor"]
+        pagina, cursor = tienda.paginar(cursor, 1, color="negro")
+        assert [m.nombre for m in pagina] == ["Silla Oficina"]
+        assert tienda.paginar(cursor, 1, color="negro") == ([], None)
+
+    def test_cursor_invalido(self, tienda):
+        """Probar que un cursor de otro orden o un límite inválido se rechazan."""
+        _, cursor = tienda.paginar(limite=1)
+        with pytest.raises(ValueError):
+            tienda.paginar(cursor, 1, por_precio=True)
+        with pytest.raises(ValueError):
+            tienda.paginar(limite=0)
+
+
+class TestTiendaTopK:
+    """Pruebas de los muebles más baratos y más caros."""
+
+    @pytest.fixture
+    def grande(self):
+        """Tienda con precios repetidos, un material raro y uno frecuente."""
+        rng = random.Random(20)
+        tienda = TiendaMuebles()
+        tienda.agregar_muebles(
+            rng.choice([Silla, Mesa, Cama])(
+                f"Mueble {i}",
+                "Roble" if i % 50 == 0 else rng.choice(["Madera", "Metal"]),
+                rng.choice(["Negro", "Blanco"]),
+                float(rng.randint(50, 300)),
+            )
+            for i in range(600)
+        )
+        return tienda
+
+    @staticmethod
+    def esperado(tienda, k, descendente, filtro=lambda m: True):
+        """Referencia: ordenar todo el rango de precios y cortar."""
+        muebles = [m for m in tienda.filtrar_por_precio() if filtro(m)]
+        if descendente:
+            muebles.reverse()
+        return muebles[:k]
+
+    @pytest.mark.parametrize("k", [0, 1, 5, 40, 1000])
+    def test_sin_filtros(self, grande, k):
+        """Probar los extremos globales, incluidos k nulo y mayor al inventario."""
+        assert grande.mas_baratos(k) == self.esperado(grande, k, False)
+        assert grande.mas_caros(k) == self.esperado(grande, k, True)
+
+    @pytest.mark.parametrize(
+        "criterios, filtro",
+        [
+            ({"material": "roble"}, lambda m: m.material == "Roble"),
+            ({"material": "madera"}, lambda m: m.material == "Madera"),
+            ({"tipo": Silla}, lambda m: isinstance(m, Silla)),
+            (
+                {"tipo": Cama, "material": "metal", "color": "negro"},
+                lambda m: isinstance(m, Cama) and m.material == "Metal" and m.color == "Negro",
+            ),
+            ({"color": "verde"}, lambda m: False),
+        ],
+    )
+    @pytest.mark.parametrize("k", [1, 3, 30])
+    def test_con_filtros(self, grande, criterios, filtro, k):
+        """Probar con filtros raros (montículo) y frecuentes (recorrido por precio)."""
+        assert grande.mas_baratos(k, **criterios) == self.esperado(grande, k, False, filtro)
+        assert grande.mas_caros(k, **criterios) == self.esperado(grande, k, True, filtro)
+
+    def test_por_tipo(self, grande):
+        """Probar los extremos de cada clase concreta."""
+        baratos = grande.mas_baratos_por_tipo(3)
+        caros = grande.mas_caros_por_tipo(2)
+
+        assert set(baratos) == {"Silla", "Mesa", "Cama"}
+        assert baratos["Mesa"] == self.esperado(grande, 3, False, lambda m: type(m) is Mesa)
+        assert caros["Cama"] == self.esperado(grande, 2, True, lambda m: type(m) is Cama)
+        assert grande.mas_baratos_por_tipo(0) == {}
+
+    def test_por_tipo_con_clase_rara(self, grande):
+        """Probar la mezcla de recorrido (clases frecuentes) y montículo (clase rara)."""
+        sofa = Sofa("Sofá único", "Tela", "Gris", 999.0)
+        grande.agregar_mueble(sofa)
+
+        for k in (1, 4):
+            caros = grande.mas_caros_por_tipo(k)
+            assert caros["Sofa"] == [sofa]
+            assert caros["Silla"] == self.esperado(grande, k, True, lambda m: type(m) is Silla)
+
+    def test_refleja_ventas(self, tienda):
+        """Probar que un mueble vendido deja de aparecer."""
+        barata = tienda.mas_baratos(1)[0]
+        tienda.realizar_venta(barata)
+
+        assert tienda.mas_baratos(1)[0].nombre == "Silla Oficina"
+        assert [m.nombre for m in tienda.mas_caros(1, tipo=Silla)] == ["Silla Oficina"]
+
+
+class TestTiendaAltaPorLotes:
+    """Pruebas del alta de muebles por lotes."""
+
+    def test_agregar_muebles_resumen(self):
+        """Probar el resumen de aceptados y rechazados."""
+        tienda = TiendaMuebles()
+        silla = Silla("Silla", "Madera", "Café", 100.0)
+        resumen = tienda.agregar_muebles([silla, None, silla, Silla("Gratis", "Pino", "Café", 0)])
+
+        assert resumen["aceptados"] == 1
+        assert resumen["rechazados"] == 3
+        assert [posicion for posicion, _ in resumen["errores"]] == [1, 2, 3]
+
+    def test_lote_equivale_a_altas_individuales(self):
+        """Probar que el lote deja índices y estadísticas igual que las altas una a una."""
+        muebles = [
+            Silla(f"Silla {i}", ["Madera", "Metal"][i % 2], "Café", 100.0 + i) for i in range(50)
+        ]
+        muebles += [Mesa(f"Mesa {i}", "Vidrio", "Negro", 300.0 - i) for i in range(20)]
+        por_lote = TiendaMuebles()
+        individual = TiendaMuebles()
+        por_lote.agregar_mueble(muebles[0])
+        individual.agregar_mueble(muebles[0])
+        por_lote.agregar_muebles(iter(muebles[1:]))
+        for mueble in muebles[1:]:
+            individual.agregar_mueble(mueble)
+
+        assert por_lote.listar_muebles() == individual.listar_muebles()
+        assert por_lote.filtrar_por_precio(120, 290) == individual.filtrar_por_precio(120, 290)
+        assert por_lote.filtrar_por_material("metal") == individual.filtrar_por_material("metal")
+        assert por_lote.buscar_muebles_por_nombre("mesa 1") == individual.buscar_muebles_por_nombre(
+            "mesa 1"
+        )
+        assert por_lote.obtener_estadisticas() == individual.obtener_estadisticas()
+
+    def test_lote_vacio(self):
+        """Probar un lote vacío."""
+        tienda = TiendaMuebles()
+
+        assert tienda.agregar_muebles([]) == {"aceptados": 0, "rechazados": 0, "errores": []}
+
+
+class TestTiendaConcurrente:
+    """Pruebas del modo concurrente."""
+
+    @pytest.fixture(autouse=True)
+    def cambios_frecuentes(self):
+        """Forzar cambios de hilo frecuentes para provocar intercalados."""
+        intervalo = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        yield
+        sys.setswitchinterval(intervalo)
+
+    def test_sin_ventas_dobles(self, tmp_path):
+        """Probar que con varios vendedores cada unidad se vende una sola vez."""
+        tienda = TiendaMuebles(concurrente=True)
+        # El diario hace E/S dentro de la venta y amplía la ventana de carrera
+        tienda.abrir_diario(tmp_path / "ventas.jsonl")
+        muebles = [Silla(f"Silla {i}", "Madera", "Café", 100.0 + i) for i in range(300)]
+        tienda.agregar_muebles(muebles)
+        ventas = []
+        errores_lectura = []
+        terminado = threading.Event()
+
+        def vendedor(semilla):
+            orden = muebles[:]
+            random.Random(semilla).shuffle(orden)
+            for mueble in orden:
+                venta = tienda.realizar_venta(mueble, f"Vendedor {semilla}")
+                if "error" not in venta:
+                    ventas.append(venta["mueble"])
+
+        def lector():
+            while not terminado.is_set():
+                try:
+                    resultado = tienda.filtrar_por_precio(150, 250)
+                    assert all(150 <= m.calcular_precio() <= 250 for m in resultado)
+                    assert len(set(map(id, resultado))) == len(resultado)
+                    tienda.buscar_muebles_por_nombre("silla 1")
+                    tienda.filtrar_por_material("madera")
+                except Exception as e:
+                    errores_lectura.append(e)
+
+        lectores = [threading.Thread(target=lector) for _ in range(2)]
+        vendedores = [threading.Thread(target=vendedor, args=(i,)) for i in range(8)]
+        for hilo in lectores + vendedores:
+            hilo.start()
+        for hilo in vendedores:
+            hilo.join()
+        terminado.set()
+        for hilo in lectores:
+            hilo.join()
+
+        assert errores_lectura == []
+        assert sorted(ventas) == sorted(m.nombre for m in muebles)
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 0
+        assert estadisticas["ventas_realizadas"] == 300
+        assert estadisticas["valor_inventario"] == 0
+        assert tienda.filtrar_por_precio() == []
+        tienda.cerrar_diario()
+        assert len((tmp_path / "ventas.jsonl").read_text(encoding="utf-8").splitlines()) == 300
+
+    def test_valor_columnar_durante_altas(self):
+        """Probar que leer el valor con el motor columnar siempre ve lotes completos."""
+        tienda = TiendaMuebles(motor_columnar=True, concurrente=True)
+        lote = 200
+        precio = Silla("Silla", "Madera", "Café", 100.0).calcular_precio()
+        valores = []
+        terminado = threading.Event()
+
+        def lector():
+            while not terminado.is_set():
+                valores.append(tienda.calcular_valor_inventario())
+
+        hilos = [threading.Thread(target=lector) for _ in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for i in range(50):
+            tienda.agregar_muebles(
+                Silla(f"Silla {i}-{j}", "Madera", "Café", 100.0) for j in range(lote)
+            )
+        terminado.set()
+        for hilo in hilos:
+            hilo.join()
+
+        assert valores
+        assert all(round(valor / (precio * lote), 6).is_integer() for valor in valores)
+        assert tienda.calcular_valor_inventario() == pytest.approx(50 * lote * precio)
+
+    def test_consultas_por_precio_durante_ventas(self):
+        """Probar que leer por precio mientras se vende no falla ni devuelve vendidos."""
+        tienda = TiendaMuebles(concurrente=True)
+        muebles = [
+            Silla(f"Silla {i}", "Madera" if i % 2 else "Metal", "Café", 100.0 + i % 400)
+            for i in range(20000)
+        ]
+        tienda.agregar_muebles(muebles)
+        errores_lectura = []
+        terminado = threading.Event()
+
+        def vendedor():
+            for mueble in muebles[1::2]:
+                tienda.realizar_venta(mueble)
+            terminado.set()
+
+        def lector():
+            while not terminado.is_set():
+                try:
+                    # Material como acceso y precio como filtro sobre cada candidato
+                    resultado = tienda.consultar(material="madera", precio_min=150, precio_max=400)
+                    assert all(m.material == "Madera" for m in resultado)
+                except Exception as e:
+                    errores_lectura.append(e)
+                    return
+
+        hilos = [threading.Thread(target=lector) for _ in range(3)]
+        hilos.append(threading.Thread(target=vendedor))
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert errores_lectura == []
+        assert len(tienda.consultar(precio_min=0)) == 10000
+
+    def test_top_k_durante_ventas(self):
+        """Probar que los k extremos se calculan mientras se venden los candidatos."""
+        tienda = TiendaMuebles(concurrente=True)
+        muebles = [Silla(f"Silla {i}", "Metal", "Negro", 100.0 + i % 300) for i in range(20000)]
+        # Grupos poco frecuentes: se seleccionan con un montículo sobre sus candidatos
+        robles = [Silla(f"Roble {i}", "Roble", "Natural", 50.0 + i) for i in range(100)]
+        mesas = [Mesa(f"Mesa {i}", "Vidrio", "Negro", 200.0 + i) for i in range(100)]
+        tienda.agregar_muebles(muebles + robles + mesas)
+        errores_lectura = []
+        terminado = threading.Event()
+
+        def vendedor():
+            for roble, mesa in zip(robles, mesas):
+                tienda.realizar_venta(roble)
+                tienda.realizar_venta(mesa)
+            terminado.set()
+
+        def lector():
+            while not terminado.is_set():
+                try:
+                    baratos = tienda.mas_baratos(5, material="roble")
+                    precios = [m.calcular_precio() for m in baratos]
+                    assert precios == sorted(precios)
+                    assert all(m.material == "Roble" for m in baratos)
+                    tienda.mas_caros_por_tipo(5)
+                except Exception as e:
+                    errores_lectura.append(e)
+                    return
+
+        hilos = [threading.Thread(target=lector) for _ in range(3)]
+        hilos.append(threading.Thread(target=vendedor))
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert errores_lectura == []
+        assert tienda.mas_baratos(5, material="roble") == []
+        assert "Mesa" not in tienda.mas_caros_por_tipo(5)
+
+    def test_altas_concurrentes(self):
+        """Probar altas individuales desde varios hilos."""
+        tienda = TiendaMuebles(concurrente=True)
+
+        def agregar(inicio):
+            for i in range(inicio, inicio + 100):
+                tienda.agregar_mueble(Mesa(f"Mesa {i}", "Roble", "Natural", 200.0 + i))
+
+        hilos = [threading.Thread(target=agregar, args=(i * 100,)) for i in range(4)]
+        for hilo in hilos:
+            hilo.start()
+        for hilo in hilos:
+            hilo.join()
+
+        assert len(tienda.listar_muebles()) == 400
+        assert len(tienda.filtrar_por_precio()) == 400
+        assert tienda.obtener_estadisticas()["total_muebles"] == 400
+
+    def test_modo_por_defecto(self, tienda):
+        """Probar que por defecto la tienda no usa candados por mueble."""
+        assert not tienda.concurrente
+        assert tienda._candados_venta is None
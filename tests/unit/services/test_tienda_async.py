@@ -0,0 +1,165 @@
+"""
+Pruebas para la fachada asyncio de la tienda.
+"""
+
+import asyncio
+import threading
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.tienda import TiendaMuebles
+from src.services.tienda_async import AsyncTiendaMuebles
+
+
+@pytest.fixture
+def tienda():
+    """Fixture con una tienda concurrente pequeña."""
+    tienda = TiendaMuebles("Tienda Async", concurrente=True)
+    tienda.agregar_muebles(
+        [
+            Silla("Silla Clásica", "Madera", "Café", 100.0),
+            Mesa("Mesa Comedor", "Vidrio", "Negro", 300.0),
+            Silla("Silla Oficina", "Metal", "Negro", 150.0),
+        ]
+    )
+    return tienda
+
+
+def ejecutar(corrutina):
+    return asyncio.run(corrutina)
+
+
+class TestAsyncTiendaMuebles:
+    """Pruebas de las operaciones asíncronas."""
+
+    def test_consultas(self, tienda):
+        """Probar que las consultas coinciden con la tienda síncrona."""
+
+        async def escenario():
+            async with AsyncTiendaMuebles(tienda) as servicio:
+                return (
+                    await servicio.buscar_muebles_por_nombre("silla"),
+                    await servicio.filtrar_por_precio(0, 200),
+                    await servicio.filtrar_por_color("negro"),
+                    await servicio.calcular_valor_inventario(),
+                    await servicio.generar_reporte_inventario(),
+                )
+
+        nombres, precio, color, valor, reporte = ejecutar(escenario())
+
+        assert nombres == tienda.buscar_muebles_por_nombre("silla")
+        assert precio == tienda.filtrar_por_precio(0, 200)
+        assert color == tienda.filtrar_por_color("negro")
+        assert valor == tienda.calcular_valor_inventario()
+        assert reporte == tienda.generar_reporte_inventario()
+
+    def test_ventas_concurrentes(self, tienda):
+        """Probar que muchas ventas simultáneas venden cada unidad una vez."""
+        muebles = tienda.listar_muebles()
+
+        async def escenario():
+            async with AsyncTiendaMuebles(tienda, max_hilos=8) as servicio:
+                ventas = await asyncio.gather(
+                    *(servicio.realizar_venta(m, "Ana") for m in muebles * 20)
+                )
+                return ventas, await servicio.obtener_estadisticas()
+
+        ventas, estadisticas = ejecutar(escenario())
+
+        assert sum("error" not in venta for venta in ventas) == 3
+        assert estadisticas["ventas_realizadas"] == 3
+        assert estadisticas["total_muebles"] == 0
+
+    def test_lecturas_identicas_se_agrupan(self, tienda):
+        """Probar que las lecturas idénticas en curso se ejecutan una vez."""
+        llamadas = []
+        liberar = threading.Event()
+        original = tienda.buscar_muebles_por_nombre
+
+        def lenta(nombre):
+            llamadas.append(nombre)
+            liberar.wait(5)
+            return original(nombre)
+
+        tienda.buscar_muebles_por_nombre = lenta
+
+        async def escenario():
+            async with AsyncTiendaMuebles(tienda) as servicio:
+                tareas = [
+                    asyncio.ensure_future(servicio.buscar_muebles_por_nombre("silla"))
+                    for _ in range(1000)
+                ]
+                otra = asyncio.ensure_future(servicio.buscar_muebles_por_nombre("mesa"))
+                await asyncio.sleep(0.05)
+                liberar.set()
+                resultados = await asyncio.gather(*tareas)
+                return resultados, await otra, servicio.lecturas_agrupadas
+
+        resultados, mesa, agrupadas = ejecutar(escenario())
+
+        assert sorted(llamadas) == ["mesa", "silla"]
+        assert agrupadas == 999
+        assert all(len(r) == 2 for r in resultados)
+        # Cada llamador recibe su propia lista
+        assert resultados[0] is not resultados[1]
+        assert [m.nombre for m in mesa] == ["Mesa Comedor"]
+
+    def test_estadisticas_fuera_del_bucle(self, tienda):
+        """Probar que las estadísticas se calculan en el pool de hilos."""
+        hilos = []
+        original = tienda.obtener_estadisticas
+
+        def registrar():
+            hilos.append(threading.current_thread())
+            return original()
+
+        tienda.obtener_estadisticas = registrar
+
+        async def escenario():
+            async with AsyncTiendaMuebles(tienda) as servicio:
+                return await servicio.obtener_estadisticas()
+
+        estadisticas = ejecutar(escenario())
+
+        assert estadisticas["total_muebles"] == 3
+        assert hilos and threading.main_thread() not in hilos
+
+    def test_cancelar_no_afecta_a_otros(self, tienda):
+        """Probar que cancelar una lectura agrupada no cancela a las demás."""
+        liberar = threading.Event()
+        original = tienda.filtrar_por_precio
+
+        def lenta(*argumentos):
+            liberar.wait(5)
+            return original(*argumentos)
+
+        tienda.filtrar_por_precio = lenta
+
+        async def escenario():
+            async with AsyncTiendaMuebles(tienda) as servicio:
+                primera = asyncio.ensure_future(servicio.filtrar_por_precio(0, 500))
+                segunda = asyncio.ensure_future(servicio.filtrar_por_precio(0, 500))
+                await asyncio.sleep(0.01)
+                primera.cancel()
+                liberar.set()
+                return await segunda
+
+        assert len(ejecutar(escenario())) == 3
+
+    def test_requiere_modo_concurrente(self):
+        """Probar que se rechaza una tienda no concurrente."""
+        with pytest.raises(ValueError):
+            AsyncTiendaMuebles(TiendaMuebles())
+
+    def test_tienda_por_defecto(self):
+        """Probar la tienda creada por la fachada."""
+
+        async def escenario():
+            async with AsyncTiendaMuebles() as servicio:
+                await servicio.agregar_mueble(Silla("Silla", "Madera", "Café", 100.0))
+                return await servicio.listar_muebles(), servicio.tienda.concurrente
+
+        muebles, concurrente = ejecutar(escenario())
+        assert len(muebles) == 1 and concurrente
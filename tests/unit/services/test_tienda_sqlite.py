@@ -0,0 +1,370 @@
+"""
+Pruebas para el backend SQLite de la tienda.
+"""
+
+import gc
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.models.categorias.asientos import Asiento
+from src.models.concretos.cama import Cama
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.models.concretos.sofacama import SofaCama
+from src.models.precio_cache import _observadores
+from src.services.reglas_precio import MotorPrecios
+from src.services.tienda import TiendaMuebles
+from src.services.tienda_sqlite import TiendaSQLite
+
+
+def poblar(tienda):
+    """Agrega el mismo catálogo que usan las pruebas de TiendaMuebles."""
+    return tienda.agregar_muebles(
+        [
+            Silla("Silla Clásica", "Madera", "Café", 100),
+            Mesa("Mesa Comedor", "Vidrio", "Negro", 300),
+            Cama("Cama Queen", " madera ", "Blanco", 500, "queen"),
+            Silla("Silla Oficina", "Metal", "Negro", 150),
+        ]
+    )
+
+
+@pytest.fixture
+def ruta(tmp_path):
+    """Fixture con la ruta de la base."""
+    return tmp_path / "tienda.db"
+
+
+@pytest.fixture
+def tienda(ruta):
+    """Fixture con la tienda SQLite poblada."""
+    tienda = TiendaSQLite(ruta, "Mueblería SQL")
+    poblar(tienda)
+    yield tienda
+    tienda.cerrar()
+
+
+def nombres(muebles):
+    return [m.nombre for m in muebles]
+
+
+class TestTiendaSQLiteConsultas:
+    """Pruebas de equivalencia con la tienda en memoria."""
+
+    @pytest.fixture
+    def memoria(self):
+        tienda = TiendaMuebles()
+        poblar(tienda)
+        return tienda
+
+    @pytest.mark.parametrize("termino", ["silla", "SILLA", "la", "  comedor ", "xyz", ""])
+    def test_buscar_por_nombre(self, tienda, memoria, termino):
+        """Probar la búsqueda por nombre con y sin trigramas."""
+        assert nombres(tienda.buscar_muebles_por_nombre(termino)) == nombres(
+            memoria.buscar_muebles_por_nombre(termino)
+        )
+
+    @pytest.mark.parametrize("rango", [(0, float("inf")), (150, 400), (-10, 100), (400, 100)])
+    def test_filtrar_por_precio(self, tienda, memoria, rango):
+        """Probar el rango de precios ordenado."""
+        assert nombres(tienda.filtrar_por_precio(*rango)) == nombres(
+            memoria.filtrar_por_precio(*rango)
+        )
+
+    def test_filtros_material_color(self, tienda):
+        """Probar los filtros normalizados."""
+        assert nombres(tienda.filtrar_por_material("MADERA ")) == ["Silla Clásica", "Cama Queen"]
+        assert nombres(tienda.filtrar_por_color("negro")) == ["Mesa Comedor", "Silla Oficina"]
+        assert tienda.filtrar_por_material("") == []
+
+    def test_por_tipo_incluye_subclases(self, tienda):
+        """Probar que el filtro por tipo respeta la herencia."""
+        tienda.agregar_mueble(SofaCama("Sofá Cama", "Tela", "Gris", 900))
+
+        sillas = tienda.obtener_muebles_por_tipo(Silla)
+        assert nombres(sillas) == ["Silla Clásica", "Silla Oficina"]
+        assert len(tienda.obtener_muebles_por_tipo(Asiento)) == 3
+        assert nombres(tienda.obtener_muebles_por_tipo(Cama)) == ["Cama Queen", "Sofá Cama"]
+
+    def test_identidad_estable(self, tienda):
+        """Probar que cada fila se corresponde con un único objeto."""
+        silla = tienda.listar_muebles()[0]
+
+        assert tienda.buscar_muebles_por_nombre("clásica")[0] is silla
+        assert tienda.agregar_mueble(silla) == "Error: El mueble ya está en el inventario"
+
+    def test_fila_de(self, ruta, tienda):
+        """Probar que el id de fila identifica al mueble al reabrir la base."""
+        fila = tienda.fila_de(tienda.buscar_muebles_por_nombre("queen")[0])
+        tienda.cerrar()
+
+        reabierta = TiendaSQLite(ruta)
+        try:
+            assert reabierta.obtener_por_fila(fila).nombre == "Cama Queen"
+            assert reabierta.fila_de(reabierta.obtener_por_fila(fila)) == fila
+            assert reabierta.obtener_por_fila(999) is None
+            assert reabierta.fila_de(Silla("Suelta", "Madera", "Café", 100)) is None
+        finally:
+            reabierta.cerrar()
+
+    def test_valor_y_estadisticas(self, tienda, memoria):
+        """Probar los agregados calculados en SQL."""
+        assert tienda.calcular_valor_inventario() == memoria.calcular_valor_inventario()
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["total_muebles"] == 4
+        assert estadisticas["tipos_muebles"] == {"Silla": 2, "Mesa": 1, "Cama": 1}
+
+    def test_indices_en_plan(self, tienda):
+        """Probar que los filtros usan los índices de la tabla."""
+        with tienda._pool.conexion() as conexion:
+            plan_precio = conexion.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM muebles WHERE precio BETWEEN 1 AND 2"
+            ).fetchall()
+            plan_material = conexion.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM muebles WHERE material = 'madera'"
+            ).fetchall()
+        assert "idx_muebles_precio" in str(plan_precio)
+        assert "idx_muebles_material" in str(plan_material)
+
+    @pytest.mark.parametrize(
+        "criterios",
+        [
+            {},
+            {"nombre": "silla", "color": "negro"},
+            {"material": "madera", "precio_max": 200},
+            {"tipo": Asiento, "precio_min": 120},
+            {"nombre": "la", "tipo": Cama},
+            {"color": "verde"},
+        ],
+    )
+    def test_consultar(self, tienda, memoria, criterios):
+        """Probar que la consulta compuesta coincide con la tienda en memoria."""
+        assert nombres(tienda.consultar(**criterios)) == nombres(memoria.consultar(**criterios))
+
+    @pytest.mark.parametrize("por_precio", [False, True])
+    def test_paginar(self, tienda, memoria, por_precio):
+        """Probar que la paginación por clave coincide con la tienda en memoria."""
+        assert nombres(tienda.iter_consultar(por_precio, 1, material="madera")) == nombres(
+            memoria.iter_consultar(por_precio, 1, material="madera")
+        )
+        pagina, cursor = tienda.paginar(limite=2, por_precio=por_precio)
+        siguiente, fin = tienda.paginar(cursor, 5, por_precio=por_precio)
+        assert nombres(pagina + siguiente) == nombres(
+            memoria.filtrar_por_precio() if por_precio else memoria.listar_muebles()
+        )
+        assert fin is None
+
+    @pytest.mark.parametrize("criterios", [{}, {"material": "madera"}, {"tipo": Silla}])
+    def test_top_k(self, tienda, memoria, criterios):
+        """Probar los extremos por precio resueltos en SQL."""
+        for k in (0, 1, 3):
+            assert nombres(tienda.mas_baratos(k, **criterios)) == nombres(
+                memoria.mas_baratos(k, **criterios)
+            )
+            assert nombres(tienda.mas_caros(k, **criterios)) == nombres(
+                memoria.mas_caros(k, **criterios)
+            )
+        assert {t: nombres(m) for t, m in tienda.mas_caros_por_tipo(1).items()} == {
+            t: nombres(m) for t, m in memoria.mas_caros_por_tipo(1).items()
+        }
+
+    def test_explicar_consulta(self, tienda):
+        """Probar que el plan de SQLite usa un índice de la tabla."""
+        plan = tienda.explicar_consulta(material="madera", precio_min=100)
+
+        assert "idx_muebles" in str(plan)
+        assert plan.como_dict()["sentencia"].startswith("SELECT")
+
+
+class TestTiendaSQLiteIdentidad:
+    """Pruebas del mapa de identidad de filas y objetos."""
+
+    def test_objetos_sin_uso_se_liberan(self, tienda):
+        """Probar que los objetos que nadie usa salen de los mapas y del registro de observadores."""
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        fila = tienda.fila_de(silla)
+        referencias = [weakref.ref(m) for m in tienda.listar_muebles()]
+        claves = [id(m) for m in tienda.listar_muebles()]
+        gc.collect()
+
+        assert len(tienda._objetos) == len(tienda._filas) == 1
+        assert tienda.obtener_por_fila(fila) is silla
+        del silla
+        gc.collect()
+
+        assert [r() for r in referencias] == [None] * 4
+        assert len(tienda._objetos) == len(tienda._filas) == 0
+        assert not set(claves) & set(_observadores)
+        assert tienda.obtener_por_fila(fila).nombre == "Silla Clásica"
+
+    def test_objeto_reconstruido_guarda_cambios(self, tienda):
+        """Probar que un objeto construido de nuevo sigue guardando sus cambios."""
+        tienda.buscar_muebles_por_nombre("clásica")[0].material = "Metal"
+        gc.collect()
+
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        silla.color = "Rojo"
+
+        assert nombres(tienda.filtrar_por_color("rojo")) == ["Silla Clásica"]
+        assert nombres(tienda.filtrar_por_material("metal")) == ["Silla Clásica", "Silla Oficina"]
+
+    def test_fila_de_objeto_ajeno(self, tienda):
+        """Probar que un objeto sin referencias débiles no está en la base."""
+        assert tienda.fila_de(3) is None
+        assert "error" in tienda.realizar_venta("Silla")
+
+    def test_desde_snapshot(self, tienda, tmp_path):
+        """Probar la carga de un snapshot en una base nueva."""
+        tienda.aplicar_descuento("Mesa", 20)
+        tienda.guardar_snapshot(tmp_path / "tienda.snap")
+
+        copia = TiendaSQLite.desde_snapshot(
+            tmp_path / "tienda.snap", ruta_base=tmp_path / "copia.db"
+        )
+        assert copia.nombre == "Mueblería SQL"
+        copia.cerrar()
+
+        reabierta = TiendaSQLite(tmp_path / "copia.db")
+        try:
+            assert nombres(reabierta.listar_muebles()) == nombres(tienda.listar_muebles())
+            assert reabierta.obtener_estadisticas()["descuentos_activos"] == {"Mesa": 0.2}
+        finally:
+            reabierta.cerrar()
+
+    @pytest.mark.parametrize(
+        "argumentos",
+        [{}, {"ruta_base": "copia.db", "motor_columnar": True}],
+    )
+    def test_desde_snapshot_invalido(self, tienda, tmp_path, argumentos):
+        """Probar que sin base de destino o con motor columnar se rechaza la carga."""
+        tienda.guardar_snapshot(tmp_path / "tienda.snap")
+
+        with pytest.raises(ValueError):
+            TiendaSQLite.desde_snapshot(tmp_path / "tienda.snap", **argumentos)
+
+
+class TestTiendaSQLiteCambios:
+    """Pruebas de muebles modificados después de guardarlos."""
+
+    def test_cambios_se_guardan_en_la_fila(self, tienda, ruta):
+        """Probar que precio, material y nombre nuevos llegan a la base."""
+        silla = tienda.buscar_muebles_por_nombre("clásica")[0]
+        silla.precio_base = 1000
+        silla.material = "Metal"
+        silla.nombre = "Banco"
+
+        assert silla not in tienda.filtrar_por_precio(0, 500)
+        assert tienda.buscar_muebles_por_nombre("banco") == [silla]
+        assert tienda.buscar_muebles_por_nombre("clásica") == []
+        assert nombres(tienda.filtrar_por_material("metal")) == ["Banco", "Silla Oficina"]
+        assert tienda.obtener_estadisticas()["valor_inventario"] == pytest.approx(
+            sum(tienda.precio(m) for m in tienda.listar_muebles())
+        )
+        tienda.cerrar()
+        reabierta = TiendaSQLite(ruta)
+        try:
+            assert nombres(reabierta.buscar_muebles_por_nombre("banco")) == ["Banco"]
+        finally:
+            reabierta.cerrar()
+
+
+class TestTiendaSQLiteVentas:
+    """Pruebas de ventas y persistencia."""
+
+    def test_venta_con_descuento(self, tienda):
+        """Probar que la venta borra la fila y registra el total."""
+        tienda.aplicar_descuento("Silla", 10)
+        silla = tienda.listar_muebles()[0]
+
+        venta = tienda.realizar_venta(silla, "Ana")
+
+        assert venta["precio_final"] == round(silla.calcular_precio() * 0.9, 2)
+        assert silla not in tienda.listar_muebles()
+        assert "error" in tienda.realizar_venta(silla)
+        estadisticas = tienda.obtener_estadisticas()
+        assert estadisticas["ventas_realizadas"] == 1
+        assert estadisticas["valor_total_ventas"] == venta["precio_final"]
+        assert estadisticas["tipos_muebles"] == {"Mesa": 1, "Cama": 1, "Silla": 1}
+
+    def test_descuento_por_categoria(self, tienda):
+        """Probar que el descuento a Asiento se hereda al vender una silla."""
+        tienda.aplicar_descuento("asientos", 25)
+        silla = tienda.listar_muebles()[0]
+
+        venta = tienda.realizar_venta(silla)
+
+        assert venta["descuento"] == 25
+        assert tienda.obtener_estadisticas()["descuentos_activos"] == {"Asiento": 0.25}
+
+    def test_ventas_por_lote(self, tienda):
+        """Probar la venta de un lote en una sola transacción."""
+        silla, mesa, cama, _ = tienda.listar_muebles()
+
+        resultados = tienda.realizar_ventas([silla, mesa, silla, cama], "Ana")
+
+        assert ["error" in r for r in resultados] == [False, False, True, False]
+        assert len({r["fecha"] for r in resultados if "error" not in r}) == 1
+        assert nombres(tienda.listar_muebles()) == ["Silla Oficina"]
+        assert tienda.obtener_estadisticas()["ventas_realizadas"] == 3
+
+    def test_persistencia(self, ruta):
+        """Probar que inventario, ventas y descuentos sobreviven al reabrir."""
+        tienda = TiendaSQLite(ruta)
+        poblar(tienda)
+        tienda.aplicar_descuento("Mesa", 20)
+        tienda.realizar_venta(tienda.listar_muebles()[1])
+        tienda.cerrar()
+
+        reabierta = TiendaSQLite(ruta)
+        try:
+            assert nombres(reabierta.listar_muebles()) == [
+                "Silla Clásica",
+                "Cama Queen",
+                "Silla Oficina",
+            ]
+            estadisticas = reabierta.obtener_estadisticas()
+            assert estadisticas["descuentos_activos"] == {"Mesa": 0.2}
+            assert estadisticas["ventas_realizadas"] == 1
+        finally:
+            reabierta.cerrar()
+
+    def test_tipo_no_soportado(self, tienda):
+        """Probar que un mueble fuera del catálogo se rechaza."""
+
+        class Banco(Silla):
+            pass
+
+        assert tienda.agregar_mueble(Banco("Banco", "Madera", "Café", 50)).startswith("Error")
+
+    def test_lecturas_concurrentes(self, tienda):
+        """Probar lecturas desde varios hilos con el pool de conexiones."""
+        with ThreadPoolExecutor(max_workers=8) as ejecutor:
+            resultados = list(
+                ejecutor.map(lambda _: len(tienda.filtrar_por_precio(0, 1000)), range(200))
+            )
+
+        assert resultados == [4] * 200
+
+
+class TestTiendaSQLiteReglasPrecio:
+    """Pruebas de la tienda SQLite con motor de reglas de precio."""
+
+    def test_cargar_reglas_actualiza_la_base(self, ruta):
+        """Probar que la revaluación guarda los precios nuevos en la base."""
+        motor = MotorPrecios()
+        tienda = TiendaSQLite(ruta, "Mueblería SQL", motor_precios=motor)
+        try:
+            poblar(tienda)
+            cama = tienda.obtener_muebles_por_tipo(Cama)[0]
+            valor = tienda.calcular_valor_inventario()
+            reglas = motor.reglas()
+            reglas["Cama"]["recargos"][0]["valores"]["queen"] += 100
+
+            tienda.cargar_reglas(reglas)
+
+            assert tienda.calcular_valor_inventario() == pytest.approx(valor + 100)
+            assert tienda.realizar_venta(cama)["precio_original"] == tienda.precio(cama)
+        finally:
+            tienda.cerrar()
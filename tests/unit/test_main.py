@@ -0,0 +1,210 @@
+"""
+Pruebas de los subcomandos no interactivos de main.py.
+"""
+
+import io
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from src.main import main
+
+CATALOGO = [
+    {
+        "tipo": "Silla",
+        "nombre": "Silla Clásica",
+        "material": "Madera",
+        "color": "Café",
+        "precio_base": 100,
+    },
+    {
+        "tipo": "Sofa",
+        "nombre": "Sofá Gris",
+        "material": "Tela",
+        "color": "Gris",
+        "precio_base": 1000,
+    },
+    {
+        "tipo": "Mesa",
+        "nombre": "Mesa Roble",
+        "material": "Madera",
+        "color": "Roble",
+        "precio_base": 300,
+    },
+]
+
+
+@pytest.fixture
+def base(tmp_path, capsys):
+    """Fixture con una base cargada a partir de un catálogo JSON Lines."""
+    ruta_catalogo = tmp_path / "catalogo.jsonl"
+    ruta_catalogo.write_text(
+        "".join(json.dumps(registro, ensure_ascii=False) + "\n" for registro in CATALOGO),
+        encoding="utf-8",
+    )
+    ruta = str(tmp_path / "tienda.db")
+    assert main(["load", str(ruta_catalogo), "--base", ruta]) == 0
+    capsys.readouterr()
+    return ruta
+
+
+def lineas(capsys):
+    return capsys.readouterr().out.splitlines()
+
+
+class TestComandos:
+    """Pruebas de cada subcomando sobre la base SQLite."""
+
+    def test_load_con_errores(self, tmp_path, capsys):
+        """Probar que las filas inválidas se informan y cambian el código de salida."""
+        ruta_catalogo = tmp_path / "catalogo.jsonl"
+        ruta_catalogo.write_text(
+            json.dumps(CATALOGO[0]) + '\n{"tipo": "Banco", "nombre": "x"}\n', encoding="utf-8"
+        )
+
+        codigo = main(["cargar", str(ruta_catalogo), "--base", str(tmp_path / "t.db")])
+
+        salida = capsys.readouterr()
+        assert codigo == 1
+        assert salida.out == "1 muebles cargados, 1 rechazados\n"
+        assert salida.err.startswith("línea 2:")
+
+    def test_search(self, base, capsys):
+        """Probar la búsqueda con id en la primera columna."""
+        assert main(["search", "silla", "--base", base]) == 0
+        assert lineas(capsys) == ["1\tSilla\tSilla Clásica\tMadera\tCafé\t110.00"]
+
+    def test_filter_jsonl(self, base, capsys):
+        """Probar el filtro por categoría y material en JSON Lines."""
+        assert main(["filter", "--tipo", "asientos", "--formato", "jsonl", "--base", base]) == 0
+        registros = [json.loads(linea) for linea in lineas(capsys)]
+
+        assert [(r["id"], r["tipo"]) for r in registros] == [(1, "Silla"), (2, "Sofa")]
+        assert registros[0]["precio"] == pytest.approx(110)
+
+    def test_formato_y_salida_no_se_mezclan(self, base, capsys):
+        """Probar que --salida solo nombra archivos: el formato se elige con --formato."""
+        with pytest.raises(SystemExit):
+            main(["filter", "--salida", "jsonl", "--base", base])
+        assert "--salida" in capsys.readouterr().err
+
+    def test_filter_por_precio(self, base, capsys):
+        """Probar que un rango de precios ordena por precio."""
+        assert main(["filter", "--precio-min", "100", "--base", base]) == 0
+        assert [linea.split("\t")[0] for linea in lineas(capsys)] == ["1", "3", "2"]
+
+    def test_filter_tipo_desconocido(self, base, capsys):
+        """Probar el error de un tipo inexistente."""
+        assert main(["filter", "--tipo", "banco", "--base", base]) == 1
+        assert capsys.readouterr().err == "Error: Tipo de mueble desconocido 'banco'\n"
+
+    def test_sell_desde_tuberia(self, base, capsys, monkeypatch):
+        """Probar la venta de los ids leídos de la salida de filter."""
+        main(["filter", "--base", base])
+        monkeypatch.setattr(sys, "stdin", io.StringIO(capsys.readouterr().out))
+
+        assert main(["sell", "--cliente", "Ana", "--base", base]) == 0
+        ventas = [json.loads(linea) for linea in lineas(capsys)]
+        assert [(v["id"], v["cliente"]) for v in ventas] == [(1, "Ana"), (2, "Ana"), (3, "Ana")]
+
+        main(["stats", "--base", base])
+        estadisticas = json.loads(capsys.readouterr().out)
+        assert estadisticas["total_muebles"] == 0
+        assert estadisticas["ventas_realizadas"] == 3
+
+    def test_sell_id_inexistente(self, base, capsys):
+        """Probar que un id inexistente no impide vender los demás."""
+        assert main(["vender", "3", "99", "3", "--base", base]) == 1
+
+        salida = capsys.readouterr()
+        assert [json.loads(linea)["mueble"] for linea in salida.out.splitlines()] == ["Mesa Roble"]
+        assert "id 99" in salida.err
+        assert "id 3: El mueble no está disponible" in salida.err
+
+    def test_sell_id_invalido(self, base, capsys):
+        """Probar el error de un id que no es un número."""
+        assert main(["sell", "uno", "--base", base]) == 1
+        assert capsys.readouterr().err.startswith("Error: Id de mueble inválido")
+
+    def test_stats(self, base, capsys):
+        """Probar las estadísticas en JSON."""
+        assert main(["stats", "--base", base]) == 0
+        estadisticas = json.loads(capsys.readouterr().out)
+
+        assert estadisticas["total_muebles"] == 3
+        assert estadisticas["tipos_muebles"] == {"Silla": 1, "Sofa": 1, "Mesa": 1}
+
+    def test_report_salida_estandar(self, base, capsys):
+        """Probar el reporte de texto en la salida estándar."""
+        assert main(["report", "--base", base]) == 0
+        salida = capsys.readouterr().out
+
+        assert salida.startswith("=== REPORTE DE INVENTARIO - ")
+        assert "Muebles listados: 3" in salida
+
+    def test_report_archivos(self, base, tmp_path, capsys):
+        """Probar varios formatos escritos en archivos con un nombre base."""
+        nombre = str(tmp_path / "inventario")
+        argumentos = ["report", "--formato", "csv", "--formato", "jsonl", "--base", base]
+
+        assert main(argumentos) == 1
+        assert "--salida" in capsys.readouterr().err
+        assert main(argumentos + ["--salida", nombre]) == 0
+
+        assert len(Path(nombre + ".csv").read_text(encoding="utf-8").splitlines()) == 4
+        assert len(Path(nombre + ".jsonl").read_text(encoding="utf-8").splitlines()) == 3
+
+    def test_base_invalida(self, tmp_path, capsys):
+        """Probar el error al abrir un archivo que no es una base SQLite."""
+        ruta = tmp_path / "texto.db"
+        ruta.write_text("no es una base de datos\n" * 10)
+
+        assert main(["stats", "--base", str(ruta)]) == 1
+        assert capsys.readouterr().err.startswith(f"Error: No se pudo abrir la base {ruta}")
+
+
+class TestImportaciones:
+    """Pruebas de los imports perezosos."""
+
+    def test_subcomando_no_importa_el_menu(self, base):
+        """Probar que un subcomando no carga la interfaz interactiva."""
+        src = Path(__file__).resolve().parents[2] / "src"
+        codigo = (
+            "import sys, main\n"
+            f"main.main(['stats', '--base', {base!r}])\n"
+            "print(sorted(m for m in sys.modules if m.startswith(('ui', 'rich'))))\n"
+        )
+        resultado = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=src, capture_output=True, text=True, check=True
+        )
+        assert resultado.stdout.splitlines()[-1] == "[]"
+
+    def test_stats_no_importa_el_catalogo(self, base):
+        """Probar que stats no carga el catálogo ni las clases concretas."""
+        src = Path(__file__).resolve().parents[2] / "src"
+        codigo = (
+            "import sys, main\n"
+            f"main.main(['stats', '--base', {base!r}])\n"
+            "print(sorted(m for m in sys.modules if m.startswith(('services.catalogo', "
+            "'models.concretos'))))\n"
+        )
+        resultado = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=src, capture_output=True, text=True, check=True
+        )
+        assert resultado.stdout.splitlines()[-1] == "[]"
+
+    def test_tienda_no_importa_servicios_opcionales(self):
+        """Probar que la tienda carga snapshot, diario, reportes y columnar solo al usarlos."""
+        src = Path(__file__).resolve().parents[2] / "src"
+        codigo = (
+            "import sys, services.tienda\n"
+            "opcionales = ('snapshot', 'diario', 'reportes', 'columnar', 'reglas_precio')\n"
+            "print(sorted(m for m in opcionales if 'services.' + m in sys.modules))\n"
+        )
+        resultado = subprocess.run(
+            [sys.executable, "-c", codigo], cwd=src, capture_output=True, text=True, check=True
+        )
+        assert resultado.stdout.splitlines()[-1] == "[]"
@@ -0,0 +1,183 @@
+"""
+Pruebas para la API HTTP de la tienda.
+"""
+
+import http.client
+import json
+import threading
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.tienda import TiendaMuebles
+from src.ui.api_http import ServidorTienda
+
+
+@pytest.fixture
+def tienda():
+    """Fixture con una tienda concurrente pequeña."""
+    tienda = TiendaMuebles("Tienda HTTP", concurrente=True)
+    tienda.agregar_muebles(
+        [
+            Silla("Silla Clásica", "Madera", "Café", 100.0),
+            Mesa("Mesa Comedor", "Vidrio", "Negro", 300.0),
+            Silla("Silla Oficina", "Metal", "Negro", 150.0),
+        ]
+    )
+    return tienda
+
+
+@pytest.fixture
+def conexion(tienda):
+    """Servidor en un puerto libre y una conexión keep-alive hacia él."""
+    servidor = ServidorTienda(tienda, ("127.0.0.1", 0), max_hilos=4)
+    hilo = threading.Thread(target=servidor.serve_forever, daemon=True)
+    hilo.start()
+    conexion = http.client.HTTPConnection("127.0.0.1", servidor.server_address[1], timeout=5)
+    yield conexion
+    conexion.close()
+    servidor.shutdown()
+    servidor.server_close()
+    hilo.join()
+
+
+def pedir(conexion, metodo, ruta, cuerpo=None, cabeceras=None):
+    """Hace una petición y devuelve (estado, cabeceras, JSON o None)."""
+    datos = None if cuerpo is None else json.dumps(cuerpo)
+    conexion.request(metodo, ruta, body=datos, headers=cabeceras or {})
+    respuesta = conexion.getresponse()
+    contenido = respuesta.read()
+    return respuesta.status, respuesta, json.loads(contenido) if contenido else None
+
+
+class TestApiHttp:
+    """Pruebas de las rutas de la API."""
+
+    def test_requiere_tienda_concurrente(self):
+        """Probar que el servidor rechaza una tienda no concurrente."""
+        with pytest.raises(ValueError):
+            ServidorTienda(TiendaMuebles(), ("127.0.0.1", 0))
+
+    def test_listar_y_filtrar(self, conexion, tienda):
+        """Probar el listado y la combinación de filtros."""
+        estado, _, cuerpo = pedir(conexion, "GET", "/muebles")
+        assert estado == 200
+        assert len(cuerpo["muebles"]) == 3
+        assert cuerpo["siguiente"] is None
+
+        estado, _, cuerpo = pedir(conexion, "GET", "/muebles?color=negro&precio_max=200")
+        assert estado == 200
+        assert [m["nombre"] for m in cuerpo["muebles"]] == ["Silla Oficina"]
+
+    def test_paginar_con_cursor(self, conexion, tienda):
+        """Probar que el cursor recorre las páginas aunque se venda entre una y otra."""
+        _, _, cuerpo = pedir(conexion, "GET", "/muebles?limite=1")
+        nombres = [m["nombre"] for m in cuerpo["muebles"]]
+        mesa = tienda.filtrar_por_material("vidrio")[0]
+        tienda.realizar_venta(mesa)
+        while cuerpo["siguiente"] is not None:
+            _, _, cuerpo = pedir(conexion, "GET", f"/muebles?limite=1&cursor={cuerpo['siguiente']}")
+            nombres += [m["nombre"] for m in cuerpo["muebles"]]
+
+        assert nombres == ["Silla Clásica", "Silla Oficina"]
+        _, _, cuerpo = pedir(conexion, "GET", "/muebles?nombre=silla&limite=1")
+        assert [m["nombre"] for m in cuerpo["muebles"]] == ["Silla Clásica"]
+        assert cuerpo["siguiente"]
+
+    def test_obtener_mueble(self, conexion, tienda):
+        """Probar la consulta de un mueble por id y el 404."""
+        mueble = tienda.listar_muebles()[0]
+        estado, _, cuerpo = pedir(conexion, "GET", f"/muebles/{tienda.identificador(mueble)}")
+        assert estado == 200
+        assert cuerpo["id"] == tienda.identificador(mueble)
+        assert cuerpo["nombre"] == mueble.nombre
+        assert cuerpo["precio"] == round(mueble.calcular_precio(), 2)
+
+        estado, _, cuerpo = pedir(conexion, "GET", "/muebles/123")
+        assert estado == 404
+        assert "error" in cuerpo
+
+    def test_ids_estables(self, conexion, tienda):
+        """Probar que el id de un mueble vendido no pasa a identificar a otro."""
+        _, _, cuerpo = pedir(conexion, "GET", "/muebles")
+        ids = [m["id"] for m in cuerpo["muebles"]]
+        pedir(conexion, "POST", "/ventas", {"ids": ids[:1]})
+        tienda.agregar_mueble(Silla("Silla Nueva", "Madera", "Café", 120.0))
+
+        assert pedir(conexion, "GET", f"/muebles/{ids[0]}")[0] == 404
+        _, _, cuerpo = pedir(conexion, "GET", "/muebles")
+        assert [m["id"] for m in cuerpo["muebles"]] == ids[1:] + [ids[-1] + 1]
+        assert pedir(conexion, "GET", f"/muebles/{ids[1]}")[2]["nombre"] == "Mesa Comedor"
+
+    def test_etag_y_get_condicional(self, conexion, tienda):
+        """Probar que el ETag evita reenviar datos sin cambios y cambia tras una venta."""
+        _, respuesta, _ = pedir(conexion, "GET", "/estadisticas")
+        etag = respuesta.getheader("ETag")
+        assert etag
+
+        estado, _, cuerpo = pedir(
+            conexion, "GET", "/estadisticas", cabeceras={"If-None-Match": etag}
+        )
+        assert estado == 304
+        assert cuerpo is None
+
+        mueble = tienda.listar_muebles()[0]
+        estado, _, cuerpo = pedir(
+            conexion, "POST", "/ventas", {"ids": [tienda.identificador(mueble), 99]}
+        )
+        assert estado == 200
+        assert "precio_final" in cuerpo["resultados"][0]
+        assert cuerpo["resultados"][1] == {"error": "Mueble no encontrado"}
+
+        estado, respuesta, cuerpo = pedir(
+            conexion, "GET", "/estadisticas", cabeceras={"If-None-Match": etag}
+        )
+        assert estado == 200
+        assert respuesta.getheader("ETag") != etag
+        assert cuerpo["total_muebles"] == 2
+
+    def test_descuentos(self, conexion, tienda):
+        """Probar la aplicación de descuentos y la validación del cuerpo."""
+        estado, _, cuerpo = pedir(
+            conexion, "POST", "/descuentos", {"categoria": "sillas", "porcentaje": 10}
+        )
+        assert estado == 200
+        assert "Silla" in cuerpo["mensaje"]
+
+        estado, _, _ = pedir(conexion, "POST", "/descuentos", {"categoria": "sillas"})
+        assert estado == 400
+        estado, _, _ = pedir(conexion, "POST", "/descuentos", {"porcentaje": 500})
+        assert estado == 400
+
+    def test_errores(self, conexion):
+        """Probar rutas inexistentes y parámetros inválidos."""
+        assert pedir(conexion, "GET", "/nada")[0] == 404
+        assert pedir(conexion, "GET", "/muebles?precio_min=abc")[0] == 400
+        assert pedir(conexion, "GET", "/muebles?tipo=lampara")[0] == 400
+        assert pedir(conexion, "POST", "/ventas", {"ids": []})[0] == 400
+        assert pedir(conexion, "GET", "/muebles?desde=inf")[0] == 400
+        assert pedir(conexion, "GET", "/muebles?limite=-inf")[0] == 400
+        assert pedir(conexion, "GET", "/muebles?desde=1")[0] == 400
+        assert pedir(conexion, "GET", "/muebles?limite=0")[0] == 400
+        for cursor in ("%%%", "bm8", "WyJhIl0", "WzEsMiwzXQ"):
+            assert pedir(conexion, "GET", f"/muebles?cursor={cursor}")[0] == 400
+
+    def test_content_length_invalido(self, conexion):
+        """Probar que un Content-Length mal formado se responde con 400."""
+        for longitud in ("abc", "-5"):
+            conexion.putrequest("POST", "/ventas")
+            conexion.putheader("Content-Length", longitud)
+            conexion.endheaders()
+            respuesta = conexion.getresponse()
+            assert respuesta.status == 400
+            assert "error" in json.loads(respuesta.read())
+            conexion.close()
+
+    def test_keep_alive(self, conexion):
+        """Probar que varias peticiones reutilizan la misma conexión."""
+        pedir(conexion, "GET", "/muebles")
+        socket = conexion.sock
+        for _ in range(5):
+            assert pedir(conexion, "GET", "/estadisticas")[0] == 200
+        assert conexion.sock is socket
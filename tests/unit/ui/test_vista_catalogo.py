@@ -0,0 +1,115 @@
+"""
+Pruebas para la vista paginada del catálogo.
+"""
+
+import pytest
+
+from src.models.concretos.mesa import Mesa
+from src.models.concretos.silla import Silla
+from src.services.tienda import TiendaMuebles
+from src.ui.vista_catalogo import VistaCatalogo, formatear_fila
+
+
+@pytest.fixture
+def tienda():
+    """Fixture con 25 muebles (dos páginas y media de 10)."""
+    tienda = TiendaMuebles("Tienda Vista")
+    tienda.agregar_muebles(
+        Silla(f"Silla {i}", "Madera" if i % 2 else "Metal", "Café", 100.0 + i) for i in range(25)
+    )
+    return tienda
+
+
+class TestVistaCatalogo:
+    """Pruebas de la paginación perezosa y la caché de filas."""
+
+    def test_paginas_y_numeracion(self, tienda):
+        """Probar que cada página trae su ventana con números globales."""
+        vista = VistaCatalogo(tienda, tamaño_pagina=10)
+
+        primera, tercera = vista.pagina(0), vista.pagina(2)
+
+        assert [numero for numero, _, _ in primera] == list(range(1, 11))
+        assert [numero for numero, _, _ in tercera] == list(range(21, 26))
+        assert tercera[0][2] == formatear_fila(tercera[0][1])
+        assert vista.pagina(3) == []
+        assert vista.hay_siguiente(1)
+        assert not vista.hay_siguiente(2)
+
+    def test_solo_lee_lo_necesario(self, tienda):
+        """Probar que la primera página no recorre el resto del inventario."""
+        vista = VistaCatalogo(tienda, tamaño_pagina=10)
+
+        vista.pagina(0)
+
+        assert vista.estadisticas_cache() == {
+            "paginas_conocidas": 2,
+            "paginas_en_cache": 1,
+            "lecturas": 1,
+        }
+
+    def test_cache_de_filas(self, tienda):
+        """Probar que volver a una página no consulta la tienda otra vez."""
+        vista = VistaCatalogo(tienda, tamaño_pagina=10)
+        vista.pagina(0)
+        vista.pagina(1)
+
+        vista.pagina(0)
+
+        assert vista.estadisticas_cache()["lecturas"] == 2
+
+    def test_cache_acotada(self, tienda):
+        """Probar que solo se conservan las últimas páginas vistas."""
+        vista = VistaCatalogo(tienda, tamaño_pagina=5, paginas_en_cache=2)
+        for indice in range(5):
+            vista.pagina(indice)
+
+        vista.pagina(0)
+
+        assert vista.estadisticas_cache()["paginas_en_cache"] == 2
+        assert vista.estadisticas_cache()["lecturas"] == 6
+
+    def test_cambio_en_la_tienda_invalida_cache(self, tienda):
+        """Probar que una venta descarta las filas formateadas."""
+        vista = VistaCatalogo(tienda, tamaño_pagina=10)
+        vendido = vista.mueble(3)
+
+        tienda.realizar_venta(vendido)
+
+        assert vendido not in [mueble for _, mueble, _ in vista.pagina(0)]
+        assert len(vista.pagina(0)) == 10
+
+    def test_mueble_por_numero(self, tienda):
+        """Probar la selección por número, leyendo las páginas intermedias."""
+        vista = VistaCatalogo(tienda, tamaño_pagina=10)
+
+        assert vista.mueble(23).nombre == "Silla 22"
+        assert vista.mueble(26) is None
+        assert vista.mueble(0) is None
+
+    def test_filtros_y_orden_por_precio(self, tienda):
+        """Probar que los criterios se pasan a paginar."""
+        vista = VistaCatalogo(
+            tienda, tamaño_pagina=4, material="metal", por_precio=True, precio_min=121
+        )
+
+        nombres = [mueble.nombre for i in range(4) for _, mueble, _ in vista.pagina(i)]
+
+        assert nombres == [f"Silla {i}" for i in range(10, 25, 2)]
+        assert vista.total is None
+
+    def test_pagina_completa_al_final(self):
+        """Probar el fin del recorrido cuando la última página está llena."""
+        tienda = TiendaMuebles()
+        tienda.agregar_muebles(Mesa(f"Mesa {i}", "Roble", "Natural", 100.0) for i in range(10))
+        vista = VistaCatalogo(tienda, tamaño_pagina=5)
+
+        assert len(vista.pagina(1)) == 5
+        assert vista.pagina(2) == []
+        assert not vista.hay_siguiente(1)
+        assert vista.total == 10
+
+    def test_tamaño_invalido(self, tienda):
+        """Probar que el tamaño de página debe ser positivo."""
+        with pytest.raises(ValueError):
+            VistaCatalogo(tienda, tamaño_pagina=0)